@@ -1,29 +1,51 @@
-import requests
 import structlog
-from flask import Blueprint, jsonify, request as flask_request
+from flask import Blueprint, Response, jsonify, request as flask_request
+from werkzeug.http import is_resource_modified
 
 from app import limiter
+from app.dog_show import db as dog_db
+from app.dog_show import payload as dog_payload
+from app.dog_show.conditional import (
+    _all_results_delta_validator, _all_results_validator, _breed_results_validator, _profile_validator,
+    _search_validator, _show_detail_validator, _show_list_validator,
+)
 from app.dog_show.config import RESULT_RETRY_AFTER_SECONDS
+from app.dog_show.events import LIST_TOPIC, _event_stream
 from app.dog_show.indexing import (
     _show_detail_from_index, _show_result_availability_for_id,
     _show_stats_from_index, _shows_with_cached_stats,
 )
 from app.dog_show.result_cache import (
-    _all_results_response, _breed_results_from_all_results_cache,
+    _all_results_delta, _all_results_payload, _all_results_response, _breed_results_from_all_results_cache,
     _enrich_breeds_with_result_progress, _queue_live_result_cache_refresh,
     _queue_live_result_cache_refreshes, _result_cache_progress,
 )
 from app.dog_show.profile import dog_profile_data
 from app.dog_show.search import search_shows_data
-from app.dog_show.shows import _get_show_list
+from app.dog_show.shows import _stored_show_list
 from app.dog_show.store import (
-    _index_summary, _load_result_cache_doc, _queue_result_cache_job, _show_list_cache,
+    _index_summary, _load_result_cache_doc, _queue_result_cache_job,
 )
 
 logger = structlog.get_logger(__name__)
 
 dog_bp = Blueprint('dog', __name__)
 
+
+@dog_bp.before_request
+def _begin_dog_reads():
+    # Every dog.db read of a request shares one session and one snapshot, so a
+    # response's stats, index summary and results agree (see dog_db.read_scope).
+    dog_db.begin_request_reads()
+
+
+@dog_bp.teardown_request
+def _end_dog_reads(_exc):
+    # Streamed responses (the SSE endpoints) are torn down before their body
+    # runs, so a stream never holds the snapshot open.
+    dog_db.end_request_reads()
+
+
 def _results_not_ready_response(show_id, availability, reason=None):
     reason_messages = {
         "future_show": "Tuloksia ei haeta vielä ennen näyttelypäivän aamua.",
@@ -49,26 +71,82 @@ def _attach_show_detail_stats(show_id, data):
         data["stats"] = stats
 
 
+def _with_validator(resp, validator):
+    """Attach the ETag/Last-Modified validator to a full (or 304) response.
+    `no-cache` makes browsers revalidate every poll instead of guessing a
+    freshness lifetime from Last-Modified."""
+    if validator is not None:
+        resp.set_etag(validator["etag"])
+        if validator["last_modified"]:
+            resp.last_modified = validator["last_modified"]
+        resp.headers["Cache-Control"] = "no-cache"
+    return resp
+
+
+def _not_modified(validator):
+    """A 304 when the client's copy still matches `validator`, else None."""
+    if validator is None or is_resource_modified(
+        flask_request.environ, etag=validator["etag"], last_modified=validator["last_modified"],
+    ):
+        return None
+    return _with_validator(Response(status=304), validator)
+
+
+def _gzip_validator(validator):
+    """`validator` for the gzip-encoded representation of the same data. A
+    strong ETag names one byte sequence, so the encoded body needs its own."""
+    if validator is None:
+        return None
+    return dict(validator, etag=f"{validator['etag']}-gzip")
+
+
+def _doc_validator(validator):
+    """`validator` for an /all-results body built from the result doc when no
+    stored payload is usable. It carries the same data, serialized differently
+    from the stored body, so it gets its own strong ETag too."""
+    if validator is None:
+        return None
+    return dict(validator, etag=f"{validator['etag']}-doc")
+
+
+def _stored_payload_response(stored, fields, validator):
+    """Send a materialized /all-results body with `fields` appended, gzip-encoded
+    as stored when the client accepts it (no re-serializing or re-compressing)."""
+    if flask_request.accept_encodings["gzip"]:
+        resp = Response(
+            dog_payload.gzip_response(stored["body"], stored["body_crc"], stored["body_size"], fields),
+            mimetype="application/json",
+        )
+        resp.headers["Content-Encoding"] = "gzip"
+        validator = _gzip_validator(validator)
+    else:
+        resp = Response(dog_payload.plain_response(stored["body"], fields), mimetype="application/json")
+    resp.vary.add("Accept-Encoding")
+    return _with_validator(resp, validator)
+
+
+def _show_list_response(shows):
+    _queue_live_result_cache_refreshes(shows)
+    validator = _show_list_validator(shows)
+    not_modified = _not_modified(validator)
+    if not_modified:
+        return not_modified
+    return _with_validator(jsonify({
+        "shows": _shows_with_cached_stats(shows),
+        "index": _index_summary(total_show_count=len(shows)),
+    }), validator)
+
+
 @dog_bp.route("/api/dog/shows")
 @limiter.limit("30/minute")
 def show_list():
+    # Served from the crawler-persisted list (dog.db); the web tier never waits
+    # on Showlink. Before the crawler's first list fetch there is nothing to show.
     try:
-        shows = _get_show_list()
-        _queue_live_result_cache_refreshes(shows)
-        return jsonify({
-            "shows": _shows_with_cached_stats(shows),
-            "index": _index_summary(total_show_count=len(shows)),
-        })
-    except requests.RequestException as exc:
-        logger.warning("showlink_fetch_failed", endpoint="shows", exc_info=True)
-        if _show_list_cache["data"]:
-            shows = _show_list_cache["data"]
-            _queue_live_result_cache_refreshes(shows)
-            return jsonify({
-                "shows": _shows_with_cached_stats(shows),
-                "index": _index_summary(total_show_count=len(shows)),
-            })
-        return jsonify({"error": "Failed to fetch show list", "detail": str(exc)}), 502
+        shows = _stored_show_list()
+        if shows is None:
+            return jsonify({"error": "Show list not available yet"}), 503
+        return _show_list_response(shows)
     except Exception:
         logger.exception("show_list_error")
         return jsonify({"error": "Internal server error"}), 500
@@ -81,12 +159,18 @@ def show_detail(show_id):
     # fetches Showlink pages for detail; a show missing from the index (a brand
     # new listing) is picked up by the crawler's index pass within minutes.
     try:
+        validator = _show_detail_validator(show_id)
+        not_modified = _not_modified(validator)
+        if not_modified:
+            _queue_live_result_cache_refresh(show_id)
+            return not_modified
+
         indexed = _show_detail_from_index(show_id)
         if indexed:
             _enrich_breeds_with_result_progress(show_id, indexed.get("breeds", []))
             _queue_live_result_cache_refresh(show_id)
             _attach_show_detail_stats(show_id, indexed)
-            return jsonify(indexed)
+            return _with_validator(jsonify(indexed), validator)
 
         return jsonify({
             "show_id": int(show_id),
@@ -116,9 +200,14 @@ def breed_results(show_id):
         return jsonify({"error": "Parameters group and breed are outside the supported range"}), 400
 
     try:
+        validator = _breed_results_validator(show_id, group, breed)
+        not_modified = _not_modified(validator)
+        if not_modified:
+            return not_modified
+
         persisted = _breed_results_from_all_results_cache(show_id, group, breed)
         if persisted:
-            return jsonify(persisted)
+            return _with_validator(jsonify(persisted), validator)
 
         # Not in the whole-show cache. The web tier does not fetch Showlink result
         # pages itself; outside the fetch window this is a plain "not ready", and
@@ -141,12 +230,42 @@ def breed_results(show_id):
 def show_all_results(show_id):
     try:
         availability = _show_result_availability_for_id(show_id)
+        since = flask_request.args.get("since", type=int)
+        if since is not None:
+            validator = _all_results_delta_validator(show_id, availability, since)
+            not_modified = _not_modified(validator)
+            if not_modified:
+                return not_modified
+            delta = _all_results_delta(show_id, since)
+            if delta:
+                delta["availability"] = availability
+                if delta["cache"]["stale"] and availability.get("can_fetch", True):
+                    _queue_result_cache_job(show_id, reason="stale-refresh")
+                return _with_validator(jsonify(delta), validator)
+
+        validator = _all_results_validator(show_id, availability)
+        representations = [validator, _doc_validator(validator)]
+        if flask_request.accept_encodings["gzip"]:
+            representations.append(_gzip_validator(validator))
+        for representation in representations:
+            not_modified = _not_modified(representation)
+            if not_modified:
+                return not_modified
+
+        stored = _all_results_payload(show_id)
+        if stored:
+            if stored["cache"]["stale"] and availability.get("can_fetch", True):
+                _queue_result_cache_job(show_id, reason="stale-refresh")
+            return _stored_payload_response(
+                stored, {"availability": availability, "cache": stored["cache"]}, validator,
+            )
+
         cached = _all_results_response(show_id, allow_stale=True)
         if cached:
             cached["availability"] = availability
             if cached.get("cache", {}).get("stale") and availability.get("can_fetch", True):
                 _queue_result_cache_job(show_id, reason="stale-refresh")
-            return jsonify(cached)
+            return _with_validator(jsonify(cached), _doc_validator(validator))
 
         if not availability.get("can_fetch", True):
             return jsonify(_results_not_ready_response(show_id, availability)), 425
@@ -166,6 +285,33 @@ def show_all_results(show_id):
         return jsonify({"error": "Failed to load show all results cache", "detail": str(e)}), 500
 
 
+def _event_stream_response(topic):
+    stream = _event_stream(topic)
+    if stream is None:
+        return jsonify({"error": "Too many live streams, poll instead"}), 503, {
+            "Retry-After": str(RESULT_RETRY_AFTER_SECONDS),
+        }
+    return Response(stream, mimetype="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",  # nginx must pass events through unbuffered
+    })
+
+
+@dog_bp.route("/api/dog/shows/events")
+@limiter.limit("10/minute")
+def show_list_events():
+    # Live stats/list changes pushed from dog.db (see app/dog_show/events.py).
+    return _event_stream_response(LIST_TOPIC)
+
+
+@dog_bp.route("/api/dog/shows/<int:show_id>/events")
+@limiter.limit("10/minute")
+def show_events(show_id):
+    # Per-breed result deltas for an open show page instead of re-downloading
+    # /all-results on every refresh.
+    return _event_stream_response(show_id)
+
+
 @dog_bp.route("/api/dog/dogs")
 @limiter.limit("30/minute")
 def dog_profile():
@@ -178,10 +324,15 @@ def dog_profile():
         return jsonify({"error": "Parameter reg is too long"}), 400
 
     try:
+        validator = _profile_validator(reg)
+        not_modified = _not_modified(validator)
+        if not_modified:
+            return not_modified
+
         profile = dog_profile_data(reg)
         if profile is None:
             return jsonify({"error": "Koiraa ei löytynyt.", "reg_id": reg}), 404
-        return jsonify(profile)
+        return _with_validator(jsonify(profile), validator)
     except Exception:
         logger.exception("dog_profile_error")
         return jsonify({"error": "Internal server error"}), 500
@@ -195,7 +346,11 @@ def search_shows():
         return jsonify({"error": "Missing required query parameter: q"}), 400
 
     try:
-        return jsonify(search_shows_data(query))
+        validator = _search_validator(query, _stored_show_list())
+        not_modified = _not_modified(validator)
+        if not_modified:
+            return not_modified
+        return _with_validator(jsonify(search_shows_data(query)), validator)
     except Exception:
         logger.exception("search_error")
         return jsonify({"error": "Internal server error"}), 500
@@ -0,0 +1,145 @@
+"""Raw-page archive: the Showlink pages the crawler fetched, kept for re-parsing.
+
+Backfilling a parser fix or a new field used to mean re-crawling Showlink
+politely (hours for a season). With PAGE_ARCHIVE_DIR set, the fetch layer
+(showlink._fetch_page / _fetch_page_text_if_changed) also hands every page body
+it receives to `_archive_page`, and replay.py re-parses a show from here with no
+network traffic.
+
+Layout under PAGE_ARCHIVE_DIR:
+
+- `blobs/<aa>/<sha1>.html.gz`: one gzip blob per distinct body, named by the
+  SHA-1 of its UTF-8 text (the same hash dog_fetch_state keeps), so an unchanged
+  page re-fetched by every live probe is stored once.
+- `index/<show id>.jsonl`: one line per archived fetch of the show's pages —
+  `url`, `page` (the parser kind it was fetched for), `sha1`, `fetched_at`. Pages
+  without a show id (the show list) go to `index/list.jsonl`.
+
+Blobs are written to a temp file and renamed into place; index lines are single
+O_APPEND writes, so the crawler's threads and processes can archive at once.
+Archiving never fails a fetch: errors are logged as `dog_page_archive_failed`.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import structlog
+
+from . import config
+
+logger = structlog.get_logger(__name__)
+
+PAGE_ARCHIVE_DIR = config.PAGE_ARCHIVE_DIR
+LIST_INDEX = "list"
+
+_index_lock = threading.Lock()
+
+
+def _archive_dir(directory=None):
+    return directory or PAGE_ARCHIVE_DIR or None
+
+
+def _body_hash(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _blob_path(directory, body_hash):
+    return os.path.join(directory, "blobs", body_hash[:2], f"{body_hash}.html.gz")
+
+
+def _index_name(url):
+    ids = parse_qs(urlsplit(url).query).get("Id") or []
+    return ids[0] if ids and ids[0].isdigit() else LIST_INDEX
+
+
+def _index_path(directory, name):
+    return os.path.join(directory, "index", f"{name}.jsonl")
+
+
+def _write_blob(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}"
+    try:
+        with open(tmp_path, "wb") as fh:
+            # mtime=0: the same body always compresses to the same bytes.
+            fh.write(gzip.compress(text.encode("utf-8"), mtime=0))
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _archive_page(url, text, page=None, body_hash=None, fetched_at=None, if_missing=False):
+    """Archive one fetched page body; returns its hash, or None when the archive
+    is disabled or the write failed. `if_missing` skips a body already archived
+    (a re-fetch that matched the stored capture)."""
+    directory = _archive_dir()
+    if directory is None:
+        return None
+    try:
+        body_hash = body_hash or _body_hash(text)
+        path = _blob_path(directory, body_hash)
+        exists = os.path.exists(path)
+        if exists and if_missing:
+            return body_hash
+        if not exists:
+            _write_blob(path, text)
+        line = json.dumps({
+            "url": url,
+            "page": page,
+            "sha1": body_hash,
+            "fetched_at": fetched_at or time.time(),
+        }, ensure_ascii=False) + "\n"
+        index_path = _index_path(directory, _index_name(url))
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        with _index_lock, open(index_path, "a", encoding="utf-8") as fh:
+            fh.write(line)
+        return body_hash
+    except Exception:
+        logger.warning("dog_page_archive_failed", url=url, exc_info=True)
+        return None
+
+
+def _read_archived_page(body_hash, directory=None):
+    """The archived body with this hash (raises OSError when it is missing)."""
+    with open(_blob_path(_archive_dir(directory), body_hash), "rb") as fh:
+        return gzip.decompress(fh.read()).decode("utf-8")
+
+
+def _archived_pages(show_id, directory=None):
+    """{url: latest index entry} of a show's archived pages."""
+    directory = _archive_dir(directory)
+    if directory is None:
+        return {}
+    pages = {}
+    try:
+        with open(_index_path(directory, str(show_id)), encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # a torn last line from an interrupted write
+                previous = pages.get(entry.get("url"))
+                if previous is None or (entry.get("fetched_at") or 0) >= (previous.get("fetched_at") or 0):
+                    pages[entry.get("url")] = entry
+    except FileNotFoundError:
+        return {}
+    return pages
+
+
+def _archived_show_ids(directory=None):
+    """Show ids with archived pages, ascending."""
+    directory = _archive_dir(directory)
+    if directory is None:
+        return []
+    try:
+        names = os.listdir(os.path.join(directory, "index"))
+    except FileNotFoundError:
+        return []
+    return sorted(int(name[:-6]) for name in names if name.endswith(".jsonl") and name[:-6].isdigit())
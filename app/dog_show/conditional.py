@@ -0,0 +1,144 @@
+"""HTTP validators (ETag / Last-Modified) for the dog API.
+
+Every validator is derived from data versions dog.db already keeps — the show
+row's `updated_at`, the result-cache header's `updated_at`/`cached_at`/`status`,
+the crawler job row, the show's newest dog_change id (a breed's judge or result
+flag), and the index-wide `last_updated` meta — read in a single
+small query, so a matching `If-None-Match` is answered with a 304 before any doc
+reconstruction or stats computation. Responses that also move with the clock
+(live phases, the fetch window, the stale flag, the 20s stats cache) fold in a
+clock bucket of API_VALIDATOR_CLOCK_SECONDS, which bounds how late such a
+transition reaches a revalidating client.
+
+A validator is {"etag", "last_modified"} or None when the versions could not be
+read, in which case the endpoint simply answers in full.
+"""
+
+import datetime
+import hashlib
+import json
+import time
+
+from . import config
+from .indexing import _is_show_recent_by_id
+from .store import _index_data_version, _show_data_version
+
+API_VALIDATOR_CLOCK_SECONDS = config.API_VALIDATOR_CLOCK_SECONDS
+
+# The Showlink list is re-fetched every SHOW_LIST_TTL; its digest is memoized on
+# the list object so a 15s poll doesn't re-hash ~700 shows.
+_show_list_digest_memo = {"data": None, "digest": ""}
+
+
+def _number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _show_list_digest(shows):
+    if shows is not None and _show_list_digest_memo["data"] is shows:
+        return _show_list_digest_memo["digest"]
+    digest = hashlib.sha1(
+        json.dumps(shows or [], sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    _show_list_digest_memo.update(data=shows, digest=digest)
+    return digest
+
+
+def _validator(kind, parts, modified_at, clock=False, now=None):
+    parts = [kind, *parts]
+    if clock:
+        seconds = max(1, int(API_VALIDATOR_CLOCK_SECONDS))
+        bucket = int((time.time() if now is None else now) // seconds)
+        parts.append(bucket)
+        modified_at = max(modified_at, bucket * seconds)
+    digest = hashlib.sha1(json.dumps(parts, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    return {
+        "etag": f"{kind}-{digest[:24]}",
+        "last_modified": (
+            datetime.datetime.fromtimestamp(modified_at, tz=datetime.timezone.utc)
+            if modified_at else None
+        ),
+    }
+
+
+def _show_version_parts(show_id):
+    version = _show_data_version(show_id)
+    if version is None:
+        return None, 0.0
+    modified_at = max(
+        _number(version.get(key))
+        for key in ("show_updated_at", "updated_at", "cached_at", "job_updated_at")
+    )
+    return sorted(version.items()), modified_at
+
+
+def _index_version_parts():
+    version = _index_data_version()
+    if version is None:
+        return None, 0.0
+    modified_at = max(
+        _number(version.get(key))
+        for key in ("last_updated", "cache_updated_max", "job_updated_max")
+    )
+    return sorted(version.items()), modified_at
+
+
+def _show_list_validator(shows, now=None):
+    parts, modified_at = _index_version_parts()
+    if parts is None:
+        return None
+    return _validator("list", [_show_list_digest(shows), parts], modified_at, clock=True, now=now)
+
+
+def _show_detail_validator(show_id, now=None):
+    parts, modified_at = _show_version_parts(show_id)
+    if parts is None:
+        return None
+    return _validator(f"show{int(show_id)}", [parts], modified_at, clock=_is_show_recent_by_id(show_id), now=now)
+
+
+def _breed_results_validator(show_id, group, breed):
+    # The breed payload carries no clock-derived fields.
+    parts, modified_at = _show_version_parts(show_id)
+    if parts is None:
+        return None
+    return _validator(f"breed{int(show_id)}", [parts, str(group), str(breed)], modified_at)
+
+
+def _all_results_validator(show_id, availability, now=None):
+    # `availability` is part of the body and cheap to compute, so it is hashed
+    # as-is; the clock bucket covers the stale flag of a recent show.
+    parts, modified_at = _show_version_parts(show_id)
+    if parts is None:
+        return None
+    return _validator(
+        f"all{int(show_id)}", [parts, availability], modified_at,
+        clock=_is_show_recent_by_id(show_id), now=now,
+    )
+
+
+def _all_results_delta_validator(show_id, availability, since, now=None):
+    parts, modified_at = _show_version_parts(show_id)
+    if parts is None:
+        return None
+    return _validator(
+        f"all{int(show_id)}d", [parts, availability, int(since)], modified_at,
+        clock=_is_show_recent_by_id(show_id), now=now,
+    )
+
+
+def _search_validator(query, shows, now=None):
+    parts, modified_at = _index_version_parts()
+    if parts is None:
+        return None
+    return _validator("search", [parts, _show_list_digest(shows), query], modified_at, clock=True, now=now)
+
+
+def _profile_validator(reg_id):
+    parts, modified_at = _index_version_parts()
+    if parts is None:
+        return None
+    return _validator("dog", [parts, reg_id], modified_at)
@@ -1,8 +1,30 @@
 import os
 
-BASE_URL = "https://tulospalvelu.kennelliitto.fi/nayttelyt/Tulokset"
+# The Showlink results page every crawl URL is built on. Overridden only to
+# point a crawler at a local stand-in (scripts/dog_showlink_sim.py).
+BASE_URL = os.environ.get("DOG_SHOWLINK_BASE_URL", "https://tulospalvelu.kennelliitto.fi/nayttelyt/Tulokset")
 REQUEST_HEADERS = {"User-Agent": "erez.ac-dog-show-browser/1.0 (+https://erez.ac/dog/about-crawler)"}
 REQUEST_TIMEOUT = 10
+# The per-host Showlink fetch budget shared by every crawler path (see
+# showlink._HostBudget): request starts per second and concurrent requests.
+# The crawler's --result-delay overrides the rate for its process.
+SHOWLINK_REQUESTS_PER_SECOND = float(os.environ.get("DOG_SHOWLINK_REQUESTS_PER_SECOND", "2.5"))
+SHOWLINK_MAX_IN_FLIGHT = int(os.environ.get("DOG_SHOWLINK_MAX_IN_FLIGHT", "3"))
+# How fetched Showlink pages are parsed (see showlink._page_soup): "full" builds
+# the whole document tree, "strained" only the elements parsers.py reads. The
+# strainer is only checked against synthetic pages (tests/fixtures/showlink), so
+# it stays opt-in until scripts/dog_bench_parsers.py --archive-dir shows both
+# backends agree on real captured pages.
+SHOWLINK_PARSER = os.environ.get("DOG_SHOWLINK_PARSER", "full")
+# Directory of the raw-page archive (see archive.py): every fetched Showlink
+# page, gzip-compressed by content hash, for offline re-parses. Empty disables it.
+PAGE_ARCHIVE_DIR = os.environ.get("DOG_PAGE_ARCHIVE_DIR", "")
+# The crawler's Prometheus metrics (see metrics.py): served at /metrics on
+# METRICS_HOST:METRICS_PORT (0 disables it), and/or rewritten after every pass to
+# METRICS_TEXTFILE for node_exporter's textfile collector (empty disables it).
+METRICS_PORT = int(os.environ.get("DOG_METRICS_PORT", "0"))
+METRICS_HOST = os.environ.get("DOG_METRICS_HOST", "127.0.0.1")
+METRICS_TEXTFILE = os.environ.get("DOG_METRICS_TEXTFILE", "")
 
 SHOW_LIST_TTL = 1800
 SHOW_DETAIL_TTL = 600
@@ -44,6 +66,22 @@ RESULT_JOB_STALE_SECONDS = 1800
 RESULT_JOB_BACKOFF_SECONDS = 300
 RESULT_CRAWL_DEFAULT_DELAY = 0.4
 RESULT_CRAWL_DEFAULT_WORKERS = 3
+# Selected shows crawled at once per result pass; their fetches share the
+# Showlink host budget (SHOWLINK_REQUESTS_PER_SECOND), so this adds no load.
+RESULT_CRAWL_SHOW_CONCURRENCY = int(os.environ.get("DOG_RESULT_SHOW_CONCURRENCY", "4"))
+# Worker processes that parse fetched breed pages for the result crawl (see
+# parse_pool.py), so the fetch threads never wait on the GIL to parse; shared by
+# every show the crawler process crawls. 0 parses in the fetch threads instead.
+RESULT_PARSE_PROCESSES = int(os.environ.get("DOG_RESULT_PARSE_PROCESSES", "2"))
+# Breeds the result crawl's writer thread (see writer.py) commits per transaction
+# at most. Captures arriving while a commit is in flight are folded into the next
+# one, so a fast pipeline takes one write lock per batch instead of several per breed.
+RESULT_WRITE_BATCH = int(os.environ.get("DOG_RESULT_WRITE_BATCH", "16"))
+# Seconds between the writer's refreshes of the crawled show's list stats. A
+# refresh rebuilds the show's whole result doc, so one per commit made a crawl
+# quadratic in its breed count; the writer refreshes after its first commit, at
+# most this often after that, and once more when it closes.
+SHOW_STATS_REFRESH_SECONDS = float(os.environ.get("DOG_SHOW_STATS_REFRESH_SECONDS", "30"))
 RESULT_LIVE_PROBE_BREED_LIMIT = int(os.environ.get("DOG_RESULT_LIVE_PROBE_BREED_LIMIT", "64"))
 # Captured breed results are immutable, so a live refresh re-fetches only newly
 # judged breeds — except the show finals (RYP/BIS-1/BIS JUN/VET), which Showlink
@@ -65,13 +103,42 @@ RESULT_SHOW_EVENING_HOUR = int(os.environ.get("DOG_RESULT_SHOW_EVENING_HOUR", "2
 RESULT_PAUSE_STALL_SECONDS = int(os.environ.get("DOG_RESULT_PAUSE_STALL_SECONDS", "7200"))
 RESULT_PAUSE_EVENING_HOUR = int(os.environ.get("DOG_RESULT_PAUSE_EVENING_HOUR", "17"))
 
-# Per-show stats cache TTL (seconds). The /dog page polls /api/dog/shows every 15s
-# whenever a live show is present, and a live show's stats reconstruct its whole-show
-# result doc (thousands of rows) from SQLite. Caching the computed stats this long
-# decouples that cost from the poll rate (and from the number of viewers). Stats
-# only shift when the result cache refreshes (~every live TTL) or the clock crosses
-# a phase hour, so a few seconds of staleness is invisible.
+# Per-show fallback stats cache TTL (seconds). The crawler keeps dog_show_stats
+# current; a show without a current row is computed on request, and a live show's
+# stats reconstruct its whole-show result doc (thousands of rows) from SQLite while
+# /dog polls every 15s. Caching those computations this long decouples that cost
+# from the poll rate (and from the number of viewers). Stats only shift when the
+# result cache refreshes (~every live TTL) or the clock crosses a phase hour, so a
+# few seconds of staleness is invisible.
 SHOW_STATS_CACHE_TTL = float(os.environ.get("DOG_SHOW_STATS_CACHE_TTL", "20"))
+# Clock granularity folded into the dog API's ETag/Last-Modified validators (see
+# conditional.py). Data-driven changes move a validator immediately; clock-driven
+# ones (live phases, fetch windows, the stale flag, the cached stats) reach a
+# revalidating client at most this late — the live result refresh cadence.
+API_VALIDATOR_CLOCK_SECONDS = int(os.environ.get("DOG_API_VALIDATOR_CLOCK_SECONDS", str(RESULT_CACHE_LIVE_TTL)))
+# Byte budget (estimated) for the per-process cache of reconstructed whole-show
+# result docs (see store._load_result_cache_doc). A big all-breed show is a few
+# MB once rebuilt into dicts; the default holds a busy weekend's live shows plus
+# the settled shows viewers are browsing, well inside the 256 MB container.
+RESULT_DOC_CACHE_BYTES = int(os.environ.get("DOG_RESULT_DOC_CACHE_BYTES", str(32 * 1024 * 1024)))
+# Live event streams (SSE, see events.py). Each web worker polls dog.db's change
+# counter this often for the shows being watched; streams close after
+# SSE_STREAM_SECONDS (browsers reconnect by themselves) and send a keep-alive
+# comment every SSE_HEARTBEAT_SECONDS so nginx doesn't time them out. A stream
+# holds a gunicorn thread, so each worker serves at most SSE_MAX_STREAMS of them
+# and answers 503 beyond that (the page falls back to polling): with 2 gthread
+# workers x 32 threads that is 48 streams site-wide, leaving 8 threads per worker
+# for normal requests. More streams need more threads, not a higher cap.
+SSE_POLL_SECONDS = float(os.environ.get("DOG_SSE_POLL_SECONDS", "1"))
+SSE_HEARTBEAT_SECONDS = float(os.environ.get("DOG_SSE_HEARTBEAT_SECONDS", "15"))
+SSE_STREAM_SECONDS = float(os.environ.get("DOG_SSE_STREAM_SECONDS", "300"))
+SSE_MAX_STREAMS = int(os.environ.get("DOG_SSE_MAX_STREAMS", "24"))
+# Single-flight coalescing (see single_flight.py): how long a worker waits for
+# another process computing the same thing before computing it itself.
+SINGLE_FLIGHT_WAIT_SECONDS = float(os.environ.get("DOG_SINGLE_FLIGHT_WAIT_SECONDS", "10"))
+# The dog_change log is pruned by the crawler to this window; a consumer that
+# falls further behind starts over from a full scan.
+CHANGE_LOG_RETENTION_SECONDS = int(os.environ.get("DOG_CHANGE_LOG_RETENTION_SECONDS", str(14 * 86400)))
 RESULT_LOCAL_TIMEZONE = os.environ.get("DOG_RESULT_TIMEZONE", "Europe/Helsinki")
 
 INDEX_DIR = os.environ.get("DOG_INDEX_DIR", os.path.join(os.path.dirname(__file__), "..", "data"))
@@ -84,6 +151,21 @@ DOG_DATABASE_URI = os.environ.get(
     "DOG_DATABASE_URI",
     "sqlite:///" + os.path.abspath(os.path.join(INDEX_DIR, "dog.db")),
 )
+# Reads on the request paths go through a second, read-only engine (see
+# db.read_scope) tuned for reading: memory-mapped I/O of the first
+# SQLITE_MMAP_BYTES of the file (pages are read straight from the OS page cache,
+# not copied into SQLite's), a pool of READ_POOL_SIZE connections — one per
+# gunicorn thread — and SQLite page caches sized from READ_CACHE_BUDGET_KIB. The
+# page cache is per connection, so the budget is what one process's read pool
+# may hold in total, split evenly: 16 MiB / 32 = 512 KiB per connection, 32 MiB
+# for the web service's 2 workers. The crawler shares the 256 MB limit with its
+# parse processes and sets a smaller budget in docker-compose.yml.
+# DOG_READ_ENGINE=0 sends reads through the write engine again.
+READ_ENGINE = os.environ.get("DOG_READ_ENGINE", "1") != "0"
+READ_POOL_SIZE = int(os.environ.get("DOG_READ_POOL_SIZE", "32"))
+SQLITE_MMAP_BYTES = int(os.environ.get("DOG_SQLITE_MMAP_BYTES", str(128 * 1024 * 1024)))
+READ_CACHE_BUDGET_KIB = int(os.environ.get("DOG_READ_CACHE_BUDGET_KIB", str(16 * 1024)))
+SQLITE_CACHE_KIB = max(64, READ_CACHE_BUDGET_KIB // max(1, READ_POOL_SIZE))
 
 FINNISH_MONTHS = [
     "tammikuu", "helmikuu", "maaliskuu", "huhtikuu", "toukokuu", "kesäkuu",
@@ -2,18 +2,19 @@ import time
 
 import structlog
 
-from .indexing import _index_entry_from_detail, _merge_persisted_result_state_into_breeds
+from . import config
+from .indexing import _index_entry_from_detail, _merge_persisted_result_state_into_breeds, _refresh_show_stats
 from .parsers import _parse_show_detail
 from .showlink import _fetch_page, _source_url
 from .shows import _get_show_list
-from .store import _index_states, _index_summary, _write_index_show
+from .store import _due_show_stats_ids, _index_states, _index_summary, _prune_change_log, _write_index_show
 from .utils import _show_is_recent
 
 logger = structlog.get_logger(__name__)
 
 def _update_index_show(show):
     sid = show["id"]
-    soup = _fetch_page(_source_url(sid))
+    soup = _fetch_page(_source_url(sid), page="detail")
     detail = _parse_show_detail(soup, sid)
     show_updated = time.time()
 
@@ -22,6 +23,7 @@ def _update_index_show(show):
     merged_breeds = _merge_persisted_result_state_into_breeds(sid, detail.get("breeds") or [])
     entry = _index_entry_from_detail(sid, show, {**detail, "breeds": merged_breeds}, show_updated)
     _write_index_show(sid, entry)
+    _refresh_show_stats([sid])
 
     logger.info("dog_crawler_indexed_show", show_id=sid, breed_count=len(detail["breeds"]))
     return detail
@@ -100,4 +102,21 @@ def crawl_index_once(limit=None, delay=1.5):
     logger.info("dog_crawler_index_pass_complete", **summary)
     return summary
 
-
+def refresh_show_stats_once():
+    """Recompute the stored list stats that are due: missing, stamped with older
+    data (a write the per-write refreshes didn't cover), or past a phase
+    boundary. Cheap when nothing is due — one stamp comparison over the index."""
+    due = _due_show_stats_ids()
+    written = _refresh_show_stats(due) if due else 0
+    if due:
+        logger.info("dog_crawler_show_stats_refreshed", due=len(due), written=written)
+    return {"due": len(due), "written": written}
+
+def prune_change_log_once(now=None):
+    """Trim the dog_change log to CHANGE_LOG_RETENTION_SECONDS. One indexed
+    delete; consumers further behind than the window start over."""
+    cutoff = (time.time() if now is None else now) - config.CHANGE_LOG_RETENTION_SECONDS
+    pruned = _prune_change_log(cutoff)
+    if pruned:
+        logger.info("dog_crawler_change_log_pruned", pruned=pruned)
+    return pruned
@@ -7,18 +7,28 @@ fetch worker threads) and in one-off scripts, none of which has a Flask
 app/request context. A plain engine with a thread-local scoped session works
 identically in web requests, worker threads, and the crawler process.
 
+Reads on the request paths use a second engine (`read_scope`): read-only
+connections tuned for reading (see `read_pragmas`). Every write stays on the
+read-write engine through `run_write`. Within a web request the reads share one
+session and one read transaction (`begin_request_reads`), so everything a
+response is built from comes from the same snapshot of dog.db.
+
 This is a permanent store, not a cache: historical rows are never evicted.
 """
 
 import contextlib
+import os
+import threading
 import time
+from urllib.request import pathname2url
 
 import structlog
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, make_url, text
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker
 
-from .config import DOG_DATABASE_URI
+from . import metrics
+from .config import DOG_DATABASE_URI, READ_ENGINE, READ_POOL_SIZE, SQLITE_CACHE_KIB, SQLITE_MMAP_BYTES
 
 logger = structlog.get_logger(__name__)
 
@@ -38,6 +48,27 @@ _engine = None
 _Session = None
 _current_uri = None
 
+# The read engine, built lazily per (bound URI, process): gunicorn --preload
+# imports the app before forking its workers, and pooled SQLite connections must
+# not cross a fork.
+_read_engine = None
+_ReadSession = None
+_read_key = None
+_read_lock = threading.Lock()
+
+# The current request's shared read session (see begin_request_reads); per
+# thread, since gunicorn's gthread workers serve one request per thread.
+_request = threading.local()
+
+# The entity search index: an FTS5 virtual table that create_all() can't manage.
+# The trigram tokenizer keeps search an infix match (Finnish compounds: "tähti"
+# must find "Iltatähti"); case and diacritics are folded on the way in by
+# sqlstore._search_fold. Readiness is tracked per bound URI; without FTS5 (or on
+# a non-SQLite URL) search falls back to the LIKE scans.
+SEARCH_INDEX_TABLE = "dog_search"
+_SEARCH_INDEX_DDL = f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_INDEX_TABLE} USING fts5(text, tokenize='trigram')"
+_search_index_ready = {}
+
 
 def _make_engine(uri):
     connect_args = {}
@@ -66,12 +97,94 @@ def _make_engine(uri):
     return engine
 
 
+def read_pragmas():
+    """{pragma: value} every read-engine connection runs on connect, in order.
+
+    - query_only: the read engine can never write, even if a caller tries;
+    - mmap_size: memory-mapped I/O, so a page already in the OS cache costs no
+      read() call and no copy into SQLite's own cache;
+    - cache_size: SQLite's page cache (negative = KiB), the connection's share
+      of READ_CACHE_BUDGET_KIB; with mmap it mostly holds the pages past the
+      mapped range, so it can sit below SQLite's 2 MiB default;
+    - temp_store: sorter and temp b-trees (ORDER BY, DISTINCT) in memory;
+    - busy_timeout: a reader waits out a WAL checkpoint's brief exclusive lock."""
+    return {
+        "query_only": "ON",
+        "mmap_size": SQLITE_MMAP_BYTES,
+        "cache_size": -SQLITE_CACHE_KIB,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    }
+
+
+def _make_read_engine(path, pool_size=None):
+    # mode=ro opens the file read-only; WAL readers still map the -shm index.
+    engine = create_engine(
+        f"sqlite:///file:{pathname2url(path)}?mode=ro&uri=true",
+        future=True,
+        connect_args={"check_same_thread": False},
+        pool_size=max(1, int(pool_size or READ_POOL_SIZE)),
+        max_overflow=0,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _sqlite_read_pragmas(dbapi_conn, _record):
+        cursor = dbapi_conn.cursor()
+        for name, value in read_pragmas().items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+        # pysqlite only opens a transaction before DML, so a session's SELECTs
+        # would each run on their own snapshot. Take over BEGIN (below): every
+        # session transaction is one SQLite read transaction, one snapshot,
+        # ended by the rollback when the session closes.
+        dbapi_conn.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _sqlite_read_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+def _drop_read_engine():
+    global _read_engine, _ReadSession, _read_key
+    with _read_lock:
+        if _ReadSession is not None:
+            _ReadSession.remove()
+        if _read_engine is not None:
+            # A forked child must not close its parent's connections.
+            _read_engine.dispose(close=_read_key[1] == os.getpid())
+        _read_engine = _ReadSession = _read_key = None
+
+
+def get_read_engine():
+    """The read-only engine, or None when reads use the read-write engine: the
+    read engine is disabled (DOG_READ_ENGINE=0), the bound database is not a
+    SQLite file, or the file doesn't exist yet."""
+    global _read_engine, _ReadSession, _read_key
+    path = database_path()
+    key = (_current_uri, os.getpid())
+    if _read_key == key:
+        return _read_engine
+    if not READ_ENGINE or path is None or not os.path.exists(path):
+        return None
+    if _read_key is not None:
+        _drop_read_engine()
+    with _read_lock:
+        if _read_key != key:
+            _read_engine = _make_read_engine(path)
+            _ReadSession = scoped_session(sessionmaker(bind=_read_engine, future=True, expire_on_commit=False))
+            _read_key = key
+    return _read_engine
+
+
 def configure(uri=None):
     """(Re)bind the engine/session to a database URL. Idempotent per URL."""
     global _engine, _Session, _current_uri
     uri = uri or DOG_DATABASE_URI
     if _engine is not None and uri == _current_uri:
         return _engine
+    _drop_read_engine()
     if _Session is not None:
         _Session.remove()
     if _engine is not None:
@@ -95,12 +208,57 @@ def get_session():
     return _Session()
 
 
+def database_path():
+    """Filesystem path of the bound SQLite database, or None (in-memory or not
+    SQLite). Sidecar state shared by every process using the file lives next to it."""
+    if _Session is None:
+        configure()
+    url = make_url(_current_uri)
+    if url.get_backend_name() != "sqlite" or not url.database or url.database == ":memory:":
+        return None
+    return os.path.abspath(url.database)
+
+
+def search_index_ready():
+    """Whether the bound database has the FTS5 entity search index."""
+    return _search_index_ready.get(_current_uri, False)
+
+
+def _ensure_search_index():
+    """Create the search index table if missing. True when it was created now
+    (and so still needs its backfill)."""
+    engine = get_engine()
+    if engine.dialect.name != "sqlite":
+        _search_index_ready[_current_uri] = False
+        return False
+    try:
+        with engine.begin() as conn:
+            existed = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE name = :name"), {"name": SEARCH_INDEX_TABLE},
+            ).first() is not None
+            if not existed:
+                conn.execute(text(_SEARCH_INDEX_DDL))
+    except OperationalError:
+        logger.warning("dog_search_index_unavailable", uri=_current_uri, exc_info=True)
+        _search_index_ready[_current_uri] = False
+        return False
+    _search_index_ready[_current_uri] = True
+    return not existed
+
+
 def init_db(uri=None):
     """Create dog tables if missing. Safe to call repeatedly; never drops."""
     configure(uri)
     # Import models for their side effect of registering on Base.metadata.
     from . import models  # noqa: F401
     Base.metadata.create_all(get_engine())
+    if _ensure_search_index():
+        # First start with the index: backfill it from the existing rows. Later
+        # writes keep it current in the same transactions (see sqlstore).
+        from . import sqlstore
+        started = time.time()
+        rows = run_write(sqlstore.rebuild_search_index, op="search_index_rebuild")
+        logger.info("dog_search_index_built", rows=rows, duration_s=round(time.time() - started, 2))
     logger.info("dog_db_initialized", uri=_current_uri)
 
 
@@ -114,6 +272,7 @@ def session_scope():
     try:
         yield session
         session.commit()
+        _end_request_snapshot()
     except Exception:
         session.rollback()
         raise
@@ -121,10 +280,87 @@ def session_scope():
         _Session.remove()
 
 
+def begin_request_reads():
+    """Make this thread's read_scope calls share one session until
+    end_request_reads: one connection checkout and one read transaction (one WAL
+    snapshot) for the whole request instead of one per store helper. The session
+    is opened by the first read, so a request that reads nothing costs nothing."""
+    _request.active = True
+    _request.session = None
+
+
+def end_request_reads():
+    session = getattr(_request, "session", None)
+    _request.active = False
+    _request.session = None
+    if session is not None:
+        session.close()
+
+
+def _end_request_snapshot():
+    # A request that writes must read its own write: the next read starts a
+    # fresh read transaction.
+    session = getattr(_request, "session", None)
+    if session is not None:
+        session.rollback()
+
+
+def _request_read_session():
+    session = _request.session
+    if session is None:
+        if get_read_engine() is not None:
+            session = _ReadSession.session_factory()
+        else:
+            if _Session is None:
+                configure()
+            session = _Session.session_factory()
+        _request.session = session
+    return session
+
+
+@contextlib.contextmanager
+def read_scope():
+    """Session for reads: a read-only connection from the read engine (see
+    `read_pragmas`), or `session_scope`'s when there is none; inside a request,
+    the request's shared session. Never commits; writes go through run_write."""
+    if getattr(_request, "active", False):
+        session = _request_read_session()
+        try:
+            yield session
+        except Exception:
+            session.rollback()
+            raise
+        return
+    if get_read_engine() is None:
+        with session_scope() as session:
+            yield session
+        return
+    registry = _ReadSession
+    session = registry()
+    try:
+        yield session
+    finally:
+        registry.remove()
+
+
 def _is_locked_error(exc):
     return "database is locked" in str(exc).lower()
 
 
+def _begin_write(session, op):
+    """Start `session`'s transaction with BEGIN IMMEDIATE, so SQLite's write lock
+    is taken (or waited for, up to busy_timeout) here and not at whichever write
+    statement comes first, and record that wait as
+    dog_db_write_lock_wait_seconds. Other databases begin as usual."""
+    if session.get_bind().dialect.name != "sqlite":
+        return
+    started = time.perf_counter()
+    try:
+        session.execute(text("BEGIN IMMEDIATE"))
+    finally:
+        metrics.DB_WRITE_LOCK_WAIT_SECONDS.observe(time.perf_counter() - started, op=op)
+
+
 def run_write(work, op="dog_db_write"):
     """Run work(session) in a transaction, retrying on SQLite write contention.
 
@@ -134,16 +370,23 @@ def run_write(work, op="dog_db_write"):
     propagate immediately; persistent contention re-raises after the last attempt."""
     if _Session is None:
         configure()
+    started = time.perf_counter()
     for attempt in range(1, _WRITE_MAX_ATTEMPTS + 1):
         session = _Session()
         try:
+            _begin_write(session, op)
             result = work(session)
             session.commit()
+            _end_request_snapshot()
+            metrics.DB_WRITE_SECONDS.observe(time.perf_counter() - started, op=op)
+            for table, rows in session.info.get("rows_inserted", {}).items():
+                metrics.DB_ROWS_WRITTEN.inc(rows, table=table)
             return result
         except OperationalError as exc:
             session.rollback()
             if not _is_locked_error(exc) or attempt == _WRITE_MAX_ATTEMPTS:
                 raise
+            metrics.DB_WRITE_CONTENTION.inc(op=op)
             backoff = _WRITE_RETRY_BACKOFF * attempt
             logger.warning(
                 "dog_db_write_contention",
@@ -158,4 +401,5 @@ def run_write(work, op="dog_db_write"):
             session.rollback()
             raise
         finally:
+            session.info.pop("rows_inserted", None)
             _Session.remove()
@@ -0,0 +1,334 @@
+"""Server-Sent Events fan-out for live dog data.
+
+The /dog page used to learn about a new ring's results by polling the show list
+every 15s and re-downloading the whole show's /all-results. The event streams
+push the change instead:
+
+- `/api/dog/shows/<id>/events`: `breed` when the crawler captures (or re-sweeps)
+  a breed — carrying only that breed's rows, honor roll and breedObj, in the
+  /results shape — `stats` when the show's stored list stats are rewritten,
+  `finals` when the terminal award is confirmed (`_mark_terminal_confirmation`),
+  `status` when the cache status moves, and `reload` when the change can't be
+  expressed as breeds (a breed dropped by a rewrite, or a client too slow to
+  keep up) and the client should refetch /all-results once.
+- `/api/dog/shows/events`: `stats` for any show whose stored stats change, and
+  `list` when the crawler stores a new Showlink list.
+
+Each stream opens with `ready` (the state the deltas apply to).
+
+One `_EventHub` per web process watches dog.db for every stream it serves. Its
+poller thread reads SQLite's `PRAGMA data_version` on a dedicated connection —
+a counter that moves whenever another connection (the crawler) commits — every
+SSE_POLL_SECONDS, and only when it moved runs one stamp query for the watched
+shows (sqlstore.read_show_event_stamps). A moved doc stamp costs one header read
+(each completed breed's capture time decides which breeds changed) plus one
+slice read per changed breed, once per process however many viewers watch the
+show. Nothing here reconstructs a whole-show doc.
+"""
+
+import json
+import queue
+import threading
+import time
+
+import structlog
+
+from . import config
+from . import db as dog_db
+from . import sqlstore
+
+logger = structlog.get_logger(__name__)
+
+SSE_POLL_SECONDS = config.SSE_POLL_SECONDS
+SSE_HEARTBEAT_SECONDS = config.SSE_HEARTBEAT_SECONDS
+SSE_STREAM_SECONDS = config.SSE_STREAM_SECONDS
+SSE_MAX_STREAMS = config.SSE_MAX_STREAMS
+SSE_RETRY_MS = 3000
+# Events buffered per subscriber before it is cut off with a `reload`.
+_SUBSCRIBER_QUEUE_SIZE = 256
+
+LIST_TOPIC = "list"
+
+
+class _Subscriber:
+    def __init__(self, topic, ready):
+        self.topic = topic
+        self.ready = ready
+        self.queue = queue.Queue(maxsize=_SUBSCRIBER_QUEUE_SIZE)
+        self.overflowed = False
+
+
+def _sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, separators=(',', ':'))}\n\n"
+
+
+def _breed_times(meta):
+    return {
+        key: (entry or {}).get("updated_at")
+        for key, entry in ((meta or {}).get("completed_breeds") or {}).items()
+    }
+
+
+class _EventHub:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = {}
+        # Per watched topic, the state the last delivered events left it in:
+        # show id -> {"stamp", "status", "terminal_confirmed", "breeds"}; LIST_TOPIC
+        # -> {"stats_at", "list_version"}.
+        self._state = {}
+        self._thread = None
+        self._conn = None
+        self._conn_uri = None
+        self._data_version = None
+        self.counters = {"polls": 0, "events": 0, "dropped": 0}
+
+    # -- subscriptions -----------------------------------------------------
+
+    def subscribe(self, topic):
+        """A new subscriber to a show id or LIST_TOPIC, or None at capacity."""
+        with self._lock:
+            if sum(len(subs) for subs in self._subscribers.values()) >= SSE_MAX_STREAMS:
+                return None
+            known = self._state.get(topic)
+        if known is None:
+            known = self._baseline(topic)
+        subscriber = _Subscriber(topic, self._ready_payload(topic, known))
+        with self._lock:
+            self._state.setdefault(topic, known)
+            self._subscribers.setdefault(topic, set()).add(subscriber)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="dog-events", daemon=True)
+                self._thread.start()
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            subs = self._subscribers.get(subscriber.topic)
+            if subs is not None:
+                subs.discard(subscriber)
+                if not subs:
+                    self._subscribers.pop(subscriber.topic, None)
+                    self._state.pop(subscriber.topic, None)
+
+    def stream_count(self):
+        with self._lock:
+            return sum(len(subs) for subs in self._subscribers.values())
+
+    # -- state -------------------------------------------------------------
+
+    def _baseline(self, topic):
+        with dog_db.read_scope() as session:
+            if topic == LIST_TOPIC:
+                rows = sqlstore.read_show_stats_rows(session, 0)
+                stamp = sqlstore.read_show_list_version(session)
+                return {
+                    "stats_at": max([row[2] or 0 for row in rows] or [0]),
+                    "list_version": stamp["version"] if stamp else None,
+                }
+            stamp = sqlstore.read_show_event_stamps(session, [topic]).get(topic, (None,) * 4)
+            header = sqlstore.read_result_doc_header(session, topic) or {}
+        meta = header.get("meta") or {}
+        return {
+            "stamp": stamp,
+            "status": header.get("status"),
+            "terminal_confirmed": bool(meta.get("terminal_confirmed")),
+            "breeds": _breed_times(meta),
+        }
+
+    @staticmethod
+    def _ready_payload(topic, state):
+        if topic == LIST_TOPIC:
+            return {"list_version": state["list_version"]}
+        return {
+            "show_id": topic,
+            "status": state["status"],
+            "terminal_confirmed": state["terminal_confirmed"],
+            "completed_breeds": len(state["breeds"]),
+        }
+
+    def _db_changed(self):
+        """Whether dog.db may have changed since the last poll. Always True when
+        the change counter can't be read (the poll then just runs)."""
+        try:
+            if self._conn is None or self._conn_uri != dog_db._current_uri:
+                if self._conn is not None:
+                    self._conn.close()
+                self._conn = dog_db.get_engine().connect()
+                self._conn_uri = dog_db._current_uri
+                self._data_version = None
+            if self._conn.dialect.name != "sqlite":
+                return True
+            version = self._conn.exec_driver_sql("PRAGMA data_version").scalar()
+            self._conn.rollback()
+        except Exception:
+            logger.warning("dog_events_change_counter_failed", exc_info=True)
+            self._conn = None
+            return True
+        changed = version != self._data_version
+        self._data_version = version
+        return changed
+
+    # -- polling -----------------------------------------------------------
+
+    def poll_once(self):
+        """Check dog.db once and deliver the events for every watched topic."""
+        with self._lock:
+            watched = dict(self._state)
+        if not watched or not self._db_changed():
+            return 0
+        self.counters["polls"] += 1
+
+        events = []
+        updates = {}
+        with dog_db.read_scope() as session:
+            show_ids = [topic for topic in watched if topic != LIST_TOPIC]
+            stamps = sqlstore.read_show_event_stamps(session, show_ids) if show_ids else {}
+            for sid in show_ids:
+                stamp = stamps.get(sid, (None,) * 4)
+                if stamp != watched[sid]["stamp"]:
+                    state, show_events = self._show_changes(session, sid, watched[sid], stamp)
+                    updates[sid] = state
+                    events.extend((sid, event) for event in show_events)
+            if LIST_TOPIC in watched:
+                state, list_events = self._list_changes(session, watched[LIST_TOPIC])
+                updates[LIST_TOPIC] = state
+                events.extend((LIST_TOPIC, event) for event in list_events)
+
+        with self._lock:
+            for topic, state in updates.items():
+                if topic in self._state:
+                    self._state[topic] = state
+            for topic, event in events:
+                for subscriber in self._subscribers.get(topic, ()):
+                    self._deliver(subscriber, event)
+        return len(events)
+
+    def _deliver(self, subscriber, event):
+        if subscriber.overflowed:
+            return
+        try:
+            subscriber.queue.put_nowait(event)
+            self.counters["events"] += 1
+        except queue.Full:
+            subscriber.overflowed = True
+            self.counters["dropped"] += 1
+
+    def _show_changes(self, session, sid, previous, stamp):
+        events = []
+        state = dict(previous, stamp=stamp)
+        if stamp[:3] != previous["stamp"][:3]:
+            header = sqlstore.read_result_doc_header(session, sid) or {}
+            meta = header.get("meta") or {}
+            breeds = _breed_times(meta)
+            state.update(
+                status=header.get("status"),
+                terminal_confirmed=bool(meta.get("terminal_confirmed")),
+                breeds=breeds,
+            )
+            if set(previous["breeds"]) - set(breeds):
+                events.append(("reload", {"show_id": sid}))
+            else:
+                for key, updated_at in breeds.items():
+                    if key in previous["breeds"] and previous["breeds"][key] == updated_at:
+                        continue
+                    group, _, breed_id = key.partition(":")
+                    slice_ = sqlstore.read_breed_result_slice(session, sid, group, breed_id)
+                    if slice_ is None:
+                        continue
+                    events.append(("breed", {
+                        "show_id": sid,
+                        "group": group,
+                        "breed_id": breed_id,
+                        "updated_at": updated_at,
+                        "breed": slice_["breed"],
+                        "awards": slice_["awards"],
+                        "results": slice_["results"],
+                    }))
+            if state["status"] != previous["status"]:
+                events.append(("status", {"show_id": sid, "status": state["status"]}))
+            if state["terminal_confirmed"] and not previous["terminal_confirmed"]:
+                events.append(("finals", {"show_id": sid, "terminal_confirmed": True, "status": state["status"]}))
+        if stamp[3] != previous["stamp"][3] and stamp[3] is not None:
+            for _, stats, _ in sqlstore.read_show_stats_rows(session, previous["stamp"][3] or 0, [sid])[-1:]:
+                events.append(("stats", {"show_id": sid, "stats": stats}))
+        return state, events
+
+    @staticmethod
+    def _list_changes(session, previous):
+        events = []
+        state = dict(previous)
+        for sid, stats, computed_at in sqlstore.read_show_stats_rows(session, previous["stats_at"]):
+            events.append(("stats", {"show_id": sid, "stats": stats}))
+            state["stats_at"] = max(state["stats_at"], computed_at or 0)
+        stamp = sqlstore.read_show_list_version(session)
+        version = stamp["version"] if stamp else None
+        if version != previous["list_version"]:
+            state["list_version"] = version
+            events.append(("list", {"list_version": version}))
+        return state, events
+
+    def _run(self):
+        while True:
+            time.sleep(SSE_POLL_SECONDS)
+            with self._lock:
+                if not self._subscribers:
+                    self._thread = None
+                    return
+            try:
+                self.poll_once()
+            except Exception:
+                logger.exception("dog_events_poll_failed")
+
+
+_hub = _EventHub()
+
+
+class _EventStream:
+    """The SSE body of one subscriber. `close()` (called by the WSGI server when
+    the response ends) releases the subscription even when the body was never
+    iterated, which a generator's `finally` alone would not."""
+
+    def __init__(self, subscriber, events):
+        self._subscriber = subscriber
+        self._events = events
+
+    def __iter__(self):
+        return self._events
+
+    def close(self):
+        self._events.close()
+        _hub.unsubscribe(self._subscriber)
+
+
+def _event_stream(topic):
+    """An iterable of SSE text for one subscriber of `topic`, or None when this
+    worker is already serving SSE_MAX_STREAMS streams."""
+    try:
+        subscriber = _hub.subscribe(topic)
+    except Exception:
+        logger.exception("dog_events_subscribe_failed", topic=topic)
+        return None
+    if subscriber is None:
+        logger.warning("dog_events_capacity_reached", topic=topic, streams=SSE_MAX_STREAMS)
+        return None
+
+    def _stream():
+        try:
+            yield f"retry: {SSE_RETRY_MS}\n\n"
+            yield _sse("ready", subscriber.ready)
+            deadline = time.monotonic() + SSE_STREAM_SECONDS
+            while time.monotonic() < deadline:
+                try:
+                    event, data = subscriber.queue.get(timeout=SSE_HEARTBEAT_SECONDS)
+                except queue.Empty:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield _sse(event, data)
+                if subscriber.overflowed and subscriber.queue.empty():
+                    yield _sse("reload", {"show_id": topic} if topic != LIST_TOPIC else {})
+                    return
+        finally:
+            _hub.unsubscribe(subscriber)
+
+    return _EventStream(subscriber, _stream())
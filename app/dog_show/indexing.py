@@ -4,15 +4,20 @@ import time
 
 import structlog
 
-from .config import SHOW_DETAIL_TTL, FINNISH_MONTHS, SHOW_STATS_CACHE_TTL
+from .config import (
+    FINNISH_MONTHS, RESULT_PAUSE_EVENING_HOUR, RESULT_PAUSE_STALL_SECONDS,
+    RESULT_SHOW_EVENING_HOUR, RESULT_SHOW_MORNING_HOUR, SHOW_DETAIL_TTL, SHOW_STATS_CACHE_TTL,
+)
 from .store import (
     _indexed_show, _indexed_show_meta, _indexed_shows, _load_result_cache_doc,
-    _show_list_cache, _write_index_show,
+    _load_show_stats, _save_show_stats, _show_list_cache, _show_stats_version,
+    _write_index_show,
 )
 from .showlink import _source_url
+from .single_flight import _single_flight
 from .utils import (
     _clean_breed_data, _clean_breed_list, _clean_judge_name,
-    _parse_show_date,
+    _next_local_hour_at, _parse_show_date,
     _result_doc_last_result_at, _result_live_plan, _show_age_days,
     _show_date_state, _show_is_recent, _show_live_phase, _show_result_availability, _utc_iso,
 )
@@ -210,13 +215,78 @@ def _compute_show_stats(show_id, indexed_show, show=None, today=None):
             stats["result_count"] = result_count
     return stats
 
-# Per-show stats cache. `/api/dog/shows` is polled every 15s by every open /dog
-# client whenever a live show is present, and computing a live show's stats
-# reconstructs its whole-show result doc (thousands of rows) from SQLite. Caching
-# the computed stats briefly decouples that cost from the poll rate. Bypassed when
-# an explicit `today` is passed (tests), and cleared per-test in the suite.
+# Local hours at which a show's list stats can change with the clock alone: the
+# date flip, the fetch window's morning/evening edges, and the evening floor of
+# the stall-based pause.
+_STATS_PHASE_HOURS = (0, RESULT_SHOW_MORNING_HOUR, RESULT_PAUSE_EVENING_HOUR, RESULT_SHOW_EVENING_HOUR)
+
+def _show_stats_valid_until(show_id, show_item, now):
+    """When a show's stats computed at `now` may next change without any data
+    write, or None for a past show (its stats only move with its data)."""
+    state = _show_date_state(show_item, today=datetime.date.fromtimestamp(now))
+    if state == "past":
+        return None
+    boundaries = [
+        _next_local_hour_at(_STATS_PHASE_HOURS, now),
+        # _show_date_state reads the process-local date, which may flip apart
+        # from the Finnish one.
+        datetime.datetime.combine(
+            datetime.date.fromtimestamp(now) + datetime.timedelta(days=1), datetime.time(),
+        ).timestamp(),
+    ]
+    if state == "live":
+        last_result_at = _result_doc_last_result_at(_load_result_cache_doc(show_id))
+        if last_result_at is not None and last_result_at + RESULT_PAUSE_STALL_SECONDS > now:
+            boundaries.append(last_result_at + RESULT_PAUSE_STALL_SECONDS)
+    return min(boundary for boundary in boundaries if boundary is not None)
+
+def _refresh_show_stats(show_ids):
+    """Crawler side: recompute and store the list stats of `show_ids`
+    (dog_show_stats). Called after the crawler's index and result writes and by
+    its due sweep. Returns the number of shows written."""
+    written = 0
+    for show_id in show_ids:
+        try:
+            # Version first: a write racing the computation leaves the row
+            # stamped older than the data, so it is recomputed, never trusted.
+            version = _show_stats_version(show_id)
+            if version is None:
+                continue
+            now = time.time()
+            indexed_show = _indexed_show(show_id)
+            show_item = _show_item_for_stats(
+                show_id, show=_show_list_item_for_id(show_id), indexed_show=indexed_show,
+            )
+            stats = _compute_show_stats(show_id, indexed_show, show=show_item)
+            _save_show_stats(show_id, version, stats, _show_stats_valid_until(show_id, show_item, now))
+            written += 1
+        except Exception:
+            logger.exception("dog_show_stats_refresh_failed", show_id=show_id)
+    return written
+
+# Per-show fallback stats cache. The crawler keeps dog_show_stats current, so
+# requests normally read stored rows; a show whose row is missing or stale (a
+# write the crawler hasn't swept yet, a phase hour it hasn't reached) is
+# computed per request, which for a live show reconstructs its whole-show result
+# doc. Caching those computations briefly decouples that cost from the 15s poll
+# rate. Bypassed when an explicit `today` is passed (tests), and cleared
+# per-test in the suite.
 _show_stats_cache = {}
 
+def _computed_show_stats(key, show=None, indexed_show=None):
+    now = time.time()
+    cached = _show_stats_cache.get(key)
+    if cached and (now - cached["ts"]) < SHOW_STATS_CACHE_TTL:
+        return cached["stats"]
+
+    # Concurrent misses for the same show (the list and detail polls of a busy
+    # live show) share one computation.
+    stats = _single_flight("show_stats", key, lambda: _compute_show_stats(
+        key, indexed_show if indexed_show is not None else _indexed_show(key), show=show,
+    ))
+    _show_stats_cache[key] = {"stats": stats, "ts": now}
+    return stats
+
 def _show_stats_from_index(show_id, show=None, today=None, indexed_show=None):
     if today is not None:
         return _compute_show_stats(
@@ -228,24 +298,20 @@ def _show_stats_from_index(show_id, show=None, today=None, indexed_show=None):
     except (TypeError, ValueError):
         return None
 
-    now = time.time()
-    cached = _show_stats_cache.get(key)
-    if cached and (now - cached["ts"]) < SHOW_STATS_CACHE_TTL:
-        return cached["stats"]
-
-    stats = _compute_show_stats(
-        show_id, indexed_show if indexed_show is not None else _indexed_show(show_id), show=show,
-    )
-    _show_stats_cache[key] = {"stats": stats, "ts": now}
-    return stats
+    stored = _load_show_stats([key])
+    if key in stored:
+        return stored[key]
+    return _computed_show_stats(key, show=show, indexed_show=indexed_show)
 
 def _shows_with_cached_stats(shows):
-    # Bulk-load the index entries the stats cache doesn't already cover, so a
-    # 15s list poll costs two queries instead of one per show.
+    # One read of the crawler-maintained stats for the whole list; only shows
+    # without a current row fall back to computing (their index entries
+    # bulk-loaded, unless the fallback cache already covers them).
     now = time.time()
+    stored = _load_show_stats([show.get("id") for show in shows], now=now)
     uncached_ids = [
         show.get("id") for show in shows
-        if not (
+        if show.get("id") not in stored and not (
             (cached := _show_stats_cache.get(show.get("id")))
             and (now - cached["ts"]) < SHOW_STATS_CACHE_TTL
         )
@@ -255,10 +321,16 @@ def _shows_with_cached_stats(shows):
     enriched = []
     for show in shows:
         item = dict(show)
-        stats = _show_stats_from_index(
-            show.get("id"), show=show,
-            indexed_show=indexed.get(str(show.get("id"))),
-        )
+        sid = show.get("id")
+        if sid in stored:
+            stats = stored[sid]
+        else:
+            try:
+                stats = _computed_show_stats(
+                    int(sid), show=show, indexed_show=indexed.get(str(sid)),
+                )
+            except (TypeError, ValueError):
+                stats = None
         if stats:
             item["stats"] = stats
         enriched.append(item)
@@ -413,6 +485,7 @@ def _persist_show_detail_to_index(show_id, detail, updated_at):
         updated_at,
     )
     _write_index_show(show_id, entry)
+    _refresh_show_stats([show_id])
 
 def _index_entry_from_detail(show_id, show, detail, updated_at):
     entry = {
@@ -0,0 +1,266 @@
+"""Prometheus metrics for the crawler process, in the text exposition format.
+
+scripts/dog_crawl.py used to report only through structlog events, so every
+crawler panel and alert had to be a Loki query over its log lines. The crawl
+now also keeps a few counters, gauges and histograms here, updated where the
+work happens:
+
+- `dog_showlink_fetch_seconds{page,status}`: each Showlink request, from send
+  to response (status `error` when no response came back), and the seconds
+  spent waiting for a host-budget slot first (showlink._get);
+- `dog_parse_seconds{page}`: building a fetched page's soup
+  (showlink._fetch_page) and, for the result crawl's breed pages, the whole
+  parse, in the parse pool or inline (result_cache._record_breed_item);
+- `dog_db_write_seconds{op}`, `dog_db_write_lock_wait_seconds{op}`,
+  `dog_db_write_contention_total{op}` and `dog_db_rows_written_total{table}`:
+  each run_write transaction, including time blocked on SQLite's write lock and
+  retries; each attempt's wait for that lock alone (its BEGIN IMMEDIATE); its
+  `dog_db_write_contention` retries; and the rows its bulk inserts committed
+  (db.run_write);
+- `dog_result_jobs{state}`, `dog_crawler_pass_seconds` and
+  `dog_crawler_last_pass_timestamp_seconds`: queue depth, pass duration and
+  the last finished pass (scripts/dog_crawl.py);
+- `dog_result_capture_lag_seconds`: how long a breed's results waited for
+  capture (result_cache._record_result_breed_success). There is no per-show
+  series: show ids are unbounded, and a crawler process lives for months.
+
+Showlink publishes no judging time, so a capture's lag is measured from the
+previous fetch of the breed's page that still had no results — an upper bound
+on the time since judging, off by at most the probe interval. Breeds whose
+first fetch already had results are not observed.
+
+No prometheus_client: the process needs a handful of metrics, one exporter and
+no extra dependency in a 256 MB container. `_serve_metrics` answers
+GET /metrics from a daemon thread (DOG_METRICS_PORT) and
+`_write_metrics_textfile` replaces a .prom file for node_exporter's textfile
+collector (DOG_METRICS_TEXTFILE). Updates take a per-metric lock; nothing here
+touches the network or dog.db, so metrics stay cheap wherever they are kept.
+"""
+
+import math
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_registry = []
+
+
+def _format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(names, values, extra=()):
+    pairs = [*zip(names, values), *extra]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in pairs) + "}"
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+        self._series = {}
+        if not self.labels:
+            # An unlabelled metric is exposed from the start, at zero.
+            self._series[()] = self._empty()
+        _registry.append(self)
+
+    def _empty(self):
+        return 0.0
+
+    def _key(self, labels):
+        if len(labels) != len(self.labels) or any(name not in labels for name in self.labels):
+            raise ValueError(f"{self.name} takes labels {self.labels}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labels)
+
+    def _samples(self):
+        with self._lock:
+            series = sorted(self._series.items())
+        for values, value in series:
+            yield f"{self.name}{_label_text(self.labels, values)} {_format_value(value)}"
+
+    def _clear(self):
+        with self._lock:
+            self._series = {(): self._empty()} if not self.labels else {}
+
+
+class _Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        if amount < 0:
+            raise ValueError("counters only go up")
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0.0) + amount
+
+
+class _Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = float(value)
+
+
+class _Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labels=(), buckets=()):
+        self.buckets = tuple(sorted(float(bound) for bound in buckets))
+        super().__init__(name, documentation, labels)
+
+    def _empty(self):
+        # Per-bucket (not yet cumulative) counts, with +Inf last; then sum, count.
+        return [[0] * (len(self.buckets) + 1), 0.0, 0]
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = len(self.buckets)
+        for position, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = position
+                break
+        with self._lock:
+            state = self._series.get(key)
+            if state is None:
+                state = self._series[key] = self._empty()
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def _samples(self):
+        with self._lock:
+            series = sorted((values, (list(state[0]), state[1], state[2])) for values, state in self._series.items())
+        for values, (counts, total, count) in series:
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, math.inf), counts):
+                cumulative += bucket_count
+                le = (("le", _format_value(bound)),)
+                yield f"{self.name}_bucket{_label_text(self.labels, values, le)} {cumulative}"
+            yield f"{self.name}_sum{_label_text(self.labels, values)} {_format_value(total)}"
+            yield f"{self.name}_count{_label_text(self.labels, values)} {count}"
+
+
+SHOWLINK_FETCH_SECONDS = _Histogram(
+    "dog_showlink_fetch_seconds", "Showlink request time, send to response, by page kind and HTTP status.",
+    labels=("page", "status"), buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+SHOWLINK_BUDGET_WAIT_SECONDS = _Counter(
+    "dog_showlink_budget_wait_seconds_total", "Seconds Showlink requests waited for a host-budget slot.",
+)
+PARSE_SECONDS = _Histogram(
+    "dog_parse_seconds", "Time parsing a fetched Showlink page, by page kind.",
+    labels=("page",), buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+DB_WRITE_SECONDS = _Histogram(
+    "dog_db_write_seconds", "dog.db write transactions, including write-lock waits and contention retries, by op.",
+    labels=("op",), buckets=(0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+DB_WRITE_LOCK_WAIT_SECONDS = _Histogram(
+    "dog_db_write_lock_wait_seconds", "Time a dog.db write attempt waited for SQLite's write lock, by op.",
+    labels=("op",), buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+DB_WRITE_CONTENTION = _Counter(
+    "dog_db_write_contention_total", "dog.db write transactions retried on SQLite write-lock contention, by op.",
+    labels=("op",),
+)
+DB_ROWS_WRITTEN = _Counter(
+    "dog_db_rows_written_total", "Rows committed to dog.db by bulk inserts, by table.",
+    labels=("table",),
+)
+RESULT_JOBS = _Gauge(
+    "dog_result_jobs", "Result cache jobs by state (queued and due, deferred, running), after each crawler pass.",
+    labels=("state",),
+)
+CRAWLER_PASS_SECONDS = _Histogram(
+    "dog_crawler_pass_seconds", "Crawler pass duration.",
+    buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1800),
+)
+CRAWLER_LAST_PASS = _Gauge(
+    "dog_crawler_last_pass_timestamp_seconds", "Unix time the last crawler pass finished.",
+)
+RESULT_CAPTURE_LAG_SECONDS = _Histogram(
+    "dog_result_capture_lag_seconds",
+    "Seconds from the last fetch of a breed page without results to the capture of its results.",
+    buckets=(30, 60, 120, 300, 600, 900, 1800, 3600, 7200),
+)
+
+
+def _render_metrics():
+    """Every metric in the Prometheus text exposition format (0.0.4)."""
+    lines = []
+    for metric in _registry:
+        documentation = metric.documentation.replace("\\", "\\\\").replace("\n", "\\n")
+        lines.append(f"# HELP {metric.name} {documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        lines.extend(metric._samples())
+    return "\n".join(lines) + "\n"
+
+
+def _reset_metrics():
+    """Zero every metric (tests)."""
+    for metric in _registry:
+        metric._clear()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if urlsplit(self.path).path != "/metrics":
+            self.send_error(404)
+            return
+        body = _render_metrics().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # noqa: A002 - BaseHTTPRequestHandler's signature
+        pass
+
+
+def _serve_metrics(port, host="127.0.0.1"):
+    """Serve GET /metrics on host:port from a daemon thread; returns the server
+    (`server_address` has the bound port when `port` is 0)."""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="dog-metrics", daemon=True).start()
+    logger.info("dog_metrics_serving", host=host, port=server.server_address[1])
+    return server
+
+
+def _write_metrics_textfile(path):
+    """Replace `path` with the current metrics, atomically (node_exporter's
+    textfile collector may read it at any moment). Failures are logged, never
+    raised."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as fh:
+            fh.write(_render_metrics())
+        os.replace(tmp, path)
+    except OSError as exc:
+        logger.warning("dog_metrics_textfile_failed", path=path, error=str(exc))
@@ -7,14 +7,22 @@
   show (doc metadata + completed/failed breeds + live-tracking fields as a JSON
   blob) plus normalized result rows (one per dog result — the part that scales
   to 100k+ rows and powers cross-dog/judge queries).
+- `DogResultPayload`: the pre-serialized, pre-compressed /all-results body of
+  a complete show, written by the crawler after each save (see payload.py).
+- `DogShowStats`: the per-show list stats (counts, live/paused state, result
+  progress), computed by the crawler whenever their inputs change.
 - `DogResultJob`: the durable crawler job queue.
+- `DogFetchState`: per-URL HTTP validators and body hash of the last captured
+  Showlink page, for conditional re-fetches.
+- `DogChange`: the append-only change log the index/result writers add to in
+  the same transaction as their writes.
 
 Column names avoid SQL reserved words (`fci_group` not `group`); the store layer
 maps these back to the dict keys the rest of the package expects.
 """
 
 from sqlalchemy import (
-    Boolean, Column, Float, ForeignKey, Index, Integer, Text,
+    Boolean, Column, Float, ForeignKey, Index, Integer, LargeBinary, Text,
 )
 
 from .db import Base
@@ -134,6 +142,68 @@ class DogResultCache(Base):
     meta = Column(Text)
 
 
+class DogResultTombstone(Base):
+    """Where a breed's earlier result rows were dropped from a show's sequence.
+
+    `dog_result.seq` only grows within a show: an appended or replaced breed gets
+    seqs above every seq handed out before (rows and tombstones alike), so a
+    client holding everything up to a cursor needs just the rows above it plus
+    the breeds tombstoned above it (the /all-results?since= delta). One row per
+    breed, moved up on every replacement."""
+
+    __tablename__ = "dog_result_tombstone"
+
+    show_id = Column(Integer, primary_key=True)
+    fci_group = Column(Text, primary_key=True, default="")
+    breed_id = Column(Text, primary_key=True, default="")
+    seq = Column(Integer, nullable=False)    # the replacement's first seq
+    dropped_at = Column(Float)
+
+
+class DogResultPayload(Base):
+    """A complete show's /all-results response, serialized and compressed once
+    per crawler save instead of once per viewer.
+
+    The stamp columns copy the result-doc version (sqlstore.read_result_doc_version)
+    the body was built from; the web tier serves the row only while they still
+    match, so any later doc write or re-index simply retires it."""
+
+    __tablename__ = "dog_result_payload"
+
+    show_id = Column(Integer, primary_key=True)
+    doc_updated_at = Column(Float)
+    doc_cached_at = Column(Float)
+    doc_status = Column(Text)
+    show_updated_at = Column(Float)
+    change_id = Column(Integer)              # the show's newest dog_change id
+    result_count = Column(Integer, default=0, nullable=False)
+    cache_block = Column(Text)               # the response's "cache" object (JSON), as fresh
+    body = Column(LargeBinary, nullable=False)  # raw DEFLATE of the JSON body minus its closing brace
+    body_crc = Column(Integer, nullable=False)  # CRC32 of the uncompressed body bytes
+    body_size = Column(Integer, nullable=False)
+    created_at = Column(Float)
+
+
+class DogShowStats(Base):
+    """A show's /api/dog/shows row stats, precomputed by the crawler.
+
+    Stamped like DogResultPayload with the index row and result-cache header
+    versions read before computing; readers ignore a row whose stamp moved or
+    whose `valid_until` (the next clock-driven change: a phase hour, a stall
+    deadline, a date flip) has passed, and the crawler's due sweep rewrites it."""
+
+    __tablename__ = "dog_show_stats"
+
+    show_id = Column(Integer, ForeignKey("dog_show.id", ondelete="CASCADE"), primary_key=True)
+    stats = Column(Text)                     # JSON object, or null: the show has no stats
+    show_updated_at = Column(Float)
+    doc_updated_at = Column(Float)
+    doc_cached_at = Column(Float)
+    doc_status = Column(Text)
+    valid_until = Column(Float, index=True)  # NULL: nothing clock-driven ahead
+    computed_at = Column(Float)
+
+
 class DogResultJob(Base):
     __tablename__ = "dog_result_job"
 
@@ -149,6 +219,47 @@ class DogResultJob(Base):
     last_error = Column(Text)
 
 
+class DogFetchState(Base):
+    """What the crawler last captured from one Showlink URL: the response's
+    validators (sent back as If-None-Match / If-Modified-Since) and a SHA-1 of
+    the body. Written only once the capture itself is persisted, so a matching
+    hash always means "already stored"."""
+
+    __tablename__ = "dog_fetch_state"
+
+    url = Column(Text, primary_key=True)
+    etag = Column(Text)
+    last_modified = Column(Text)
+    body_hash = Column(Text)
+    fetched_at = Column(Float)   # last time the page was fetched or revalidated
+    changed_at = Column(Float)   # last time its body differed
+
+
+class DogChange(Base):
+    """One entry of the append-only change log: which show (and breed, when the
+    write was breed-scoped) a writer touched, and how.
+
+    Written by the sqlstore writers in the same transaction as the rows they
+    describe, so a consumer that remembers the last id it processed sees every
+    later change exactly once, in commit order. AUTOINCREMENT keeps ids from
+    being reused after old entries are pruned."""
+
+    __tablename__ = "dog_change"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    show_id = Column(Integer, nullable=False)
+    fci_group = Column(Text)     # None for show-wide changes
+    breed_id = Column(Text)
+    kind = Column(Text, nullable=False)  # sqlstore.CHANGE_KINDS
+    created_at = Column(Float, nullable=False)
+
+    __table_args__ = (
+        Index("ix_change_show", "show_id", "id"),
+        Index("ix_change_created", "created_at"),
+        {"sqlite_autoincrement": True},
+    )
+
+
 class DogMeta(Base):
     __tablename__ = "dog_meta"
 
@@ -0,0 +1,106 @@
+"""Process pool for the result crawl's parse stage.
+
+Parsing a breed page is pure-Python, CPU-bound BeautifulSoup work. Done in the
+result crawl's fetch threads it serializes on the GIL, so the threads meant to
+keep RESULT_CRAWL_DEFAULT_WORKERS requests in flight mostly wait for each other
+to finish parsing. With RESULT_PARSE_PROCESSES > 0 the crawl is a pipeline
+instead (result_cache._crawl_missing_breed_results): fetch threads only fetch,
+the raw HTML goes to this pool for `_parse_breed_results`, and the crawl's own
+thread records the parsed breeds (the writer).
+
+One pool per crawler process, created on first use and shared by every show
+crawled at once. Workers come from a forkserver, never forked from the
+multi-threaded crawler itself. The forkserver preloads `dog_parse_worker`
+(next to `app`), which imports this module without running app/__init__.py, so
+neither it nor the workers build the Flask app or open site.db and dog.db. When the pool can't be
+used — disabled, failed to start, or a worker died — the page is parsed in the
+calling thread, so a broken pool slows the crawl but never fails a breed.
+"""
+
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import structlog
+
+from . import config
+from .parsers import _parse_breed_results
+from .showlink import _page_soup
+
+logger = structlog.get_logger(__name__)
+
+_WORKER_PRELOAD = "dog_parse_worker"
+
+RESULT_PARSE_PROCESSES = config.RESULT_PARSE_PROCESSES
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _timed_parse_breed_page(html, show_id):
+    """(parsed breed page, seconds spent parsing it); runs in the pool."""
+    started = time.perf_counter()
+    breed_data = _parse_breed_results(_page_soup(html, "breed"), show_id)
+    return breed_data, time.perf_counter() - started
+
+
+def _parse_pool():
+    """The shared parse pool, or None when RESULT_PARSE_PROCESSES is 0."""
+    global _pool
+    if RESULT_PARSE_PROCESSES <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            try:
+                context = multiprocessing.get_context("forkserver")
+                context.set_forkserver_preload([_WORKER_PRELOAD])
+            except ValueError:  # pragma: no cover - no forkserver on this platform
+                context = multiprocessing.get_context("spawn")
+            _pool = ProcessPoolExecutor(max_workers=RESULT_PARSE_PROCESSES, mp_context=context)
+        return _pool
+
+
+def _reset_parse_pool(pool):
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _parse_inline(html, show_id):
+    future = Future()
+    try:
+        future.set_result(_timed_parse_breed_page(html, show_id))
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
+def _submit_breed_parse(html, show_id):
+    """A Future of (breed_data, parse_s) for one fetched breed page."""
+    pool = _parse_pool()
+    if pool is not None:
+        try:
+            future = pool.submit(_timed_parse_breed_page, html, show_id)
+            future.dog_parse_pool = pool
+            return future
+        except (BrokenProcessPool, RuntimeError):
+            logger.warning("dog_parse_pool_unavailable", exc_info=True)
+            _reset_parse_pool(pool)
+    return _parse_inline(html, show_id)
+
+
+def _breed_parse_result(future, html, show_id):
+    """The (breed_data, parse_s) of a `_submit_breed_parse` future; re-parses in
+    this thread when the pool broke under it."""
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        logger.warning("dog_parse_pool_broken", show_id=show_id, exc_info=True)
+        pool = getattr(future, "dog_parse_pool", None)
+        if pool is not None:
+            _reset_parse_pool(pool)
+        return _timed_parse_breed_page(html, show_id)
@@ -1,5 +1,4 @@
 import re
-import time
 
 import structlog
 
@@ -139,8 +138,9 @@ def _breed_list_targets_from_soup(soup, show_id):
         unique_targets.append(target)
     return unique_targets
 
-def _parse_show_detail(soup, show_id):
-    """Parse the show detail page: title and breed list."""
+def _parse_show_detail(soup, show_id, fetch_page=None):
+    """Parse the show detail page: title and breed list. Linked group pages are
+    fetched with `fetch_page(url, page=...)` (Showlink by default)."""
     title_el = soup.select_one("#divOtsikko h1")
     title = title_el.get_text(strip=True) if title_el else ""
 
@@ -156,9 +156,8 @@ def _parse_show_detail(soup, show_id):
             for target in breed_list_targets:
                 url = f"{BASE_URL}?Id={show_id}&R={target}"
                 try:
-                    # Sleep 0.5s to be polite during nested crawls
-                    time.sleep(0.5)
-                    group_soup = _fetch_page(url)
+                    # Paced by the Showlink host budget (showlink._HostBudget).
+                    group_soup = (fetch_page or _fetch_page)(url, page="detail")
                     group_breeds = _parse_breeds_from_soup(group_soup, show_id)
                     breeds.extend(group_breeds)
                 except Exception as e:
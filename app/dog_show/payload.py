@@ -0,0 +1,59 @@
+"""Pre-serialized, pre-compressed /all-results bodies.
+
+The crawler serializes a complete show's /all-results response once per save
+and stores it in `dog_result_payload`; the web tier then splices the small
+per-request fields (the `cache` freshness flags and `availability`) onto the
+stored bytes without re-serializing or re-compressing the multi-megabyte
+result list.
+
+The stored body is a raw DEFLATE stream of the JSON object minus its closing
+brace, ended with a sync flush: byte-aligned and without a final block, so a
+separately compressed tail can follow it directly. A response is then a single
+ordinary gzip member — header, stored body, compressed tail, and a trailer whose
+CRC32 continues from the stored body's. Clients that do not accept gzip get the
+inflated body plus the plain tail. (gzip rather than brotli: it is in the
+standard library and every browser and proxy speaks it.)
+"""
+
+import json
+import struct
+import zlib
+
+PAYLOAD_COMPRESS_LEVEL = 9
+
+# Magic, CM=deflate, no flags, MTIME=0, XFL=0, OS=unknown (RFC 1952).
+_GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+def _raw_deflate(data, flush_mode):
+    compressor = zlib.compressobj(PAYLOAD_COMPRESS_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(flush_mode)
+
+
+def encode_body(body):
+    """(deflated, crc32, size) for the non-empty JSON object `body`, left open
+    (no closing brace) so per-request fields can be appended."""
+    raw = _dumps(body)[:-1]
+    return _raw_deflate(raw, zlib.Z_SYNC_FLUSH), zlib.crc32(raw), len(raw)
+
+
+def _tail(fields):
+    # `fields` continue the stored object: ',"k1":...,"k2":...}'.
+    return b"," + _dumps(fields)[1:]
+
+
+def gzip_response(deflated, crc, size, fields):
+    """A complete gzip stream of the stored body with `fields` appended."""
+    tail = _tail(fields)
+    trailer = struct.pack("<II", zlib.crc32(tail, crc) & 0xFFFFFFFF, (size + len(tail)) & 0xFFFFFFFF)
+    return b"".join((_GZIP_HEADER, deflated, _raw_deflate(tail, zlib.Z_FINISH), trailer))
+
+
+def plain_response(deflated, fields):
+    """The uncompressed JSON bytes of the stored body with `fields` appended."""
+    # decompressobj, not zlib.decompress: the stored stream has no final block.
+    return zlib.decompressobj(-zlib.MAX_WBITS).decompress(deflated) + _tail(fields)
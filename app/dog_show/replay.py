@@ -0,0 +1,176 @@
+"""Offline re-parse of archived shows (see archive.py).
+
+`replay_show_from_archive` rebuilds a show's captured breeds from the pages the
+crawler archived, without touching Showlink: the breed list comes from the
+archived detail page (its group pages served from the archive too) or, failing
+that, from the breed index; each breed whose result page is archived is
+re-parsed — across CPU cores with a process pool — and mapped exactly as a
+live capture (`result_cache._apply_breed_capture`). Only breeds whose rows,
+judge or honor roll actually come out different are rewritten, through the
+regular diff-aware `_save_result_cache_doc`, so a replay after a parser fix
+touches just the breeds the fix changes, and replaying an unchanged show writes
+nothing. The doc's status, terminal confirmation and live bookkeeping are kept:
+replay only rewrites rows of shows the crawler already captured.
+"""
+
+import copy
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import structlog
+
+from .archive import _archive_dir, _archived_pages, _read_archived_page
+from .indexing import _refresh_show_stats
+from .parsers import _parse_breed_results, _parse_show_detail
+from .result_cache import _apply_breed_capture, _breed_cache_key_from_breed, _map_breed_results_to_all_results
+from .showlink import _page_soup, _source_url
+from .store import (
+    _indexed_show, _load_result_cache_doc, _save_result_cache_doc,
+    _update_index_breed_judge, _update_index_breed_result_flag,
+)
+from .utils import _clean_judge_name
+
+logger = structlog.get_logger(__name__)
+
+# The per-dog fields a re-parse can change (the breed-level ones are compared
+# through the completed_breeds entry).
+_ROW_FIELDS = (
+    "number", "name", "reg_url", "grade", "placement", "competitive_placement",
+    "awards", "critique", "gender", "class_name",
+)
+
+
+def _parse_archived_breed(show_id, body_hash, directory):
+    """One archived breed page through `_parse_breed_results`, or None when its
+    blob is missing. Runs in the replay's worker processes."""
+    try:
+        html = _read_archived_page(body_hash, directory)
+    except OSError:
+        return None
+    return _parse_breed_results(_page_soup(html, "breed"), show_id)
+
+
+def _archived_detail(show_id, pages, directory):
+    entry = pages.get(_source_url(show_id))
+    if entry is None:
+        return None
+
+    def fetch_archived(url, page=None):
+        linked = pages.get(url)
+        if linked is None:
+            raise LookupError(f"{url} is not archived")
+        return _page_soup(_read_archived_page(linked["sha1"], directory), page)
+
+    try:
+        return _parse_show_detail(fetch_archived(_source_url(show_id), "detail"), show_id, fetch_page=fetch_archived)
+    except OSError:
+        return None
+
+
+def _replay_breeds(show_id, detail, doc):
+    """The show's breeds: the archived detail page's, else the index's, plus any
+    breed only the stored doc still knows."""
+    breeds = [dict(breed) for breed in ((detail or {}).get("breeds") or (_indexed_show(show_id) or {}).get("breeds") or [])]
+    known = {_breed_cache_key_from_breed(breed) for breed in breeds}
+    for key, entry in (doc.get("completed_breeds") or {}).items():
+        if key not in known:
+            group, _, breed_id = key.partition(":")
+            breeds.append({"name": (entry or {}).get("name", ""), "group": group, "breed_id": breed_id})
+    return breeds
+
+
+def _row_values(row):
+    return tuple(row.get(field) if row.get(field) is not None else "" for field in _ROW_FIELDS)
+
+
+def _breed_capture_differs(doc, breed, breed_data, mapped_results):
+    group = str(breed.get("group", ""))
+    breed_id = str(breed.get("breed_id", ""))
+    entry = (doc.get("completed_breeds") or {}).get(_breed_cache_key_from_breed(breed))
+    if entry is None:
+        return True
+    if (entry.get("judge") or None) != (_clean_judge_name(breed_data.get("judge")) or None):
+        return True
+    if (entry.get("awards") or []) != (breed_data.get("awards") or []):
+        return True
+    stored = [
+        _row_values(row) for row in doc.get("results") or []
+        if str(row.get("breedGroup")) == group and str(row.get("breedId")) == breed_id
+    ]
+    return stored != [_row_values(row) for row in mapped_results]
+
+
+def _parse_all(show_id, targets, directory, workers):
+    hashes = [entry["sha1"] for _, entry in targets]
+    if workers <= 1 or len(targets) < 2:
+        return [_parse_archived_breed(show_id, body_hash, directory) for body_hash in hashes]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunksize = max(1, len(hashes) // (workers * 4))
+        return list(pool.map(_parse_archived_breed, repeat(show_id), hashes, repeat(directory), chunksize=chunksize))
+
+
+def replay_show_from_archive(show_id, workers=None, dry_run=False, directory=None):
+    """Re-parse one show's archived breed pages and rewrite the breeds whose
+    parse changed. Returns a summary; `status` is `replayed`, `unchanged`,
+    `dry-run`, `no-archive` or `no-result-doc`."""
+    show_id = int(show_id)
+    directory = _archive_dir(directory)
+    workers = workers or os.cpu_count() or 1
+    summary = {
+        "show_id": show_id, "status": None, "pages": 0, "breeds": 0,
+        "changed_breeds": 0, "missing_pages": 0, "parse_s": 0.0, "write_s": 0.0,
+    }
+    pages = _archived_pages(show_id, directory)
+    summary["pages"] = len(pages)
+    if not pages:
+        summary["status"] = "no-archive"
+        return summary
+    existing = _load_result_cache_doc(show_id)
+    if not existing:
+        summary["status"] = "no-result-doc"
+        return summary
+
+    started = time.perf_counter()
+    doc = copy.deepcopy(existing)
+    detail = _archived_detail(show_id, pages, directory)
+    targets = []
+    for breed in _replay_breeds(show_id, detail, doc):
+        entry = pages.get(_source_url(show_id, breed.get("group", ""), breed.get("breed_id", "")))
+        if entry is not None:
+            targets.append((breed, entry))
+    parsed = _parse_all(show_id, targets, directory, workers)
+    summary["parse_s"] = round(time.perf_counter() - started, 3)
+    summary["breeds"] = len(targets)
+
+    changed = []
+    for (breed, entry), breed_data in zip(targets, parsed):
+        if breed_data is None:
+            summary["missing_pages"] += 1
+            continue
+        mapped_results = _map_breed_results_to_all_results(show_id, breed, breed_data)
+        if not _breed_capture_differs(doc, breed, breed_data, mapped_results):
+            continue
+        result_count, judge = _apply_breed_capture(doc, breed, breed_data, mapped_results, entry.get("fetched_at") or time.time())
+        changed.append((breed, result_count, judge))
+    summary["changed_breeds"] = len(changed)
+
+    if dry_run:
+        summary["status"] = "dry-run"
+    elif not changed:
+        summary["status"] = "unchanged"
+    else:
+        started = time.perf_counter()
+        _save_result_cache_doc(show_id, doc)
+        for breed, result_count, judge in changed:
+            group, breed_id = str(breed.get("group", "")), str(breed.get("breed_id", ""))
+            if result_count:
+                _update_index_breed_result_flag(show_id, group, breed_id)
+            if judge:
+                _update_index_breed_judge(show_id, group, breed_id, judge)
+        _refresh_show_stats([show_id])
+        summary["write_s"] = round(time.perf_counter() - started, 3)
+        summary["status"] = "replayed"
+    logger.info("dog_replay_show_complete", **summary)
+    return summary
@@ -1,32 +1,35 @@
+import contextvars
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 import structlog
 
-from . import config, finals
+from . import config, finals, metrics, payload
 from .indexing import (
     _indexed_result_flags_need_refresh, _is_show_recent_by_id,
     _mark_single_probe_breed_result_available, _persist_show_detail_to_index,
-    _result_cache_doc_needs_result_refresh,
+    _refresh_show_stats, _result_cache_doc_needs_result_refresh,
     _result_breeds_for_cache, _result_breeds_from_index,
     _show_date_for_id, _show_result_availability_for_id,
 )
+from .parse_pool import _breed_parse_result, _parse_pool, _submit_breed_parse
 from .parsers import _parse_breed_results, _parse_show_detail
-from .showlink import _fetch_page, _source_url
+from .showlink import (
+    _fetch_page, _fetch_page_text_if_changed, _fetch_priority_scope, _pace_showlink, _page_soup, _source_url,
+)
 from .shows import _get_show_list
 from .store import (
-    _append_result_breed,
     _defer_result_cache_job,
-    _heartbeat_result_cache_job, _indexed_show, _load_result_cache_doc,
-    _load_result_jobs, _remove_result_cache_job, _result_job_due, _queue_result_cache_job,
-    _save_result_cache_doc, _save_result_cache_header, _set_result_job_running,
-    _update_index_breed_judge, _update_index_breed_result_flag,
+    _indexed_show, _load_breed_result_slice, _load_result_cache_doc,
+    _claim_result_cache_job, _load_fetch_states, _load_result_delta, _load_result_job, _load_result_jobs, _load_result_payload, _load_versioned_result_cache_doc, _remove_result_cache_job, _result_job_due, _queue_result_cache_job,
+    _save_fetch_states, _save_result_cache_doc, _save_result_cache_header, _save_result_payload,
 )
 from .utils import (
     _clean_all_results, _clean_breed_data, _clean_judge_name,
     _local_dt, _result_live_plan, _show_age_days, _show_date_state,
     _show_result_availability, _terminal_status, _utc_iso,
 )
+from .writer import _CaptureWriter
 
 logger = structlog.get_logger(__name__)
 
@@ -40,9 +43,13 @@ RESULT_CACHE_VERSION = config.RESULT_CACHE_VERSION
 RESULT_RETRY_AFTER_SECONDS = config.RESULT_RETRY_AFTER_SECONDS
 RESULT_CRAWL_DEFAULT_DELAY = config.RESULT_CRAWL_DEFAULT_DELAY
 RESULT_CRAWL_DEFAULT_WORKERS = config.RESULT_CRAWL_DEFAULT_WORKERS
+RESULT_CRAWL_SHOW_CONCURRENCY = config.RESULT_CRAWL_SHOW_CONCURRENCY
 RESULT_LIVE_PROBE_BREED_LIMIT = config.RESULT_LIVE_PROBE_BREED_LIMIT
 RESULT_FINALS_SWEEP_BREED_LIMIT = config.RESULT_FINALS_SWEEP_BREED_LIMIT
 RESULT_LIVE_JOB_STALE_SECONDS = config.RESULT_LIVE_JOB_STALE_SECONDS
+# Fetch priority of queued (viewer-requested) jobs in the Showlink budget: with
+# the brand-new live shows, ahead of finals, live refreshes and warming (1..3).
+RESULT_QUEUED_FETCH_PRIORITY = 0
 
 def _result_cache_doc_is_complete(doc):
     return bool(doc and doc.get("status") == "complete")
@@ -168,7 +175,7 @@ def _result_cache_due(show_id, now=None):
 
 def _result_cache_progress(show_id, doc=None, job=None):
     doc = doc or _load_result_cache_doc(show_id) or {}
-    job = job or _load_result_jobs().get("jobs", {}).get(str(int(show_id)), {})
+    job = job or _load_result_job(show_id) or {}
 
     completed_breeds = doc.get("completed_breeds") or {}
     failed_breeds = doc.get("failed_breeds") or {}
@@ -224,6 +231,7 @@ def _result_response_from_doc(show_id, doc, stale=False):
         "source_url": doc.get("source_url") or _source_url(show_id),
         "results": _clean_all_results(doc.get("results") or []),
         "breed_awards": _breed_awards_from_doc(doc),
+        "cursor": doc.get("result_cursor"),
         "fetched_at": fetched_at,
         "fetched_at_iso": _utc_iso(fetched_at),
         "cache": {
@@ -257,63 +265,116 @@ def _all_results_response(show_id, allow_stale=False):
 
     return _result_response_from_doc(show_id, doc, stale=stale)
 
-def _breed_results_from_all_results_cache(show_id, group, breed):
-    doc = _load_result_cache_doc(show_id)
-    if not _result_cache_doc_is_complete(doc):
+def _all_results_delta(show_id, since, now=None):
+    """The /all-results?since= body: only the rows written after seq cursor
+    `since` (a previous response's `cursor`), the breeds to drop first
+    (`tombstones`), and the touched breeds' honor rolls — or None when the full
+    body has to be served instead (no complete cache, or a cursor from another
+    generation of it).
+
+    Applying a delta to the body the cursor came from, in order — drop every
+    tombstoned breed's rows, append `results`, replace `breed_awards` per key —
+    yields the current full body; `cursor` is the next `since`."""
+    delta = _load_result_delta(show_id, since)
+    if not _result_cache_doc_is_complete(delta) or delta["reset"]:
         return None
+    stale = False
+    if _is_show_recent_by_id(show_id):
+        doc = _load_result_cache_doc(show_id)
+        stale = not _result_cache_doc_is_fresh(show_id, doc, now=now or time.time())
+    fetched_at = delta.get("cached_at") or delta.get("updated_at") or time.time()
+    return {
+        "show_id": int(show_id),
+        "since": int(since),
+        "cursor": delta["cursor"],
+        "results": _clean_all_results(delta["results"]),
+        "tombstones": [{"group": group, "breed_id": breed_id} for group, breed_id in delta["tombstones"]],
+        "breed_awards": _breed_awards_from_doc(delta),
+        "fetched_at": fetched_at,
+        "fetched_at_iso": _utc_iso(fetched_at),
+        "cache": {
+            "status": "stale" if stale else "complete",
+            "stale": stale,
+            "cached_at": delta.get("cached_at"),
+            "cached_at_iso": _utc_iso(delta.get("cached_at")),
+        },
+    }
+
+def _materialize_all_results_payload(show_id):
+    """Serialize and compress a complete show's /all-results body into
+    dog_result_payload — once per crawler save instead of once per viewer.
+
+    Best effort: the web tier serves the stored body only while its doc-version
+    stamp is current and otherwise builds the response from the doc, so a failure
+    here only costs CPU on the read side."""
+    try:
+        version, doc = _load_versioned_result_cache_doc(show_id)
+        if not _result_cache_doc_is_complete(doc):
+            return False
+        response = _result_response_from_doc(show_id, doc, stale=False)
+        cache_block = response.pop("cache")
+        body, body_crc, body_size = payload.encode_body(response)
+        _save_result_payload(show_id, version, {
+            "result_count": len(response["results"]),
+            "cache": cache_block,
+            "body": body,
+            "body_crc": body_crc,
+            "body_size": body_size,
+            "created_at": time.time(),
+        })
+        return True
+    except Exception:
+        logger.exception("dog_result_payload_materialize_failed", show_id=show_id)
+        return False
+
+def _all_results_payload(show_id, now=None):
+    """The materialized /all-results body with its per-request `cache` block, or
+    None when the response has to be built from the doc instead (no payload for
+    the current doc version, or an empty cache that may be owed a rebuild).
 
+    A settled show is served without touching its result rows at all; a recent
+    one still checks freshness against the (process-cached) doc."""
+    stored = _load_result_payload(show_id)
+    if not stored or not stored.get("result_count"):
+        return None
+
+    stale = False
+    if _is_show_recent_by_id(show_id):
+        doc = _load_result_cache_doc(show_id)
+        if not _result_cache_doc_is_complete(doc):
+            return None
+        stale = not _result_cache_doc_is_fresh(show_id, doc, now=now or time.time())
+    stored["cache"] = dict(stored["cache"], status="stale" if stale else "complete", stale=stale)
+    return stored
+
+def _breed_results_from_all_results_cache(show_id, group, breed):
+    """One breed's /results payload from the persisted whole-show cache, or None
+    when the show's cache is incomplete or the breed was never captured.
+
+    Reads only the breed's slice (its rows, honor roll and the cache header), so
+    a single-breed view of a big show never rebuilds the whole-show doc."""
     group = str(group)
     breed = str(breed)
-    breed_key = f"{group}:{breed}"
-    completed_breeds = doc.get("completed_breeds") or {}
-    if breed_key not in completed_breeds:
+    breed_slice = _load_breed_result_slice(show_id, group, breed)
+    if not _result_cache_doc_is_complete(breed_slice) or not breed_slice.get("completed"):
         return None
 
-    matched = [
-        dog for dog in doc.get("results", [])
-        if str(dog.get("breedGroup")) == group and str(dog.get("breedId")) == breed
-    ]
-
-    breed_obj = None
-    if matched:
-        breed_obj = matched[0].get("breedObj") or {}
-    else:
-        indexed_show = _indexed_show(show_id) or {}
-        for item in indexed_show.get("breeds", []):
-            if str(item.get("group")) == group and str(item.get("breed_id")) == breed:
-                breed_obj = item
-                break
-    breed_obj = _clean_breed_data(breed_obj or {})
-    fetched_at = doc.get("cached_at") or doc.get("updated_at") or time.time()
-    breed_completed = (doc.get("completed_breeds") or {}).get(f"{group}:{breed}") or {}
+    breed_obj = _clean_breed_data(breed_slice.get("breed") or {})
+    fetched_at = breed_slice.get("cached_at") or breed_slice.get("updated_at") or time.time()
     return {
         "show_id": int(show_id),
-        "title": doc.get("title", ""),
+        "title": breed_slice.get("title") or "",
         "breed": breed_obj.get("name", ""),
         "judge": breed_obj.get("judge", ""),
-        "awards": breed_completed.get("awards") or [],
-        "results": [
-            {
-                "number": dog.get("number"),
-                "name": dog.get("name"),
-                "reg_url": dog.get("reg_url"),
-                "grade": dog.get("grade"),
-                "placement": dog.get("placement"),
-                "competitive_placement": dog.get("competitive_placement"),
-                "awards": dog.get("awards"),
-                "critique": dog.get("critique"),
-                "gender": dog.get("gender"),
-                "class_name": dog.get("class_name"),
-            }
-            for dog in matched
-        ],
+        "awards": breed_slice.get("awards") or [],
+        "results": breed_slice.get("results") or [],
         "source_url": _source_url(show_id, group, breed),
         "fetched_at": fetched_at,
         "fetched_at_iso": _utc_iso(fetched_at),
         "cache": {
             "status": "show_all_results",
-            "cached_at": doc.get("cached_at"),
-            "cached_at_iso": _utc_iso(doc.get("cached_at")),
+            "cached_at": breed_slice.get("cached_at"),
+            "cached_at_iso": _utc_iso(breed_slice.get("cached_at")),
         },
     }
 
@@ -334,7 +395,7 @@ def _show_detail_for_result_cache(show_id):
                 "breeds": breeds,
             }
 
-    soup = _fetch_page(_source_url(show_id))
+    soup = _fetch_page(_source_url(show_id), page="detail")
     detail = _parse_show_detail(soup, show_id)
     fetched_at = time.time()
     detail["fetched_at"] = fetched_at
@@ -583,31 +644,58 @@ def _enrich_breeds_with_result_progress(show_id, breeds, doc=None):
 
     return updated
 
-def _fetch_breed_results_for_show_cache(show_id, breed):
+def _fetch_breed_page_for_show_cache(show_id, breed, previous=None):
+    """The fetch stage of one breed: its result page's raw HTML, unparsed, or an
+    `unchanged` item when the page is unchanged since the stored capture state
+    `previous`."""
     group = str(breed.get("group", ""))
     breed_id = str(breed.get("breed_id", ""))
     breed_url = _source_url(show_id, group, breed_id)
-    breed_soup = _fetch_page(breed_url)
-    breed_data = _parse_breed_results(breed_soup, show_id)
-    fetched_at = time.time()
-    breed_data["source_url"] = breed_url
-    breed_data["fetched_at"] = fetched_at
-    breed_data["fetched_at_iso"] = _utc_iso(fetched_at)
-    mapped_results = _map_breed_results_to_all_results(show_id, breed, breed_data)
-    return {
+    started = time.perf_counter()
+    html, fetch_state = _fetch_page_text_if_changed(breed_url, previous, page="breed")
+    item = {
         "breed": breed,
         "breed_key": _breed_cache_key_from_breed(breed),
-        "breed_data": breed_data,
-        "mapped_results": mapped_results,
-        "fetched_at": fetched_at,
+        "unchanged": html is None,
+        "source_url": breed_url,
+        "fetch_state": fetch_state,
+        "fetch_s": time.perf_counter() - started,
+        # The last look before this one (capture lag, see metrics.py).
+        "previous_fetched_at": (previous or {}).get("fetched_at"),
     }
+    if html is not None:
+        item["html"] = html
+        item["fetched_at"] = time.time()
+    return item
+
+def _complete_breed_item(show_id, item, breed_data, parse_s):
+    """The parse stage's output folded into a fetched item, ready to record."""
+    item.pop("html", None)
+    breed_data["source_url"] = item["source_url"]
+    breed_data["fetched_at"] = item["fetched_at"]
+    breed_data["fetched_at_iso"] = _utc_iso(item["fetched_at"])
+    item["breed_data"] = breed_data
+    item["mapped_results"] = _map_breed_results_to_all_results(show_id, item["breed"], breed_data)
+    item["parse_s"] = parse_s
+    return item
+
+def _fetch_breed_results_for_show_cache(show_id, breed, previous=None):
+    """Fetch and parse one breed's result page. `previous` is the stored capture
+    state of an already-captured breed: when the page is unchanged since, the
+    item comes back `unchanged` with nothing parsed."""
+    item = _fetch_breed_page_for_show_cache(show_id, breed, previous)
+    if item["unchanged"]:
+        return item
+    started = time.perf_counter()
+    breed_data = _parse_breed_results(_page_soup(item["html"], "breed"), show_id)
+    return _complete_breed_item(show_id, item, breed_data, time.perf_counter() - started)
 
 def _save_result_doc_progress(show_id, doc, preserve_existing_complete):
     """Header-only progress save (status / completed / failed breeds / live meta).
 
     Used where no new result rows were produced (breed failure, detail-fetch
-    failure, bounded pause). The success path appends the breed's rows via
-    _append_result_breed instead of rewriting the whole show."""
+    failure, bounded pause). The success path hands the breed's rows to the
+    crawl's writer thread (writer.py) instead of rewriting the whole show."""
     if not preserve_existing_complete:
         _save_result_cache_header(show_id, doc)
 
@@ -639,13 +727,14 @@ def _record_result_breed_failure(show_id, doc, breed, exc, preserve_existing_com
         "progress": _result_cache_progress(show_id, doc=doc),
     }
 
-def _record_result_breed_success(show_id, doc, item, preserve_existing_complete):
-    breed = item["breed"]
+def _apply_breed_capture(doc, breed, breed_data, mapped_results, fetched_at):
+    """Put one parsed breed page into `doc`: its rows replace any the breed had,
+    and its completed_breeds entry (count, judge, honor roll, capture time) is
+    rewritten. Returns (result_count, judge)."""
     group = str(breed.get("group", ""))
     breed_id = str(breed.get("breed_id", ""))
-    fetched_at = item["fetched_at"]
-    mapped_results = item["mapped_results"]
-    judge = _clean_judge_name(item["breed_data"].get("judge"))
+    breed_key = _breed_cache_key_from_breed(breed)
+    judge = _clean_judge_name(breed_data.get("judge"))
 
     result_count = len(mapped_results)
     if result_count:
@@ -654,7 +743,7 @@ def _record_result_breed_success(show_id, doc, item, preserve_existing_complete)
     # A finals re-sweep re-fetches an already-captured breed; drop its old rows so
     # the refreshed rows (now carrying RYP/BIS) replace them instead of duplicating.
     # New breeds aren't in completed_breeds yet, so this is a no-op for them.
-    if item["breed_key"] in doc.get("completed_breeds", {}):
+    if breed_key in doc.get("completed_breeds", {}):
         doc["results"] = [
             row for row in doc.get("results", [])
             if not (str(row.get("breedGroup")) == group and str(row.get("breedId")) == breed_id)
@@ -668,64 +757,160 @@ def _record_result_breed_success(show_id, doc, item, preserve_existing_complete)
         "updated_at": fetched_at,
         "updated_at_iso": _utc_iso(fetched_at),
     }
-    honor_roll = item["breed_data"].get("awards") or []
+    honor_roll = breed_data.get("awards") or []
     if honor_roll:
         completed_entry["awards"] = honor_roll
-    doc.setdefault("completed_breeds", {})[item["breed_key"]] = completed_entry
-    doc.setdefault("failed_breeds", {}).pop(item["breed_key"], None)
-    doc["updated_at"] = fetched_at
-    if not preserve_existing_complete:
-        _append_result_breed(show_id, doc, group, breed_id, mapped_results)
-    _heartbeat_result_cache_job(show_id)
-    # Fold the capture into the breed index at capture time — the index is the
-    # only judge/result-flag source the read paths consult.
-    if result_count:
-        _update_index_breed_result_flag(show_id, group, breed_id)
-    if judge:
-        _update_index_breed_judge(show_id, group, breed_id, judge)
+    doc.setdefault("completed_breeds", {})[breed_key] = completed_entry
+    doc.setdefault("failed_breeds", {}).pop(breed_key, None)
+    return result_count, judge
+
+def _record_result_breed_success(doc, item, writer, fetch_memo):
+    breed = item["breed"]
+    captured = {item["source_url"]: item["fetch_state"]} if item.get("fetch_state") else {}
+    if item.get("unchanged"):
+        # Same page as the stored capture: nothing to parse, map or rewrite.
+        fetch_memo["unchanged"] += 1
+        fetch_memo["captured"].update(captured)
+        writer.put()
+        return
+    mapped_results = item["mapped_results"]
+    previous = (doc.get("completed_breeds") or {}).get(item["breed_key"])
+    result_count, judge = _apply_breed_capture(doc, breed, item["breed_data"], mapped_results, item["fetched_at"])
+    if result_count and previous is not None and not previous.get("result_count") and item.get("previous_fetched_at"):
+        # First results on a page that had none at the previous fetch.
+        lag = max(0.0, item["fetched_at"] - item["previous_fetched_at"])
+        metrics.RESULT_CAPTURE_LAG_SECONDS.observe(lag)
+    doc["updated_at"] = item["fetched_at"]
+    fetch_memo["changed"] += 1
+    if not writer.write_rows:
+        # Stored with the pass's full save, once the rows are on disk.
+        fetch_memo["captured"].update(captured)
+        captured = {}
+    # The index flag and judge are folded in at capture time too — the index is
+    # the only judge/result-flag source the read paths consult.
+    writer.put(doc, {
+        "group": str(breed.get("group", "")),
+        "breed_id": str(breed.get("breed_id", "")),
+        "results": mapped_results,
+        "result_count": result_count,
+        "judge": judge,
+    }, captured)
+
+def _new_fetch_memo():
+    """Per-pass crawl bookkeeping: {"changed", "unchanged"} breed counts, the
+    capture states to store once their rows are persisted (live refreshes persist
+    in the final save), and the seconds spent in each pipeline stage — fetch
+    (including the wait for a Showlink budget slot), parse and write; `pipelined`
+    when the parses ran in the parse pool, `write_commits` the writer thread's
+    transactions."""
+    return {
+        "changed": 0, "unchanged": 0, "captured": {},
+        "fetch_s": 0.0, "parse_s": 0.0, "write_s": 0.0, "pipelined": False, "write_commits": 0,
+    }
+
+def _record_breed_item(doc, item, writer, fetch_memo):
+    fetch_memo["fetch_s"] += item.get("fetch_s", 0.0)
+    fetch_memo["parse_s"] += item.get("parse_s", 0.0)
+    if "parse_s" in item:
+        metrics.PARSE_SECONDS.observe(item["parse_s"], page="breed")
+    _record_result_breed_success(doc, item, writer, fetch_memo)
+
+def _crawl_missing_breed_results(show_id, pending_breeds, doc, workers, preserve_existing_complete, fetch_memo):
+    """Fetch, parse and record `pending_breeds`; None, or the failure summary of
+    the breed that stopped the pass. Captures are persisted by a writer thread
+    (writer.py), drained before this returns."""
+    writer = _CaptureWriter(show_id, write_rows=not preserve_existing_complete)
+    try:
+        failed = _crawl_breeds(show_id, pending_breeds, doc, workers, writer, fetch_memo)
+    finally:
+        try:
+            writer.close()
+        finally:
+            fetch_memo["write_s"] += writer.write_s
+            fetch_memo["write_commits"] += writer.commits
+    if failed is not None:
+        breed, exc = failed
+        return _record_result_breed_failure(show_id, doc, breed, exc, preserve_existing_complete)
+    return None
+
+def _crawl_breeds(show_id, pending_breeds, doc, workers, writer, fetch_memo):
+    # No sleeps here: every breed-page fetch waits for its slot in the shared
+    # Showlink host budget (showlink._HostBudget), which spaces request starts
+    # across all workers and shows. The pool only sets how many can be open.
+    #
+    # Breeds already captured in this doc (live probes, finals re-sweeps) are
+    # fetched conditionally against their stored capture state, so an unchanged
+    # page costs a 304 or a hash compare instead of a parse and a rewrite.
+    completed = doc.get("completed_breeds") or {}
+    urls = {
+        _breed_cache_key_from_breed(breed): _source_url(show_id, breed.get("group", ""), breed.get("breed_id", ""))
+        for breed in pending_breeds
+    }
+    stored = _load_fetch_states([url for key, url in urls.items() if key in completed])
+
+    def previous_for(breed):
+        return stored.get(urls[_breed_cache_key_from_breed(breed)])
 
-def _crawl_missing_breed_results(show_id, pending_breeds, doc, delay, workers, preserve_existing_complete):
     workers = max(1, int(workers or 1))
     if workers == 1:
         for breed in pending_breeds:
-            if delay:
-                time.sleep(delay)
             try:
-                item = _fetch_breed_results_for_show_cache(show_id, breed)
+                item = _fetch_breed_results_for_show_cache(show_id, breed, previous_for(breed))
             except Exception as exc:
-                return _record_result_breed_failure(show_id, doc, breed, exc, preserve_existing_complete)
-            _record_result_breed_success(show_id, doc, item, preserve_existing_complete)
+                return breed, exc
+            _record_breed_item(doc, item, writer, fetch_memo)
         return None
 
+    # Pipelined: the fetch threads only fetch when the parse pool is on; each
+    # fetched page is handed to the pool as soon as it arrives (and its thread
+    # to the next breed), and this thread records breeds as their parses finish.
+    fetch_memo["pipelined"] = _parse_pool() is not None
+    fetch_stage = _fetch_breed_page_for_show_cache if fetch_memo["pipelined"] else _fetch_breed_results_for_show_cache
     breed_iter = iter(pending_breeds)
-    futures = {}
+    fetches = {}
+    parses = {}
 
     def submit_next(executor):
         try:
             breed = next(breed_iter)
         except StopIteration:
             return False
-        if delay:
-            time.sleep(delay)
-        futures[executor.submit(_fetch_breed_results_for_show_cache, show_id, breed)] = breed
+        # A copy of this context carries the show's fetch priority to the worker.
+        fetches[executor.submit(
+            contextvars.copy_context().run, fetch_stage, show_id, breed, previous_for(breed),
+        )] = breed
         return True
 
+    def fail(breed, exc):
+        for pending in list(fetches) + list(parses):
+            pending.cancel()
+        return breed, exc
+
     with ThreadPoolExecutor(max_workers=workers) as executor:
         for _ in range(min(workers, len(pending_breeds))):
             submit_next(executor)
 
-        while futures:
-            for future in as_completed(list(futures.keys())):
-                breed = futures.pop(future)
-                try:
-                    item = future.result()
-                except Exception as exc:
-                    for pending in futures:
-                        pending.cancel()
-                    return _record_result_breed_failure(show_id, doc, breed, exc, preserve_existing_complete)
-                _record_result_breed_success(show_id, doc, item, preserve_existing_complete)
-                submit_next(executor)
-                break
+        while fetches or parses:
+            done, _ = wait(list(fetches) + list(parses), return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in fetches:
+                    breed = fetches.pop(future)
+                    try:
+                        item = future.result()
+                    except Exception as exc:
+                        return fail(breed, exc)
+                    submit_next(executor)
+                    if "html" in item:
+                        parses[_submit_breed_parse(item["html"], show_id)] = item
+                        continue
+                else:
+                    item = parses.pop(future)
+                    try:
+                        breed_data, parse_s = _breed_parse_result(future, item["html"], show_id)
+                    except Exception as exc:
+                        return fail(item["breed"], exc)
+                    item = _complete_breed_item(show_id, item, breed_data, parse_s)
+                _record_breed_item(doc, item, writer, fetch_memo)
 
     return None
 
@@ -919,15 +1104,20 @@ def crawl_result_cache_for_show(show_id, delay=RESULT_CRAWL_DEFAULT_DELAY, force
         workers=max(1, int(workers or 1)),
         delay=delay,
     )
+    _pace_showlink(delay)
+    fetch_memo = _new_fetch_memo()
+    crawl_started = time.perf_counter()
     failure = _crawl_missing_breed_results(
         show_id,
         pending_breeds,
         doc,
-        delay=delay,
         workers=workers,
         preserve_existing_complete=preserve_existing_complete,
+        fetch_memo=fetch_memo,
     )
     if failure:
+        if not preserve_existing_complete:
+            _save_fetch_states(fetch_memo["captured"])
         failure["crawled_breeds"] = len(pending_breeds)
         return failure
 
@@ -939,13 +1129,27 @@ def crawl_result_cache_for_show(show_id, delay=RESULT_CRAWL_DEFAULT_DELAY, force
     doc["cached_at"] = cached_at
     doc["updated_at"] = cached_at
     doc["last_error"] = None
-    if preserve_existing_complete and not pending_breeds:
-        # Live refresh that fetched nothing new: the complete result rows are
-        # already on disk, so only refresh the header/meta (cached_at, live-state
-        # blob). Avoids rewriting ~thousands of rows every couple of minutes.
+    save_started = time.perf_counter()
+    if preserve_existing_complete and not fetch_memo["changed"]:
+        # Live refresh that captured nothing new (nothing pending, or every page
+        # unchanged): the complete result rows are already on disk, so only
+        # refresh the header/meta (cached_at, live-state blob). Avoids rewriting
+        # ~thousands of rows every couple of minutes.
         _save_result_cache_header(show_id, doc)
     else:
         _save_result_cache_doc(show_id, doc)
+    _save_fetch_states(fetch_memo["captured"])
+    fetch_memo["write_s"] += time.perf_counter() - save_started
+    stages = {
+        "crawl_s": round(save_started - crawl_started, 3),
+        "fetch_s": round(fetch_memo["fetch_s"], 3),
+        "parse_s": round(fetch_memo["parse_s"], 3),
+        "write_s": round(fetch_memo["write_s"], 3),
+        "write_commits": fetch_memo["write_commits"],
+        "pipelined": fetch_memo["pipelined"],
+    }
+    _materialize_all_results_payload(show_id)
+    _refresh_show_stats([show_id])
 
     logger.info(
         "dog_result_cache_complete",
@@ -953,11 +1157,15 @@ def crawl_result_cache_for_show(show_id, delay=RESULT_CRAWL_DEFAULT_DELAY, force
         source=source,
         breed_count=len(completed_breeds),
         result_count=len(doc.get("results", [])),
+        fetched_breeds=len(pending_breeds),
+        unchanged_breeds=fetch_memo["unchanged"],
+        **stages,
     )
     return {
         "show_id": show_id,
         "status": "complete",
         "crawled_breeds": len(pending_breeds),
+        "stages": stages,
         "progress": _result_cache_progress(show_id, doc=doc),
     }
 
@@ -978,12 +1186,12 @@ def _queued_result_cache_candidates(now):
             stale_complete_jobs.append(show_id)
             continue
 
-        if _result_job_due(
-            job,
-            now=now,
-            stale_seconds=_result_job_stale_seconds_for_show(show_id, now=now),
-        ):
-            candidates.append({"show_id": show_id, "source": "queued", "job": job})
+        stale_seconds = _result_job_stale_seconds_for_show(show_id, now=now)
+        if _result_job_due(job, now=now, stale_seconds=stale_seconds):
+            candidates.append({
+                "show_id": show_id, "source": "queued", "job": job, "stale_seconds": stale_seconds,
+                "priority": RESULT_QUEUED_FETCH_PRIORITY,
+            })
 
     for show_id in stale_complete_jobs:
         _remove_result_cache_job(show_id)
@@ -1076,6 +1284,7 @@ def _auto_result_cache_candidates(now):
             "show_id": show_id,
             "source": "auto",
             "job": None,
+            "priority": priority,
             "rank": (priority, recency_rank, show_id),
         })
 
@@ -1129,8 +1338,44 @@ def _queue_live_result_cache_refreshes(shows, limit=2):
         logger.info("dog_live_result_refresh_queued", count=len(queued), shows=queued)
     return queued
 
-def crawl_result_cache_once(limit=1, delay=RESULT_CRAWL_DEFAULT_DELAY, auto_recent=True, workers=RESULT_CRAWL_DEFAULT_WORKERS):
-    """Warm whole-show result caches without doing that work in web requests."""
+def _crawl_result_cache_candidate(candidate, delay, workers):
+    """Claim (when queued), crawl and settle the job of one pass candidate, at
+    its priority class in the Showlink budget. The crawl summary, or None when
+    another crawler claimed the job first."""
+    show_id = candidate["show_id"]
+    source = candidate["source"]
+    if source == "queued" and _claim_result_cache_job(
+        show_id, stale_seconds=candidate.get("stale_seconds"),
+    ) is None:
+        # Another crawler claimed it (or it was re-deferred) since the read.
+        logger.info("dog_result_cache_job_claim_lost", show_id=show_id)
+        return None
+
+    logger.info("dog_result_cache_job_start", show_id=show_id, source=source, priority=candidate.get("priority"))
+    with _fetch_priority_scope(candidate.get("priority", RESULT_QUEUED_FETCH_PRIORITY)):
+        summary = crawl_result_cache_for_show(show_id, delay=delay, source=source, workers=workers)
+    logger.info(
+        "dog_result_cache_job_complete",
+        show_id=show_id,
+        source=source,
+        status=summary.get("status"),
+        reason=summary.get("reason"),
+        error=summary.get("error"),
+    )
+
+    if summary.get("status") in ("complete", "skipped"):
+        _remove_result_cache_job(show_id)
+    elif source == "queued":
+        _defer_result_cache_job(show_id, summary.get("error") or summary.get("status"))
+    return summary
+
+def crawl_result_cache_once(
+    limit=1, delay=RESULT_CRAWL_DEFAULT_DELAY, auto_recent=True, workers=RESULT_CRAWL_DEFAULT_WORKERS,
+    show_concurrency=RESULT_CRAWL_SHOW_CONCURRENCY,
+):
+    """Warm whole-show result caches without doing that work in web requests.
+
+    Up to `show_concurrency` of the selected shows are crawled at once."""
     now = time.time()
     candidates = _queued_result_cache_candidates(now)
     queued_count = len(candidates)
@@ -1153,43 +1398,28 @@ def crawl_result_cache_once(limit=1, delay=RESULT_CRAWL_DEFAULT_DELAY, auto_rece
         auto_recent=bool(auto_recent),
         limit=limit,
         workers=max(1, int(workers or 1)),
+        show_concurrency=max(1, int(show_concurrency or 1)),
         delay=delay,
         show_ids=[candidate["show_id"] for candidate in candidates],
     )
 
-    attempted = []
-    completed = 0
-    failed = 0
-    skipped = 0
-
-    for candidate in candidates:
-        show_id = candidate["show_id"]
-        source = candidate["source"]
-        if source == "queued":
-            _set_result_job_running(show_id)
-
-        logger.info("dog_result_cache_job_start", show_id=show_id, source=source)
-        summary = crawl_result_cache_for_show(show_id, delay=delay, source=source, workers=workers)
-        attempted.append(summary)
-        logger.info(
-            "dog_result_cache_job_complete",
-            show_id=show_id,
-            source=source,
-            status=summary.get("status"),
-            reason=summary.get("reason"),
-            error=summary.get("error"),
-        )
-
-        if summary.get("status") == "complete":
-            completed += 1
-            _remove_result_cache_job(show_id)
-        elif summary.get("status") == "skipped":
-            skipped += 1
-            _remove_result_cache_job(show_id)
-        else:
-            failed += 1
-            if source == "queued":
-                _defer_result_cache_job(show_id, summary.get("error") or summary.get("status"))
+    show_workers = max(1, min(len(candidates), int(show_concurrency or 1)))
+    if show_workers == 1:
+        outcomes = [_crawl_result_cache_candidate(candidate, delay, workers) for candidate in candidates]
+    else:
+        # Each selected show runs its own crawl; their breed fetches interleave
+        # in the shared Showlink budget, most urgent priority class first, so no
+        # show waits behind another's whole pass and the combined request rate
+        # stays at the host limit.
+        with ThreadPoolExecutor(max_workers=show_workers, thread_name_prefix="dog-result-show") as executor:
+            outcomes = list(executor.map(
+                lambda candidate: _crawl_result_cache_candidate(candidate, delay, workers), candidates,
+            ))
+
+    attempted = [summary for summary in outcomes if summary is not None]
+    completed = sum(1 for summary in attempted if summary.get("status") == "complete")
+    skipped = sum(1 for summary in attempted if summary.get("status") == "skipped")
+    failed = len(attempted) - completed - skipped
 
     pass_summary = {
         "attempted": len(attempted),
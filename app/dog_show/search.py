@@ -1,15 +1,15 @@
 import datetime
 
-import requests
 import structlog
 
 from .indexing import _show_from_index_for_search, _show_stats_from_index
-from .shows import _get_show_list
+from .shows import _stored_show_list
+from .single_flight import _single_flight
 from .store import (
     _index_summary, _indexed_ids_among, _indexed_show, _indexed_shows,
     _search_breed_award_owners, _search_breeder_awards, _search_dog_results_by_name,
     _search_dogs_by_name, _search_index_breeds, _search_index_judges,
-    _search_index_show_ids, _show_list_cache,
+    _search_index_show_ids,
 )
 from .utils import _clean_judge_name, _month_year_from_label, _parse_show_date_range
 
@@ -74,6 +74,13 @@ def _result_recency_key(result):
 
 
 def search_shows_data(query):
+    """/api/dog/search results for `query` (see _search_shows_data). Identical
+    searches running at the same time — a shared link, the type-ahead of many
+    viewers — are computed once and shared."""
+    return _single_flight("search", query, lambda: _search_shows_data(query))
+
+
+def _search_shows_data(query):
     """Assemble /api/dog/search results from SQL index scans.
 
     The index queries (breed name, judge, show text) run against dog.db; this
@@ -85,11 +92,7 @@ def search_shows_data(query):
     """
     query_variants = _search_query_variants(query)
 
-    try:
-        shows = _get_show_list()
-    except requests.RequestException:
-        logger.warning("showlink_fetch_failed", endpoint="search", exc_info=True)
-        shows = _show_list_cache["data"] or []
+    shows = _stored_show_list() or []
 
     list_shows_by_id = {str(show["id"]): show for show in shows}
 
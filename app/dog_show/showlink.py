@@ -1,9 +1,23 @@
+import contextlib
+import contextvars
+import hashlib
+import heapq
+import itertools
+import threading
+import time
+from urllib.parse import urlsplit
+
 import requests
 import structlog
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from requests.adapters import HTTPAdapter
 
-from .config import BASE_URL, REQUEST_HEADERS, REQUEST_TIMEOUT
+from . import metrics
+from .archive import _archive_page
+from .config import (
+    BASE_URL, REQUEST_HEADERS, REQUEST_TIMEOUT, SHOWLINK_MAX_IN_FLIGHT, SHOWLINK_PARSER,
+    SHOWLINK_REQUESTS_PER_SECOND,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -20,6 +34,111 @@ _SESSION = requests.Session()
 _SESSION.mount("https://", _adapter)
 _SESSION.mount("http://", _adapter)
 
+# Politeness towards Showlink is enforced here, once per host for the whole
+# process, instead of by sleeps at each call site: every fetch takes a slot from
+# its host's budget — a token bucket of SHOWLINK_REQUESTS_PER_SECOND (burst 1, so
+# request starts are evenly spaced) and at most SHOWLINK_MAX_IN_FLIGHT requests
+# open at once. Result workers, group-page fetches and index refreshes running in
+# parallel therefore share one origin budget and can use all of it, but never
+# exceed it. A rate of 0 disables the pacing (the in-flight cap still applies).
+#
+# Waiting fetches are granted in priority order (lowest first, then arrival), so
+# when several shows are crawled together the time-critical one's breed pages go
+# out first and the rest fill the remaining budget. The priority is the calling
+# context's `_fetch_priority` (see `_fetch_priority_scope`).
+_fetch_priority = contextvars.ContextVar("showlink_fetch_priority", default=99)
+
+
+@contextlib.contextmanager
+def _fetch_priority_scope(priority):
+    """Run the enclosed fetches (and any threads started with a copy of this
+    context) at `priority` in the host budget's queue."""
+    token = _fetch_priority.set(priority)
+    try:
+        yield
+    finally:
+        _fetch_priority.reset(token)
+
+
+class _HostBudget:
+    def __init__(self, rate, max_in_flight):
+        self._cond = threading.Condition()
+        self._waiting = []
+        self._tickets = itertools.count()
+        self._in_flight = 0
+        self._next_start = 0.0
+        self.rate = 0.0
+        self.max_in_flight = 1
+        self.requests = 0
+        self.waited_s = 0.0
+        self.configure(rate, max_in_flight)
+
+    def configure(self, rate=None, max_in_flight=None):
+        """Change the pacing; in-flight requests keep the slots they hold."""
+        with self._cond:
+            if rate is not None:
+                self.rate = max(0.0, float(rate))
+            if max_in_flight is not None:
+                self.max_in_flight = max(1, int(max_in_flight))
+            self._cond.notify_all()
+
+    def _reserve(self):
+        # Seconds to wait before this request may start; reserving in grant order
+        # keeps concurrent callers from claiming the same start time.
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        if self.rate:
+            self._next_start = start + 1.0 / self.rate
+        self.requests += 1
+        self.waited_s += start - now
+        return start - now
+
+    @contextlib.contextmanager
+    def slot(self):
+        ticket = (_fetch_priority.get(), next(self._tickets))
+        with self._cond:
+            heapq.heappush(self._waiting, ticket)
+            while self._waiting[0] != ticket or self._in_flight >= self.max_in_flight:
+                self._cond.wait()
+            heapq.heappop(self._waiting)
+            self._in_flight += 1
+            wait = self._reserve()
+            start = time.monotonic() + wait
+            self._cond.notify_all()
+        try:
+            # Sleep until the reserved start, not for `wait`: time spent getting
+            # here already counts (and a simulated clock moves by the gap only).
+            remaining = start - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+            yield wait
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+
+_host_budgets = {}
+_host_budgets_lock = threading.Lock()
+
+
+def _host_budget(url):
+    """The shared fetch budget of `url`'s host."""
+    host = urlsplit(url).netloc.lower()
+    with _host_budgets_lock:
+        budget = _host_budgets.get(host)
+        if budget is None:
+            budget = _host_budgets[host] = _HostBudget(SHOWLINK_REQUESTS_PER_SECOND, SHOWLINK_MAX_IN_FLIGHT)
+        return budget
+
+
+def _pace_showlink(delay):
+    """Space Showlink request starts `delay` seconds apart, process-wide (the
+    crawler's --result-delay); a falsy delay leaves the configured rate."""
+    if delay:
+        _host_budget(BASE_URL).configure(rate=1.0 / float(delay))
+
+
 def _source_url(show_id, group="", breed=""):
     url = f"{BASE_URL}?Id={show_id}"
     if group:
@@ -28,13 +147,127 @@ def _source_url(show_id, group="", breed=""):
         url += f"&RO={breed}"
     return url
 
-def _fetch_page(url):
+# Parsing backends for fetched pages. "full" builds the whole html.parser tree;
+# "strained" hands html.parser a `_PageStrainer`, so only the subtrees the page
+# kind's parser reads (parsers.py) become Tag objects — the navigation, scripts
+# and footer around them are tokenized and dropped. Every element a parser
+# selects is either one of these roots or inside one, so both backends give the
+# parsers identical results on the synthetic corpus in tests/fixtures/showlink.
+# Real pages are checked with scripts/dog_bench_parsers.py --archive-dir; until
+# then SHOWLINK_PARSER defaults to "full".
+PARSER_BACKENDS = ("full", "strained")
+_PAGE_TARGETS = {
+    # _parse_show_list
+    "list": {"ids": ("Nayttelylista",)},
+    # _parse_show_detail: title, breed tables and — for the group-link fallback
+    # (_breed_list_targets_from_soup) — the content block or every link.
+    "detail": {"ids": ("divOtsikko", "divContent", "content"), "classes": ("rotulistatable",), "names": ("a",)},
+    # _parse_breed_results
+    "breed": {"ids": ("divOtsikko",), "classes": ("ropotsikko", "roptulostaulukko", "roduntulokset")},
+}
+
+
+class _PageStrainer(SoupStrainer):
+    """Keeps top-level elements by tag name, id or class (any one matches);
+    strings outside the kept elements are dropped."""
+
+    def __init__(self, names=(), ids=(), classes=()):
+        super().__init__()
+        self.names = frozenset(names)
+        self.ids = frozenset(ids)
+        self.classes = frozenset(classes)
+
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        attrs = attrs or {}
+        if name in self.names or attrs.get("id") in self.ids:
+            return True
+        classes = attrs.get("class")
+        return bool(classes) and not self.classes.isdisjoint(classes.split())
+
+    def allow_string_creation(self, string):
+        return False
+
+
+_page_strainers = {page: _PageStrainer(**targets) for page, targets in _PAGE_TARGETS.items()}
+
+
+def _page_soup(text, page=None, backend=None):
+    """Parse a Showlink page for the parser of `page` ("list", "detail" or
+    "breed"; None parses the whole page) with `backend` (SHOWLINK_PARSER when
+    None; an unknown name parses the whole page)."""
+    backend = backend or SHOWLINK_PARSER
+    if backend == "strained" and page in _page_strainers:
+        return BeautifulSoup(text, "html.parser", parse_only=_page_strainers[page])
+    return BeautifulSoup(text, "html.parser")
+
+
+def _fetch_page(url, page=None):
     """Fetch a page from Showlink with timeout and logging.
 
     Uses the shared keep-alive session so back-to-back breed-page fetches reuse
-    one connection instead of handshaking per request.
+    one connection instead of handshaking per request, and waits for a slot in
+    the host's fetch budget first. `page` names the parser the soup is for (see
+    `_page_soup`).
     """
-    logger.info("showlink_request", url=url)
-    resp = _SESSION.get(url, headers=REQUEST_HEADERS, timeout=REQUEST_TIMEOUT)
+    resp = _get(url, REQUEST_HEADERS, page)
     resp.raise_for_status()
-    return BeautifulSoup(resp.text, "html.parser")
+    _archive_page(url, resp.text, page)
+    started = time.perf_counter()
+    soup = _page_soup(resp.text, page)
+    metrics.PARSE_SECONDS.observe(time.perf_counter() - started, page=page or "page")
+    return soup
+
+
+def _get(url, headers, page=None):
+    with _host_budget(url).slot() as waited:
+        logger.info("showlink_request", url=url, waited_s=round(waited, 3))
+        metrics.SHOWLINK_BUDGET_WAIT_SECONDS.inc(waited)
+        status = "error"
+        started = time.perf_counter()
+        try:
+            resp = _SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+            status = resp.status_code
+            return resp
+        finally:
+            metrics.SHOWLINK_FETCH_SECONDS.observe(time.perf_counter() - started, page=page or "page", status=status)
+
+
+def _response_header(resp, name):
+    value = resp.headers.get(name) if resp.headers is not None else None
+    return value if isinstance(value, str) and value else None
+
+
+def _fetch_page_text_if_changed(url, previous=None, page=None):
+    """Fetch a page unless it is unchanged since the capture `previous` describes
+    (a stored dog_fetch_state: validators and body hash).
+
+    Returns (text, state): text is None when Showlink answered 304 to the stored
+    ETag/Last-Modified or returned a body with the stored hash — the page needs
+    no parse then. `state` is what to store once the caller has persisted the
+    capture (fetched_at moves on every fetch, changed_at only with the body).
+    `page` is as for `_fetch_page`."""
+    headers = dict(REQUEST_HEADERS)
+    if previous:
+        if previous.get("etag"):
+            headers["If-None-Match"] = previous["etag"]
+        if previous.get("last_modified"):
+            headers["If-Modified-Since"] = previous["last_modified"]
+    resp = _get(url, headers, page)
+    now = time.time()
+    if previous and resp.status_code == 304:
+        return None, dict(previous, fetched_at=now)
+    resp.raise_for_status()
+    state = {
+        "etag": _response_header(resp, "ETag"),
+        "last_modified": _response_header(resp, "Last-Modified"),
+        "body_hash": hashlib.sha1(resp.text.encode("utf-8")).hexdigest(),
+        "fetched_at": now,
+        "changed_at": now,
+    }
+    if previous and previous.get("body_hash") == state["body_hash"]:
+        state["changed_at"] = previous.get("changed_at")
+        _archive_page(url, resp.text, page, body_hash=state["body_hash"], fetched_at=now, if_missing=True)
+        return None, state
+    _archive_page(url, resp.text, page, body_hash=state["body_hash"], fetched_at=now)
+    return resp.text, state
+
@@ -1,19 +1,49 @@
 import time
 
+import structlog
+
 from .config import BASE_URL, SHOW_LIST_TTL
 from .parsers import _parse_show_list
 from .showlink import _fetch_page
-from .store import _show_list_cache
+from .store import _load_show_list, _load_show_list_version, _save_show_list, _show_list_cache
+
+logger = structlog.get_logger(__name__)
+
+# The Showlink show list lives in dog.db (sqlstore.write_show_list). The crawler
+# owns the fetch (_get_show_list, at most once per SHOW_LIST_TTL across restarts);
+# web workers only read the stored copy (_stored_show_list), so no request waits
+# on the origin and every worker serves the same list.
+
+
+def _stored_show_list():
+    """Web side: the crawler-persisted show list, or None before its first fetch.
+
+    Never fetches from Showlink. One small stamp read per call; the list itself is
+    re-read only when the stored version moved. When the stamp can't be read the
+    last in-process copy is served."""
+    stamp = _load_show_list_version()
+    if stamp is not None and stamp["version"] != _show_list_cache["version"]:
+        stored = _load_show_list()
+        if stored is not None:
+            _show_list_cache.update(data=stored["shows"], ts=stored["fetched_at"], version=stored["version"])
+    return _show_list_cache["data"]
+
 
 def _get_show_list():
-    """Return cached show list, refreshing if stale."""
+    """Crawler side: the show list, re-fetched from Showlink and persisted when
+    the stored one is older than SHOW_LIST_TTL. Raises on fetch failure, like the
+    page fetches themselves."""
     now = time.time()
-    if _show_list_cache["data"] and (now - _show_list_cache["ts"]) < SHOW_LIST_TTL:
-        return _show_list_cache["data"]
+    stamp = _load_show_list_version()
+    if stamp is not None and (now - stamp["fetched_at"]) < SHOW_LIST_TTL:
+        shows = _stored_show_list()
+        if shows is not None:
+            return shows
 
-    soup = _fetch_page(BASE_URL)
+    soup = _fetch_page(BASE_URL, page="list")
     shows = _parse_show_list(soup)
 
-    _show_list_cache["data"] = shows
-    _show_list_cache["ts"] = now
+    version = _save_show_list(shows, now)
+    _show_list_cache.update(data=shows, ts=now, version=version)
+    logger.info("dog_show_list_stored", count=len(shows), version=version[:12])
     return shows
@@ -0,0 +1,258 @@
+"""Single-flight coalescing for the expensive dog read paths.
+
+When a popular live show opens, many viewers ask for the same whole-show doc,
+stats, or search at the same moment. `_single_flight(kind, key, compute)` (with
+a hashable `key`) makes the identical concurrent calls share one computation:
+
+- Within a process, the first caller (the leader) computes; threads arriving
+  while it runs wait on its flight and get the same value (or exception).
+- Across processes (the gunicorn workers, the crawler), the leader also holds an
+  flock on its key's shard, `<shard>.lock` in a `.flight` directory next to
+  dog.db. A worker that finds the lock taken registers itself on
+  `<shard>.wait` and waits for the lock; a leader that sees registered waiters
+  when it finishes publishes its value, tagged with its key, to
+  `<shard>.json`, and each waiter takes a value for its own key published
+  after it started waiting instead of recomputing. A waiter that finds nothing
+  (the leader failed, finished before the waiter registered, or computed
+  another key of the shard) computes itself, still under the lock. The last
+  waiter out deletes the published value. Waits are bounded by
+  SINGLE_FLIGHT_WAIT_SECONDS.
+- Flights nest (a search computes show stats, which read the result doc), and
+  a shard's flock is not re-entrant: an inner key landing on a shard its
+  thread already holds would wait on itself. Each thread tracks the shards it
+  holds, and an inner flight on one of them computes under the in-process
+  part only.
+
+The keys come from requests (every distinct search query, every doc version), so
+the directory never holds a file per key: keys hash onto FLIGHT_SHARDS shards,
+at most three files each. Two keys on one shard only serialize their
+cross-process computations; each still computes its own value.
+
+Only in-flight work is shared: nothing here outlives the computation, so a call
+arriving after the leader finished computes afresh (the callers' own caches
+decide freshness). Values crossing processes must be JSON-serializable, and
+callers must treat a coalesced value as read-only. Without `fcntl` or with an
+in-memory database only the in-process part applies.
+
+Coalesced hits are counted per kind and logged as `dog_single_flight_coalesced`
+(with the running `computed_total`/`coalesced_total`/`cross_process_total`)
+whenever a flight served anyone besides its leader.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import threading
+import time
+
+import structlog
+
+from . import config
+from . import db as dog_db
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None
+
+logger = structlog.get_logger(__name__)
+
+SINGLE_FLIGHT_WAIT_SECONDS = config.SINGLE_FLIGHT_WAIT_SECONDS
+FLIGHT_SHARDS = 64
+_LOCK_POLL_SECONDS = 0.02
+
+_flights = {}
+_flights_lock = threading.Lock()
+# {kind: {"computed", "coalesced", "cross_process"}}: leader computations,
+# in-process waiters served by a leader, and values taken from another process.
+_counters = {}
+# Per thread: the lock paths of the shards its enclosing flights hold.
+_held = threading.local()
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.waiters = 0
+        self.value = None
+        self.error = None
+
+
+def _count(kind, field, n=1):
+    counters = _counters.setdefault(kind, {"computed": 0, "coalesced": 0, "cross_process": 0})
+    counters[field] += n
+    return counters
+
+
+def _single_flight_stats():
+    """Snapshot of the per-kind counters."""
+    with _flights_lock:
+        return {kind: dict(counters) for kind, counters in _counters.items()}
+
+
+def _flight_paths(kind, key):
+    """(directory, lock, wait, result paths, key digest) of the key's shard, or
+    None when cross-process flights are unavailable."""
+    path = dog_db.database_path() if fcntl is not None else None
+    if path is None:
+        return None
+    directory = path + ".flight"
+    digest = hashlib.sha1(json.dumps([kind, key], default=str).encode("utf-8")).hexdigest()[:32]
+    base = os.path.join(directory, f"{int(digest[:8], 16) % FLIGHT_SHARDS:02d}")
+    return directory, base + ".lock", base + ".wait", base + ".json", digest
+
+
+def _try_flock(fd, flags):
+    try:
+        fcntl.flock(fd, flags | fcntl.LOCK_NB)
+        return True
+    except BlockingIOError:
+        return False
+
+
+def _wait_flock(fd, timeout):
+    deadline = time.monotonic() + timeout
+    while not _try_flock(fd, fcntl.LOCK_EX):
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(_LOCK_POLL_SECONDS)
+    return True
+
+
+def _read_published(result_path, digest, since):
+    try:
+        with open(result_path, encoding="utf-8") as fh:
+            published = json.load(fh)
+    except (OSError, ValueError):
+        return False, None
+    if not isinstance(published, dict) or published.get("key") != digest or (published.get("ts") or 0) < since:
+        return False, None
+    return True, published.get("value")
+
+
+def _publish(result_path, digest, value):
+    tmp_path = f"{result_path}.{os.getpid()}.{threading.get_ident()}"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump({"key": digest, "ts": time.time(), "value": value}, fh)
+        os.replace(tmp_path, result_path)
+    except Exception:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def _has_process_waiters(wait_fd):
+    # Waiters hold a shared lock on the wait file; an exclusive probe fails
+    # while any is registered.
+    if _try_flock(wait_fd, fcntl.LOCK_EX):
+        fcntl.flock(wait_fd, fcntl.LOCK_UN)
+        return False
+    return True
+
+
+def _held_shards():
+    held = getattr(_held, "shards", None)
+    if held is None:
+        held = _held.shards = set()
+    return held
+
+
+def _compute_across_processes(kind, key, compute):
+    """(value, shared): compute under the cross-process lock, or take the value
+    another process published while this one waited."""
+    paths = _flight_paths(kind, key)
+    if paths is None:
+        return compute(), False
+    directory, lock_path, wait_path, result_path, digest = paths
+    held = _held_shards()
+    if lock_path in held:
+        # An enclosing flight of this thread holds the shard already.
+        return compute(), False
+    try:
+        os.makedirs(directory, exist_ok=True)
+        lock_fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        wait_fd = os.open(wait_path, os.O_RDWR | os.O_CREAT, 0o644)
+    except OSError:
+        logger.warning("dog_single_flight_lock_unavailable", kind=kind, exc_info=True)
+        return compute(), False
+
+    try:
+        if not _try_flock(lock_fd, fcntl.LOCK_EX):
+            since = time.time()
+            fcntl.flock(wait_fd, fcntl.LOCK_SH)
+            try:
+                locked = _wait_flock(lock_fd, SINGLE_FLIGHT_WAIT_SECONDS)
+            finally:
+                fcntl.flock(wait_fd, fcntl.LOCK_UN)
+            found, value = _read_published(result_path, digest, since)
+            if locked and not _has_process_waiters(wait_fd):
+                # Nobody left to read it; holding the lock, no leader is writing it.
+                with contextlib.suppress(OSError):
+                    os.remove(result_path)
+            if found:
+                return value, True
+            if not locked:
+                logger.warning("dog_single_flight_wait_timeout", kind=kind, wait_s=SINGLE_FLIGHT_WAIT_SECONDS)
+                return compute(), False
+
+        held.add(lock_path)
+        try:
+            value = compute()
+        finally:
+            held.discard(lock_path)
+        if _has_process_waiters(wait_fd):
+            try:
+                _publish(result_path, digest, value)
+            except (OSError, TypeError, ValueError):
+                logger.warning("dog_single_flight_publish_failed", kind=kind, exc_info=True)
+        return value, False
+    finally:
+        os.close(wait_fd)
+        os.close(lock_fd)  # also releases the flock
+
+
+def _single_flight(kind, key, compute):
+    """compute(), shared with every identical (kind, key) call in flight at the
+    same time in this process and, where possible, in the other workers."""
+    flight_key = (dog_db._current_uri, kind, key)
+    with _flights_lock:
+        flight = _flights.get(flight_key)
+        if flight is not None:
+            flight.waiters += 1
+            leader = False
+        else:
+            flight = _flights[flight_key] = _Flight()
+            leader = True
+
+    if not leader:
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.value
+
+    shared = False
+    try:
+        flight.value, shared = _compute_across_processes(kind, key, compute)
+    except Exception as exc:
+        flight.error = exc
+        raise
+    finally:
+        with _flights_lock:
+            _flights.pop(flight_key, None)
+            waiters = flight.waiters
+            counters = _count(kind, "cross_process" if shared else "computed")
+            if waiters:
+                counters = _count(kind, "coalesced", waiters)
+            counters = dict(counters)
+        flight.done.set()
+        if waiters or shared:
+            logger.info(
+                "dog_single_flight_coalesced",
+                kind=kind,
+                waiters=waiters,
+                from_other_process=shared,
+                **{f"{field}_total": count for field, count in counters.items()},
+            )
+    return flight.value
@@ -6,12 +6,19 @@ read paths (show detail, stats, search) run directly against dog.db. Everything
 goes through `store.py`, which wraps these helpers in sessions and error handling.
 """
 
+import hashlib
 import json
+import time
+import unicodedata
 
-from sqlalchemy import delete, exists, func, or_, select, update
+from sqlalchemy import Integer, Text, and_, case, column, delete, exists, func, insert, or_, select, table, tuple_, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from . import db as dog_db
 
 from .models import (
-    DogBreed, DogBreedAward, DogMeta, DogResult, DogResultCache, DogResultJob, DogShow,
+    DogBreed, DogBreedAward, DogChange, DogFetchState, DogMeta, DogResult, DogResultCache, DogResultJob,
+    DogResultPayload, DogResultTombstone, DogShow, DogShowStats,
 )
 from .utils import _clean_judge_name, _parse_reg_id
 
@@ -33,6 +40,23 @@ _JOB_FIELDS = (
 # Show index  (<-> dog_show_index.json)
 # ---------------------------------------------------------------------------
 
+# Child rows (breeds, results, awards) are written as Core executemany inserts
+# rather than one ORM object each: no identity map or unit-of-work bookkeeping,
+# and SQLite sees one prepared statement per batch. A whole-show rewrite holds
+# the write lock several times shorter (scripts/dog_bench_writes.py). Nothing
+# reads these rows back through the session before commit, so skipping the ORM
+# loses nothing.
+_BULK_INSERT_BATCH = 1000
+
+
+def _bulk_insert(session, model, rows):
+    # Tallied on the session; db.run_write counts them as written once committed.
+    pending = session.info.setdefault("rows_inserted", {})
+    pending[model.__tablename__] = pending.get(model.__tablename__, 0) + len(rows)
+    for start in range(0, len(rows), _BULK_INSERT_BATCH):
+        session.execute(insert(model), rows[start:start + _BULK_INSERT_BATCH])
+
+
 def _breed_judge_for_storage(breed):
     judge = _clean_judge_name(breed.get("judge"))
     return judge or None
@@ -41,6 +65,7 @@ def _breed_judge_for_storage(breed):
 def write_show(session, show_id, show):
     """Replace one show's metadata + breed list. Returns nothing."""
     sid = int(show_id)
+    _search_forget(session, DogBreed, _search_ids(session, DogBreed, DogBreed.show_id == sid))
     session.execute(delete(DogBreed).where(DogBreed.show_id == sid))
     session.merge(DogShow(
         id=sid,
@@ -54,18 +79,23 @@ def write_show(session, show_id, show):
         empty_breed_list_confirmed=bool(show.get("empty_breed_list_confirmed")),
     ))
     session.flush()  # ensure the parent show row exists before its breed FKs
-    for position, breed in enumerate(show.get("breeds") or []):
-        session.add(DogBreed(
-            show_id=sid,
-            position=position,
-            fci_group=str(breed.get("group", "") or ""),
-            breed_id=str(breed.get("breed_id", "") or ""),
-            name=breed.get("name", "") or "",
-            entry_count=breed.get("count"),
-            has_results=bool(breed.get("has_results")),
-            judge=_breed_judge_for_storage(breed),
-            source_url=breed.get("source_url", "") or "",
-        ))
+    _bulk_insert(session, DogBreed, [
+        {
+            "show_id": sid,
+            "position": position,
+            "fci_group": str(breed.get("group", "") or ""),
+            "breed_id": str(breed.get("breed_id", "") or ""),
+            "name": breed.get("name", "") or "",
+            "entry_count": breed.get("count"),
+            "has_results": bool(breed.get("has_results")),
+            "judge": _breed_judge_for_storage(breed),
+            "source_url": breed.get("source_url", "") or "",
+        }
+        for position, breed in enumerate(show.get("breeds") or [])
+    ])
+    _search_add(session, DogBreed, _search_ids(session, DogBreed, DogBreed.show_id == sid))
+    _search_add(session, DogShow, [sid])
+    _log_changes(session, sid, "show")
 
 
 def _breed_to_dict(row):
@@ -238,12 +268,16 @@ def set_breed_judge(session, show_id, fci_group, breed_id, judge, only_missing=F
         stmt = stmt.where(or_(DogBreed.judge.is_(None), DogBreed.judge == ""))
     else:
         stmt = stmt.where(or_(DogBreed.judge.is_(None), DogBreed.judge != judge))
-    return session.execute(stmt).rowcount
+    changed_ids = [row[0] for row in session.execute(stmt.returning(DogBreed.id))]
+    _search_add(session, DogBreed, changed_ids)
+    if changed_ids:
+        _log_changes(session, show_id, "judge", [(fci_group, breed_id)])
+    return len(changed_ids)
 
 
 def set_breed_has_results(session, show_id, fci_group, breed_id):
     """Flag a breed's index row as having results. Returns rows changed."""
-    return session.execute(
+    changed = session.execute(
         update(DogBreed)
         .where(
             DogBreed.show_id == int(show_id),
@@ -253,16 +287,25 @@ def set_breed_has_results(session, show_id, fci_group, breed_id):
         )
         .values(has_results=True)
     ).rowcount
+    if changed:
+        # The flag feeds result_breed_count but moves no stats stamp.
+        drop_show_stats(session, [show_id])
+        _log_changes(session, show_id, "has_results", [(fci_group, breed_id)])
+    return changed
 
 
 # ---------------------------------------------------------------------------
 # Whole-show result doc  (<-> dog_result_cache/<id>.json)
 # ---------------------------------------------------------------------------
 
+# Doc keys that are read back from rows, never stored in the meta blob.
+_RESULT_DOC_DERIVED = ("results", "show_id", "result_cursor")
+
+
 def _result_cache_meta_blob(doc):
     meta = {
         k: v for k, v in doc.items()
-        if k not in _RESULT_DOC_PROMOTED and k not in ("results", "show_id")
+        if k not in _RESULT_DOC_PROMOTED and k not in _RESULT_DOC_DERIVED
     }
     return json.dumps(meta, ensure_ascii=False)
 
@@ -284,65 +327,141 @@ def _write_result_cache_header(session, sid, doc):
     ))
 
 
+# The stored result-row columns other than show_id/seq: a row is unchanged by a
+# rewrite exactly when these match.
+_RESULT_ROW_FIELDS = (
+    "fci_group", "breed_id", "breed_name", "number", "name", "reg_url", "reg_id",
+    "breed_judge", "grade", "placement", "competitive_placement", "awards",
+    "critique", "gender", "class_name",
+)
+
+
+def _result_row(result):
+    return {
+        "fci_group": str(result.get("breedGroup", "") or ""),
+        "breed_id": str(result.get("breedId", "") or ""),
+        "breed_name": result.get("breedName", "") or "",
+        "number": result.get("number"),
+        "name": result.get("name", "") or "",
+        "reg_url": result.get("reg_url", "") or "",
+        "reg_id": _parse_reg_id(result.get("reg_url")) or None,
+        "breed_judge": (result.get("breedObj") or {}).get("judge") or None,
+        "grade": result.get("grade", "") or "",
+        "placement": result.get("placement"),
+        "competitive_placement": result.get("competitive_placement", "") or "",
+        "awards": result.get("awards", "") or "",
+        "critique": result.get("critique", "") or "",
+        "gender": result.get("gender", "") or "",
+        "class_name": result.get("class_name", "") or "",
+    }
+
+
 def _insert_result_rows(session, sid, results, start_seq=0):
-    for offset, result in enumerate(results or []):
-        session.add(DogResult(
-            show_id=sid,
-            seq=start_seq + offset,
-            fci_group=str(result.get("breedGroup", "") or ""),
-            breed_id=str(result.get("breedId", "") or ""),
-            breed_name=result.get("breedName", "") or "",
-            number=result.get("number"),
-            name=result.get("name", "") or "",
-            reg_url=result.get("reg_url", "") or "",
-            reg_id=_parse_reg_id(result.get("reg_url")) or None,
-            breed_judge=(result.get("breedObj") or {}).get("judge") or None,
-            grade=result.get("grade", "") or "",
-            placement=result.get("placement"),
-            competitive_placement=result.get("competitive_placement", "") or "",
-            awards=result.get("awards", "") or "",
-            critique=result.get("critique", "") or "",
-            gender=result.get("gender", "") or "",
-            class_name=result.get("class_name", "") or "",
-        ))
+    _bulk_insert(session, DogResult, [
+        {"show_id": sid, "seq": start_seq + offset, **_result_row(result)}
+        for offset, result in enumerate(results or [])
+    ])
 
 
 # completed_breeds keys are "group:breed_id"; each value's "awards" list holds the
 # breed honor-roll winners projected into the queryable DogBreedAward table.
+def _breed_award_rows(sid, group, breed_id, awards):
+    return [
+        {
+            "show_id": sid,
+            "fci_group": group,
+            "breed_id": breed_id,
+            "position": position,
+            "award_type": award.get("type", "") or "",
+            "name": award.get("name", "") or "",
+            "owner": award.get("owner", "") or "",
+            "text": award.get("text", "") or "",
+        }
+        for position, award in enumerate(awards or [])
+        if isinstance(award, dict)
+    ]
+
+
 def _insert_breed_award_rows(session, sid, group, breed_id, awards):
-    for position, award in enumerate(awards or []):
-        if not isinstance(award, dict):
-            continue
-        session.add(DogBreedAward(
-            show_id=sid,
-            fci_group=group,
-            breed_id=breed_id,
-            position=position,
-            award_type=award.get("type", "") or "",
-            name=award.get("name", "") or "",
-            owner=award.get("owner", "") or "",
-            text=award.get("text", "") or "",
-        ))
+    _bulk_insert(session, DogBreedAward, _breed_award_rows(sid, group, breed_id, awards))
+
+
+def _next_result_seq(session, sid):
+    """The next seq of a show: above every seq its rows or tombstones hold."""
+    return session.execute(select(func.max(
+        func.coalesce(select(func.max(DogResult.seq)).where(DogResult.show_id == sid).scalar_subquery(), -1),
+        func.coalesce(
+            select(func.max(DogResultTombstone.seq)).where(DogResultTombstone.show_id == sid).scalar_subquery(), -1,
+        ),
+    ))).scalar_one() + 1
+
+
+def _tombstone_breed(session, sid, group, breed_id, seq, dropped_at):
+    session.execute(
+        sqlite_insert(DogResultTombstone)
+        .values(show_id=sid, fci_group=group, breed_id=breed_id, seq=seq, dropped_at=dropped_at)
+        .on_conflict_do_update(
+            index_elements=[DogResultTombstone.show_id, DogResultTombstone.fci_group, DogResultTombstone.breed_id],
+            set_={"seq": seq, "dropped_at": dropped_at},
+        )
+    )
 
 
 def write_result_doc(session, show_id, doc):
-    """Full delete-and-reinsert of a whole-show result doc.
-
-    Reserved for the final status="complete" save and the one-off migration, where
-    a single clean rewrite is correct (and renormalizes seq to 0..n-1). Per-breed
-    progress saves go through append_result_breed instead, which avoids re-deleting
-    and re-inserting the entire accumulated set on every breed."""
+    """Rewrite a whole-show result doc, breed by breed.
+
+    Used by the final status="complete" save, the fresh-crawl baseline and the
+    one-off migration. A breed whose rows are unchanged keeps them (and their
+    seq); a changed or new breed's rows are replaced and appended after the
+    show's current seq, and a breed that had rows before is tombstoned there —
+    so a live show's full save rewrites only what the pass actually refetched,
+    and /all-results?since= sees exactly those breeds. Per-breed progress saves
+    go through append_result_breed. The honor-roll awards are rewritten whole."""
     sid = int(show_id)
-    session.execute(delete(DogResult).where(DogResult.show_id == sid))
+    new_rows = {}
+    for result in doc.get("results") or []:
+        row = _result_row(result)
+        new_rows.setdefault((row["fci_group"], row["breed_id"]), []).append(row)
+    old_rows = {}
+    for row in session.execute(
+        select(*[getattr(DogResult, field) for field in _RESULT_ROW_FIELDS])
+        .where(DogResult.show_id == sid)
+        .order_by(DogResult.seq)
+    ):
+        old_rows.setdefault((row.fci_group, row.breed_id), []).append(tuple(row))
+
+    changed = [
+        key for key, rows in new_rows.items()
+        if old_rows.get(key) != [tuple(r[field] for field in _RESULT_ROW_FIELDS) for r in rows]
+    ]
+    dropped = [key for key in old_rows if key not in new_rows or key in changed]
+    next_seq = _next_result_seq(session, sid)
+    for group, breed_id in dropped:
+        scope = (DogResult.show_id == sid, DogResult.fci_group == group, DogResult.breed_id == breed_id)
+        _search_forget(session, DogResult, _search_ids(session, DogResult, *scope))
+        session.execute(delete(DogResult).where(*scope))
+        _tombstone_breed(session, sid, group, breed_id, next_seq, doc.get("updated_at"))
+    _search_forget(session, DogBreedAward, _search_ids(session, DogBreedAward, DogBreedAward.show_id == sid))
     session.execute(delete(DogBreedAward).where(DogBreedAward.show_id == sid))
 
     _write_result_cache_header(session, sid, doc)
-    _insert_result_rows(session, sid, doc.get("results") or [], start_seq=0)
+    _bulk_insert(session, DogResult, [
+        {"show_id": sid, "seq": next_seq + offset, **row}
+        for offset, row in enumerate(row for key in changed for row in new_rows[key])
+    ])
+    # One batched insert for every breed's honor roll, not one per breed.
+    award_rows = []
     for breed_key, breed_data in (doc.get("completed_breeds") or {}).items():
         if not isinstance(breed_data, dict):
             continue
         group, _, bid = str(breed_key).partition(":")
-        _insert_breed_award_rows(session, sid, group, bid, breed_data.get("awards"))
+        award_rows.extend(_breed_award_rows(sid, group, bid, breed_data.get("awards")))
+    _bulk_insert(session, DogBreedAward, award_rows)
+    session.flush()
+    _search_add(session, DogResult, _search_ids(session, DogResult, DogResult.show_id == sid, DogResult.seq >= next_seq))
+    _search_add(session, DogBreedAward, _search_ids(session, DogBreedAward, DogBreedAward.show_id == sid))
+    _log_changes(session, sid, "result_doc")
+    _log_changes(session, sid, "results", sorted(set(dropped) | set(changed)))
 
 
 def write_result_cache_header(session, show_id, doc):
@@ -356,36 +475,67 @@ def write_result_cache_header(session, show_id, doc):
 
 def append_result_breed(session, show_id, doc, group, breed_id, results):
     """Incrementally persist one freshly-completed breed: append its result rows
-    (seq continues monotonically after the show's current max) and its honor-roll
+    (seq continues after every seq the show has handed out) and its honor-roll
     awards, then refresh the cache header/meta from doc.
 
     Scoped-deletes the breed's existing result + award rows first so a resumed or
-    retried breed stays idempotent (no duplicates). Each transaction writes a
-    single breed's handful of rows instead of the whole accumulated set."""
+    retried breed stays idempotent (no duplicates); replaced rows leave a
+    tombstone at the new seq. Each transaction writes a single breed's handful of
+    rows instead of the whole accumulated set."""
     sid = int(show_id)
     group = str(group or "")
     breed_id = str(breed_id or "")
+    _replace_breed_rows(session, sid, doc, group, breed_id, results)
+    _write_result_cache_header(session, sid, doc)
+    _log_changes(session, sid, "results", [(group, breed_id)])
 
-    session.execute(delete(DogResult).where(
-        DogResult.show_id == sid,
-        DogResult.fci_group == group,
-        DogResult.breed_id == breed_id,
-    ))
-    session.execute(delete(DogBreedAward).where(
-        DogBreedAward.show_id == sid,
-        DogBreedAward.fci_group == group,
-        DogBreedAward.breed_id == breed_id,
-    ))
 
-    next_seq = session.execute(
-        select(func.coalesce(func.max(DogResult.seq), -1)).where(DogResult.show_id == sid)
-    ).scalar_one() + 1
+def _replace_breed_rows(session, sid, doc, group, breed_id, results):
+    result_scope = (DogResult.show_id == sid, DogResult.fci_group == group, DogResult.breed_id == breed_id)
+    award_scope = (
+        DogBreedAward.show_id == sid, DogBreedAward.fci_group == group, DogBreedAward.breed_id == breed_id,
+    )
+
+    next_seq = _next_result_seq(session, sid)
+    _search_forget(session, DogResult, _search_ids(session, DogResult, *result_scope))
+    _search_forget(session, DogBreedAward, _search_ids(session, DogBreedAward, *award_scope))
+    if session.execute(delete(DogResult).where(*result_scope)).rowcount:
+        _tombstone_breed(session, sid, group, breed_id, next_seq, doc.get("updated_at"))
+    session.execute(delete(DogBreedAward).where(*award_scope))
+
     _insert_result_rows(session, sid, results or [], start_seq=next_seq)
 
     breed_data = (doc.get("completed_breeds") or {}).get(f"{group}:{breed_id}") or {}
     _insert_breed_award_rows(session, sid, group, breed_id, breed_data.get("awards"))
-
-    _write_result_cache_header(session, sid, doc)
+    session.flush()
+    _search_add(session, DogResult, _search_ids(session, DogResult, *result_scope))
+    _search_add(session, DogBreedAward, _search_ids(session, DogBreedAward, *award_scope))
+
+
+def write_breed_captures(session, show_id, doc, captures, write_rows=True):
+    """Persist a batch of one show's freshly-captured breeds in one transaction
+    (the crawler's group commit, see writer.py). `captures` are {"group",
+    "breed_id", "results", "result_count", "judge"} dicts. Per breed: its result
+    and award rows as append_result_breed (when `write_rows`), its index
+    has_results flag and judge; then the cache header once, from `doc`.
+    Returns the number of index rows changed."""
+    sid = int(show_id)
+    changed = 0
+    appended = []
+    for capture in captures:
+        group = str(capture.get("group") or "")
+        breed_id = str(capture.get("breed_id") or "")
+        if write_rows:
+            _replace_breed_rows(session, sid, doc, group, breed_id, capture.get("results"))
+            appended.append((group, breed_id))
+        if capture.get("result_count"):
+            changed += set_breed_has_results(session, sid, group, breed_id)
+        if capture.get("judge"):
+            changed += set_breed_judge(session, sid, group, breed_id, capture["judge"])
+    if write_rows and appended:
+        _write_result_cache_header(session, sid, doc)
+        _log_changes(session, sid, "results", appended)
+    return changed
 
 
 def _breed_obj_for(breed_row, fallback_group, fallback_breed_id, fallback_name):
@@ -394,6 +544,32 @@ def _breed_obj_for(breed_row, fallback_group, fallback_breed_id, fallback_name):
     return {"name": fallback_name or "", "group": fallback_group or "", "breed_id": fallback_breed_id or ""}
 
 
+def read_result_doc_version(session, show_id):
+    """The cheap freshness stamp of a show's result doc, or None without a cache.
+
+    One primary-key read of the cache header joined to the show row: every doc
+    write moves `updated_at`/`cached_at`/`status`, and a re-index moves the show's
+    own `updated_at` (the breedObj fields come from dog_breed). A breed's judge or
+    result flag set on its own moves neither, so the show's newest dog_change id
+    (one ix_change_show seek) is part of the stamp too. A reconstructed doc stays
+    valid for exactly as long as this tuple is unchanged."""
+    sid = int(show_id)
+    change_id = (
+        select(func.max(DogChange.id)).where(DogChange.show_id == sid).scalar_subquery()
+    )
+    row = session.execute(
+        select(
+            DogResultCache.updated_at, DogResultCache.cached_at, DogResultCache.status,
+            DogShow.updated_at.label("show_updated_at"), change_id.label("change_id"),
+        )
+        .outerjoin(DogShow, DogShow.id == DogResultCache.show_id)
+        .where(DogResultCache.show_id == sid)
+    ).first()
+    if row is None:
+        return None
+    return (row.updated_at, row.cached_at, row.status, row.show_updated_at, row.change_id)
+
+
 def read_result_doc(session, show_id):
     sid = int(show_id)
     cache = session.get(DogResultCache, sid)
@@ -415,41 +591,431 @@ def read_result_doc(session, show_id):
     if cache.meta:
         doc.update(json.loads(cache.meta))
 
-    results = []
-    for row in session.execute(
-        select(DogResult).where(DogResult.show_id == sid).order_by(DogResult.seq)
-    ).scalars():
-        breed_row = breed_lookup.get((row.fci_group or "", row.breed_id or ""))
-        breed_obj = _breed_obj_for(breed_row, row.fci_group, row.breed_id, row.breed_name)
-        # The result row carries the breed's judge in its own right (the result
-        # cache is the source of per-breed judges), so it survives even when the
-        # index breed has not been enriched with it yet.
-        if row.breed_judge:
-            breed_obj["judge"] = row.breed_judge
-        result = {
-            "number": row.number,
-            "name": row.name or "",
-            "reg_url": row.reg_url or "",
-            "grade": row.grade or "",
-            "placement": row.placement,
-            "awards": row.awards or "",
-            "critique": row.critique or "",
-            "gender": row.gender or "",
-            "class_name": row.class_name or "",
-            "breedName": row.breed_name or "",
-            "breedGroup": row.fci_group or "",
-            "breedId": row.breed_id or "",
-            "breedObj": breed_obj,
-        }
-        # Only emit when present, mirroring the optional judge field — keeps the
-        # pre-Phase-C migrated docs (which had no PU/PN data) round-tripping clean.
-        if row.competitive_placement:
-            result["competitive_placement"] = row.competitive_placement
-        results.append(result)
-    doc["results"] = results
+    doc["results"] = [
+        _result_from_row(row, breed_lookup)
+        for row in session.execute(
+            select(DogResult).where(DogResult.show_id == sid).order_by(DogResult.seq)
+        ).scalars()
+    ]
+    doc["result_cursor"] = _next_result_seq(session, sid) - 1
     return doc
 
 
+def _result_from_row(row, breed_lookup):
+    """A DogResult row in the whole-show doc's result shape."""
+    breed_row = breed_lookup.get((row.fci_group or "", row.breed_id or ""))
+    breed_obj = _breed_obj_for(breed_row, row.fci_group, row.breed_id, row.breed_name)
+    # The result row carries the breed's judge in its own right (the result
+    # cache is the source of per-breed judges), so it survives even when the
+    # index breed has not been enriched with it yet.
+    if row.breed_judge:
+        breed_obj["judge"] = row.breed_judge
+    result = {
+        "number": row.number,
+        "name": row.name or "",
+        "reg_url": row.reg_url or "",
+        "grade": row.grade or "",
+        "placement": row.placement,
+        "awards": row.awards or "",
+        "critique": row.critique or "",
+        "gender": row.gender or "",
+        "class_name": row.class_name or "",
+        "breedName": row.breed_name or "",
+        "breedGroup": row.fci_group or "",
+        "breedId": row.breed_id or "",
+        "breedObj": breed_obj,
+    }
+    # Only emit when present, mirroring the optional judge field — keeps the
+    # pre-Phase-C migrated docs (which had no PU/PN data) round-tripping clean.
+    if row.competitive_placement:
+        result["competitive_placement"] = row.competitive_placement
+    return result
+
+
+def read_result_delta(session, show_id, since):
+    """What changed in a show's result rows after seq cursor `since`, or None
+    without a cache.
+
+    {"cursor", "reset", "status", "updated_at", "cached_at", "results",
+    "tombstones", "completed_breeds"}: the rows written after the cursor (seq
+    order, doc shape), the (group, breed_id) of every breed whose earlier rows
+    were dropped after it — a client discards its rows for those before applying
+    `results` — and the completed_breeds entries of every breed touched either
+    way. `cursor` is the show's current high-water seq; `reset` is True (and
+    nothing else is read) when `since` is ahead of it, i.e. the cursor came from
+    a different generation of the cache and the client must start over."""
+    sid = int(show_id)
+    header = read_result_doc_header(session, sid)
+    if header is None:
+        return None
+    cursor = _next_result_seq(session, sid) - 1
+    delta = {
+        "cursor": cursor,
+        "reset": since > cursor,
+        "status": header["status"],
+        "updated_at": header["updated_at"],
+        "cached_at": header["cached_at"],
+        "results": [],
+        "tombstones": [],
+        "completed_breeds": {},
+    }
+    if delta["reset"]:
+        return delta
+
+    rows = session.execute(
+        select(DogResult).where(DogResult.show_id == sid, DogResult.seq > since).order_by(DogResult.seq)
+    ).scalars().all()
+    delta["tombstones"] = [
+        (row.fci_group, row.breed_id)
+        for row in session.execute(
+            select(DogResultTombstone.fci_group, DogResultTombstone.breed_id)
+            .where(DogResultTombstone.show_id == sid, DogResultTombstone.seq > since)
+            .order_by(DogResultTombstone.seq)
+        )
+    ]
+    touched = set(delta["tombstones"]) | {(row.fci_group or "", row.breed_id or "") for row in rows}
+    if rows:
+        breed_lookup = {
+            (b.fci_group or "", b.breed_id or ""): b
+            for b in session.execute(
+                select(DogBreed).where(
+                    DogBreed.show_id == sid,
+                    tuple_(DogBreed.fci_group, DogBreed.breed_id).in_(sorted(touched)),
+                )
+            ).scalars()
+        }
+        delta["results"] = [_result_from_row(row, breed_lookup) for row in rows]
+    completed = (header["meta"] or {}).get("completed_breeds") or {}
+    delta["completed_breeds"] = {
+        f"{group}:{bid}": completed[f"{group}:{bid}"]
+        for group, bid in sorted(touched)
+        if f"{group}:{bid}" in completed
+    }
+    return delta
+
+
+def read_breed_result_slice(session, show_id, fci_group, breed_id):
+    """One breed's slice of a show's result doc, or None without a cache.
+
+    The /results read path: the cache header plus that breed's completed_breeds
+    entry, its result rows (via ix_result_breed, in seq order) and its honor roll
+    (via ix_breed_award_breed) — never the rest of the show's rows. Result rows
+    come back in the per-breed response shape with the breedObj judge already
+    resolved the way read_result_doc resolves it."""
+    sid = int(show_id)
+    group = str(fci_group or "")
+    bid = str(breed_id or "")
+    cache = session.execute(
+        select(
+            DogResultCache.status, DogResultCache.title,
+            DogResultCache.updated_at, DogResultCache.cached_at, DogResultCache.meta,
+        ).where(DogResultCache.show_id == sid)
+    ).first()
+    if cache is None:
+        return None
+
+    completed_breeds = (json.loads(cache.meta) if cache.meta else {}).get("completed_breeds") or {}
+    breed_key = f"{group}:{bid}"
+
+    breed_row = session.execute(
+        select(*_BREED_COLUMNS)
+        .where(DogBreed.show_id == sid, DogBreed.fci_group == group, DogBreed.breed_id == bid)
+        .order_by(DogBreed.position)
+        .limit(1)
+    ).first()
+
+    rows = session.execute(
+        select(*_PROFILE_RESULT_COLUMNS)
+        .where(DogResult.show_id == sid, DogResult.fci_group == group, DogResult.breed_id == bid)
+        .order_by(DogResult.seq)
+    ).all()
+
+    awards = [
+        {"type": row.award_type or "", "text": row.text or "", "name": row.name or "", "owner": row.owner or ""}
+        for row in session.execute(
+            select(DogBreedAward.award_type, DogBreedAward.text, DogBreedAward.name, DogBreedAward.owner)
+            .where(DogBreedAward.show_id == sid, DogBreedAward.fci_group == group, DogBreedAward.breed_id == bid)
+            .order_by(DogBreedAward.position)
+        )
+    ]
+
+    if rows:
+        breed_obj = _breed_obj_for(breed_row, group, bid, rows[0].breed_name)
+        if rows[0].breed_judge:
+            breed_obj["judge"] = rows[0].breed_judge
+    else:
+        breed_obj = _breed_to_dict(breed_row) if breed_row is not None else {}
+
+    return {
+        "status": cache.status,
+        "title": cache.title,
+        "updated_at": cache.updated_at,
+        "cached_at": cache.cached_at,
+        "completed": breed_key in completed_breeds,
+        "breed": breed_obj,
+        "awards": awards,
+        "results": [
+            {
+                "number": row.number,
+                "name": row.name or "",
+                "reg_url": row.reg_url or "",
+                "grade": row.grade or "",
+                "placement": row.placement,
+                "competitive_placement": row.competitive_placement or None,
+                "awards": row.awards or "",
+                "critique": row.critique or "",
+                "gender": row.gender or "",
+                "class_name": row.class_name or "",
+            }
+            for row in rows
+        ],
+    }
+
+
+def write_result_payload(session, show_id, version, payload):
+    """Store a show's materialized /all-results body, stamped with the doc
+    `version` (a read_result_doc_version tuple) it was built from."""
+    doc_updated_at, doc_cached_at, doc_status, show_updated_at, change_id = version
+    session.merge(DogResultPayload(
+        show_id=int(show_id),
+        doc_updated_at=doc_updated_at,
+        doc_cached_at=doc_cached_at,
+        doc_status=doc_status,
+        show_updated_at=show_updated_at,
+        change_id=change_id,
+        result_count=payload["result_count"],
+        cache_block=json.dumps(payload["cache"], ensure_ascii=False),
+        body=payload["body"],
+        body_crc=payload["body_crc"],
+        body_size=payload["body_size"],
+        created_at=payload["created_at"],
+    ))
+
+
+def read_result_payload(session, show_id):
+    """A show's materialized /all-results body, or None when there is none or it
+    was built from an older doc version than the one now on disk."""
+    sid = int(show_id)
+    payload = session.get(DogResultPayload, sid)
+    if payload is None:
+        return None
+    stamp = (
+        payload.doc_updated_at, payload.doc_cached_at, payload.doc_status,
+        payload.show_updated_at, payload.change_id,
+    )
+    if stamp != read_result_doc_version(session, sid):
+        return None
+    return {
+        "result_count": payload.result_count or 0,
+        "cache": json.loads(payload.cache_block) if payload.cache_block else {},
+        "body": payload.body,
+        "body_crc": payload.body_crc,
+        "body_size": payload.body_size,
+        "created_at": payload.created_at,
+    }
+
+
+def _show_stats_version_select():
+    return (
+        select(
+            DogShow.id, DogShow.updated_at.label("show_updated_at"),
+            DogResultCache.updated_at, DogResultCache.cached_at, DogResultCache.status,
+        )
+        .outerjoin(DogResultCache, DogResultCache.show_id == DogShow.id)
+    )
+
+
+def _show_stats_version(row):
+    return (row.show_updated_at, row.updated_at, row.cached_at, row.status)
+
+
+def read_show_stats_version(session, show_id):
+    """The inputs' version a show's stats are stamped with: the index row's
+    `updated_at` plus the result-cache header (None fields without a cache).
+    None when the show is not indexed."""
+    row = session.execute(_show_stats_version_select().where(DogShow.id == int(show_id))).first()
+    return _show_stats_version(row) if row is not None else None
+
+
+def write_show_stats(session, show_id, version, stats, valid_until, computed_at):
+    """Store a show's computed list stats (a dict, or None for "no stats"),
+    stamped with the read_show_stats_version `version` read before computing."""
+    show_updated_at, doc_updated_at, doc_cached_at, doc_status = version
+    session.merge(DogShowStats(
+        show_id=int(show_id),
+        stats=json.dumps(stats, ensure_ascii=False),
+        show_updated_at=show_updated_at,
+        doc_updated_at=doc_updated_at,
+        doc_cached_at=doc_cached_at,
+        doc_status=doc_status,
+        valid_until=valid_until,
+        computed_at=computed_at,
+    ))
+
+
+def read_show_stats(session, show_ids, now):
+    """{show_id: stats or None} for the requested shows whose stored stats are
+    current: stamp unchanged and `valid_until` not reached. Shows that are not
+    indexed map to None (they have no stats); shows with a missing or stale row
+    are left out, for the caller to compute. One statement for the whole list."""
+    ids = sorted({int(sid) for sid in show_ids})
+    if not ids:
+        return {}
+    stmt = (
+        _show_stats_version_select()
+        .add_columns(
+            DogShowStats.show_id.label("stats_show_id"), DogShowStats.stats,
+            DogShowStats.show_updated_at.label("stats_show_updated_at"),
+            DogShowStats.doc_updated_at, DogShowStats.doc_cached_at, DogShowStats.doc_status,
+            DogShowStats.valid_until,
+        )
+        .outerjoin(DogShowStats, DogShowStats.show_id == DogShow.id)
+        .where(DogShow.id.in_(ids))
+    )
+    current = {sid: None for sid in ids}
+    for row in session.execute(stmt):
+        stamp = (row.stats_show_updated_at, row.doc_updated_at, row.doc_cached_at, row.doc_status)
+        fresh = (
+            row.stats_show_id is not None
+            and stamp == _show_stats_version(row)
+            and (row.valid_until is None or row.valid_until > now)
+        )
+        if not fresh:
+            current.pop(row.id)
+            continue
+        try:
+            current[row.id] = json.loads(row.stats) if row.stats else None
+        except (ValueError, TypeError):
+            current.pop(row.id)
+    return current
+
+
+def due_show_stats_ids(session, now):
+    """Indexed shows whose stored stats are missing, stamped with an older input
+    version, or past their `valid_until` — the crawler's recompute list."""
+    stmt = (
+        _show_stats_version_select()
+        .add_columns(
+            DogShowStats.show_id.label("stats_show_id"),
+            DogShowStats.show_updated_at.label("stats_show_updated_at"),
+            DogShowStats.doc_updated_at, DogShowStats.doc_cached_at, DogShowStats.doc_status,
+            DogShowStats.valid_until,
+        )
+        .outerjoin(DogShowStats, DogShowStats.show_id == DogShow.id)
+        .order_by(DogShow.id)
+    )
+    due = []
+    for row in session.execute(stmt):
+        stamp = (row.stats_show_updated_at, row.doc_updated_at, row.doc_cached_at, row.doc_status)
+        if (
+            row.stats_show_id is None
+            or stamp != _show_stats_version(row)
+            or (row.valid_until is not None and row.valid_until <= now)
+        ):
+            due.append(row.id)
+    return due
+
+
+def drop_show_stats(session, show_ids=None):
+    """Retire stored stats whose inputs changed without moving their stamp (a
+    breed's result flag); all rows when `show_ids` is None."""
+    stmt = delete(DogShowStats)
+    if show_ids is not None:
+        stmt = stmt.where(DogShowStats.show_id.in_([int(sid) for sid in show_ids]))
+    session.execute(stmt)
+
+
+def read_show_event_stamps(session, show_ids):
+    """{show_id: (doc_updated_at, doc_cached_at, doc_status, stats_computed_at)}
+    for the live event streams (events.py): what moves when the crawler appends a
+    breed, settles a show or rewrites its stats. Fields read None without a cache
+    or stats row; shows not indexed are absent. One statement for all shows."""
+    ids = sorted({int(sid) for sid in show_ids})
+    if not ids:
+        return {}
+    stmt = (
+        select(
+            DogShow.id, DogResultCache.updated_at, DogResultCache.cached_at,
+            DogResultCache.status, DogShowStats.computed_at,
+        )
+        .outerjoin(DogResultCache, DogResultCache.show_id == DogShow.id)
+        .outerjoin(DogShowStats, DogShowStats.show_id == DogShow.id)
+        .where(DogShow.id.in_(ids))
+    )
+    return {row.id: (row.updated_at, row.cached_at, row.status, row.computed_at) for row in session.execute(stmt)}
+
+
+def read_result_doc_header(session, show_id):
+    """A show's result-cache header without any rows — {"status", "updated_at",
+    "cached_at", "meta"} with `meta` decoded (completed_breeds with each breed's
+    capture time, the terminal flags) — or None without a cache."""
+    row = session.execute(
+        select(DogResultCache.status, DogResultCache.updated_at, DogResultCache.cached_at, DogResultCache.meta)
+        .where(DogResultCache.show_id == int(show_id))
+    ).first()
+    if row is None:
+        return None
+    return {
+        "status": row.status,
+        "updated_at": row.updated_at,
+        "cached_at": row.cached_at,
+        "meta": json.loads(row.meta) if row.meta else {},
+    }
+
+
+def read_show_stats_rows(session, computed_after, show_ids=None):
+    """[(show_id, stats or None, computed_at)] for stored stats rows written after
+    `computed_after`, oldest first, whatever their validity."""
+    stmt = (
+        select(DogShowStats.show_id, DogShowStats.stats, DogShowStats.computed_at)
+        .where(DogShowStats.computed_at > computed_after)
+        .order_by(DogShowStats.computed_at)
+    )
+    if show_ids is not None:
+        stmt = stmt.where(DogShowStats.show_id.in_([int(sid) for sid in show_ids]))
+    return [
+        (row.show_id, json.loads(row.stats) if row.stats else None, row.computed_at)
+        for row in session.execute(stmt)
+    ]
+
+
+def read_show_data_version(session, show_id):
+    """The data-version stamp behind one show's API responses (the HTTP
+    validators): the index row, the result-cache header, the crawler job that
+    drives result progress, and the show's newest dog_change id (a breed's judge
+    or result flag moves nothing else). Three primary-key lookups and one index
+    seek in a single statement."""
+    sid = int(show_id)
+    row = session.execute(select(
+        select(DogShow.updated_at).where(DogShow.id == sid).scalar_subquery().label("show_updated_at"),
+        select(DogResultCache.updated_at).where(DogResultCache.show_id == sid).scalar_subquery().label("updated_at"),
+        select(DogResultCache.cached_at).where(DogResultCache.show_id == sid).scalar_subquery().label("cached_at"),
+        select(DogResultCache.status).where(DogResultCache.show_id == sid).scalar_subquery().label("status"),
+        select(DogResultJob.updated_at).where(DogResultJob.show_id == sid).scalar_subquery().label("job_updated_at"),
+        select(DogResultJob.state).where(DogResultJob.show_id == sid).scalar_subquery().label("job_state"),
+        select(func.max(DogChange.id)).where(DogChange.show_id == sid).scalar_subquery().label("change_id"),
+    )).one()
+    return dict(row._mapping)
+
+
+def read_index_data_version(session):
+    """The data-version stamp behind cross-show responses (list, search,
+    profiles): the index-wide last_updated meta plus aggregates over the cache
+    headers and job rows. Sums rather than only maxima, so a write that moves an
+    older row still changes the stamp; a few hundred rows per table."""
+    row = session.execute(select(
+        select(DogMeta.value).where(DogMeta.key == "last_updated").scalar_subquery().label("last_updated"),
+        select(func.count()).select_from(DogResultCache).scalar_subquery().label("cache_count"),
+        select(func.total(DogResultCache.updated_at)).scalar_subquery().label("cache_updated_total"),
+        select(func.max(DogResultCache.updated_at)).scalar_subquery().label("cache_updated_max"),
+        select(func.total(DogResultCache.cached_at)).scalar_subquery().label("cache_cached_total"),
+        select(func.count()).select_from(DogResultJob).scalar_subquery().label("job_count"),
+        select(func.total(DogResultJob.updated_at)).scalar_subquery().label("job_updated_total"),
+        select(func.max(DogResultJob.updated_at)).scalar_subquery().label("job_updated_max"),
+    )).one()
+    return dict(row._mapping)
+
+
 def complete_result_cache_show_ids(session):
     """Show ids with a fully-captured result cache (status='complete').
 
@@ -549,14 +1115,165 @@ def read_breed_awards_for_shows(session, show_ids):
     ]
 
 
+# ---------------------------------------------------------------------------
+# Entity search index  (dog_search, FTS5)
+# ---------------------------------------------------------------------------
+# One FTS5 row per searchable entity string: dog names, honor-roll owners and
+# winner/kennel names, breed names, judges, and show text. The rowid encodes
+# both the source row and the entity kind — (source id << 3) | kind — so rows are
+# maintained and resolved by rowid alone, never by scanning the FTS table.
+# The text is folded (case + diacritics: "Tähti" -> "tahti") before the trigram
+# tokenizer sees it, so matching is a case/diacritic-insensitive substring test
+# on every SQLite build. Writers keep it current in their own transactions.
+
+_SEARCH_KIND_BITS = 3
+_SEARCH_DOG = 1
+_SEARCH_OWNER = 2
+_SEARCH_AWARD_NAME = 3
+_SEARCH_BREED = 4
+_SEARCH_JUDGE = 5
+_SEARCH_SHOW = 6
+# Trigram MATCH needs at least three characters; shorter queries use LIKE.
+_SEARCH_MIN_MATCH_LENGTH = 3
+_SEARCH_CHUNK = 500
+
+_search_fts = table(
+    dog_db.SEARCH_INDEX_TABLE,
+    column("rowid", Integer),
+    column("text", Text),
+)
+
+
+def _show_search_text():
+    return (
+        func.coalesce(DogShow.name, "") + " " + func.coalesce(DogShow.title, "")
+        + " " + func.coalesce(DogShow.date, "") + " " + func.coalesce(DogShow.month, "")
+    )
+
+
+# Per source table: its id column and the (kind, text column) pairs it feeds.
+_SEARCH_SOURCES = {
+    DogResult: (DogResult.id, ((_SEARCH_DOG, DogResult.name),)),
+    DogBreedAward: (DogBreedAward.id, ((_SEARCH_OWNER, DogBreedAward.owner), (_SEARCH_AWARD_NAME, DogBreedAward.name))),
+    DogBreed: (DogBreed.id, ((_SEARCH_BREED, DogBreed.name), (_SEARCH_JUDGE, DogBreed.judge))),
+    DogShow: (DogShow.id, ((_SEARCH_SHOW, _show_search_text()),)),
+}
+
+
+def _search_fold(value):
+    """Case- and diacritic-folded text, as stored in and matched against the index."""
+    decomposed = unicodedata.normalize("NFKD", str(value or ""))
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+
+
+def _chunks(values, size=_SEARCH_CHUNK):
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def _search_ids(session, model, *conditions):
+    id_column = _SEARCH_SOURCES[model][0]
+    return [row[0] for row in session.execute(select(id_column).where(*conditions))]
+
+
+def _search_forget(session, model, ids):
+    """Drop a source table's index entries for the given row ids."""
+    if not ids or not dog_db.search_index_ready():
+        return
+    kinds = [kind for kind, _ in _SEARCH_SOURCES[model][1]]
+    rowids = [(int(row_id) << _SEARCH_KIND_BITS) | kind for row_id in ids for kind in kinds]
+    for chunk in _chunks(rowids):
+        session.execute(delete(_search_fts).where(_search_fts.c.rowid.in_(chunk)))
+
+
+def _search_add(session, model, ids):
+    """(Re)index a source table's rows by id from their current column values."""
+    if not ids or not dog_db.search_index_ready():
+        return
+    _search_forget(session, model, ids)
+    id_column, sources = _SEARCH_SOURCES[model]
+    session.flush()
+    for chunk in _chunks(ids):
+        rows = session.execute(
+            select(id_column, *[text_column for _, text_column in sources]).where(id_column.in_(chunk))
+        ).all()
+        entries = [
+            {"rowid": (row[0] << _SEARCH_KIND_BITS) | kind, "text": _search_fold(row[position + 1])}
+            for row in rows
+            for position, (kind, _) in enumerate(sources)
+            if row[position + 1]
+        ]
+        if entries:
+            session.execute(insert(_search_fts), entries)
+
+
+def rebuild_search_index(session):
+    """Rebuild the whole entity search index from the source tables. Returns the
+    number of index rows written. Used for the first-start backfill."""
+    if not dog_db.search_index_ready():
+        return 0
+    session.execute(delete(_search_fts))
+    written = 0
+    for model, (id_column, sources) in _SEARCH_SOURCES.items():
+        rows = session.execute(select(id_column, *[text_column for _, text_column in sources]))
+        while True:
+            batch = rows.fetchmany(_SEARCH_CHUNK * 4)
+            if not batch:
+                break
+            entries = [
+                {"rowid": (row[0] << _SEARCH_KIND_BITS) | kind, "text": _search_fold(row[position + 1])}
+                for row in batch
+                for position, (kind, _) in enumerate(sources)
+                if row[position + 1]
+            ]
+            if entries:
+                session.execute(insert(_search_fts), entries)
+                written += len(entries)
+    return written
+
+
+def _search_refs(kind, folded):
+    """Subquery of source ids whose `kind` entry contains the folded text."""
+    phrase = '"' + folded.replace('"', '""') + '"'
+    return (
+        select(_search_fts.c.rowid.op(">>")(_SEARCH_KIND_BITS))
+        .where(_search_fts.c.text.op("MATCH")(phrase))
+        .where(_search_fts.c.rowid.op("&")((1 << _SEARCH_KIND_BITS) - 1) == kind)
+    )
+
+
+def _text_match(model, kind, text_column, variants, min_length=1):
+    """SQL condition: the row's `kind` text contains any of `variants`.
+
+    Through the search index when it is available and the folded variant is long
+    enough for trigram matching; otherwise the escaped LIKE scan below."""
+    conditions = []
+    id_column = _SEARCH_SOURCES[model][0]
+    for variant in variants or []:
+        raw = str(variant or "").strip()
+        if len(raw) < min_length:
+            continue
+        folded = _search_fold(raw)
+        if dog_db.search_index_ready() and len(folded) >= _SEARCH_MIN_MATCH_LENGTH:
+            conditions.append(id_column.in_(_search_refs(kind, folded)))
+        else:
+            conditions.append(_like_any(text_column, _like_patterns(raw, min_length)))
+    if not conditions:
+        return None
+    return or_(*conditions)
+
+
 # ---------------------------------------------------------------------------
 # Cross-show entity search (dog names, owners) over the captured result rows
 # ---------------------------------------------------------------------------
-# SQLite LIKE is only ASCII case-insensitive, so a name stored as "Tähti" is not
-# matched by "TÄHTI" and vice versa for the å/ä/ö range. We OR together the raw,
-# Unicode-upper, and Unicode-lower forms of the query so either stored casing is
-# found without a normalized column / migration. `%`/`_`/`\` in the query are
-# escaped so a literal "100%" search can't turn into a wildcard.
+# Matching goes through the dog_search index (_text_match). The LIKE helpers
+# below are its fallback for queries too short for trigrams and databases
+# without FTS5: SQLite LIKE is only ASCII case-insensitive, so a name stored as
+# "Tähti" is not matched by "TÄHTI" and vice versa for the å/ä/ö range. We OR
+# together the raw, Unicode-upper, and Unicode-lower forms of the query so either
+# stored casing is found. `%`/`_`/`\` in the query are escaped so a literal
+# "100%" search can't turn into a wildcard.
 
 def _like_patterns(query, min_length=3):
     """Escaped `%q%` LIKE patterns (raw + upper + lower) or [] if too short."""
@@ -581,8 +1298,8 @@ def search_dogs_by_name(session, query, limit=20, min_length=3):
 
     Returns `[{reg_id, name, gender, reg_url, show_id, show_count, result_count}]`
     where `show_id` is the dog's newest captured show."""
-    patterns = _like_patterns(query, min_length)
-    if not patterns:
+    condition = _text_match(DogResult, _SEARCH_DOG, DogResult.name, [query], min_length)
+    if condition is None:
         return []
     grouped = session.execute(
         select(
@@ -591,7 +1308,7 @@ def search_dogs_by_name(session, query, limit=20, min_length=3):
             func.count(func.distinct(DogResult.show_id)).label("show_count"),
             func.max(DogResult.show_id).label("newest_show_id"),
         )
-        .where(_like_any(DogResult.name, patterns), DogResult.reg_id.is_not(None))
+        .where(condition, DogResult.reg_id.is_not(None))
         .group_by(DogResult.reg_id)
         .order_by(func.max(DogResult.show_id).desc())
         .limit(limit)
@@ -639,10 +1356,9 @@ def search_dog_results_by_name(session, query, limit=20, min_length=3):
     source page carried no reg_url — those can't be aggregated into a dog
     identity, so they keep the old one-row-per-show shape. Returns
     `[{show_id, name, count}]`, newest shows first, bounded by `limit`."""
-    patterns = _like_patterns(query, min_length)
-    if not patterns:
+    condition = _text_match(DogResult, _SEARCH_DOG, DogResult.name, [query], min_length)
+    if condition is None:
         return []
-    condition = or_(*[DogResult.name.like(pattern, escape="\\") for pattern in patterns])
     rows = session.execute(
         select(
             DogResult.show_id,
@@ -667,10 +1383,9 @@ def search_breed_award_owners(session, query, limit=20, min_length=3):
     `dog_breed_award` honor roll (`Om.` field), so this surfaces the people
     behind the ROP/VSP/SERT winners, which no other column carries. Newest
     shows first, bounded by `limit`."""
-    patterns = _like_patterns(query, min_length)
-    if not patterns:
+    condition = _text_match(DogBreedAward, _SEARCH_OWNER, DogBreedAward.owner, [query], min_length)
+    if condition is None:
         return []
-    condition = or_(*[DogBreedAward.owner.like(pattern, escape="\\") for pattern in patterns])
     rows = session.execute(
         select(
             DogBreedAward.show_id,
@@ -707,8 +1422,8 @@ def search_breeder_awards(session, query, limit=20, min_length=3):
     "kasvatt" (production data uses "ROP kasvattaja"). Returns
     `[{show_id, fci_group, breed_id, kennel, owner, count}]`, one row per breed
     honor roll for deep-linking, newest shows first, bounded by `limit`."""
-    patterns = _like_patterns(query, min_length)
-    if not patterns:
+    condition = _text_match(DogBreedAward, _SEARCH_AWARD_NAME, DogBreedAward.name, [query], min_length)
+    if condition is None:
         return []
     rows = session.execute(
         select(
@@ -720,7 +1435,7 @@ def search_breeder_awards(session, query, limit=20, min_length=3):
             func.count().label("count"),
         )
         .where(
-            _like_any(DogBreedAward.name, patterns),
+            condition,
             func.lower(DogBreedAward.award_type).like("%kasvatt%"),
         )
         .group_by(DogBreedAward.show_id, DogBreedAward.fci_group, DogBreedAward.breed_id)
@@ -743,21 +1458,11 @@ def search_breeder_awards(session, query, limit=20, min_length=3):
 # ---------------------------------------------------------------------------
 # Show / breed / judge index search
 # ---------------------------------------------------------------------------
-# The /api/dog/search index scan, in SQL. `variants` are the raw query forms
-# (the query itself plus its judge-label-stripped form); each is expanded into
-# escaped raw/upper/lower LIKE patterns like the dog/owner search above. These
-# are infix matches, so they scan the breed table — measured at a few ms for
-# 50k rows, ~200ms for the broadest breed-name queries, on a rate-limited
-# endpoint. No index helps a %substring% LIKE; revisit with FTS5 if it grows.
-
-def _variant_like_patterns(variants, min_length=1):
-    patterns = []
-    for variant in variants or []:
-        for pattern in _like_patterns(variant, min_length=min_length):
-            if pattern not in patterns:
-                patterns.append(pattern)
-    return patterns
-
+# The /api/dog/search index lookup, in SQL. `variants` are the raw query forms
+# (the query itself plus its judge-label-stripped form); each is matched as an
+# infix through the dog_search index, so the cost follows the number of hits
+# rather than the size of the breed table. One- and two-character variants fall
+# back to the LIKE scan (trigrams need three characters).
 
 def _like_any(column, patterns):
     return or_(*[column.like(pattern, escape="\\") for pattern in patterns])
@@ -765,12 +1470,12 @@ def _like_any(column, patterns):
 
 def search_breeds_by_name(session, variants):
     """Breeds whose name matches: [(show_id, breed_dict)], breed-list order."""
-    patterns = _variant_like_patterns(variants)
-    if not patterns:
+    condition = _text_match(DogBreed, _SEARCH_BREED, DogBreed.name, variants)
+    if condition is None:
         return []
     rows = session.execute(
         select(*_BREED_COLUMNS)
-        .where(_like_any(DogBreed.name, patterns))
+        .where(condition)
         .order_by(DogBreed.show_id, DogBreed.position)
     )
     return [(row.show_id, _breed_to_dict(row)) for row in rows]
@@ -781,14 +1486,14 @@ def search_breeds_by_judge(session, variants):
 
     The name exclusion mirrors the per-breed precedence in search assembly — a
     breed-name match outranks and swallows a judge match on the same breed."""
-    patterns = _variant_like_patterns(variants)
-    if not patterns:
+    judge_condition = _text_match(DogBreed, _SEARCH_JUDGE, DogBreed.judge, variants)
+    if judge_condition is None:
         return []
     rows = session.execute(
         select(*_BREED_COLUMNS)
         .where(
-            _like_any(DogBreed.judge, patterns),
-            ~_like_any(DogBreed.name, patterns),
+            judge_condition,
+            ~_text_match(DogBreed, _SEARCH_BREED, DogBreed.name, variants),
         )
         .order_by(DogBreed.show_id, DogBreed.position)
     )
@@ -797,14 +1502,10 @@ def search_breeds_by_judge(session, variants):
 
 def search_show_ids(session, variants):
     """Ids of shows whose combined name/title/date/month text matches."""
-    patterns = _variant_like_patterns(variants)
-    if not patterns:
+    condition = _text_match(DogShow, _SEARCH_SHOW, _show_search_text(), variants)
+    if condition is None:
         return []
-    show_text = (
-        func.coalesce(DogShow.name, "") + " " + func.coalesce(DogShow.title, "")
-        + " " + func.coalesce(DogShow.date, "") + " " + func.coalesce(DogShow.month, "")
-    )
-    rows = session.execute(select(DogShow.id).where(_like_any(show_text, patterns)))
+    rows = session.execute(select(DogShow.id).where(condition))
     return [row[0] for row in rows]
 
 
@@ -836,9 +1537,16 @@ def _result_breed_correlation():
     )
 
 
-def sweep_breed_judges_from_results(session):
-    """Copy the judge from captured result rows onto index breeds missing one.
-    Returns the number of breed rows updated."""
+def _sweep_scope(column, show_ids):
+    # None sweeps every show; a list (from the change log) only those shows.
+    if show_ids is None:
+        return ()
+    return (column.in_(sorted({int(sid) for sid in show_ids})),)
+
+
+def sweep_breed_judges_from_results(session, show_ids=None):
+    """Copy the judge from captured result rows onto index breeds missing one,
+    in every show or just `show_ids`. Returns the number of breed rows updated."""
     judge_present = _result_breed_correlation() & DogResult.breed_judge.is_not(None) & (DogResult.breed_judge != "")
     judge_subq = (
         select(DogResult.breed_judge)
@@ -847,20 +1555,27 @@ def sweep_breed_judges_from_results(session):
         .limit(1)
         .scalar_subquery()
     )
-    return session.execute(
+    changed = session.execute(
         update(DogBreed)
-        .where(or_(DogBreed.judge.is_(None), DogBreed.judge == ""))
+        .where(or_(DogBreed.judge.is_(None), DogBreed.judge == ""), *_sweep_scope(DogBreed.show_id, show_ids))
         .where(exists(select(DogResult.id).where(judge_present)))
         .values(judge=judge_subq)
-    ).rowcount
+        .returning(DogBreed.id, DogBreed.show_id, DogBreed.fci_group, DogBreed.breed_id)
+    ).all()
+    _search_add(session, DogBreed, [row.id for row in changed])
+    _log_breed_changes(session, "judge", changed)
+    return len(changed)
 
 
-def sweep_breed_judges_from_cache_meta(session):
+def sweep_breed_judges_from_cache_meta(session, show_ids=None):
     """Copy judges recorded only in completed_breeds cache meta (a zero-result
-    breed has a judged page but no result rows) onto index breeds missing one.
-    Returns the number of breed rows updated."""
+    breed has a judged page but no result rows) onto index breeds missing one,
+    in every show or just `show_ids`. Returns the number of breed rows updated."""
     updated = 0
-    for cache_row in session.execute(select(DogResultCache.show_id, DogResultCache.meta)):
+    for cache_row in session.execute(
+        select(DogResultCache.show_id, DogResultCache.meta)
+        .where(*_sweep_scope(DogResultCache.show_id, show_ids))
+    ):
         if not cache_row.meta:
             continue
         try:
@@ -880,39 +1595,152 @@ def sweep_breed_judges_from_cache_meta(session):
     return updated
 
 
-def sweep_breed_result_flags(session):
-    """Flag index breeds that have captured result rows but has_results=False.
-    Returns the number of breed rows updated."""
-    return session.execute(
+def sweep_breed_result_flags(session, show_ids=None):
+    """Flag index breeds that have captured result rows but has_results=False,
+    in every show or just `show_ids`. Returns the number of breed rows updated."""
+    changed = session.execute(
         update(DogBreed)
-        .where(DogBreed.has_results.is_(False))
+        .where(DogBreed.has_results.is_(False), *_sweep_scope(DogBreed.show_id, show_ids))
         .where(exists(select(DogResult.id).where(_result_breed_correlation())))
         .values(has_results=True)
-    ).rowcount
+        .returning(DogBreed.id, DogBreed.show_id, DogBreed.fci_group, DogBreed.breed_id)
+    ).all()
+    if changed:
+        drop_show_stats(session, None if show_ids is None else {row.show_id for row in changed})
+        _log_breed_changes(session, "has_results", changed)
+    return len(changed)
 
 
 # ---------------------------------------------------------------------------
-# Result jobs  (<-> dog_result_jobs.json)
+# Showlink fetch state  (dog_fetch_state)
+# ---------------------------------------------------------------------------
+
+def read_fetch_states(session, urls):
+    """{url: {"etag", "last_modified", "body_hash", "fetched_at", "changed_at"}}
+    for the given URLs that have a stored capture."""
+    states = {}
+    for chunk in _chunks(sorted(set(urls))):
+        for row in session.execute(select(DogFetchState).where(DogFetchState.url.in_(chunk))).scalars():
+            states[row.url] = {
+                "etag": row.etag,
+                "last_modified": row.last_modified,
+                "body_hash": row.body_hash,
+                "fetched_at": row.fetched_at,
+                "changed_at": row.changed_at,
+            }
+    return states
+
+
+def write_fetch_states(session, states):
+    """Upsert {url: state} (the keys read_fetch_states returns)."""
+    for url, state in sorted(states.items()):
+        values = {
+            "etag": state.get("etag"),
+            "last_modified": state.get("last_modified"),
+            "body_hash": state.get("body_hash"),
+            "fetched_at": state.get("fetched_at"),
+            "changed_at": state.get("changed_at"),
+        }
+        session.execute(
+            sqlite_insert(DogFetchState)
+            .values(url=url, **values)
+            .on_conflict_do_update(index_elements=[DogFetchState.url], set_=values)
+        )
+
+
+# ---------------------------------------------------------------------------
+# Change log  (dog_change)
 # ---------------------------------------------------------------------------
 
-def write_jobs(session, jobs_doc):
-    session.execute(delete(DogResultJob))
-    for sid, job in (jobs_doc.get("jobs") or {}).items():
-        session.merge(DogResultJob(
-            show_id=int(sid),
-            state=job.get("state"),
-            reason=job.get("reason"),
-            attempts=int(job.get("attempts") or 0),
-            created_at=job.get("created_at"),
-            updated_at=job.get("updated_at"),
-            requested_at=job.get("requested_at"),
-            next_attempt_at=job.get("next_attempt_at"),
-            last_started_at=job.get("last_started_at"),
-            last_error=job.get("last_error"),
-        ))
-    set_meta(session, "jobs_updated_at", jobs_doc.get("updated_at") or 0)
+# What a dog_change entry says happened:
+# - "show": the show's metadata and breed list were rewritten (write_show);
+# - "result_doc": its result-cache header and honor rolls were rewritten whole;
+# - "results": one breed's result rows were appended, replaced or dropped;
+# - "judge" / "has_results": one index breed's judge or result flag was set.
+CHANGE_KINDS = ("show", "result_doc", "results", "judge", "has_results")
+
+
+def _log_changes(session, show_id, kind, breeds=None):
+    """Append change-log entries for one show: one per (group, breed_id) in
+    `breeds`, or a single show-wide entry when `breeds` is None."""
+    now = time.time()
+    if breeds is None:
+        breeds = [(None, None)]
+    _bulk_insert(session, DogChange, [
+        {
+            "show_id": int(show_id),
+            "fci_group": None if group is None else str(group),
+            "breed_id": None if breed_id is None else str(breed_id),
+            "kind": kind,
+            "created_at": now,
+        }
+        for group, breed_id in breeds
+    ])
+
+
+def _log_breed_changes(session, kind, rows):
+    # rows carry show_id/fci_group/breed_id (a sweep's RETURNING).
+    by_show = {}
+    for row in rows:
+        by_show.setdefault(row.show_id, []).append((row.fci_group, row.breed_id))
+    for sid, breeds in sorted(by_show.items()):
+        _log_changes(session, sid, kind, breeds)
+
+
+def read_change_cursor(session):
+    """The id of the newest change-log entry (0 when empty)."""
+    return session.execute(select(func.coalesce(func.max(DogChange.id), 0))).scalar_one()
+
+
+def read_changes(session, after_id, show_id=None, kinds=None, limit=1000):
+    """Change-log entries with id > `after_id`, oldest first, at most `limit`:
+    [{"id", "show_id", "group", "breed_id", "kind", "created_at"}] (group and
+    breed_id None for show-wide entries). Optionally one show's or some kinds'."""
+    stmt = select(DogChange).where(DogChange.id > int(after_id))
+    if show_id is not None:
+        stmt = stmt.where(DogChange.show_id == int(show_id))
+    if kinds is not None:
+        stmt = stmt.where(DogChange.kind.in_(list(kinds)))
+    return [
+        {
+            "id": row.id,
+            "show_id": row.show_id,
+            "group": row.fci_group,
+            "breed_id": row.breed_id,
+            "kind": row.kind,
+            "created_at": row.created_at,
+        }
+        for row in session.execute(stmt.order_by(DogChange.id).limit(int(limit))).scalars()
+    ]
+
+
+def read_changed_show_ids(session, after_id, kinds=None):
+    """(sorted show ids with a change after `after_id`, newest id seen) — what an
+    incremental consumer needs to redo its per-show work. `after_id` older than
+    the retained log (pruned past it) returns None for the ids: start over."""
+    oldest = session.execute(select(func.min(DogChange.id))).scalar()
+    newest = read_change_cursor(session)
+    if oldest is not None and int(after_id) < oldest - 1:
+        return None, newest
+    stmt = select(DogChange.show_id).where(DogChange.id > int(after_id)).distinct()
+    if kinds is not None:
+        stmt = stmt.where(DogChange.kind.in_(list(kinds)))
+    return sorted(row[0] for row in session.execute(stmt)), newest
+
+
+def prune_changes(session, before):
+    """Delete change-log entries created before `before`; returns how many. The
+    newest entry is always kept so ids (and consumers' cursors) stay continuous."""
+    newest = read_change_cursor(session)
+    return session.execute(
+        delete(DogChange).where(DogChange.created_at < before, DogChange.id < newest)
+    ).rowcount
 
 
+# ---------------------------------------------------------------------------
+# Result jobs  (<-> dog_result_jobs.json)
+# ---------------------------------------------------------------------------
+
 def _job_to_dict(row):
     job = {"show_id": row.show_id}
     for field in _JOB_FIELDS:
@@ -927,7 +1755,179 @@ def read_jobs(session):
         str(row.show_id): _job_to_dict(row)
         for row in session.execute(select(DogResultJob)).scalars()
     }
-    return {"jobs": jobs, "updated_at": get_meta_number(session, "jobs_updated_at", 0)}
+    # The per-row operations below don't touch the meta stamp; the newest row
+    # `updated_at` stands in for it.
+    updated_at = max(
+        [get_meta_number(session, "jobs_updated_at", 0) or 0]
+        + [job.get("updated_at") or 0 for job in jobs.values()]
+    )
+    return {"jobs": jobs, "updated_at": updated_at}
+
+
+# The queue operations: each one is a single statement on the job's own row
+# (SQLite upsert or conditional UPDATE ... RETURNING), so a viewer queueing a
+# refresh and the crawler heartbeating another show only ever hold the write
+# lock for one row, and a decision like "is it running?" is made by the write
+# itself rather than by a read that another process may have overtaken.
+
+_JOB_TABLE = DogResultJob.__table__
+
+
+def _job_row(session, stmt):
+    row = session.execute(stmt.returning(*_JOB_TABLE.c)).first()
+    return _job_to_dict(row) if row is not None else None
+
+
+def read_job(session, show_id):
+    row = session.get(DogResultJob, int(show_id))
+    return _job_to_dict(row) if row is not None else None
+
+
+def queue_job(session, show_id, reason, now):
+    """Queue a result-cache job, or re-request an existing one. A running job
+    keeps its state and heartbeat; only `reason`/`requested_at` move. Returns
+    the job dict."""
+    running = _JOB_TABLE.c.state == "running"
+    stmt = sqlite_insert(_JOB_TABLE).values(
+        show_id=int(show_id), state="queued", reason=reason, attempts=0,
+        created_at=now, updated_at=now, requested_at=now, next_attempt_at=now,
+    ).on_conflict_do_update(
+        index_elements=[_JOB_TABLE.c.show_id],
+        set_={
+            "state": case((running, _JOB_TABLE.c.state), else_="queued"),
+            "updated_at": case((running, _JOB_TABLE.c.updated_at), else_=now),
+            "reason": reason,
+            "requested_at": now,
+            "created_at": func.coalesce(_JOB_TABLE.c.created_at, now),
+            "attempts": func.coalesce(_JOB_TABLE.c.attempts, 0),
+            "next_attempt_at": func.coalesce(_JOB_TABLE.c.next_attempt_at, now),
+        },
+    )
+    return _job_row(session, stmt)
+
+
+def _job_due_clause(now, stale_seconds):
+    # Both arms are keyed on `state`, so the lookup runs off its index.
+    return or_(
+        and_(_JOB_TABLE.c.state == "queued", func.coalesce(_JOB_TABLE.c.next_attempt_at, 0) <= now),
+        and_(
+            _JOB_TABLE.c.state == "running",
+            func.coalesce(_JOB_TABLE.c.updated_at, 0) <= now - stale_seconds,
+            func.coalesce(_JOB_TABLE.c.next_attempt_at, 0) <= now,
+        ),
+    )
+
+
+def claim_job(session, now, stale_seconds, show_id=None):
+    """Atomically move a due job to running and return it, or None when there is
+    nothing to claim. Due means queued with `next_attempt_at` reached, or running
+    without a heartbeat for `stale_seconds` (its worker died). With `show_id` only
+    that job is considered; otherwise the longest-waiting due job is taken. Two
+    crawlers racing for the same job: the second claim finds it running and
+    fresh, and gets None."""
+    if show_id is not None:
+        target = _JOB_TABLE.c.show_id == int(show_id)
+    else:
+        target = _JOB_TABLE.c.show_id == (
+            select(_JOB_TABLE.c.show_id)
+            .where(_job_due_clause(now, stale_seconds))
+            .order_by(
+                func.coalesce(_JOB_TABLE.c.requested_at, _JOB_TABLE.c.created_at, 0),
+                _JOB_TABLE.c.show_id,
+            )
+            .limit(1)
+            .scalar_subquery()
+        )
+    stmt = (
+        update(_JOB_TABLE)
+        .where(target, _job_due_clause(now, stale_seconds))
+        .values(state="running", updated_at=now, last_started_at=now)
+    )
+    return _job_row(session, stmt)
+
+
+def heartbeat_job(session, show_id, now, min_interval):
+    """Move a running job's `updated_at` to now, at most once per `min_interval`.
+    Returns True when the row was touched."""
+    result = session.execute(
+        update(_JOB_TABLE)
+        .where(
+            _JOB_TABLE.c.show_id == int(show_id),
+            _JOB_TABLE.c.state == "running",
+            func.coalesce(_JOB_TABLE.c.updated_at, 0) <= now - min_interval,
+        )
+        .values(updated_at=now)
+    )
+    return result.rowcount > 0
+
+
+def defer_job(session, show_id, error, now, backoff_seconds, max_backoff):
+    """Record a failed attempt: back to queued, `attempts` + 1, retried after a
+    linear backoff (`backoff_seconds` per attempt, capped at `max_backoff`).
+    Returns the job dict."""
+    error = str(error)[:500]
+    attempts = func.coalesce(_JOB_TABLE.c.attempts, 0) + 1
+    stmt = sqlite_insert(_JOB_TABLE).values(
+        show_id=int(show_id), state="queued", attempts=1, created_at=now, updated_at=now,
+        last_error=error, next_attempt_at=now + min(max_backoff, backoff_seconds),
+    ).on_conflict_do_update(
+        index_elements=[_JOB_TABLE.c.show_id],
+        set_={
+            "state": "queued",
+            "attempts": attempts,
+            "last_error": error,
+            "next_attempt_at": now + func.min(max_backoff, backoff_seconds * attempts),
+            "updated_at": now,
+        },
+    )
+    return _job_row(session, stmt)
+
+
+def delete_job(session, show_id):
+    """Drop a job row. Returns True when one existed."""
+    result = session.execute(delete(_JOB_TABLE).where(_JOB_TABLE.c.show_id == int(show_id)))
+    return result.rowcount > 0
+
+
+# ---------------------------------------------------------------------------
+# Showlink show list  (dog_meta: show_list + show_list_version)
+# ---------------------------------------------------------------------------
+# The crawler owns the Showlink list fetch and stores the parsed list here; the
+# web tier only reads it. The list and its stamp are separate meta rows so the
+# per-request freshness check reads the small stamp, not the ~700-show blob.
+# `version` is a digest of the list, so an unchanged re-fetch only moves
+# `fetched_at` and readers keep their in-process copy.
+
+def _show_list_digest(shows):
+    return hashlib.sha1(json.dumps(shows, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def write_show_list(session, shows, fetched_at):
+    """Store a freshly fetched show list. Returns its version."""
+    shows = list(shows or [])
+    version = _show_list_digest(shows)
+    current = read_show_list_version(session)
+    if current is None or current["version"] != version:
+        set_meta(session, "show_list", shows)
+    set_meta(session, "show_list_version", {"version": version, "fetched_at": fetched_at})
+    return version
+
+
+def read_show_list_version(session):
+    """The stored list's {"version", "fetched_at"}, or None before the first fetch."""
+    stamp = get_meta_number(session, "show_list_version", None)
+    if not isinstance(stamp, dict) or not stamp.get("version"):
+        return None
+    return {"version": str(stamp["version"]), "fetched_at": float(stamp.get("fetched_at") or 0.0)}
+
+
+def read_show_list(session):
+    """The stored list with its stamp ({"shows", "version", "fetched_at"}), or None."""
+    stamp = read_show_list_version(session)
+    shows = get_meta_number(session, "show_list", None)
+    if stamp is None or not isinstance(shows, list):
+        return None
+    return {"shows": shows, **stamp}
 
 
 # ---------------------------------------------------------------------------
@@ -1,10 +1,13 @@
+import threading
 import time
+from collections import OrderedDict
 
 import structlog
 
 from . import config
 from . import db as dog_db
 from . import sqlstore
+from .single_flight import _single_flight
 from .utils import _utc_iso
 
 logger = structlog.get_logger(__name__)
@@ -12,10 +15,26 @@ logger = structlog.get_logger(__name__)
 INDEX_DIR = config.INDEX_DIR
 RESULT_JOB_STALE_SECONDS = config.RESULT_JOB_STALE_SECONDS
 RESULT_JOB_BACKOFF_SECONDS = config.RESULT_JOB_BACKOFF_SECONDS
+RESULT_DOC_CACHE_BYTES = config.RESULT_DOC_CACHE_BYTES
 
-# The only in-memory cache left: the 30-minute Showlink show-list fetch gate
-# (see shows._get_show_list). Everything else is read from dog.db per request.
-_show_list_cache = {"data": None, "ts": 0}
+# In-process copy of the crawler-persisted Showlink show list (see shows.py):
+# `version` is the stored list's digest, `ts` its fetch time.
+_show_list_cache = {"data": None, "ts": 0, "version": None}
+
+# Read-through cache of reconstructed whole-show result docs, shared by every
+# thread in the process: {show_id: {"version", "doc", "size"}} in LRU order.
+# Not a second source of truth — each hit is validated against the doc's header
+# stamp (sqlstore.read_result_doc_version), so a crawler write in any process
+# invalidates it on the next read. Size is an estimate, bounded by
+# RESULT_DOC_CACHE_BYTES.
+_result_doc_cache = OrderedDict()
+_result_doc_cache_state = {"bytes": 0, "hits": 0, "misses": 0}
+_result_doc_cache_lock = threading.Lock()
+
+# Rough per-object overheads for the size estimate: a reconstructed result row is
+# two small dicts (the row + its breedObj) plus its strings.
+_RESULT_ROW_OVERHEAD_BYTES = 1200
+_COMPLETED_BREED_OVERHEAD_BYTES = 400
 
 
 # ---------------------------------------------------------------------------
@@ -25,7 +44,7 @@ _show_list_cache = {"data": None, "ts": 0}
 def _indexed_show(show_id):
     """One show's full index entry (metadata + breeds) or None."""
     try:
-        with dog_db.session_scope() as session:
+        with dog_db.read_scope() as session:
             return sqlstore.read_show(session, show_id)
     except (TypeError, ValueError):
         return None
@@ -37,7 +56,7 @@ def _indexed_show(show_id):
 def _indexed_show_meta(show_id):
     """One show's index metadata (no breeds) or None."""
     try:
-        with dog_db.session_scope() as session:
+        with dog_db.read_scope() as session:
             return sqlstore.read_show_meta(session, show_id)
     except (TypeError, ValueError):
         return None
@@ -49,7 +68,7 @@ def _indexed_show_meta(show_id):
 def _indexed_shows(show_ids):
     """Bulk read of full index entries: {str(show_id): entry}."""
     try:
-        with dog_db.session_scope() as session:
+        with dog_db.read_scope() as session:
             return sqlstore.read_shows(session, show_ids)
     except Exception:
         logger.exception("dog_indexed_shows_read_failed")
@@ -59,7 +78,7 @@ def _indexed_shows(show_ids):
 def _indexed_show_metas(show_ids):
     """Bulk read of index metadata (no breeds): {str(show_id): meta}."""
     try:
-        with dog_db.session_scope() as session:
+        with dog_db.read_scope() as session:
             return sqlstore.read_shows_meta(session, show_ids)
     except Exception:
         logger.exception("dog_indexed_show_metas_read_failed")
@@ -69,7 +88,7 @@ def _indexed_show_metas(show_ids):
 def _index_states():
     """Crawler candidate selection: per-show breed counts + empty-confirmed flags."""
     try:
-        with dog_db.session_scope() as session:
+        with dog_db.read_scope() as session:
             return sqlstore.index_states(session)
     except Exception:
         logger.exception("dog_index_states_read_failed")
@@ -85,36 +104,43 @@ def _write_index_show(show_id, entry):
         sqlstore.set_meta(session, "last_updated", max(current, entry.get("updated_at") or time.time()))
 
     dog_db.run_write(_write, op="index_show")
+    _invalidate_result_doc(show_id)
 
 
 def _update_index_breed_judge(show_id, group, breed_id, judge):
     """Store a freshly-captured judge on the breed's index row. True if changed."""
     try:
-        return dog_db.run_write(
+        changed = dog_db.run_write(
             lambda session: sqlstore.set_breed_judge(session, show_id, group, breed_id, judge),
             op="breed_judge",
         ) > 0
     except Exception:
         logger.exception("dog_breed_judge_update_failed", show_id=show_id)
         return False
+    if changed:
+        _invalidate_result_doc(show_id)
+    return changed
 
 
 def _update_index_breed_result_flag(show_id, group, breed_id):
     """Flag the breed's index row as having results. True if changed."""
     try:
-        return dog_db.run_write(
+        changed = dog_db.run_write(
             lambda session: sqlstore.set_breed_has_results(session, show_id, group, breed_id),
             op="breed_result_flag",
         ) > 0
     except Exception:
         logger.exception("dog_breed_flag_update_failed", show_id=show_id)
         return False
+    if changed:
+        _invalidate_result_doc(show_id)
+    return changed
 
 
 def _search_index_breeds(variants):
     """Breed-name matches over the whole index: [(show_id, breed_dict)]."""
     try:
-        with dog_db.session_scope() as session:
+        with dog_db.read_scope() as session:
             return sqlstore.search_breeds_by_name(session, variants)
     except Exception:
         logger.exception("dog_search_breeds_failed")
@@ -124,7 +150,7 @@ def _search_index_breeds(variants):
 def _search_index_judges(variants):
     """Judge matches (excluding breed-name matches): [(show_id, breed_dict)]."""
     try:
-        with dog_db.session_scope() as session:
+        with dog_db.read_scope() as session:
             return sqlstore.search_breeds_by_judge(session, variants)
     except Exception:
         logger.exception("dog_search_judges_failed")
@@ -134,7 +160,7 @@ def _search_index_judges(variants):
 def _search_index_show_ids(variants):
     """Ids of indexed shows whose name/title/date/month text matches."""
     try:
-        with dog_db.session_scope() as session:
+        with dog_db.read_scope() as session:
             return sqlstore.search_show_ids(session, variants)
     except Exception:
         logger.exception("dog_search_show_ids_failed")
@@ -144,7 +170,7 @@ def _search_index_show_ids(variants):
 def _indexed_ids_among(show_ids):
     """Which of the given ids are in the index, as a set of ints."""
     try:
-        with dog_db.session_scope() as session:
+        with dog_db.read_scope() as session:
             return sqlstore.indexed_show_ids(session, show_ids)
     except Exception:
         logger.exception("dog_indexed_ids_failed")
@@ -155,7 +181,7 @@ def _index_summary(total_show_count=None):
     indexed_count = 0
     updated = 0
     try:
-        with dog_db.session_scope() as session:
+        with dog_db.read_scope() as session:
             indexed_count = sqlstore.count_shows(session)
             updated = sqlstore.get_meta_number(session, "last_updated", 0)
     except Exception:
@@ -168,16 +194,166 @@ def _index_summary(total_show_count=None):
     }
 
 
+def _load_show_list_version():
+    """The stored show list's {"version", "fetched_at"} stamp, or None when no
+    list is stored yet or it cannot be read."""
+    try:
+        with dog_db.read_scope() as session:
+            return sqlstore.read_show_list_version(session)
+    except Exception:
+        logger.exception("dog_show_list_version_failed")
+        return None
+
+
+def _load_show_list():
+    """The stored show list with its stamp, or None (see sqlstore.read_show_list)."""
+    try:
+        with dog_db.read_scope() as session:
+            return sqlstore.read_show_list(session)
+    except Exception:
+        logger.exception("dog_show_list_load_failed")
+        return None
+
+
+def _save_show_list(shows, fetched_at):
+    """Persist a freshly fetched Showlink show list. Returns its version."""
+    return dog_db.run_write(
+        lambda session: sqlstore.write_show_list(session, shows, fetched_at),
+        op="show_list",
+    )
+
+
 # ---------------------------------------------------------------------------
 # Whole-show result doc  (dog_result_cache + dog_result)
 # ---------------------------------------------------------------------------
 
+def _result_doc_size_estimate(doc):
+    """Approximate in-memory bytes of a reconstructed doc (strings + dict overhead).
+    Only the variable-size parts are counted; good enough to bound the cache."""
+    size = 0
+    for row in doc.get("results") or []:
+        size += _RESULT_ROW_OVERHEAD_BYTES
+        size += len(row.get("critique") or "") + len(row.get("name") or "") + len(row.get("reg_url") or "")
+    size += _COMPLETED_BREED_OVERHEAD_BYTES * len(doc.get("completed_breeds") or {})
+    return size
+
+
+def _result_doc_cache_drop(key):
+    entry = _result_doc_cache.pop(key, None)
+    if entry is not None:
+        _result_doc_cache_state["bytes"] -= entry["size"]
+
+
+def _result_doc_cache_put(key, version, doc):
+    size = _result_doc_size_estimate(doc)
+    with _result_doc_cache_lock:
+        _result_doc_cache_drop(key)
+        if size > RESULT_DOC_CACHE_BYTES:
+            return
+        _result_doc_cache[key] = {"version": version, "doc": doc, "size": size}
+        _result_doc_cache_state["bytes"] += size
+        while _result_doc_cache_state["bytes"] > RESULT_DOC_CACHE_BYTES and _result_doc_cache:
+            _result_doc_cache_drop(next(iter(_result_doc_cache)))
+
+
+def _invalidate_result_doc(show_id):
+    """Drop one show's cached doc. Every store write touching the doc's rows or
+    the show's breeds calls this, so same-process writes never serve a doc whose
+    header stamp happens to be unchanged (e.g. a judge fold after an append)."""
+    try:
+        sid = int(show_id)
+    except (TypeError, ValueError):
+        return
+    with _result_doc_cache_lock:
+        for key in [key for key in _result_doc_cache if key[1] == sid]:
+            _result_doc_cache_drop(key)
+
+
+def _clear_result_doc_cache():
+    with _result_doc_cache_lock:
+        _result_doc_cache.clear()
+        _result_doc_cache_state.update(bytes=0, hits=0, misses=0)
+
+
 def _load_result_cache_doc(show_id):
+    """A show's whole-show result doc, or None.
+
+    Served from the process-wide doc cache when the header stamp still matches, so
+    the doc is rebuilt once per write rather than once per caller. The returned
+    dict is a shallow copy: callers may set top-level keys freely but must treat
+    `results`/`completed_breeds` contents as read-only (the crawl path copies them
+    in _all_results_doc_base before extending)."""
+    return _load_versioned_result_cache_doc(show_id)[1]
+
+
+def _load_versioned_result_cache_doc(show_id):
+    """(version, doc) for a show — the doc plus the header stamp it was read at,
+    or (None, None). See _load_result_cache_doc."""
     try:
-        with dog_db.session_scope() as session:
-            return sqlstore.read_result_doc(session, show_id)
+        sid = int(show_id)
+        # The bound database is part of the key, so rebinding dog_db (tests,
+        # one-off scripts) can never serve another file's doc.
+        key = (dog_db._current_uri, sid)
+        with dog_db.read_scope() as session:
+            version = sqlstore.read_result_doc_version(session, sid)
+            if version is None:
+                _invalidate_result_doc(sid)
+                return None, None
+            with _result_doc_cache_lock:
+                entry = _result_doc_cache.get(key)
+                if entry is not None and entry["version"] == version:
+                    _result_doc_cache.move_to_end(key)
+                    _result_doc_cache_state["hits"] += 1
+                    return version, dict(entry["doc"])
+                _result_doc_cache_state["misses"] += 1
+
+        def _rebuild():
+            with dog_db.read_scope() as session:
+                doc = sqlstore.read_result_doc(session, sid)
+            if doc is not None:
+                _result_doc_cache_put(key, version, doc)
+            return doc
+
+        # Viewers of a just-updated live show all miss at once; one of them
+        # rebuilds the doc and the rest share it.
+        doc = _single_flight("result_doc", (sid, version), _rebuild)
+        if doc is not None:
+            # A doc taken from another worker's flight skipped _rebuild: cache it here too.
+            with _result_doc_cache_lock:
+                entry = _result_doc_cache.get(key)
+                cached = entry is not None and entry["version"] == version
+            if not cached:
+                _result_doc_cache_put(key, version, doc)
+            return version, dict(doc)
+        return None, None
     except Exception:
         logger.exception("dog_result_cache_load_failed", show_id=show_id)
+        return None, None
+
+
+def _load_breed_result_slice(show_id, group, breed_id):
+    """One breed's rows, honor roll and cache header, or None (see
+    sqlstore.read_breed_result_slice). Cost scales with the breed, not the show."""
+    try:
+        with dog_db.read_scope() as session:
+            return sqlstore.read_breed_result_slice(session, show_id, group, breed_id)
+    except (TypeError, ValueError):
+        return None
+    except Exception:
+        logger.exception("dog_breed_result_slice_load_failed", show_id=show_id, group=group, breed=breed_id)
+        return None
+
+
+def _load_result_delta(show_id, since):
+    """A show's result rows and tombstones after seq cursor `since`, or None (see
+    sqlstore.read_result_delta). Cost scales with what changed, not the show."""
+    try:
+        with dog_db.read_scope() as session:
+            return sqlstore.read_result_delta(session, show_id, int(since))
+    except (TypeError, ValueError):
+        return None
+    except Exception:
+        logger.exception("dog_result_delta_load_failed", show_id=show_id, since=since)
         return None
 
 
@@ -187,6 +363,7 @@ def _save_result_cache_doc(show_id, doc):
         lambda session: sqlstore.write_result_doc(session, show_id, doc),
         op="result_cache_doc",
     )
+    _invalidate_result_doc(show_id)
 
 
 def _save_result_cache_header(show_id, doc):
@@ -196,6 +373,7 @@ def _save_result_cache_header(show_id, doc):
         lambda session: sqlstore.write_result_cache_header(session, show_id, doc),
         op="result_cache_header",
     )
+    _invalidate_result_doc(show_id)
 
 
 def _append_result_breed(show_id, doc, group, breed_id, results):
@@ -205,13 +383,150 @@ def _append_result_breed(show_id, doc, group, breed_id, results):
         lambda session: sqlstore.append_result_breed(session, show_id, doc, group, breed_id, results),
         op="result_breed_append",
     )
+    _invalidate_result_doc(show_id)
+
+
+def _write_breed_captures(show_id, doc, captures, write_rows=True, fetch_states=None, heartbeat_interval=15):
+    """Group commit of crawled breeds (see writer.py): their rows, index flags and
+    judges (sqlstore.write_breed_captures), the pages' fetch states and the job
+    heartbeat, all in one transaction. Raises like _append_result_breed."""
+    now = time.time()
+
+    def _write(session):
+        changed = sqlstore.write_breed_captures(session, show_id, doc, captures, write_rows=write_rows)
+        if fetch_states:
+            sqlstore.write_fetch_states(session, fetch_states)
+        sqlstore.heartbeat_job(session, show_id, now, max(0, int(heartbeat_interval or 0)))
+        return changed
+
+    changed = dog_db.run_write(_write, op="result_breed_batch")
+    if changed or (write_rows and captures):
+        _invalidate_result_doc(show_id)
+    return changed
+
+
+def _load_result_payload(show_id):
+    """A show's materialized /all-results body, or None when missing or built
+    from an older doc version (see sqlstore.read_result_payload)."""
+    try:
+        with dog_db.read_scope() as session:
+            return sqlstore.read_result_payload(session, show_id)
+    except (TypeError, ValueError):
+        return None
+    except Exception:
+        logger.exception("dog_result_payload_load_failed", show_id=show_id)
+        return None
+
+
+def _save_result_payload(show_id, version, payload):
+    """Persist a materialized /all-results body stamped with its doc version."""
+    dog_db.run_write(
+        lambda session: sqlstore.write_result_payload(session, show_id, version, payload),
+        op="result_payload",
+    )
+
+
+def _load_show_stats(show_ids, now=None):
+    """Current stored list stats for `show_ids` ({show_id: stats or None}; see
+    sqlstore.read_show_stats). Missing or stale shows are absent — and all of them
+    when the table can't be read — so callers compute those themselves."""
+    try:
+        with dog_db.read_scope() as session:
+            return sqlstore.read_show_stats(session, show_ids, time.time() if now is None else now)
+    except (TypeError, ValueError):
+        return {}
+    except Exception:
+        logger.exception("dog_show_stats_load_failed")
+        return {}
+
+
+def _show_stats_version(show_id):
+    """The input version to stamp a show's stats with, or None when the show is
+    not indexed (see sqlstore.read_show_stats_version)."""
+    with dog_db.read_scope() as session:
+        return sqlstore.read_show_stats_version(session, show_id)
+
+
+def _save_show_stats(show_id, version, stats, valid_until):
+    dog_db.run_write(
+        lambda session: sqlstore.write_show_stats(session, show_id, version, stats, valid_until, time.time()),
+        op="show_stats",
+    )
+
+
+def _due_show_stats_ids(now=None):
+    with dog_db.read_scope() as session:
+        return sqlstore.due_show_stats_ids(session, time.time() if now is None else now)
+
+
+def _load_fetch_states(urls):
+    """Stored Showlink capture state per URL (see sqlstore.read_fetch_states);
+    {} when it cannot be read, which only costs unconditional fetches."""
+    try:
+        with dog_db.read_scope() as session:
+            return sqlstore.read_fetch_states(session, urls)
+    except Exception:
+        logger.exception("dog_fetch_state_load_failed", urls=len(urls))
+        return {}
+
+
+def _save_fetch_states(states):
+    """Persist captured pages' validators and body hashes. Best effort: a lost
+    write only means the next fetch of those URLs is unconditional."""
+    if not states:
+        return
+    try:
+        dog_db.run_write(lambda session: sqlstore.write_fetch_states(session, states), op="fetch_state_save")
+    except Exception:
+        logger.exception("dog_fetch_state_save_failed", urls=len(states))
+
+
+def _load_changes(after_id, show_id=None, kinds=None, limit=1000):
+    """Change-log entries after `after_id` (see sqlstore.read_changes), or []."""
+    try:
+        with dog_db.read_scope() as session:
+            return sqlstore.read_changes(session, after_id, show_id=show_id, kinds=kinds, limit=limit)
+    except Exception:
+        logger.exception("dog_change_log_load_failed", after_id=after_id, show_id=show_id)
+        return []
+
+
+def _prune_change_log(before):
+    """Drop change-log entries older than `before`; returns how many."""
+    return dog_db.run_write(
+        lambda session: sqlstore.prune_changes(session, before),
+        op="change_log_prune",
+    )
+
+
+def _show_data_version(show_id):
+    """One show's data-version stamp (see sqlstore.read_show_data_version), or
+    None when it cannot be read — callers then skip conditional handling."""
+    try:
+        with dog_db.read_scope() as session:
+            return sqlstore.read_show_data_version(session, show_id)
+    except (TypeError, ValueError):
+        return None
+    except Exception:
+        logger.exception("dog_show_data_version_failed", show_id=show_id)
+        return None
+
+
+def _index_data_version():
+    """The index-wide data-version stamp (see sqlstore.read_index_data_version)."""
+    try:
+        with dog_db.read_scope() as session:
+            return sqlstore.read_index_data_version(session)
+    except Exception:
+        logger.exception("dog_index_data_version_failed")
+        return None
 
 
 def _complete_result_cache_show_ids():
     """Set of show ids with a complete result cache (one status-column scan).
     Used by the operational finals-rescue tool (scripts/dog_rescue_finals.py)."""
     try:
-        with dog_db.session_scope() as session:
+        with dog_db.read_scope() as session:
             return sqlstore.complete_result_cache_show_ids(session)
     except Exception:
         logger.exception("dog_complete_result_cache_ids_failed")
@@ -222,7 +537,7 @@ def _dog_results_by_reg_id(reg_id):
     """Every captured result row for one registered dog, newest show first (see
     sqlstore.read_results_by_reg_id). Read-only; returns [] on any failure."""
     try:
-        with dog_db.session_scope() as session:
+        with dog_db.read_scope() as session:
             return sqlstore.read_results_by_reg_id(session, reg_id)
     except Exception:
         logger.exception("dog_results_by_reg_id_failed")
@@ -233,7 +548,7 @@ def _breed_awards_for_shows(show_ids):
     """Honor-roll award rows for a set of shows (see
     sqlstore.read_breed_awards_for_shows). Read-only; returns [] on any failure."""
     try:
-        with dog_db.session_scope() as session:
+        with dog_db.read_scope() as session:
             return sqlstore.read_breed_awards_for_shows(session, show_ids)
     except Exception:
         logger.exception("dog_breed_awards_read_failed")
@@ -244,7 +559,7 @@ def _search_dogs_by_name(query, limit=20):
     """Cross-show dog search aggregated by reg_id: one entry per distinct dog,
     newest-first (see sqlstore.search_dogs_by_name). Read-only; [] on error."""
     try:
-        with dog_db.session_scope() as session:
+        with dog_db.read_scope() as session:
             return sqlstore.search_dogs_by_name(session, query, limit=limit)
     except Exception:
         logger.exception("dog_search_dogs_failed")
@@ -255,7 +570,7 @@ def _search_dog_results_by_name(query, limit=20):
     """Per-show dog-name search over reg_id-less rows: [{show_id, name, count}]
     newest-first (see sqlstore.search_dog_results_by_name). Read-only; [] on error."""
     try:
-        with dog_db.session_scope() as session:
+        with dog_db.read_scope() as session:
             return sqlstore.search_dog_results_by_name(session, query, limit=limit)
     except Exception:
         logger.exception("dog_search_dog_names_failed")
@@ -267,7 +582,7 @@ def _search_breed_award_owners(query, limit=20):
     [{show_id, fci_group, breed_id, owner, winner, count}] newest-first (see
     sqlstore.search_breed_award_owners). Read-only; [] on error."""
     try:
-        with dog_db.session_scope() as session:
+        with dog_db.read_scope() as session:
             return sqlstore.search_breed_award_owners(session, query, limit=limit)
     except Exception:
         logger.exception("dog_search_owners_failed")
@@ -279,7 +594,7 @@ def _search_breeder_awards(query, limit=20):
     [{show_id, fci_group, breed_id, kennel, owner, count}] newest-first (see
     sqlstore.search_breeder_awards). Read-only; [] on error."""
     try:
-        with dog_db.session_scope() as session:
+        with dog_db.read_scope() as session:
             return sqlstore.search_breeder_awards(session, query, limit=limit)
     except Exception:
         logger.exception("dog_search_breeders_failed")
@@ -292,106 +607,64 @@ def _search_breeder_awards(query, limit=20):
 
 def _load_result_jobs():
     try:
-        with dog_db.session_scope() as session:
+        with dog_db.read_scope() as session:
             return sqlstore.read_jobs(session)
     except Exception:
         logger.exception("dog_result_jobs_load_failed")
         return {"jobs": {}, "updated_at": 0}
 
 
-def _save_result_jobs(data):
-    dog_db.run_write(
-        lambda session: sqlstore.write_jobs(session, data),
-        op="result_jobs",
-    )
+def _load_result_job(show_id):
+    """One job row as a dict, or None (also on error)."""
+    try:
+        with dog_db.read_scope() as session:
+            return sqlstore.read_job(session, show_id)
+    except Exception:
+        logger.exception("dog_result_job_load_failed", show_id=show_id)
+        return None
 
 
 def _queue_result_cache_job(show_id, reason="user"):
     now = time.time()
-    jobs_doc = _load_result_jobs()
-    jobs = jobs_doc.setdefault("jobs", {})
-    sid = str(int(show_id))
-    job = jobs.get(sid, {})
-
-    is_running = job.get("state") == "running"
-    if not is_running:
-        job["state"] = "queued"
-    job["show_id"] = int(show_id)
-    job["reason"] = reason
-    job.setdefault("created_at", now)
-    job.setdefault("attempts", 0)
-    job["requested_at"] = now
-    if not is_running:
-        job["updated_at"] = now
-    job.setdefault("next_attempt_at", now)
-    jobs[sid] = job
-    jobs_doc["updated_at"] = now
-    _save_result_jobs(jobs_doc)
-    return job
-
-
-def _set_result_job_running(show_id):
-    now = time.time()
-    jobs_doc = _load_result_jobs()
-    jobs = jobs_doc.setdefault("jobs", {})
-    sid = str(int(show_id))
-    job = jobs.get(sid, {"show_id": int(show_id), "created_at": now, "attempts": 0})
-    job["state"] = "running"
-    job["updated_at"] = now
-    job["last_started_at"] = now
-    jobs[sid] = job
-    jobs_doc["updated_at"] = now
-    _save_result_jobs(jobs_doc)
-    return job
+    return dog_db.run_write(
+        lambda session: sqlstore.queue_job(session, show_id, reason, now),
+        op="result_job_queue",
+    )
 
 
-def _heartbeat_result_cache_job(show_id, min_interval=15):
-    now = time.time()
-    jobs_doc = _load_result_jobs()
-    jobs = jobs_doc.setdefault("jobs", {})
-    sid = str(int(show_id))
-    job = jobs.get(sid)
-    if not job or job.get("state") != "running":
-        return False
+def _claim_result_cache_job(show_id=None, now=None, stale_seconds=None):
+    """Atomically take a due job (the given show's, or the longest-waiting one)
+    and mark it running. Returns the job, or None when another crawler got there
+    first or nothing is due."""
+    now = now or time.time()
+    stale_seconds = RESULT_JOB_STALE_SECONDS if stale_seconds is None else max(1, int(stale_seconds))
+    return dog_db.run_write(
+        lambda session: sqlstore.claim_job(session, now, stale_seconds, show_id=show_id),
+        op="result_job_claim",
+    )
 
-    if (now - (job.get("updated_at") or 0)) < max(0, int(min_interval or 0)):
-        return False
 
-    job["updated_at"] = now
-    jobs_doc["updated_at"] = now
-    _save_result_jobs(jobs_doc)
-    return True
+def _heartbeat_result_cache_job(show_id, min_interval=15):
+    now = time.time()
+    return dog_db.run_write(
+        lambda session: sqlstore.heartbeat_job(session, show_id, now, max(0, int(min_interval or 0))),
+        op="result_job_heartbeat",
+    )
 
 
 def _remove_result_cache_job(show_id):
-    jobs_doc = _load_result_jobs()
-    jobs = jobs_doc.setdefault("jobs", {})
-    sid = str(int(show_id))
-    if sid in jobs:
-        jobs.pop(sid, None)
-        jobs_doc["updated_at"] = time.time()
-        _save_result_jobs(jobs_doc)
+    return dog_db.run_write(
+        lambda session: sqlstore.delete_job(session, show_id),
+        op="result_job_remove",
+    )
 
 
 def _defer_result_cache_job(show_id, error):
     now = time.time()
-    jobs_doc = _load_result_jobs()
-    jobs = jobs_doc.setdefault("jobs", {})
-    sid = str(int(show_id))
-    job = jobs.get(sid, {"show_id": int(show_id), "created_at": now})
-    attempts = int(job.get("attempts") or 0) + 1
-    backoff = min(3600, RESULT_JOB_BACKOFF_SECONDS * attempts)
-    job.update({
-        "state": "queued",
-        "attempts": attempts,
-        "last_error": str(error)[:500],
-        "next_attempt_at": now + backoff,
-        "updated_at": now,
-    })
-    jobs[sid] = job
-    jobs_doc["updated_at"] = now
-    _save_result_jobs(jobs_doc)
-    return job
+    return dog_db.run_write(
+        lambda session: sqlstore.defer_job(session, show_id, error, now, RESULT_JOB_BACKOFF_SECONDS, 3600),
+        op="result_job_defer",
+    )
 
 
 def _result_job_due(job, now=None, stale_seconds=None):
@@ -29,6 +29,12 @@ def _local_now():
         return datetime.datetime.now()
     return datetime.datetime.now(_LOCAL_TZ).replace(tzinfo=None)
 
+def _today():
+    """The process-local date the show-date helpers default to. A function of
+    its own so the crawl simulator (scripts/dog_sim_crawl.py) can put its
+    virtual clock behind it, as it does for _local_now."""
+    return datetime.date.today()
+
 def _local_dt(now=None):
     """Finnish wall-clock datetime for a unix timestamp (or now if None).
 
@@ -42,6 +48,20 @@ def _local_dt(now=None):
         return datetime.datetime.fromtimestamp(now)
     return datetime.datetime.fromtimestamp(now, _LOCAL_TZ).replace(tzinfo=None)
 
+def _next_local_hour_at(hours, now):
+    """Unix timestamp of the next Finnish local wall-clock o'clock among `hours`,
+    strictly after `now` (a unix timestamp)."""
+    localnow = _local_dt(now)
+    for day_offset in (0, 1):
+        day = localnow.date() + datetime.timedelta(days=day_offset)
+        for hour in sorted(set(hours)):
+            candidate = datetime.datetime.combine(day, datetime.time(hour=hour))
+            if candidate > localnow:
+                if _LOCAL_TZ is None:
+                    return candidate.timestamp()
+                return candidate.replace(tzinfo=_LOCAL_TZ).timestamp()
+    return None
+
 def _show_is_recent(show, today=None):
     """Whether the show's date range sits inside the "recent" window — the shows
     whose data still changes: entry counts and result flags of upcoming shows,
@@ -356,7 +376,7 @@ def _infer_show_year_from_date_month(month, today=None):
     if not month:
         return None
 
-    today = today or datetime.date.today()
+    today = today or _today()
     year = today.year
 
     # Showlink's relative sections ("Tänään", "Huomenna") omit the year.
@@ -435,7 +455,7 @@ def _parse_show_date(show, today=None):
     return end_date
 
 def _show_date_state(show, today=None):
-    today = today or datetime.date.today()
+    today = today or _today()
     start_date, end_date = _parse_show_date_range(show, today=today)
     if not start_date or not end_date:
         return "unknown"
@@ -447,7 +467,7 @@ def _show_date_state(show, today=None):
     return "upcoming"
 
 def _show_age_days(show, today=None):
-    today = today or datetime.date.today()
+    today = today or _today()
     show_date = _parse_show_date(show, today=today)
     if not show_date:
         return None
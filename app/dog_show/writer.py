@@ -0,0 +1,152 @@
+"""The result crawl's single writer thread: group commit of captured breeds.
+
+Recording a captured breed used to cost several dog.db transactions, each its
+own WAL fsync and its own turn at SQLite's single write lock, contending with
+the web workers' job-queue writes: the breed's rows (_append_result_breed), its
+index result flag, its judge, its fetch state and the job heartbeat. The crawl
+now only applies a capture to its in-memory doc and hands it to a `_CaptureWriter`;
+the writer folds everything captured since its last commit — up to
+RESULT_WRITE_BATCH breeds — into one transaction (store._write_breed_captures).
+While the pipeline is fast, breeds arrive during a commit and share the next;
+a slow crawl still commits each breed as it lands.
+
+The writer serializes the doc header from a snapshot taken at hand-off, so the
+crawl thread keeps mutating its doc freely. A failed commit stops the writer;
+the error is re-raised to the crawl at its next hand-off or at `close`, just as
+a failed _append_result_breed used to fail the pass.
+
+The show's list stats are derived from its whole result doc, so the writer
+refreshes them after its first commit and then at most every
+SHOW_STATS_REFRESH_SECONDS, plus once when it closes, rather than per commit.
+
+A page that came back unchanged hands the writer nothing but a job heartbeat.
+Such a batch rides along with the next capture when one is queued, and on its
+own commits only when the writer hasn't committed for JOB_HEARTBEAT_SECONDS
+(the job row's own heartbeat throttle), so a pass of unchanged pages costs a
+write transaction per interval rather than one per page.
+"""
+
+import queue
+import threading
+import time
+
+import structlog
+
+from . import config
+from .indexing import _refresh_show_stats
+from .store import _write_breed_captures
+
+logger = structlog.get_logger(__name__)
+
+RESULT_WRITE_BATCH = config.RESULT_WRITE_BATCH
+SHOW_STATS_REFRESH_SECONDS = config.SHOW_STATS_REFRESH_SECONDS
+JOB_HEARTBEAT_SECONDS = 15
+
+_CLOSE = object()
+
+
+def _header_snapshot(doc):
+    """`doc` without its rows, with the dicts the crawl keeps changing copied."""
+    header = {key: value for key, value in doc.items() if key != "results"}
+    for key in ("completed_breeds", "failed_breeds"):
+        if isinstance(header.get(key), dict):
+            header[key] = dict(header[key])
+    return header
+
+
+class _CaptureWriter:
+    def __init__(self, show_id, write_rows=True, max_batch=None):
+        self.show_id = show_id
+        # False on a live refresh of a complete cache: its rows go to disk with
+        # the pass's full save, so only the index updates are committed here.
+        self.write_rows = write_rows
+        self.max_batch = max(1, int(max_batch or RESULT_WRITE_BATCH))
+        self.error = None
+        self.commits = 0
+        self.breeds = 0
+        self.write_s = 0.0
+        self._stats_pending = False
+        self._stats_refreshed_at = None
+        self._committed_at = None
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=f"dog-writer-{show_id}", daemon=True)
+        self._thread.start()
+
+    def put(self, doc=None, capture=None, fetch_states=None):
+        """Hand one breed to the writer: its `capture` (see
+        sqlstore.write_breed_captures) with `doc` as it now stands, or nothing
+        but a job heartbeat for a page that came back unchanged."""
+        if self.error is not None:
+            raise self.error
+        header = _header_snapshot(doc) if capture is not None and self.write_rows else None
+        self._queue.put((header, capture, dict(fetch_states or {})))
+
+    def close(self):
+        """Commit what is queued and stop; raises the error of a failed commit."""
+        self._queue.put(_CLOSE)
+        self._thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def _run(self):
+        while True:
+            entry = self._queue.get()
+            closing = entry is _CLOSE
+            batch = [] if closing else [entry]
+            while not closing and len(batch) < self.max_batch:
+                try:
+                    entry = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if entry is _CLOSE:
+                    closing = True
+                else:
+                    batch.append(entry)
+            if batch and self.error is None:
+                try:
+                    self._commit(batch)
+                except Exception as exc:
+                    logger.exception("dog_result_write_failed", show_id=self.show_id, breeds=len(batch))
+                    self.error = exc
+            if closing:
+                if self._stats_pending:
+                    self._refresh_stats()
+                return
+
+    def _commit(self, batch):
+        started = time.perf_counter()
+        header = None
+        captures = []
+        fetch_states = {}
+        for entry_header, capture, states in batch:
+            header = entry_header or header
+            if capture is not None:
+                captures.append(capture)
+            fetch_states.update(states)
+        if (
+            not captures and not fetch_states and self._committed_at is not None
+            and time.monotonic() - self._committed_at < JOB_HEARTBEAT_SECONDS
+        ):
+            # Only a heartbeat, and the job got one within the interval.
+            return
+        _write_breed_captures(
+            self.show_id, header, captures, write_rows=self.write_rows and header is not None,
+            fetch_states=fetch_states, heartbeat_interval=JOB_HEARTBEAT_SECONDS,
+        )
+        self._committed_at = time.monotonic()
+        if captures:
+            self._stats_pending = True
+            if (
+                self._stats_refreshed_at is None
+                or time.monotonic() - self._stats_refreshed_at >= SHOW_STATS_REFRESH_SECONDS
+            ):
+                self._refresh_stats()
+        self.commits += 1
+        self.breeds += len(captures)
+        self.write_s += time.perf_counter() - started
+
+    def _refresh_stats(self):
+        # _refresh_show_stats logs its own failures; a stats refresh never fails the pass.
+        _refresh_show_stats([self.show_id])
+        self._stats_pending = False
+        self._stats_refreshed_at = time.monotonic()
@@ -0,0 +1,34 @@
+"""Import path of the /dog result crawl's parse processes.
+
+The parse pool (app/dog_show/parse_pool.py) preloads this module into its
+forkserver instead of `app.dog_show.parse_pool` itself. Importing anything
+under `app` normally runs app/__init__.py, which builds the Flask app, runs
+`db.create_all()` on site.db and opens dog.db; the forkserver and every parse
+process would carry all of that inside the crawler's memory limit. Parsing needs
+none of it, and app/dog_show never imports the web app, so this registers `app`
+as a bare package before importing the parse code. The parse processes fork
+from the forkserver and inherit the bare package, so their own imports (the
+pickled parse function, the crawler script re-run as their main module) load
+app/dog_show modules without the app factory.
+
+Lives at the top level, next to `app`, because it must be importable without
+importing `app` first.
+"""
+
+import importlib.machinery
+import importlib.util
+import os
+import sys
+
+
+def _bare_app_package():
+    if "app" in sys.modules:
+        return
+    spec = importlib.machinery.ModuleSpec("app", None, is_package=True)
+    spec.submodule_search_locations = [os.path.join(os.path.dirname(os.path.abspath(__file__)), "app")]
+    sys.modules["app"] = importlib.util.module_from_spec(spec)
+
+
+_bare_app_package()
+
+from app.dog_show import parse_pool  # noqa: E402,F401
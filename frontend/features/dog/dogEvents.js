@@ -0,0 +1,69 @@
+// Live change streams for /dog (Server-Sent Events, see app/dog_show/events.py).
+// The page keeps loading its data from the JSON endpoints; a stream only tells
+// it when something changed, so it can refetch right away instead of on a timer.
+
+export const DOG_STREAM_CHANGE_EVENTS = ['breed', 'stats', 'finals', 'status', 'reload', 'list']
+
+// EventSource.CLOSED, for implementations that don't expose the constant.
+const EVENT_SOURCE_CLOSED = 2
+
+function parseEventData(data) {
+  try {
+    return JSON.parse(data)
+  } catch {
+    return null
+  }
+}
+
+/**
+ * Open a dog event stream at `url`.
+ *
+ * `onChange(type, data)` runs for every change event, and for every `ready`
+ * after the first one: the server ends each stream after a while and the
+ * browser reconnects by itself, and changes made in between are not replayed.
+ * `onUnavailable()` runs once when the stream can't be used — no EventSource,
+ * or the server answered something other than a stream (503 when the worker is
+ * at its stream cap, 429 from the rate limit). The caller should poll then.
+ *
+ * Returns `{ close }`, or null when no stream could be opened.
+ */
+export function openDogEventStream(url, {
+  onChange,
+  onUnavailable,
+  EventSourceImpl = globalThis.EventSource,
+} = {}) {
+  if (typeof EventSourceImpl !== 'function') {
+    onUnavailable?.()
+    return null
+  }
+
+  const source = new EventSourceImpl(url)
+  let closed = false
+  let connected = false
+
+  source.addEventListener('ready', (event) => {
+    if (connected) onChange?.('ready', parseEventData(event.data))
+    connected = true
+  })
+  for (const type of DOG_STREAM_CHANGE_EVENTS) {
+    source.addEventListener(type, (event) => {
+      if (!closed) onChange?.(type, parseEventData(event.data))
+    })
+  }
+  source.onerror = () => {
+    // A dropped connection leaves the source CONNECTING and the browser retries;
+    // a non-stream answer closes it for good.
+    const closedState = EventSourceImpl.CLOSED ?? EVENT_SOURCE_CLOSED
+    if (closed || source.readyState !== closedState) return
+    closed = true
+    source.close()
+    onUnavailable?.()
+  }
+
+  return {
+    close() {
+      closed = true
+      source.close()
+    },
+  }
+}
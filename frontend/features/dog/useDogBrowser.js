@@ -35,11 +35,15 @@ import {
   sortDogsByAwardFilter,
   sourceForShow,
 } from './dogResults.js'
+import { openDogEventStream } from './dogEvents.js'
 
 const LIVE_DETAIL_REFRESH_SECONDS = 120
 // During overnight quiet hours we don't fetch, but keep a slow clock heartbeat
 // so live polling resumes by itself in the morning if the page is left open.
 const NIGHT_RECHECK_SECONDS = 900
+// A capture usually arrives as a burst of events (breed, stats, status); refetch
+// once after it settles.
+const LIVE_EVENT_REFRESH_SECONDS = 2
 
 export function useDogBrowser() {
   const route = useRoute()
@@ -109,6 +113,12 @@ export function useDogBrowser() {
   let indexPollTimer = null
   let allDogsPollTimer = null
   let liveDetailPollTimer = null
+  let liveDetailStream = null
+  let liveDetailStreamShowId = null
+  let liveDetailStreamUnavailableShowId = null
+  let showListStream = null
+  let showListStreamUnavailable = false
+  let showListEventTimer = null
   let morningAutoLoadTimer = null
   let allDogsSessionId = 0
   let routeSyncToken = 0
@@ -128,6 +138,23 @@ export function useDogBrowser() {
     }
   }
 
+  function closeLiveDetailStream() {
+    if (liveDetailStream) {
+      liveDetailStream.close()
+      liveDetailStream = null
+      liveDetailStreamShowId = null
+    }
+  }
+
+  function closeShowListStream() {
+    clearTimeout(showListEventTimer)
+    showListEventTimer = null
+    if (showListStream) {
+      showListStream.close()
+      showListStream = null
+    }
+  }
+
   function clearMorningAutoLoad() {
     if (morningAutoLoadTimer) {
       clearTimeout(morningAutoLoadTimer)
@@ -258,10 +285,50 @@ export function useDogBrowser() {
     )
   }
 
+  // While the show's event stream is open it replaces the refresh timer: each
+  // change refetches the detail (and the loaded whole-show results) once. When
+  // the stream is unavailable for this show (the worker is at its stream cap),
+  // the page polls as before.
+  function openLiveDetailStream(showId) {
+    if (liveDetailStream && sameId(liveDetailStreamShowId, showId)) return true
+    closeLiveDetailStream()
+    if (sameId(liveDetailStreamUnavailableShowId, showId)) return false
+    liveDetailStream = openDogEventStream(`/api/dog/shows/${showId}/events`, {
+      onChange: (type) => {
+        queueLiveShowDetailRefresh(showId)
+        if (allDogsLoaded.value && type !== 'stats' && type !== 'status') {
+          loadAllShowResults({ poll: true, sessionId: allDogsSessionId })
+        }
+      },
+      onUnavailable: () => {
+        liveDetailStream = null
+        liveDetailStreamShowId = null
+        liveDetailStreamUnavailableShowId = showId
+        if (selectedShow.value?.id && sameId(selectedShow.value.id, showId)) {
+          scheduleLiveShowDetailPoll()
+        }
+      },
+    })
+    liveDetailStreamShowId = liveDetailStream ? showId : null
+    return Boolean(liveDetailStream)
+  }
+
+  function queueLiveShowDetailRefresh(showId) {
+    clearLiveDetailPoll()
+    liveDetailPollTimer = setTimeout(() => {
+      liveDetailPollTimer = null
+      refreshLiveShowDetail(showId)
+    }, LIVE_EVENT_REFRESH_SECONDS * 1000)
+  }
+
   function scheduleLiveShowDetailPoll(delaySeconds = LIVE_DETAIL_REFRESH_SECONDS) {
     clearLiveDetailPoll()
-    if (!shouldPollLiveShowDetail()) return
+    if (!shouldPollLiveShowDetail()) {
+      closeLiveDetailStream()
+      return
+    }
     const showId = selectedShow.value.id
+    if (openLiveDetailStream(showId)) return
     liveDetailPollTimer = setTimeout(() => {
       liveDetailPollTimer = null
       refreshLiveShowDetail(showId)
@@ -269,6 +336,11 @@ export function useDogBrowser() {
   }
 
   async function refreshLiveShowDetail(showId = selectedShow.value?.id) {
+    if (showId && liveDetailStream && detailLoading.value) {
+      // The stream won't call again for this change; retry once the load is done.
+      queueLiveShowDetailRefresh(showId)
+      return
+    }
     if (!showId || !shouldPollLiveShowDetail() || detailLoading.value) {
       scheduleLiveShowDetailPoll()
       return
@@ -503,7 +575,14 @@ export function useDogBrowser() {
       const data = await $fetch('/api/dog/shows')
       shows.value = standardizeShows(data.shows || shows.value)
       indexStats.value = data.index || indexStats.value
-      if (!showListShouldPoll.value && indexPollTimer) {
+      if (!showListShouldPoll.value) {
+        closeShowListStream()
+        if (indexPollTimer) {
+          clearInterval(indexPollTimer)
+          indexPollTimer = null
+        }
+      } else if (indexPollTimer && !indexWarming.value && currentView.value === 'list' && openShowListStream()) {
+        // Indexing finished while polling; live shows move to the stream.
         clearInterval(indexPollTimer)
         indexPollTimer = null
       }
@@ -512,8 +591,33 @@ export function useDogBrowser() {
     }
   }
 
+  // Live list stats come over the list event stream while the list is on
+  // screen. Index-build progress isn't an event, so a warming index keeps the
+  // 15s poll, and so does a page whose stream is unavailable (the worker is at
+  // its stream cap).
+  function openShowListStream() {
+    if (showListStream) return true
+    if (showListStreamUnavailable) return false
+    showListStream = openDogEventStream('/api/dog/shows/events', {
+      onChange: () => {
+        clearTimeout(showListEventTimer)
+        showListEventTimer = setTimeout(() => {
+          showListEventTimer = null
+          refreshIndexStats()
+        }, LIVE_EVENT_REFRESH_SECONDS * 1000)
+      },
+      onUnavailable: () => {
+        showListStream = null
+        showListStreamUnavailable = true
+        startIndexPolling()
+      },
+    })
+    return Boolean(showListStream)
+  }
+
   function startIndexPolling() {
     if (indexPollTimer || !showListShouldPoll.value) return
+    if (!indexWarming.value && (currentView.value !== 'list' || openShowListStream())) return
     indexPollTimer = setInterval(refreshIndexStats, 15000)
   }
 
@@ -895,6 +999,18 @@ export function useDogBrowser() {
     }
   })
 
+  // A viewer holds one stream at a time: the list's while browsing the list,
+  // the show's while a live show is open.
+  watch(currentView, (view) => {
+    if (view !== 'list') {
+      closeShowListStream()
+      return
+    }
+    if (showListStream || indexPollTimer || !showListShouldPoll.value) return
+    refreshIndexStats()
+    startIndexPolling()
+  })
+
   watch([
     currentView,
     () => selectedShow.value?.id,
@@ -1052,6 +1168,8 @@ export function useDogBrowser() {
     allDogsSessionId += 1
     clearAllDogsPoll()
     clearLiveDetailPoll()
+    closeLiveDetailStream()
+    closeShowListStream()
     clearMorningAutoLoad()
   })
 
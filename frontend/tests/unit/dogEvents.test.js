@@ -0,0 +1,96 @@
+import { describe, expect, it, vi } from 'vitest'
+import { openDogEventStream } from '../../features/dog/dogEvents.js'
+
+class FakeEventSource {
+  static CLOSED = 2
+
+  constructor(url) {
+    this.url = url
+    this.readyState = 0
+    this.listeners = {}
+    this.onerror = null
+    FakeEventSource.last = this
+  }
+
+  addEventListener(type, listener) {
+    ;(this.listeners[type] ||= []).push(listener)
+  }
+
+  emit(type, data = {}) {
+    for (const listener of this.listeners[type] || []) {
+      listener({ type, data: JSON.stringify(data) })
+    }
+  }
+
+  fail(readyState) {
+    this.readyState = readyState
+    this.onerror?.({})
+  }
+
+  close() {
+    this.readyState = FakeEventSource.CLOSED
+  }
+}
+
+describe('openDogEventStream', () => {
+  it('reports change events, and a ready after a reconnect', () => {
+    const onChange = vi.fn()
+    const stream = openDogEventStream('/api/dog/shows/7/events', {
+      onChange,
+      EventSourceImpl: FakeEventSource,
+    })
+    const source = FakeEventSource.last
+
+    expect(stream).not.toBeNull()
+    expect(source.url).toBe('/api/dog/shows/7/events')
+    source.emit('ready', { status: 'partial' })
+    expect(onChange).not.toHaveBeenCalled()
+
+    source.emit('breed', { breed: { id: 'x' } })
+    expect(onChange).toHaveBeenLastCalledWith('breed', { breed: { id: 'x' } })
+
+    // The server ended the stream and the browser reconnected.
+    source.fail(0)
+    source.emit('ready', { status: 'complete' })
+    expect(onChange).toHaveBeenLastCalledWith('ready', { status: 'complete' })
+    expect(onChange).toHaveBeenCalledTimes(2)
+  })
+
+  it('falls back once when the server refuses the stream', () => {
+    const onChange = vi.fn()
+    const onUnavailable = vi.fn()
+    openDogEventStream('/api/dog/shows/events', { onChange, onUnavailable, EventSourceImpl: FakeEventSource })
+    const source = FakeEventSource.last
+
+    source.fail(FakeEventSource.CLOSED) // 503 at the worker's stream cap
+    source.onerror({})
+    source.emit('list', {})
+
+    expect(onUnavailable).toHaveBeenCalledTimes(1)
+    expect(onChange).not.toHaveBeenCalled()
+  })
+
+  it('falls back without EventSource', () => {
+    const onUnavailable = vi.fn()
+    expect(openDogEventStream('/api/dog/shows/events', { onUnavailable, EventSourceImpl: null })).toBeNull()
+    expect(onUnavailable).toHaveBeenCalledTimes(1)
+  })
+
+  it('stops reporting after close', () => {
+    const onChange = vi.fn()
+    const onUnavailable = vi.fn()
+    const stream = openDogEventStream('/api/dog/shows/7/events', {
+      onChange,
+      onUnavailable,
+      EventSourceImpl: FakeEventSource,
+    })
+    const source = FakeEventSource.last
+
+    stream.close()
+    source.emit('stats', {})
+    source.onerror({})
+
+    expect(onChange).not.toHaveBeenCalled()
+    expect(onUnavailable).not.toHaveBeenCalled()
+  })
+})
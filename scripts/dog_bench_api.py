@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""End-to-end benchmark of the /api/dog endpoints against a realistic dog.db.
+
+Drives the endpoints through the Flask test client (the whole request path:
+routing, validators, store reads, serialization; no network or gunicorn):
+
+- `shows`:        GET /api/dog/shows
+- `show_detail`:  GET /api/dog/shows/<id>
+- `all_results`:  GET /api/dog/shows/<id>/all-results
+- `breed_results`: GET /api/dog/shows/<id>/results?group=&breed=
+- `dog_profile`:  GET /api/dog/dogs?reg=
+- `search`:       GET /api/dog/search?q=  (dog, kennel, breed and judge queries)
+
+Each endpoint gets --requests requests over randomly drawn shows, breeds, dogs
+and queries (the same draw for a given --seed), after the per-process caches
+were cleared, so the run mixes cold and warm reads the way traffic does. For
+each it reports p50/p95/max latency, the first (cold) request, the SQL
+statements per request (counted on both dog.db engines). The process's peak
+RSS is a high-water mark over the whole run, so it is reported once, after the
+last endpoint. --json writes everything plus the data and environment it ran on;
+--baseline prints the ratio against an earlier --json run.
+
+The database comes from --db, or is generated into a temp file by
+scripts/dog_generate_db.py with its defaults (two seasons, ~200k result rows;
+about a minute) and removed afterwards. The generator runs in a child process,
+so its memory doesn't count toward the reported peak RSS.
+
+    python3 scripts/dog_bench_api.py --json bench-before.json
+    python3 scripts/dog_bench_api.py --db /tmp/dog-bench.db --requests 100 --json bench-after.json --baseline bench-before.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.abspath(os.path.join(SCRIPTS_DIR, ".."))
+for path in (REPO_ROOT, SCRIPTS_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+os.environ.setdefault("SECRET_KEY", "dog-bench-local-only")
+os.environ.setdefault("DATABASE_URI", "sqlite://")  # in-memory; the bench only touches dog.db
+os.environ["DOG_NO_CRAWLER"] = "true"  # no background crawler threads in the measured process
+os.environ.setdefault("DOG_DATABASE_URI", "sqlite://")
+
+from sqlalchemy import event, select  # noqa: E402
+
+from app import app as flask_app, limiter  # noqa: E402
+from app.dog_show import db as dog_db, indexing, store  # noqa: E402
+from app.dog_show.models import DogBreed, DogBreedAward, DogResult  # noqa: E402
+
+
+def _peak_rss_mb():
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)  # KiB on Linux
+
+
+class _StatementCounter:
+    """SQL statements executed on the dog.db engines (transaction BEGINs aside)."""
+
+    def __init__(self):
+        self.count = 0
+        self._engines = [engine for engine in (dog_db.get_engine(), dog_db.get_read_engine()) if engine is not None]
+        for engine in self._engines:
+            event.listen(engine, "before_cursor_execute", self._count)
+
+    def _count(self, _conn, _cursor, statement, *_args):
+        if statement.strip().upper() != "BEGIN":
+            self.count += 1
+
+    def close(self):
+        for engine in self._engines:
+            event.remove(engine, "before_cursor_execute", self._count)
+
+
+def _targets(rng, requests):
+    """{endpoint: [url]} — `requests` URLs per endpoint drawn from the data."""
+    with dog_db.read_scope() as session:
+        breeds = session.execute(
+            select(DogBreed.show_id, DogBreed.fci_group, DogBreed.breed_id, DogBreed.name, DogBreed.judge)
+            .where(DogBreed.has_results.is_(True))
+        ).all()
+        reg_ids = [row[0] for row in session.execute(
+            select(DogResult.reg_id).where(DogResult.reg_id.is_not(None)).distinct().limit(20000)
+        )]
+        names = [row[0] for row in session.execute(select(DogResult.name).limit(20000))]
+        kennels = [row[0] for row in session.execute(
+            select(DogBreedAward.name).where(DogBreedAward.award_type.like("%kasvatt%")).distinct()
+        )]
+    show_ids = sorted({row[0] for row in breeds})
+    queries = []
+    for _ in range(requests):
+        kind = rng.randrange(4)
+        if kind == 0:
+            words = rng.choice(names).split()
+            queries.append(" ".join(words[1:3]) if len(words) > 2 else words[-1])
+        elif kind == 1:
+            queries.append(rng.choice(kennels or names)[:6])
+        elif kind == 2:
+            queries.append(rng.choice(breeds)[3][-8:])
+        else:
+            queries.append((rng.choice(breeds)[4] or "tuomari").split()[-1])
+    picks = [rng.choice(breeds) for _ in range(requests)]
+    return {
+        "shows": ["/api/dog/shows"] * requests,
+        "show_detail": [f"/api/dog/shows/{rng.choice(show_ids)}" for _ in range(requests)],
+        "all_results": [f"/api/dog/shows/{rng.choice(show_ids)}/all-results" for _ in range(requests)],
+        "breed_results": [f"/api/dog/shows/{sid}/results?group={group}&breed={breed}" for sid, group, breed, _, _ in picks],
+        "dog_profile": [f"/api/dog/dogs?reg={rng.choice(reg_ids)}" for _ in range(requests)],
+        "search": [f"/api/dog/search?q={query}" for query in queries],
+    }
+
+
+def _clear_caches():
+    store._clear_result_doc_cache()
+    indexing._show_stats_cache.clear()
+    store._show_list_cache.update(data=None, ts=0, version=None)
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] if ordered else 0.0
+
+
+def _run_endpoint(client, urls):
+    counter = _StatementCounter()
+    latencies = []
+    statements = []
+    statuses = {}
+    response_bytes = 0
+    try:
+        for url in urls:
+            before = counter.count
+            started = time.perf_counter()
+            resp = client.get(url, headers={"Accept-Encoding": "gzip"})
+            body = resp.get_data()
+            latencies.append(time.perf_counter() - started)
+            statements.append(counter.count - before)
+            statuses[str(resp.status_code)] = statuses.get(str(resp.status_code), 0) + 1
+            response_bytes += len(body)
+    finally:
+        counter.close()
+    return {
+        "requests": len(urls),
+        "cold_ms": round(latencies[0] * 1000, 2),
+        "p50_ms": round(_percentile(latencies, 0.5) * 1000, 2),
+        "p95_ms": round(_percentile(latencies, 0.95) * 1000, 2),
+        "max_ms": round(max(latencies) * 1000, 2),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 2),
+        "queries_per_request": round(statistics.fmean(statements), 1),
+        "max_queries": max(statements),
+        "mean_response_kb": round(response_bytes / len(urls) / 1024, 1),
+        "statuses": statuses,
+    }
+
+
+def _data_summary(path):
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        counts = {
+            table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]  # noqa: S608 - fixed names
+            for table in ("dog_show", "dog_breed", "dog_result", "dog_breed_award", "dog_result_job")
+        }
+    finally:
+        conn.close()
+    counts["size_mb"] = round(os.path.getsize(path) / 1e6, 1)
+    return counts
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the /api/dog endpoints end to end")
+    parser.add_argument("--db", default=None, help="dog.db to benchmark (default: generate a temporary one)")
+    parser.add_argument("--requests", type=int, default=50, help="Requests per endpoint")
+    parser.add_argument("--endpoint", action="append", dest="endpoints", help="Only these endpoints (repeatable)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the request draw")
+    parser.add_argument("--json", default=None, help="Write the results to this JSON file")
+    parser.add_argument("--baseline", default=None, help="Earlier --json results to compare against")
+    args = parser.parse_args()
+
+    tmp_dir = None
+    path = args.db
+    if path is None:
+        tmp_dir = tempfile.mkdtemp(prefix="dog-bench-")
+        path = os.path.join(tmp_dir, "dog.db")
+        print("Generating a dog.db (scripts/dog_generate_db.py defaults)...", flush=True)
+        subprocess.run([sys.executable, os.path.join(SCRIPTS_DIR, "dog_generate_db.py"), "--out", path], check=True)
+    dog_db.init_db("sqlite:///" + os.path.abspath(path))
+    limiter.enabled = False
+    flask_app.config["TESTING"] = True
+    client = flask_app.test_client()
+
+    try:
+        targets = _targets(random.Random(args.seed), args.requests)
+        endpoints = {name: urls for name, urls in targets.items() if not args.endpoints or name in args.endpoints}
+        results = {}
+        _clear_caches()
+        print(f"{'endpoint':>14} {'cold':>8} {'p50':>8} {'p95':>8} {'max':>8} {'queries':>8} {'kB':>7}")
+        for name, urls in endpoints.items():
+            results[name] = row = _run_endpoint(client, urls)
+            print(
+                f"{name:>14} {row['cold_ms']:8.1f} {row['p50_ms']:8.1f} {row['p95_ms']:8.1f} {row['max_ms']:8.1f}"
+                f" {row['queries_per_request']:8.1f} {row['mean_response_kb']:7.1f}"
+            )
+        peak_rss_mb = _peak_rss_mb()
+        print(f"peak RSS over the run: {peak_rss_mb:.1f} MB")
+        report = {
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "args": {"requests": args.requests, "seed": args.seed, "generated": args.db is None},
+            "data": _data_summary(path),
+            "read_pragmas": dog_db.read_pragmas() if dog_db.get_read_engine() is not None else None,
+            "peak_rss_mb": peak_rss_mb,
+            "endpoints": results,
+        }
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as fh:
+                json.dump(report, fh, indent=2, ensure_ascii=False)
+            print(f"Wrote {args.json}")
+        if args.baseline:
+            with open(args.baseline, encoding="utf-8") as fh:
+                baseline = json.load(fh)
+            print(f"vs {args.baseline} ({baseline.get('commit')}): p50 / p95 / queries, new / old")
+            for name, row in results.items():
+                old = (baseline.get("endpoints") or {}).get(name)
+                if not old:
+                    continue
+                ratios = [
+                    f"{row[key] / old[key]:.2f}x" if old.get(key) else "n/a"
+                    for key in ("p50_ms", "p95_ms", "queries_per_request")
+                ]
+                print(f"{name:>14} " + " ".join(f"{ratio:>8}" for ratio in ratios))
+    finally:
+        dog_db.configure("sqlite://")
+        if tmp_dir:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
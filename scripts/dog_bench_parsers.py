@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Benchmark the Showlink page-parsing backends.
+
+Parses every page of a corpus with each backend of
+`showlink._page_soup` — `full` (the whole html.parser tree) and `strained` (only
+the elements parsers.py reads) — and runs the page kind's parser on the result,
+the way the crawler does:
+
+- `list`:   `_parse_show_list`
+- `detail`: `_parse_show_detail` (group pages it links are served from the
+            corpus by URL, parsed with the same backend)
+- `breed`:  `_parse_breed_results`
+
+The corpus is either a directory of HTML files plus a corpus.json manifest
+listing each file's `page` kind, `show_id` and `url` (--corpus; by default the
+synthetic pages in tests/fixtures/showlink, written to the shapes the parsers
+read), or the raw-page archive of real Showlink captures (--archive-dir, the
+latest capture of each URL; see archive.py). Only the archive shows whether the
+strainer keeps everything the parsers need on real markup.
+
+Per backend it reports pages/s (the best of --repeat passes over the corpus) and
+the peak traced memory (tracemalloc) of the most expensive page, and checks that
+both backends gave identical parser output.
+
+    python3 scripts/dog_bench_parsers.py
+    python3 scripts/dog_bench_parsers.py --corpus /path/to/saved-pages --repeat 10
+    python3 scripts/dog_bench_parsers.py --archive-dir app/data/pages
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+import structlog
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+os.environ.setdefault("SECRET_KEY", "dog-bench-local-only")
+os.environ.setdefault("DATABASE_URI", "sqlite://")  # in-memory; nothing here touches a database
+os.environ.setdefault("DOG_DATABASE_URI", "sqlite://")
+
+from app.dog_show import archive, parsers, showlink  # noqa: E402
+
+DEFAULT_CORPUS = os.path.join(REPO_ROOT, "tests", "fixtures", "showlink")
+
+
+def _load_corpus(directory):
+    with open(os.path.join(directory, "corpus.json"), encoding="utf-8") as fh:
+        entries = json.load(fh)
+    for entry in entries:
+        with open(os.path.join(directory, entry["file"]), encoding="utf-8") as fh:
+            entry["html"] = fh.read()
+    return entries
+
+
+def _load_archive(directory):
+    """Corpus entries for the latest archived capture of every URL with a page
+    kind (the show list's and each show's pages)."""
+    entries = []
+    for name in [archive.LIST_INDEX, *map(str, archive._archived_show_ids(directory))]:
+        for url, entry in sorted(archive._archived_pages(name, directory).items()):
+            if entry.get("page") not in ("list", "detail", "breed"):
+                continue
+            try:
+                html = archive._read_archived_page(entry["sha1"], directory)
+            except OSError:
+                continue
+            show_id = None if name == archive.LIST_INDEX else int(name)
+            entries.append({"file": entry["sha1"], "page": entry["page"], "show_id": show_id, "url": url, "html": html})
+    return entries
+
+
+def _parse_entry(entry, backend):
+    soup = showlink._page_soup(entry["html"], entry["page"], backend)
+    if entry["page"] == "list":
+        return parsers._parse_show_list(soup)
+    if entry["page"] == "detail":
+        return parsers._parse_show_detail(soup, entry["show_id"])
+    return parsers._parse_breed_results(soup, entry["show_id"])
+
+
+def _serve_corpus(entries, backend):
+    """Serve the group-page fetches of `_parse_show_detail` from the corpus."""
+    by_url = {entry["url"]: entry["html"] for entry in entries}
+    parsers._fetch_page = lambda url, page=None: showlink._page_soup(by_url[url], page, backend)
+
+
+def _timed_pass(entries, backend):
+    started = time.perf_counter()
+    outputs = [_parse_entry(entry, backend) for entry in entries]
+    return time.perf_counter() - started, outputs
+
+
+def _peak_memory(entries, backend):
+    peak = 0
+    tracemalloc.start()
+    try:
+        for entry in entries:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            _parse_entry(entry, backend)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Showlink page parsing per backend")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="Saved-page corpus directory (with corpus.json)")
+    parser.add_argument("--archive-dir", default=None, help="Use the raw-page archive's real captures instead of --corpus")
+    parser.add_argument("--repeat", type=int, default=5, help="Passes over the corpus per backend (best is reported)")
+    args = parser.parse_args()
+
+    # Keep the group-page fallback's info lines out of the timings.
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    source = args.archive_dir or args.corpus
+    entries = _load_archive(args.archive_dir) if args.archive_dir else _load_corpus(args.corpus)
+    if not entries:
+        sys.exit(f"no pages in {source}")
+    size = sum(len(entry["html"].encode("utf-8")) for entry in entries)
+    print(f"{len(entries)} pages, {size / 1024:.0f} KiB ({source})")
+
+    outputs = {}
+    best = {}
+    for backend in showlink.PARSER_BACKENDS:
+        _serve_corpus(entries, backend)
+        runs = [_timed_pass(entries, backend) for _ in range(max(1, args.repeat))]
+        best[backend] = min(elapsed for elapsed, _ in runs)
+        outputs[backend] = runs[0][1]
+        peak = _peak_memory(entries, backend)
+        print(f"{backend:>9}: {len(entries) / best[backend]:8.1f} pages/s  peak {peak / 1024:8.0f} KiB/page")
+
+    identical = all(outputs[backend] == outputs["full"] for backend in showlink.PARSER_BACKENDS)
+    print(f"strained vs full: {best['full'] / best['strained']:.1f}x faster, "
+          f"output {'identical' if identical else 'DIFFERS'}")
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
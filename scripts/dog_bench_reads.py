@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""Benchmark dog.db request-path reads: the read-write engine vs the read engine.
+
+Builds a throwaway dog.db of --shows x --breeds x --dogs result rows (100k by
+default, with honor rolls and the search index), then runs the same random mix
+of the web tier's reads against it through two engines:
+
+- `default`: the read-write engine every read used before (`db._make_engine`:
+             WAL and busy_timeout only);
+- `tuned`:   the read engine (`db._make_read_engine`: read-only URI plus the
+             `db.read_pragmas()` mmap / cache / temp_store settings).
+
+Each engine runs --threads reader threads (gunicorn gthread workers share one
+process the same way) for --seconds after a warm-up pass; latency percentiles
+are reported per read kind, and the whole run as reads/s. The OS page cache is
+shared by both runs, so the difference is SQLite's own work, not disk.
+
+    python3 scripts/dog_bench_reads.py
+    python3 scripts/dog_bench_reads.py --shows 100 --threads 16 --seconds 20
+    DOG_SQLITE_MMAP_BYTES=0 python3 scripts/dog_bench_reads.py   # tuned minus mmap
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+_TMP_DIR = tempfile.mkdtemp(prefix="dog-bench-")
+os.environ.setdefault("SECRET_KEY", "dog-bench-local-only")
+os.environ.setdefault("DATABASE_URI", "sqlite://")  # in-memory; the bench only touches dog.db
+os.environ["DOG_DATABASE_URI"] = "sqlite:///" + os.path.join(_TMP_DIR, "dog.db")
+
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.dog_show import db as dog_db, sqlstore  # noqa: E402
+
+FIRST_SHOW_ID = 90001
+
+
+def _show(sid, breeds):
+    return {
+        "title": f"01.01.2025 Bench Show {sid}", "name": f"Bench Show {sid}", "date": "01.01.",
+        "month": "tammikuu 2025", "source_url": "",
+        "breeds": [
+            {"name": f"breed {b}", "count": 20, "group": str(b % 10 + 1), "breed_id": str(b + 1),
+             "judge": f"Judge {b % 40}", "has_results": True}
+            for b in range(breeds)
+        ],
+    }
+
+
+def _result_doc(sid, breeds, dogs):
+    results = []
+    completed = {}
+    for b in range(breeds):
+        group, breed_id = str(b % 10 + 1), str(b + 1)
+        completed[f"{group}:{breed_id}"] = {
+            "name": f"breed {b}", "result_count": dogs, "judge": f"Judge {b % 40}",
+            "awards": [
+                {"type": award, "name": f"Dog {b}-{i}", "owner": f"Owner {b}-{i}", "text": f"Dog {b}-{i}, Om. Owner"}
+                for i, award in enumerate(("ROP", "VSP", "SERT", "VET-ROP"))
+            ],
+        }
+        for d in range(dogs):
+            results.append({
+                "number": d + 1, "name": f"Kennel {b} Dog Name {d}",
+                # The same dogs show at every show: reg-id lookups span shows.
+                "reg_url": f"https://jalostus.kennelliitto.fi/frmKoira.aspx?RekNo=FI{b:05d}%2F{d:02d}",
+                "grade": "ERI", "placement": d + 1, "competitive_placement": "PU1" if d == 0 else "",
+                "awards": "SA SERT" if d == 0 else "", "critique": "Hyvä tyyppi ja liikkeet. " * 6,
+                "gender": "uros" if d % 2 else "narttu", "class_name": "AVO",
+                "breedName": f"breed {b}", "breedGroup": group, "breedId": breed_id,
+                "breedObj": {"name": f"breed {b}", "group": group, "breed_id": breed_id, "judge": f"Judge {b % 40}"},
+            })
+    return {
+        "version": 1, "status": "complete", "source": "bench", "title": f"Bench Show {sid}",
+        "source_url": "", "total_breeds": breeds, "started_at": 1.0, "updated_at": 2.0,
+        "cached_at": 2.0, "last_error": None, "completed_breeds": completed, "failed_breeds": {},
+        "results": results,
+    }
+
+
+def _build(shows, breeds, dogs):
+    dog_db.init_db()
+    for sid in range(FIRST_SHOW_ID, FIRST_SHOW_ID + shows):
+        doc = _result_doc(sid, breeds, dogs)
+
+        def _write(session, sid=sid, doc=doc):
+            sqlstore.write_show(session, sid, _show(sid, breeds))
+            sqlstore.write_result_doc(session, sid, doc)
+
+        dog_db.run_write(_write, op="bench")
+
+
+def _reads(shows, breeds, dogs):
+    """(kind, read(session, rng)) — the request paths' reads, weighted roughly
+    as a live weekend serves them."""
+    show_ids = range(FIRST_SHOW_ID, FIRST_SHOW_ID + shows)
+
+    def breed_slice(session, rng):
+        b = rng.randrange(breeds)
+        return sqlstore.read_breed_result_slice(session, rng.choice(show_ids), str(b % 10 + 1), str(b + 1))
+
+    def show_meta(session, rng):
+        return sqlstore.read_shows_meta(session, rng.sample(show_ids, min(20, shows)))
+
+    def result_doc(session, rng):
+        return sqlstore.read_result_doc(session, rng.choice(show_ids))
+
+    def dog_search(session, rng):
+        return sqlstore.search_dogs_by_name(session, f"Kennel {rng.randrange(breeds)} Dog")
+
+    def reg_id(session, rng):
+        return sqlstore.read_results_by_reg_id(session, f"FI{rng.randrange(breeds):05d}/{rng.randrange(dogs):02d}")
+
+    return [
+        ("breed_slice", breed_slice, 8),
+        ("show_meta", show_meta, 4),
+        ("reg_id", reg_id, 2),
+        ("dog_search", dog_search, 2),
+        ("result_doc", result_doc, 1),
+    ]
+
+
+def _run(engine, reads, threads, seconds, seed):
+    Session = sessionmaker(bind=engine, future=True)
+    kinds = [kind for kind, _, weight in reads for _ in range(weight)]
+    by_kind = {kind: read for kind, read, _ in reads}
+    latencies = {kind: [] for kind, _, _ in reads}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def reader(n):
+        rng = random.Random(seed + n)
+        local = {kind: [] for kind in latencies}
+        while time.perf_counter() < deadline:
+            kind = rng.choice(kinds)
+            started = time.perf_counter()
+            with Session() as session:
+                by_kind[kind](session, rng)
+            local[kind].append(time.perf_counter() - started)
+        with lock:
+            for kind, values in local.items():
+                latencies[kind].extend(values)
+
+    workers = [threading.Thread(target=reader, args=(n,)) for n in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return latencies
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] if ordered else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dog.db reads: read-write vs read engine")
+    parser.add_argument("--shows", type=int, default=50, help="Shows in the synthetic dog.db")
+    parser.add_argument("--breeds", type=int, default=100, help="Breeds per show")
+    parser.add_argument("--dogs", type=int, default=20, help="Result rows per breed")
+    parser.add_argument("--threads", type=int, default=8, help="Concurrent reader threads")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Measured run per engine")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    _build(args.shows, args.breeds, args.dogs)
+    path = dog_db.database_path()
+    print(
+        f"{args.shows * args.breeds * args.dogs} result rows ({args.shows} shows x {args.breeds} breeds x"
+        f" {args.dogs} dogs), {os.path.getsize(path) / 1e6:.1f} MB, built in {time.perf_counter() - started:.1f}s"
+    )
+    print("read engine pragmas: " + ", ".join(f"{name}={value}" for name, value in dog_db.read_pragmas().items()))
+
+    reads = _reads(args.shows, args.breeds, args.dogs)
+    engines = (
+        ("default", dog_db._make_engine(dog_db._current_uri)),
+        ("tuned", dog_db._make_read_engine(path, pool_size=args.threads)),
+    )
+    results = {}
+    for name, engine in engines:
+        _run(engine, reads, args.threads, min(2.0, args.seconds), seed=1)  # warm-up
+        results[name] = _run(engine, reads, args.threads, args.seconds, seed=2)
+        engine.dispose()
+
+    print(f"{'read':>12} {'engine':>8} {'n':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for kind, _, _ in reads:
+        for name, _ in engines:
+            values = results[name][kind]
+            print(
+                f"{kind:>12} {name:>8} {len(values):>7} {_percentile(values, 0.5) * 1000:8.2f}"
+                f" {_percentile(values, 0.95) * 1000:8.2f} {_percentile(values, 0.99) * 1000:8.2f}"
+            )
+    totals = {name: sum(len(values) for values in results[name].values()) / args.seconds for name, _ in engines}
+    print("reads/s: " + "  ".join(f"{name}={rate:.0f}" for name, rate in totals.items()))
+    print(f"tuned vs default: {totals['tuned'] / totals['default']:.2f}x")
+    dog_db.configure("sqlite://")
+    shutil.rmtree(_TMP_DIR, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
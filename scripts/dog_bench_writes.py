@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Benchmark the dog.db result-row write paths.
+
+Times the child-row inserts of a whole-show rewrite — the statements that hold
+SQLite's write lock during the crawler's final complete save — two ways against
+a throwaway dog.db:
+
+- `orm`:  one `session.add(DogResult(...))` per row, the pre-bulk write path
+          (reproduced here for comparison);
+- `core`: the batched Core executemany inserts `sqlstore` uses now;
+
+plus the full `sqlstore.write_result_doc` (header, inserts, search-index
+maintenance, into an emptied show so no breed is skipped as unchanged) for
+context. Each timing is one committed transaction over a
+synthetic show of --breeds x --dogs result rows with a four-award honor roll per
+breed; the best of --repeat runs is reported as rows/s.
+
+    python3 scripts/dog_bench_writes.py
+    python3 scripts/dog_bench_writes.py --breeds 400 --dogs 25 --repeat 5
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+_TMP_DIR = tempfile.mkdtemp(prefix="dog-bench-")
+os.environ.setdefault("SECRET_KEY", "dog-bench-local-only")
+os.environ.setdefault("DATABASE_URI", "sqlite://")  # in-memory; the bench only touches dog.db
+os.environ["DOG_DATABASE_URI"] = "sqlite:///" + os.path.join(_TMP_DIR, "dog.db")
+
+from sqlalchemy import delete  # noqa: E402
+
+from app.dog_show import db as dog_db, sqlstore  # noqa: E402
+from app.dog_show.models import DogBreedAward, DogResult  # noqa: E402
+from app.dog_show.utils import _parse_reg_id  # noqa: E402
+
+SHOW_ID = 99001
+
+
+def _synthetic_doc(breeds, dogs):
+    results = []
+    completed = {}
+    for b in range(breeds):
+        group, breed_id = str(b % 10 + 1), str(b + 1)
+        completed[f"{group}:{breed_id}"] = {
+            "name": f"breed {b}", "result_count": dogs, "judge": f"Judge {b % 40}",
+            "awards": [
+                {"type": award, "name": f"Dog {b}-{i}", "owner": f"Owner {b}-{i}", "text": f"Dog {b}-{i}, Om. Owner"}
+                for i, award in enumerate(("ROP", "VSP", "SERT", "VET-ROP"))
+            ],
+        }
+        for d in range(dogs):
+            results.append({
+                "number": d + 1, "name": f"Kennel {b} Dog Name {d}",
+                "reg_url": f"https://jalostus.kennelliitto.fi/frmKoira.aspx?RekNo=FI{b:05d}%2F{d:02d}",
+                "grade": "ERI", "placement": d + 1, "competitive_placement": "PU1" if d == 0 else "",
+                "awards": "SA SERT" if d == 0 else "", "critique": "Hyvä tyyppi ja liikkeet. " * 6,
+                "gender": "uros" if d % 2 else "narttu", "class_name": "AVO",
+                "breedName": f"breed {b}", "breedGroup": group, "breedId": breed_id,
+                "breedObj": {"name": f"breed {b}", "group": group, "breed_id": breed_id, "judge": f"Judge {b % 40}"},
+            })
+    return {
+        "version": 1, "status": "complete", "source": "bench", "title": "Bench Show",
+        "source_url": "", "total_breeds": breeds, "started_at": 1.0, "updated_at": 2.0,
+        "cached_at": 2.0, "last_error": None, "completed_breeds": completed, "failed_breeds": {},
+        "results": results,
+    }
+
+
+def _orm_insert(session, sid, doc):
+    for offset, result in enumerate(doc["results"]):
+        session.add(DogResult(
+            show_id=sid, seq=offset,
+            fci_group=str(result.get("breedGroup", "") or ""),
+            breed_id=str(result.get("breedId", "") or ""),
+            breed_name=result.get("breedName", "") or "",
+            number=result.get("number"), name=result.get("name", "") or "",
+            reg_url=result.get("reg_url", "") or "",
+            reg_id=_parse_reg_id(result.get("reg_url")) or None,
+            breed_judge=(result.get("breedObj") or {}).get("judge") or None,
+            grade=result.get("grade", "") or "", placement=result.get("placement"),
+            competitive_placement=result.get("competitive_placement", "") or "",
+            awards=result.get("awards", "") or "", critique=result.get("critique", "") or "",
+            gender=result.get("gender", "") or "", class_name=result.get("class_name", "") or "",
+        ))
+    for breed_key, breed_data in doc["completed_breeds"].items():
+        group, _, bid = breed_key.partition(":")
+        for position, award in enumerate(breed_data.get("awards") or []):
+            session.add(DogBreedAward(
+                show_id=sid, fci_group=group, breed_id=bid, position=position,
+                award_type=award.get("type", "") or "", name=award.get("name", "") or "",
+                owner=award.get("owner", "") or "", text=award.get("text", "") or "",
+            ))
+    session.flush()
+
+
+def _core_insert(session, sid, doc):
+    sqlstore._insert_result_rows(session, sid, doc["results"], start_seq=0)
+    for breed_key, breed_data in doc["completed_breeds"].items():
+        group, _, bid = breed_key.partition(":")
+        sqlstore._insert_breed_award_rows(session, sid, group, bid, breed_data.get("awards"))
+
+
+def _timed(work, doc):
+    def _run(session):
+        session.execute(delete(DogResult).where(DogResult.show_id == SHOW_ID))
+        session.execute(delete(DogBreedAward).where(DogBreedAward.show_id == SHOW_ID))
+        started = time.perf_counter()
+        work(session, SHOW_ID, doc)
+        return started
+
+    started = dog_db.run_write(_run, op="bench")
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dog.db result-row writes")
+    parser.add_argument("--breeds", type=int, default=300, help="Breeds in the synthetic show")
+    parser.add_argument("--dogs", type=int, default=20, help="Result rows per breed")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per mode (best is reported)")
+    args = parser.parse_args()
+
+    dog_db.init_db()
+    doc = _synthetic_doc(args.breeds, args.dogs)
+    dog_db.run_write(
+        lambda session: sqlstore.write_show(session, SHOW_ID, {"title": "Bench Show", "breeds": []}),
+        op="bench",
+    )
+    rows = len(doc["results"]) + 4 * args.breeds
+
+    modes = (
+        ("orm", lambda: _timed(_orm_insert, doc)),
+        ("core", lambda: _timed(_core_insert, doc)),
+        ("write_result_doc", lambda: _timed(sqlstore.write_result_doc, doc)),
+    )
+    print(f"{rows} rows per write ({args.breeds} breeds x {args.dogs} dogs + awards)")
+    best = {}
+    for name, run in modes:
+        best[name] = min(run() for _ in range(max(1, args.repeat)))
+        print(f"{name:>17}: {best[name] * 1000:8.1f} ms  {rows / best[name]:10.0f} rows/s")
+    print(f"core vs orm: {best['orm'] / best['core']:.1f}x faster")
+    dog_db.configure("sqlite://")
+    shutil.rmtree(_TMP_DIR, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
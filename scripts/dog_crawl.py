@@ -18,13 +18,37 @@ if REPO_ROOT not in sys.path:
 os.environ.setdefault("SECRET_KEY", "dog-crawler-local-only")
 
 from app.dog_show import db as dog_db  # noqa: E402
-from app.dog_show.config import DOG_DATABASE_URI  # noqa: E402
-from app.dog_show.crawler import crawl_index_once  # noqa: E402
+from app.dog_show import metrics  # noqa: E402
+from app.dog_show.config import (  # noqa: E402
+    DOG_DATABASE_URI, METRICS_HOST, METRICS_PORT, METRICS_TEXTFILE, RESULT_CRAWL_SHOW_CONCURRENCY,
+)
+from app.dog_show.crawler import crawl_index_once, prune_change_log_once, refresh_show_stats_once  # noqa: E402
 from app.dog_show.result_cache import crawl_result_cache_once  # noqa: E402
+from app.dog_show.store import _load_result_jobs  # noqa: E402
 
 logger = structlog.get_logger(__name__)
 
 
+def _record_pass_metrics(pass_s):
+    """Pass duration, the job queue's depth by state and the textfile export
+    (DOG_METRICS_TEXTFILE) after a finished pass."""
+    now = time.time()
+    metrics.CRAWLER_PASS_SECONDS.observe(pass_s)
+    metrics.CRAWLER_LAST_PASS.set(now)
+    depth = {"queued": 0, "deferred": 0, "running": 0}
+    for job in (_load_result_jobs().get("jobs") or {}).values():
+        if job.get("state") == "running":
+            depth["running"] += 1
+        elif (job.get("next_attempt_at") or 0) <= now:
+            depth["queued"] += 1
+        else:
+            depth["deferred"] += 1
+    for state, count in depth.items():
+        metrics.RESULT_JOBS.set(count, state=state)
+    if METRICS_TEXTFILE:
+        metrics._write_metrics_textfile(METRICS_TEXTFILE)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Refresh dog show breed index")
     parser.add_argument("--loop", action="store_true", help="Run forever")
@@ -39,8 +63,12 @@ def main():
     parser.add_argument("--result-limit", type=int, default=1, help="Maximum whole-show result caches to update per run")
     parser.add_argument("--queued-result-limit", type=int, default=None, help="Maximum queued result cache jobs to update per run")
     parser.add_argument("--auto-result-limit", type=int, default=None, help="Maximum automatic result caches to update per run")
-    parser.add_argument("--result-delay", type=float, default=0.4, help="Seconds between result page request starts")
+    parser.add_argument("--result-delay", type=float, default=0.4, help="Seconds between Showlink request starts, across all workers and shows")
     parser.add_argument("--result-workers", type=int, default=3, help="Maximum concurrent result page requests for one show")
+    parser.add_argument(
+        "--result-shows", type=int, default=RESULT_CRAWL_SHOW_CONCURRENCY,
+        help="Selected shows crawled at once per result pass (sharing one Showlink budget)",
+    )
     args = parser.parse_args()
 
     # The crawler is the main writer; make sure the dog.db schema exists before
@@ -52,6 +80,8 @@ def main():
         dog_database_uri=DOG_DATABASE_URI,
         loop=args.loop,
     )
+    if METRICS_PORT:
+        metrics._serve_metrics(METRICS_PORT, host=METRICS_HOST)
 
     maintenance_interval = args.maintenance_interval if args.maintenance_interval is not None else args.interval
     auto_results_interval = args.auto_results_interval if args.auto_results_interval is not None else maintenance_interval
@@ -62,6 +92,7 @@ def main():
 
     while True:
         now = time.time()
+        pass_started = time.monotonic()
         run_maintenance = now >= next_maintenance_at
         run_auto_results = now >= next_auto_results_at
         summary = {}
@@ -79,11 +110,13 @@ def main():
                 delay=args.result_delay,
                 auto_recent=False,
                 workers=args.result_workers,
+                show_concurrency=args.result_shows,
             )
 
         if run_maintenance and not args.no_index_maintenance:
             index_summary = crawl_index_once(limit=args.limit, delay=args.delay)
             summary["index"] = index_summary
+            summary["change_log_pruned"] = prune_change_log_once()
             next_maintenance_at = time.time() + maintenance_interval
 
         else:
@@ -101,12 +134,18 @@ def main():
                 delay=args.result_delay,
                 auto_recent=True,
                 workers=args.result_workers,
+                show_concurrency=args.result_shows,
             )
             next_auto_results_at = time.time() + auto_results_interval
         else:
             summary["next_auto_results_in"] = max(0, round(next_auto_results_at - now))
 
+        # Every pass: the web tier serves list stats from dog_show_stats, so rows
+        # left stale by this pass's writes or by a phase hour are recomputed here.
+        summary["show_stats"] = refresh_show_stats_once()
+
         logger.info("dog_crawler_pass_complete", **summary)
+        _record_pass_metrics(time.monotonic() - pass_started)
 
         if not args.loop:
             break
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""Generate a realistic synthetic dog.db for benchmarks and load testing.
+
+The test fixtures are a show or two with a handful of dogs; production is
+hundreds of shows and hundreds of thousands of result rows, and costs that grow
+with the data (a doc reconstruction per show, an unindexed scan) only show up
+there. This builds a dog.db shaped like production, through the same helpers
+the crawler uses, so every table the web tier reads is populated the way the
+crawler leaves it:
+
+- per season (a calendar year): --all-breed-shows international/national
+  all-breed shows of about --entries entries over --breeds breeds, and
+  --specialty-shows single-breed shows;
+- entries per breed follow a long-tailed popularity curve; dogs come from a
+  per-breed population of registered dogs (reg ids shared across shows, so dog
+  profiles span seasons), bred by a pool of kennels, judged from a judge pool;
+- each breed has a judge, result rows with grades, class placements, PU/PN
+  rankings, awards and critiques, and an honor roll (ROP/VSP/junior/veteran/
+  breeder) — the index, the result docs, dog_breed_award and dog_search;
+- the show list, the crawler-computed list stats (dog_show_stats), the
+  materialized /all-results bodies, and --jobs result jobs in mixed states.
+
+Shows are dated in past seasons (the newest ending last year), so they are all
+settled: nothing is live and no request queues a crawl. Generation is seeded
+(--seed), so the same arguments give the same data.
+
+    python3 scripts/dog_generate_db.py --out /tmp/dog-bench.db
+    python3 scripts/dog_generate_db.py --out /tmp/dog-big.db --seasons 4 --entries 4000
+"""
+
+import argparse
+import datetime
+import os
+import random
+import sys
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+os.environ.setdefault("SECRET_KEY", "dog-generate-local-only")
+os.environ.setdefault("DATABASE_URI", "sqlite://")  # in-memory; the generator only touches dog.db
+os.environ.setdefault("DOG_NO_CRAWLER", "true")
+# The app's import-time init_db must not create ./app/data/dog.db; build_dog_db
+# binds the output file itself.
+os.environ.setdefault("DOG_DATABASE_URI", "sqlite://")
+
+FIRST_SHOW_ID = 20001
+GROUPS = 10
+MONTHS = [
+    "tammikuu", "helmikuu", "maaliskuu", "huhtikuu", "toukokuu", "kesäkuu",
+    "heinäkuu", "elokuu", "syyskuu", "lokakuu", "marraskuu", "joulukuu",
+]
+PLACES = [
+    "Helsinki", "Tampere", "Turku", "Oulu", "Jyväskylä", "Lahti", "Kuopio", "Pori",
+    "Joensuu", "Lappeenranta", "Hämeenlinna", "Vaasa", "Seinäjoki", "Rovaniemi", "Kouvola", "Mikkeli",
+]
+_SYLLABLES = [
+    "ka", "ri", "lo", "ve", "tä", "hi", "su", "no", "mi", "ra", "pe", "la", "ko", "ni", "va",
+    "tu", "sa", "ja", "ho", "ke", "il", "ta", "ah", "ti", "ön", "ky", "ma", "el", "or", "us",
+]
+_BREED_TAILS = [
+    "noutaja", "terrieri", "paimenkoira", "pystykorva", "spanieli", "ajokoira", "seisoja",
+    "vinttikoira", "mastiffi", "pinseri", "villakoira", "beagle", "collie", "husky",
+]
+_NAME_WORDS = [
+    "Iltatähti", "Kultainen", "Myrsky", "Lumi", "Tuuli", "Revontuli", "Onni", "Sisu", "Kaamos",
+    "Aurora", "Helmi", "Kipinä", "Sade", "Ukko", "Taika", "Salama", "Pilvi", "Vilja", "Ruska",
+    "Dancing", "Silver", "Bright", "Wild", "Golden", "Dream", "Shadow", "Star", "Royal", "Lucky",
+]
+_CRITIQUE = (
+    "Hyvä koko ja mittasuhteet. Maskuliininen pää, hyvä ilme. Riittävä kaula, hyvä selkälinja. "
+    "Hyvin kulmautunut edestä ja takaa. Erinomainen karvanlaatu. Liikkuu tehokkaasti sivulta, "
+    "hieman kapeasti takaa. Erinomainen luonne."
+)
+CLASSES = ["JUN", "NUO", "AVO", "KÄY", "VAL", "VET"]
+HONOR_ROLL = ["ROP", "VSP", "ROP-juniori", "VSP-juniori", "ROP-veteraani", "ROP kasvattaja"]
+
+
+def _word(rng, syllables):
+    return "".join(rng.choice(_SYLLABLES) for _ in range(syllables))
+
+
+def _catalogue(rng, count):
+    """[(group, breed_id, name)] — the FCI-style breed list every show draws from."""
+    names = set()
+    breeds = []
+    while len(breeds) < count:
+        name = f"{_word(rng, rng.randint(1, 3))}{rng.choice(_BREED_TAILS)}"
+        if name in names:
+            continue
+        names.add(name)
+        breeds.append((str(len(breeds) % GROUPS + 1), str(len(breeds) + 1), name))
+    return breeds
+
+
+class _World:
+    """The shared cast: dogs per breed, kennels, owners and judges."""
+
+    def __init__(self, rng, breeds, dogs_per_breed):
+        self.rng = rng
+        self.judges = [f"{_word(rng, 2).title()} {_word(rng, 3).title()}" for _ in range(150)]
+        self.kennels = [f"{_word(rng, 2).title()}{rng.choice(['n', 's', 'in', 'lan'])}" for _ in range(600)]
+        self.dogs = {}
+        serial = 10000
+        for group, breed_id, _name in breeds:
+            kennels = rng.sample(self.kennels, 8)
+            population = []
+            for _ in range(dogs_per_breed):
+                serial += 1
+                population.append({
+                    "reg_id": f"FI{serial:05d}/{rng.randint(10, 24)}",
+                    "name": f"{rng.choice(kennels)} {rng.choice(_NAME_WORDS)} {_word(rng, 2).title()}",
+                    "gender": rng.choice(("uros", "narttu")),
+                    "kennel": kennels[0],
+                    "owner": f"{_word(rng, 2).title()} {_word(rng, 3).title()}",
+                })
+            self.dogs[(group, breed_id)] = population
+
+
+def _entry_counts(rng, total, breeds):
+    """Long-tailed entries per breed summing to about `total`, at least 1 each."""
+    weights = [1.0 / (rank + 1) ** 0.9 for rank in range(len(breeds))]
+    rng.shuffle(weights)
+    scale = total / sum(weights)
+    return [max(1, round(weight * scale)) for weight in weights]
+
+
+def _breed_capture(rng, world, breed, entries, judge):
+    """A parsed breed page (`parsers._parse_breed_results` shape)."""
+    population = world.dogs[(breed["group"], breed["breed_id"])]
+    dogs = rng.sample(population, min(entries, len(population)))
+    results = []
+    for number, dog in enumerate(sorted(dogs, key=lambda dog: dog["gender"]), start=1):
+        grade = rng.choices(("ERI", "EH", "H", "T", "EVA"), weights=(55, 30, 8, 4, 3))[0]
+        placement = str(rng.randint(1, 4)) if grade == "ERI" and rng.random() < 0.6 else ""
+        results.append({
+            "number": number,
+            "name": dog["name"],
+            "reg_url": "https://jalostus.kennelliitto.fi/frmKoira.aspx?RekNo=" + dog["reg_id"].replace("/", "%2F"),
+            "grade": grade,
+            "placement": placement,
+            "competitive_placement": "",
+            "awards": rng.choice(("", "", "SA", "SA SERT", "SA CACIB", "SA SERT CACIB")) if grade == "ERI" else "",
+            "critique": _CRITIQUE[: rng.randint(120, len(_CRITIQUE))],
+            "gender": dog["gender"],
+            "class_name": rng.choice(CLASSES),
+        })
+    for gender, prefix in (("uros", "PU"), ("narttu", "PN")):
+        best = [row for row in results if row["gender"] == gender and row["grade"] == "ERI"][:4]
+        for rank, row in enumerate(best, start=1):
+            row["competitive_placement"] = f"{prefix}{rank}"
+    awards = []
+    for award in HONOR_ROLL[: max(2, min(len(HONOR_ROLL), len(dogs) // 3))]:
+        dog = rng.choice(dogs)
+        name = dog["kennel"] if award.endswith("kasvattaja") else dog["name"]
+        awards.append({"type": award, "name": name, "owner": dog["owner"], "text": f"{name}, Om. {dog['owner']}"})
+    return {"title": breed["name"], "breed": breed["name"], "judge": judge, "awards": awards, "results": results}
+
+
+def _season_dates(rng, year, count):
+    """`count` Saturdays of the year, ascending (busy weekends get several shows)."""
+    first = datetime.date(year, 1, 1)
+    first += datetime.timedelta(days=(5 - first.weekday()) % 7)
+    return sorted(first + datetime.timedelta(weeks=rng.randrange(52)) for _ in range(count))
+
+
+def _plan_shows(rng, catalogue, args):
+    plans = []
+    first_season = args.first_season or datetime.date.today().year - args.seasons
+    for year in range(first_season, first_season + args.seasons):
+        kinds = ["KV"] * (args.all_breed_shows // 2) + ["RN"] * (args.all_breed_shows - args.all_breed_shows // 2)
+        kinds += ["special"] * args.specialty_shows
+        rng.shuffle(kinds)
+        for day, kind in zip(_season_dates(rng, year, len(kinds)), kinds):
+            if kind == "special":
+                breed = rng.choice(catalogue)
+                name = f"{breed[2].capitalize()} erikoisnäyttely"
+                breeds = [breed]
+                entries = rng.randint(40, 250)
+            else:
+                name = f"{rng.choice(PLACES)} {kind}"
+                breeds = rng.sample(catalogue, min(args.breeds, len(catalogue)))
+                entries = args.entries
+            plans.append({"date": day, "name": name, "breeds": breeds, "entries": entries})
+    plans.sort(key=lambda plan: plan["date"])
+    for offset, plan in enumerate(plans):
+        plan["id"] = FIRST_SHOW_ID + offset
+    return plans
+
+
+def build_dog_db(out, seasons=2, all_breed_shows=36, specialty_shows=30, entries=3000, breeds=300,
+                 dogs_per_breed=None, jobs=20, first_season=None, seed=1, quiet=False):
+    """Write a synthetic dog.db to `out` (replaced if it exists); returns a
+    summary dict. The dog_db engine is left bound to `out`."""
+    from app.dog_show import db as dog_db, sqlstore, store
+    from app.dog_show.indexing import _refresh_show_stats
+    from app.dog_show.result_cache import (
+        _all_results_doc_base, _apply_breed_capture, _map_breed_results_to_all_results,
+        _materialize_all_results_payload,
+    )
+    from app.dog_show.showlink import _source_url
+
+    args = argparse.Namespace(
+        seasons=seasons, all_breed_shows=all_breed_shows, specialty_shows=specialty_shows,
+        entries=entries, breeds=breeds, first_season=first_season,
+    )
+    dog_db.configure("sqlite://")  # let go of `out` before replacing it
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(out + suffix):
+            os.remove(out + suffix)
+    dog_db.init_db("sqlite:///" + os.path.abspath(out))
+
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    catalogue = _catalogue(rng, max(breeds, 350))
+    # Enough dogs per breed that a popular breed's entry never runs out.
+    world = _World(rng, catalogue, dogs_per_breed or max(60, entries // 8))
+    plans = _plan_shows(rng, catalogue, args)
+
+    show_list = []
+    result_rows = 0
+    for plan in plans:
+        sid = plan["id"]
+        day = plan["date"]
+        counts = _entry_counts(rng, plan["entries"], plan["breeds"]) if len(plan["breeds"]) > 1 else [plan["entries"]]
+        judges = {}
+        index_breeds = []
+        for (group, breed_id, name), count in zip(plan["breeds"], counts):
+            judges[(group, breed_id)] = rng.choice(world.judges)
+            index_breeds.append({
+                "name": name, "count": count, "group": group, "breed_id": breed_id,
+                "judge": judges[(group, breed_id)], "has_results": True,
+                "source_url": _source_url(sid, group, breed_id),
+            })
+        date_label = day.strftime("%d.%m.")
+        show = {
+            "title": f"{day.strftime('%d.%m.%Y')} {plan['name']}", "name": plan["name"], "date": date_label,
+            "month": f"{MONTHS[day.month - 1]} {day.year}", "source_url": _source_url(sid),
+            "updated_at": time.time(), "breeds": index_breeds,
+        }
+        store._write_index_show(sid, show)
+
+        doc = _all_results_doc_base(sid, "generated")
+        fetched_at = datetime.datetime.combine(day, datetime.time(18, 0)).timestamp()
+        for breed in index_breeds:
+            breed_data = _breed_capture(rng, world, breed, breed["count"], judges[(breed["group"], breed["breed_id"])])
+            mapped = _map_breed_results_to_all_results(sid, breed, breed_data)
+            _apply_breed_capture(doc, breed, breed_data, mapped, fetched_at)
+            result_rows += len(mapped)
+        doc.update({
+            "title": show["title"], "source_url": show["source_url"], "total_breeds": len(index_breeds),
+            "status": "complete", "cached_at": fetched_at, "updated_at": fetched_at,
+            "terminal_confirmed": True, "last_error": None,
+        })
+        store._save_result_cache_doc(sid, doc)
+        show_list.append({
+            "id": sid, "date": date_label, "name": plan["name"], "month": show["month"], "source_url": _source_url(sid),
+        })
+        if not quiet and len(show_list) % 10 == 0:
+            print(f"  {len(show_list)}/{len(plans)} shows, {result_rows} result rows", flush=True)
+
+    show_list.reverse()  # Showlink lists the newest show first
+    dog_db.run_write(lambda session: sqlstore.write_show_list(session, show_list, time.time()), op="generate")
+    # What the crawler does after every save: list stats and the /all-results bodies.
+    show_ids = [plan["id"] for plan in plans]
+    _refresh_show_stats(show_ids)
+    for sid in show_ids:
+        _materialize_all_results_payload(sid)
+
+    now = time.time()
+    job_shows = rng.sample(show_ids, min(jobs, len(show_ids)))
+    for n, sid in enumerate(job_shows):
+        if n % 3 == 0:
+            dog_db.run_write(lambda session, sid=sid: sqlstore.defer_job(session, sid, "HTTP 503", now, 60, 3600), op="generate")
+        else:
+            dog_db.run_write(lambda session, sid=sid: sqlstore.queue_job(session, sid, "user", now), op="generate")
+
+    summary = {
+        "path": os.path.abspath(out),
+        "shows": len(plans),
+        "result_rows": result_rows,
+        "breeds": sum(len(plan["breeds"]) for plan in plans),
+        "jobs": len(job_shows),
+        "seed": seed,
+        "size_mb": round(os.path.getsize(out) / 1e6, 1),
+        "elapsed_s": round(time.perf_counter() - started, 1),
+    }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a realistic synthetic dog.db")
+    parser.add_argument("--out", required=True, help="dog.db path to write (replaced)")
+    parser.add_argument("--seasons", type=int, default=2, help="Calendar years of shows")
+    parser.add_argument("--first-season", type=int, default=None, help="First year (default: the last --seasons full years)")
+    parser.add_argument("--all-breed-shows", type=int, default=36, help="All-breed (KV/RN) shows per season")
+    parser.add_argument("--specialty-shows", type=int, default=30, help="Single-breed shows per season")
+    parser.add_argument("--entries", type=int, default=3000, help="Entries per all-breed show")
+    parser.add_argument("--breeds", type=int, default=300, help="Breeds per all-breed show")
+    parser.add_argument("--dogs-per-breed", type=int, default=None, help="Registered dogs per breed (default: entries / 8)")
+    parser.add_argument("--jobs", type=int, default=20, help="Result jobs to leave queued/deferred")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    args = parser.parse_args()
+
+    summary = build_dog_db(
+        args.out, seasons=args.seasons, all_breed_shows=args.all_breed_shows, specialty_shows=args.specialty_shows,
+        entries=args.entries, breeds=args.breeds, dogs_per_breed=args.dogs_per_breed, jobs=args.jobs,
+        first_season=args.first_season, seed=args.seed,
+    )
+    print(
+        f"Wrote {summary['path']}: {summary['shows']} shows, {summary['breeds']} breeds, "
+        f"{summary['result_rows']} result rows, {summary['jobs']} jobs, {summary['size_mb']} MB "
+        f"in {summary['elapsed_s']}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Re-parse archived Showlink pages and rewrite the changed breeds' rows.
+
+Backfill tool for parser fixes and new parsed fields: instead of re-crawling
+Showlink (hours at the polite fetch rate), it replays the raw pages the crawler
+archived under DOG_PAGE_ARCHIVE_DIR (see app/dog_show/archive.py) through the
+current parsers, on every CPU core, with no network traffic. Per show, only the
+breeds whose rows, judge or honor roll come out different are rewritten (see
+app/dog_show/replay.py); shows without a stored result doc are skipped.
+
+    SECRET_KEY=dev DOG_PAGE_ARCHIVE_DIR=app/data/pages python3 scripts/dog_replay_archive.py --all --dry-run
+    SECRET_KEY=dev python3 scripts/dog_replay_archive.py --archive-dir app/data/pages --show 13786 --show 13758
+    SECRET_KEY=dev python3 scripts/dog_replay_archive.py --archive-dir app/data/pages --all --workers 8
+"""
+
+import argparse
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+os.environ.setdefault("SECRET_KEY", "dog-replay-local-only")
+os.environ.setdefault("DATABASE_URI", "sqlite://")  # in-memory; replay only touches dog.db
+
+import structlog  # noqa: E402
+
+from app.dog_show import archive, db as dog_db  # noqa: E402
+from app.dog_show.replay import replay_show_from_archive  # noqa: E402
+
+logger = structlog.get_logger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-parse archived Showlink pages and rewrite changed breed rows")
+    parser.add_argument("--show", type=int, action="append", dest="shows", help="Replay only these show ids (repeatable)")
+    parser.add_argument("--all", action="store_true", help="Replay every show with archived pages")
+    parser.add_argument("--archive-dir", default=None, help="Archive directory (default: DOG_PAGE_ARCHIVE_DIR)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Parser processes (default: CPU count)")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would change without writing")
+    args = parser.parse_args()
+
+    directory = archive._archive_dir(args.archive_dir)
+    if directory is None:
+        parser.error("no archive: set DOG_PAGE_ARCHIVE_DIR or pass --archive-dir")
+    if not args.shows and not args.all:
+        parser.error("pass --show ID (repeatable) or --all")
+
+    dog_db.init_db()
+    show_ids = sorted(set(args.shows or [])) if args.shows else archive._archived_show_ids(directory)
+    print(f"Replaying {len(show_ids)} show(s) from {directory} with {args.workers} worker(s)")
+
+    started = time.perf_counter()
+    counts = {}
+    for sid in show_ids:
+        summary = replay_show_from_archive(sid, workers=args.workers, dry_run=args.dry_run, directory=directory)
+        counts[summary["status"]] = counts.get(summary["status"], 0) + 1
+        print(
+            f"  {summary['status'].upper():>13} {sid}: breeds={summary['breeds']} changed={summary['changed_breeds']}"
+            f" missing={summary['missing_pages']} parse={summary['parse_s']:.2f}s write={summary['write_s']:.2f}s"
+        )
+    elapsed = time.perf_counter() - started
+    print("Done in {:.1f}s. {}".format(elapsed, " ".join(f"{status}={n}" for status, n in sorted(counts.items())) or "nothing to replay"))
+    logger.info("dog_replay_done", shows=len(show_ids), elapsed_s=round(elapsed, 3), **counts)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        logger.info("dog_replay_shutdown", reason="keyboard_interrupt")
+    except Exception:
+        logger.exception("dog_replay_fatal")
+        raise
@@ -98,7 +98,7 @@ def _still_serves_results(show_id):
     Guards against the force re-crawl wiping captured data for a show that has aged
     out of Showlink's rolling window (its page returns an empty shell)."""
     try:
-        soup = _fetch_page(_source_url(show_id))
+        soup = _fetch_page(_source_url(show_id), page="detail")
         detail = _parse_show_detail(soup, show_id)
     except Exception as exc:
         logger.warning("dog_rescue_detail_check_failed", show_id=show_id, error=str(exc))
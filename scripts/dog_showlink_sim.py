@@ -0,0 +1,601 @@
+#!/usr/bin/env python3
+"""Local Showlink stand-in: serve Showlink-shaped pages on a virtual clock.
+
+The crawler could only be exercised against the live Kennelliitto site or with
+its fetches mocked. This serves the pages it reads — the show list, show and
+group pages (breed lists with their result check marks) and breed result pages
+— at the URLs it builds, from one of two corpora:
+
+- synthetic (default): --days consecutive show days from --date, each with
+  --shows-per-day all-breed shows of about --entries entries over --breeds
+  breeds (scripts/dog_generate_db.py's cast). The breeds are judged in --rings
+  rings from 09:00 and each is published a few minutes after its ring finishes
+  it; the group finals (RYP-1..4) are appended onto the ROP winners' rows from
+  21:00 and the main BIS-1..4 onto the RYP-1 winners' rows by 23:30, as
+  Showlink does.
+- archived (--archive-dir): playback of a page archive (archive.py). Every URL
+  answers with its latest capture at or before the virtual time. A breed page
+  requested before its first capture answers as an unjudged page.
+
+Pages are rendered for the clock's current time, so a show day plays back with
+breeds turning judged and finals landing while the crawler polls. --latency-ms
+and --error-rate add origin latency and 503s (seeded by --seed). --etags sends
+ETags and answers conditional requests with 304. The real Showlink sends no
+validators.
+
+Run on its own, the clock starts at --start (default: now, local time) and runs
+--speed times real time. Point a crawler at it with DOG_SHOWLINK_BASE_URL:
+
+    python3 scripts/dog_showlink_sim.py --port 8765 --start "2026-06-13 09:00"
+    DOG_SHOWLINK_BASE_URL=http://127.0.0.1:8765/nayttelyt/Tulokset SECRET_KEY=dev \\
+        DOG_DATABASE_URI=sqlite:////tmp/sim-dog.db python3 scripts/dog_crawl.py --loop --interval 30
+
+A crawler on the real clock only agrees with the stand-in at --speed 1 on a show
+dated today. scripts/dog_sim_crawl.py runs a whole weekend offline instead, with
+the crawler itself on the virtual clock.
+"""
+
+import argparse
+import datetime
+import hashlib
+import html
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.abspath(os.path.join(SCRIPTS_DIR, ".."))
+for path in (REPO_ROOT, SCRIPTS_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+os.environ.setdefault("SECRET_KEY", "dog-sim-local-only")
+os.environ.setdefault("DATABASE_URI", "sqlite://")  # in-memory; the stand-in touches no database
+os.environ.setdefault("DOG_NO_CRAWLER", "true")
+os.environ.setdefault("DOG_DATABASE_URI", "sqlite://")
+
+from app.dog_show import archive  # noqa: E402
+from app.dog_show import utils as dog_utils  # noqa: E402
+from app.dog_show.config import FINNISH_MONTHS  # noqa: E402
+from app.dog_show.parsers import _parse_breed_results  # noqa: E402
+from app.dog_show.showlink import _page_soup  # noqa: E402
+from app.dog_show.utils import _LOCAL_TZ  # noqa: E402
+from dog_generate_db import PLACES, _breed_capture, _catalogue, _entry_counts, _World  # noqa: E402
+
+PATH = "/nayttelyt/Tulokset"
+FIRST_SHOW_ID = 30001
+_REAL_MONOTONIC = time.monotonic
+_REAL_TIME = time.time
+_REAL_SLEEP = time.sleep
+
+
+class _SimulationOver(Exception):
+    """Raised by the clock's main-thread sleep once the run is past its end."""
+
+
+class _SimClock:
+    """Virtual unix time: starts at `start` and runs `speed` times real time.
+
+    `installed()` puts it in place of time.time / time.monotonic / time.sleep
+    for the whole process, and behind the show calendar's clocks
+    (utils._local_now and utils._today, which read the system clock directly). A sleep then returns at once and moves the clock on
+    by its length instead, so a crawler waiting 30 s between passes costs no
+    real time. Callers that sleep until a deadline (the Showlink host budget,
+    the stand-in's latency) move it only to that deadline, so concurrent
+    sleepers overlap rather than add up. With `stop_at`, the main thread's
+    first sleep that reaches it raises _SimulationOver: the crawl loop's way out.
+    """
+
+    def __init__(self, start, speed=1.0, stop_at=None):
+        self.start = float(start)
+        self.speed = float(speed)
+        self.stop_at = stop_at
+        self.sleeps = 0
+        self._real0 = _REAL_MONOTONIC()
+        self._skipped = 0.0
+        self._lock = threading.Lock()
+
+    def time(self):
+        return self.start + (_REAL_MONOTONIC() - self._real0) * self.speed + self._skipped
+
+    def monotonic(self):
+        return self.time() - self.start
+
+    def sleep(self, seconds):
+        with self._lock:
+            self._skipped += max(0.0, float(seconds))
+            self.sleeps += 1
+        if (
+            self.stop_at is not None and self.time() >= self.stop_at
+            and threading.current_thread() is threading.main_thread()
+        ):
+            raise _SimulationOver()
+
+    def sleep_until(self, deadline):
+        remaining = deadline - self.time()
+        if remaining > 0:
+            # Installed, this is our own sleep; otherwise a real one, scaled.
+            time.sleep(remaining if time.sleep == self.sleep else remaining / self.speed)
+
+    def installed(self):
+        clock = self
+
+        class _Installed:
+            def __enter__(self):
+                self.calendar = dog_utils._local_now, dog_utils._today
+                time.time, time.monotonic, time.sleep = clock.time, clock.monotonic, clock.sleep
+                dog_utils._local_now = lambda: dog_utils._local_dt(clock.time())
+                dog_utils._today = lambda: datetime.date.fromtimestamp(clock.time())
+                return clock
+
+            def __exit__(self, *exc):
+                time.time, time.monotonic, time.sleep = _REAL_TIME, _REAL_MONOTONIC, _REAL_SLEEP
+                dog_utils._local_now, dog_utils._today = self.calendar
+                return False
+
+        return _Installed()
+
+
+def _local_ts(day, hour, minute=0.0):
+    """Unix time of `hour:minute` Finnish local time on `day`."""
+    naive = datetime.datetime.combine(day, datetime.time()) + datetime.timedelta(hours=hour, minutes=minute)
+    return naive.replace(tzinfo=_LOCAL_TZ).timestamp() if _LOCAL_TZ else naive.timestamp()
+
+
+def _page_key(query):
+    """(show id, group, breed id) of a Showlink query string; '' for absent parts."""
+    params = parse_qs(query)
+    return tuple((params.get(name) or [""])[0] for name in ("Id", "R", "RO"))
+
+
+def _page_kind(key):
+    show_id, group, breed_id = key
+    if not show_id:
+        return "list"
+    if breed_id:
+        return "breed"
+    return "group" if group else "detail"
+
+
+# -- rendering: the markup parsers.py reads, in Showlink's layout -------------
+
+_HEAD = (
+    '<!DOCTYPE html>\n<html lang="fi">\n<head><meta charset="utf-8" /><title>Tulokset - Showlink</title></head>\n'
+    '<body>\n<div id="divHeader"><a href="{path}">Tulokset</a></div>\n'
+)
+_TAIL = '<div id="divFooter"><p>&copy; Suomen Kennelliitto</p></div>\n</body>\n</html>\n'
+_e = html.escape
+
+
+def _content(title, body):
+    return (
+        _HEAD.format(path=PATH) + '<div id="divContent">\n<div id="divOtsikko">\n'
+        f'<h1>{_e(title)}</h1>\n<span class="alaotsikko">Tulokset &amp; arvostelut</span>\n</div>\n'
+        f"{body}</div>\n{_TAIL}"
+    )
+
+
+def _render_list(shows):
+    """shows: [(show id, date, name)], newest first."""
+    rows = []
+    month = None
+    for show_id, day, name in shows:
+        label = f"{FINNISH_MONTHS[day.month - 1]} {day.year}"
+        if label != month:
+            month = label
+            rows.append(f'<tr class="nayttely"><td colspan="2" class="valiotsikko">{label}</td></tr>')
+        href = f"{PATH}?Id={show_id}"
+        rows.append(
+            f'<tr class="nayttely"><td><a href="{href}">{day:%d.%m.}</a></td>'
+            f'<td><a href="{href}">{_e(name)}</a></td></tr>'
+        )
+    return (
+        _HEAD.format(path=PATH) + '<div id="divSivupalkki">\n<table id="Nayttelylista" class="table">\n'
+        + "\n".join(rows) + "\n</table>\n</div>\n" + _TAIL
+    )
+
+
+def _render_breed_list(show_id, title, breeds, now):
+    rows = []
+    for breed in breeds:
+        href = f"{PATH}?Id={show_id}&amp;R={breed['group']}&amp;RO={breed['breed_id']}"
+        check = '<i class="fa fa-check"></i>' if breed["published_at"] <= now else ""
+        rows.append(
+            f'<tr class="rotuluettelo"><td><a href="{href}">{_e(breed["name"])}</a></td>'
+            f'<td class="right">{breed["count"]}</td><td class="right">{check}</td></tr>'
+        )
+    return _content(title, '<table class="rotulistatable table">\n' + "\n".join(rows) + "\n</table>\n")
+
+
+def _render_breed(title, name, judge, awards, results):
+    header = (
+        f'<tr class="ropotsikko"><td colspan="2"><div class="floatleft">{_e(name)}</div>'
+        f'<div class="floatright"><span><span class="tuomariotsikko">Tuomari </span>{_e(judge or "")}</span></div></td></tr>'
+    )
+    honor = "".join(
+        f'<tr class="roptulos"><td>{_e(award["type"])}</td><td>{_e(award["text"])}</td></tr>' for award in awards
+    )
+    rows = []
+    gender = klass = None
+    for row in results:
+        if row["gender"] != gender:
+            gender, klass = row["gender"], None
+            rows.append(f'<tr class="sukupuoli"><td colspan="7">{"Urokset" if gender == "uros" else "Nartut"}</td></tr>')
+        if row["class_name"] != klass:
+            klass = row["class_name"]
+            rows.append(f'<tr class="luokka"><td colspan="7"><span class="left">{_e(klass)}</span></td></tr>')
+        reg_path = row["reg_url"].split("kennelliitto.fi", 1)[-1]
+        rows.append(
+            f'<tr class="tulos"><td>{row["number"]}</td><td><a href="{_e(reg_path)}">{_e(row["name"])}</a></td>'
+            f'<td>{row["grade"]}</td><td>{row["placement"] or ""}</td><td>{row["competitive_placement"]}</td>'
+            f'<td>{_e(row["awards"])}</td><td></td></tr>'
+            f'<tr class="arvostelu"><td></td><td colspan="6">{_e(row["critique"])}</td></tr>'
+        )
+    return _content(
+        title,
+        f'<table class="roptulostaulukko">\n{header}\n{honor}\n</table>\n'
+        f'<table class="roduntulokset table">\n' + "\n".join(rows) + "\n</table>\n",
+    )
+
+
+# -- corpora -------------------------------------------------------------------
+
+class _SyntheticCorpus:
+    """Generated all-breed shows judged on a timetable (see the module doc).
+
+    `events` are the publications a crawler should capture: one per breed
+    ("results", when its page first shows rows) and one per finals token
+    ("finals", when it is appended onto its winner's row)."""
+
+    def __init__(self, first_day, days=2, shows_per_day=1, breeds=200, entries=2500, rings=12, seed=1):
+        rng = random.Random(seed)
+        catalogue = _catalogue(rng, max(breeds, 20))
+        plans = []
+        for day_offset in range(days):
+            day = first_day + datetime.timedelta(days=day_offset)
+            for _ in range(shows_per_day):
+                picked = sorted(rng.sample(catalogue, breeds), key=lambda item: (int(item[0]), int(item[1])))
+                plans.append((day, picked, _entry_counts(rng, entries, picked)))
+        world = _World(rng, catalogue, max(max(counts) for _, _, counts in plans))
+        self.shows = {}
+        self.events = []
+        for offset, (day, picked, counts) in enumerate(plans):
+            show_id = FIRST_SHOW_ID + offset
+            self.shows[show_id] = self._plan_show(rng, world, show_id, day, picked, counts, rings)
+        self.start = _local_ts(first_day, 6)
+        self.end = _local_ts(first_day + datetime.timedelta(days=days), 2)
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def _plan_show(self, rng, world, show_id, day, picked, counts, rings):
+        name = f"{rng.choice(PLACES)} KV"
+        show = {"id": show_id, "date": day, "name": name, "title": f"{day:%d.%m.%Y} {name}", "breeds": {}, "finals": []}
+        ring_free = [_local_ts(day, 9, rng.uniform(0, 20)) for _ in range(rings)]
+        ring_judges = [rng.choice(world.judges) for _ in range(rings)]
+        # Longest first onto the least busy ring: every ring is done by mid-afternoon.
+        for (group, breed_id, breed_name), count in sorted(zip(picked, counts), key=lambda item: -item[1]):
+            ring = min(range(rings), key=ring_free.__getitem__)
+            ring_free[ring] += (count * 2.5 + 5) * 60
+            breed = {"group": group, "breed_id": breed_id, "name": breed_name}
+            capture = _breed_capture(rng, world, breed, count, ring_judges[ring])
+            self._settle_awards(capture)
+            published_at = ring_free[ring] + rng.uniform(3, 25) * 60
+            show["breeds"][(group, breed_id)] = dict(
+                breed, count=count, judge=ring_judges[ring], capture=capture, published_at=published_at, finals=[],
+            )
+            self.events.append({"kind": "results", "show_id": show_id, "group": group, "breed_id": breed_id, "at": published_at})
+        self._plan_finals(rng, show)
+        return show
+
+    @staticmethod
+    def _settle_awards(capture):
+        """Showlink's award strings: comma-separated, ROP/VSP on the best male
+        and female, and the honor roll naming those same dogs."""
+        for row in capture["results"]:
+            row["awards"] = ", ".join(row["awards"].split())
+        winners = {}
+        for prefix, award in (("PU1", "ROP"), ("PN1", "VSP")):
+            row = next((row for row in capture["results"] if row["competitive_placement"] == prefix), None)
+            if row is not None:
+                row["awards"] = ", ".join(filter(None, (row["awards"], award)))
+                winners[award] = row
+        for entry in capture["awards"]:
+            row = winners.get(entry["type"])
+            if row is not None:
+                entry["name"] = row["name"]
+                entry["text"] = f"{row['name']}, Om. {entry['owner']}"
+
+    def _plan_finals(self, rng, show):
+        """RYP-1..4 per group among its ROP winners from 21:00, then BIS-1..4
+        among the RYP-1 winners by 23:30; each ring's placings land together."""
+        by_group = {}
+        for key, breed in show["breeds"].items():
+            if any("ROP" in row["awards"].split(", ") for row in breed["capture"]["results"]):
+                by_group.setdefault(key[0], []).append(key)
+        groups = sorted(by_group, key=int)
+        rng.shuffle(groups)
+        ryp_winners = []
+        for index, group in enumerate(groups):
+            at = _local_ts(show["date"], 21, index * 120 / max(1, len(groups)) + rng.uniform(0, 8))
+            placed = rng.sample(by_group[group], min(4, len(by_group[group])))
+            for rank, key in enumerate(placed, start=1):
+                self._add_final(show, key, f"RYP-{rank}", at)
+            ryp_winners.append(placed[0])
+        at = _local_ts(show["date"], 23, rng.uniform(0, 30))
+        for rank, key in enumerate(rng.sample(ryp_winners, min(4, len(ryp_winners))), start=1):
+            self._add_final(show, key, f"BIS-{rank}", at)
+
+    def _add_final(self, show, key, token, at):
+        show["breeds"][key]["finals"].append((at, token))
+        self.events.append({"kind": "finals", "show_id": show["id"], "group": key[0], "breed_id": key[1], "token": token, "at": at})
+
+    def page(self, key, now):
+        """The page body at `now`, or None when there is no such page."""
+        show_id, group, breed_id = key
+        if not show_id:
+            return _render_list([(s["id"], s["date"], s["name"]) for s in sorted(self.shows.values(), key=lambda s: (s["date"], s["id"]), reverse=True)])
+        show = self.shows.get(int(show_id)) if show_id.isdigit() else None
+        if show is None:
+            return None
+        if not group:
+            links = "".join(
+                f'<li><a href="{PATH}?Id={show_id}&amp;R={g}">{g}. ryhmä</a></li>'
+                for g in sorted({key[0] for key in show["breeds"]}, key=int)
+            )
+            return _content(show["title"], f'<ul class="ryhmat">{links}</ul>\n')
+        if not breed_id:
+            breeds = [breed for key, breed in show["breeds"].items() if key[0] == group]
+            return _render_breed_list(show_id, show["title"], breeds, now) if breeds else None
+        breed = show["breeds"].get((group, breed_id))
+        if breed is None:
+            return None
+        # A breed page changes only when it is published and when a final lands on it.
+        state = (key, breed["published_at"] <= now, sum(1 for at, _ in breed["finals"] if at <= now))
+        with self._lock:
+            body = self._cache.get(state)
+        if body is None:
+            body = self._render_breed_page(show, breed, now)
+            with self._lock:
+                self._cache[state] = body
+        return body
+
+    @staticmethod
+    def _render_breed_page(show, breed, now):
+        capture = breed["capture"]
+        if breed["published_at"] > now:
+            return _render_breed(show["title"], breed["name"], breed["judge"], [], [])
+        results = capture["results"]
+        landed = [(at, token) for at, token in breed["finals"] if at <= now]
+        if landed:
+            results = [dict(row) for row in results]
+            rop = next(row for row in results if "ROP" in row["awards"].split(", "))
+            rop["awards"] = ", ".join([rop["awards"]] + [token for _, token in sorted(landed)])
+        return _render_breed(show["title"], breed["name"], breed["judge"], capture["awards"], results)
+
+
+class _ArchiveCorpus:
+    """Playback of a page archive (archive.py): each URL's captures in time order.
+
+    `events` are the breed pages' changes: a page's first capture with rows, and
+    every later capture whose body differs ("results"; a finals token landing
+    shows up here too). Capture times bound Showlink's publication from above,
+    so the measured capture delays are lower bounds."""
+
+    def __init__(self, directory, show_ids=None):
+        self.directory = directory
+        self.versions = {}
+        names = [str(sid) for sid in (show_ids or archive._archived_show_ids(directory))] + [archive.LIST_INDEX]
+        for name in names:
+            try:
+                with open(archive._index_path(directory, name), encoding="utf-8") as fh:
+                    for line in fh:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            continue
+                        key = _page_key(urlsplit(entry.get("url") or "").query)
+                        self.versions.setdefault(key, []).append((entry.get("fetched_at") or 0, entry["sha1"]))
+            except FileNotFoundError:
+                continue
+        for captures in self.versions.values():
+            captures.sort()
+        if not self.versions:
+            raise SystemExit(f"No archived pages under {directory}")
+        times = [at for captures in self.versions.values() for at, _ in captures]
+        self.start, self.end = min(times) - 3600, max(times) + 3600
+        self._bodies = {}
+        self._lock = threading.Lock()
+        self.events = []
+        for key, captures in self.versions.items():
+            if _page_kind(key) != "breed":
+                continue
+            previous = None
+            for at, body_hash in captures:
+                if body_hash != previous and (previous is not None or self._has_results(key, body_hash)):
+                    self.events.append({"kind": "results", "show_id": int(key[0]), "group": key[1], "breed_id": key[2], "at": at})
+                previous = body_hash
+
+    def _body(self, body_hash):
+        with self._lock:
+            body = self._bodies.get(body_hash)
+        if body is None:
+            body = archive._read_archived_page(body_hash, self.directory)
+            with self._lock:
+                self._bodies[body_hash] = body
+        return body
+
+    def _has_results(self, key, body_hash):
+        return bool(_parse_breed_results(_page_soup(self._body(body_hash), "breed"), key[0])["results"])
+
+    def page(self, key, now):
+        captures = self.versions.get(key)
+        if not captures:
+            return None
+        current = [body_hash for at, body_hash in captures if at <= now]
+        if current:
+            return self._body(current[-1])
+        if _page_kind(key) != "breed":
+            return self._body(captures[0][1])
+        # Not captured yet: the breed page as it stood before judging.
+        parsed = _parse_breed_results(_page_soup(self._body(captures[0][1]), "breed"), key[0])
+        return _render_breed(parsed["title"], parsed["breed"], parsed["judge"], [], [])
+
+
+# -- the origin ------------------------------------------------------------------
+
+class _Origin:
+    """Answers Showlink requests from `corpus` at `clock`'s time, with latency
+    and errors, and logs every request as (time, kind, key, status)."""
+
+    def __init__(self, corpus, clock, latency_ms=0.0, error_rate=0.0, etags=False, seed=1):
+        self.corpus = corpus
+        self.clock = clock
+        self.latency_s = max(0.0, latency_ms) / 1000.0
+        self.error_rate = max(0.0, error_rate)
+        self.etags = etags
+        self.requests = []
+        self.cpu_s = 0.0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def respond(self, path, query, headers):
+        """(status, body, headers) for one GET."""
+        started = self.clock.time()
+        with self._lock:
+            latency = self.latency_s * self._rng.uniform(0.5, 1.5)
+            failed = self._rng.random() < self.error_rate
+        key = _page_key(query)
+        kind = _page_kind(key)
+        status, body, extra = 200, None, {}
+        if path != PATH:
+            status = 404
+        elif failed:
+            status = 503
+        else:
+            body = self.corpus.page(key, started)
+            if body is None:
+                status = 404
+            elif self.etags:
+                etag = '"%s"' % hashlib.sha1(body.encode("utf-8")).hexdigest()[:20]
+                extra["ETag"] = etag
+                if headers.get("If-None-Match") == etag:
+                    status, body = 304, None
+        with self._lock:
+            self.requests.append((started, kind, key, status))
+        if latency:
+            self.clock.sleep_until(started + latency)
+        return status, body, extra
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, as the crawler's pooled session expects
+    # Headers and body go out as two writes; with Nagle on, every keep-alive
+    # response would stall on the client's delayed ACK.
+    disable_nagle_algorithm = True
+
+    def handle_one_request(self):
+        cpu_started = time.thread_time()
+        try:
+            super().handle_one_request()
+        finally:
+            origin = self.server.origin
+            with origin._lock:
+                origin.cpu_s += time.thread_time() - cpu_started
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        status, body, extra = self.server.origin.respond(parts.path, parts.query, self.headers)
+        payload = (body or "").encode("utf-8")
+        self.send_response(status)
+        if status != 304:
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in extra.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve(origin, host="127.0.0.1", port=0):
+    """Start the stand-in on a daemon thread; returns the server (its base URL
+    is `_base_url(server)`; stop it with `shutdown()`)."""
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    server.origin = origin
+    threading.Thread(target=server.serve_forever, name="showlink-sim", daemon=True).start()
+    return server
+
+
+def _base_url(server):
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}{PATH}"
+
+
+def _next_saturday(today=None):
+    today = today or datetime.date.today()
+    return today + datetime.timedelta(days=(5 - today.weekday()) % 7 or 7)
+
+
+def add_corpus_arguments(parser):
+    """The corpus and origin flags shared with scripts/dog_sim_crawl.py."""
+    parser.add_argument("--archive-dir", default=None, help="Play back this page archive instead of synthetic shows")
+    parser.add_argument("--show", type=int, action="append", dest="shows", help="Archived show ids to serve (default: all)")
+    parser.add_argument("--date", default=None, help="First synthetic show day, YYYY-MM-DD (default: next Saturday)")
+    parser.add_argument("--days", type=int, default=2, help="Consecutive synthetic show days")
+    parser.add_argument("--shows-per-day", type=int, default=1, help="Synthetic all-breed shows per day")
+    parser.add_argument("--breeds", type=int, default=200, help="Breeds per synthetic show")
+    parser.add_argument("--entries", type=int, default=2500, help="Entries per synthetic show")
+    parser.add_argument("--rings", type=int, default=12, help="Judging rings per synthetic show")
+    parser.add_argument("--latency-ms", type=float, default=150.0, help="Mean origin latency (uniform +-50%%)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered 503")
+    parser.add_argument("--etags", action="store_true", help="Send ETags and answer If-None-Match with 304")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the shows, latency and errors")
+
+
+def build_corpus(args):
+    if args.archive_dir:
+        return _ArchiveCorpus(args.archive_dir, args.shows)
+    first_day = datetime.date.fromisoformat(args.date) if args.date else _next_saturday()
+    return _SyntheticCorpus(
+        first_day, days=args.days, shows_per_day=args.shows_per_day, breeds=args.breeds,
+        entries=args.entries, rings=args.rings, seed=args.seed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve Showlink-shaped pages on a virtual clock")
+    add_corpus_arguments(parser)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--start", default=None, help='Virtual start, local "YYYY-MM-DD HH:MM" (default: now)')
+    parser.add_argument("--speed", type=float, default=1.0, help="Virtual seconds per real second")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args)
+    if args.start:
+        naive = datetime.datetime.fromisoformat(args.start)
+        start = naive.replace(tzinfo=_LOCAL_TZ).timestamp() if _LOCAL_TZ else naive.timestamp()
+    else:
+        start = time.time()
+    clock = _SimClock(start, speed=args.speed)
+    server = _serve(_Origin(corpus, clock, args.latency_ms, args.error_rate, args.etags, args.seed), args.host, args.port)
+    print(f"Serving {len(corpus.events)} publications at {_base_url(server)} (Ctrl-C stops)", flush=True)
+    try:
+        while True:
+            _REAL_SLEEP(60)
+            local = datetime.datetime.fromtimestamp(clock.time(), _LOCAL_TZ)
+            print(f"{local:%Y-%m-%d %H:%M} requests={len(server.origin.requests)}", flush=True)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""Run the crawler through a whole show weekend offline, on a virtual clock.
+
+Starts the Showlink stand-in (scripts/dog_showlink_sim.py) in this process and
+runs scripts/dog_crawl.py's own loop against it, with the production service's
+flags by default (--crawler-args), on a throwaway dog.db. Both share one
+virtual clock: the crawler's sleeps between passes, its Showlink pacing and the
+origin's latency move the clock instead of taking real time, while the work in
+between runs at real speed. A weekend replays in minutes, with the crawler's
+scheduling, request volume and CPU as they would be live.
+
+The synthetic run covers --days show days from 06:00 on the first to 02:00
+after the last (after the finals' night stop). An archived run covers the
+archive's captures, an hour either side. The report covers:
+
+- Showlink requests by page kind and status, and the busiest minute;
+- capture delay: publication to the first successful fetch of the page showing
+  it, for breed results and for finals tokens (p50/p95/max, and how many were
+  never fetched);
+- what reached dog.db: breeds stored with rows, and finals tokens on their
+  winners' rows;
+- CPU: the crawler process (less the stand-in's page rendering), its parse
+  pool workers and the stand-in; plus the real time the run took.
+
+--json saves the report with the arguments; --baseline prints the ratios
+against an earlier report, so a scheduler change is judged on the same
+weekend, before and after.
+
+    python3 scripts/dog_sim_crawl.py --json sim-before.json
+    python3 scripts/dog_sim_crawl.py --error-rate 0.02 --json sim-after.json --baseline sim-before.json
+    python3 scripts/dog_sim_crawl.py --archive-dir app/data/pages --show 14100
+"""
+
+import argparse
+import bisect
+import json
+import os
+import resource
+import shlex
+import shutil
+import socket
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.abspath(os.path.join(SCRIPTS_DIR, ".."))
+for path in (REPO_ROOT, SCRIPTS_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# The crawl URLs and dog.db are fixed at import, so both are chosen first.
+_TMP_DIR = tempfile.mkdtemp(prefix="dog-sim-")
+PORT = _free_port()
+os.environ.setdefault("SECRET_KEY", "dog-sim-local-only")
+os.environ.setdefault("DATABASE_URI", "sqlite://")  # in-memory; the run only touches dog.db
+os.environ["DOG_NO_CRAWLER"] = "true"
+os.environ["DOG_DATABASE_URI"] = "sqlite:///" + os.path.join(_TMP_DIR, "dog.db")
+os.environ["DOG_SHOWLINK_BASE_URL"] = f"http://127.0.0.1:{PORT}/nayttelyt/Tulokset"
+
+import structlog  # noqa: E402
+
+import dog_crawl  # noqa: E402
+from app.dog_show import finals, parse_pool, store  # noqa: E402
+from dog_showlink_sim import (  # noqa: E402
+    _Origin, _serve, _SimClock, _SimulationOver, add_corpus_arguments, build_corpus,
+)
+
+# scripts/dog_crawl.py's flags in docker-compose.yml, less --loop (always on).
+PRODUCTION_CRAWLER_ARGS = (
+    "--interval 30 --maintenance-interval 900 --auto-results-interval 120 --limit 6 --delay 2.0 "
+    "--queued-result-limit 1 --auto-result-limit 2 --result-delay 0.4 --result-workers 3"
+)
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] if ordered else None
+
+
+def _minutes(seconds):
+    return None if seconds is None else round(seconds / 60, 1)
+
+
+def _capture_delays(events, requests):
+    """{kind: summary} of publication -> first successful fetch of its page."""
+    fetched = {}
+    for at, kind, key, status in requests:
+        if kind == "breed" and status == 200:
+            fetched.setdefault(key, []).append(at)
+    for times in fetched.values():
+        times.sort()
+    summary = {}
+    for kind in sorted({event["kind"] for event in events}):
+        delays = []
+        missed = 0
+        for event in (event for event in events if event["kind"] == kind):
+            times = fetched.get((str(event["show_id"]), event["group"], event["breed_id"]), [])
+            index = bisect.bisect_left(times, event["at"])
+            if index < len(times):
+                delays.append(times[index] - event["at"])
+            else:
+                missed += 1
+        summary[kind] = {
+            "published": len(delays) + missed,
+            "missed": missed,
+            "p50_min": _minutes(_percentile(delays, 0.5)),
+            "p95_min": _minutes(_percentile(delays, 0.95)),
+            "max_min": _minutes(max(delays) if delays else None),
+            "mean_min": _minutes(statistics.fmean(delays) if delays else None),
+        }
+    return summary
+
+
+def _stored(events):
+    """What reached dog.db: breeds stored with rows, finals tokens on rows."""
+    show_ids = sorted({event["show_id"] for event in events})
+    breeds = set()
+    tokens = set()
+    for show_id in show_ids:
+        doc = store._load_result_cache_doc(show_id) or {}
+        for key, entry in (doc.get("completed_breeds") or {}).items():
+            if entry.get("result_count"):
+                breeds.add((show_id, key))
+        for row in doc.get("results") or []:
+            for token in finals._tokens(row.get("awards")):
+                tokens.add((show_id, finals._row_key(row), token))
+    published_breeds = {(e["show_id"], f"{e['group']}:{e['breed_id']}") for e in events if e["kind"] == "results"}
+    published_tokens = {(e["show_id"], f"{e['group']}:{e['breed_id']}", e["token"]) for e in events if e["kind"] == "finals"}
+    return {
+        "breeds_with_results": len(breeds & published_breeds),
+        "breeds_published": len(published_breeds),
+        "finals_tokens": len(tokens & published_tokens),
+        "finals_published": len(published_tokens),
+    }
+
+
+def _request_summary(requests):
+    by_kind = {}
+    by_status = {}
+    per_minute = {}
+    for at, kind, _key, status in requests:
+        by_kind[kind] = by_kind.get(kind, 0) + 1
+        by_status[str(status)] = by_status.get(str(status), 0) + 1
+        per_minute[int(at // 60)] = per_minute.get(int(at // 60), 0) + 1
+    return {
+        "total": len(requests),
+        "by_kind": dict(sorted(by_kind.items())),
+        "by_status": dict(sorted(by_status.items())),
+        "peak_per_minute": max(per_minute.values(), default=0),
+    }
+
+
+def _parse_pool_cpu_s():
+    """CPU seconds of the live parse pool's workers (Linux /proc), or None."""
+    pool = parse_pool._pool
+    if pool is None:
+        return None
+    total = 0.0
+    ticks = os.sysconf("SC_CLK_TCK")
+    for pid in list(getattr(pool, "_processes", {}) or {}):
+        try:
+            with open(f"/proc/{pid}/stat", encoding="ascii") as fh:
+                fields = fh.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        total += (int(fields[11]) + int(fields[12])) / ticks
+    return round(total, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the crawler through a show weekend against the Showlink stand-in")
+    add_corpus_arguments(parser)
+    parser.add_argument(
+        "--crawler-args", default=PRODUCTION_CRAWLER_ARGS,
+        help="scripts/dog_crawl.py flags (--loop is implied; default: the production service's)",
+    )
+    parser.add_argument("--log", default=None, help="Write the crawler's log lines here (default: discard)")
+    parser.add_argument("--keep-db", default=None, help="Copy the crawled dog.db here afterwards")
+    parser.add_argument("--json", default=None, help="Write the report to this JSON file")
+    parser.add_argument("--baseline", default=None, help="Earlier --json report to compare against")
+    args = parser.parse_args()
+
+    log = open(args.log or os.devnull, "w", encoding="utf-8")  # noqa: SIM115 - closed below
+    structlog.configure(logger_factory=structlog.PrintLoggerFactory(file=log))
+    corpus = build_corpus(args)
+    clock = _SimClock(corpus.start, stop_at=corpus.end)
+    origin = _Origin(corpus, clock, args.latency_ms, args.error_rate, args.etags, args.seed)
+    server = _serve(origin, port=PORT)
+    print(
+        f"{len(corpus.events)} publications over {(corpus.end - corpus.start) / 3600:.0f} virtual hours;"
+        f" crawler: dog_crawl.py --loop {args.crawler_args}",
+        flush=True,
+    )
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    started = time.perf_counter()
+    sys.argv = ["dog_crawl.py", "--loop", *shlex.split(args.crawler_args)]
+    try:
+        with clock.installed():
+            try:
+                dog_crawl.main()
+            except _SimulationOver:
+                pass
+        real_s = time.perf_counter() - started
+        after = resource.getrusage(resource.RUSAGE_SELF)
+        process_cpu = (after.ru_utime - usage.ru_utime) + (after.ru_stime - usage.ru_stime)
+        report = {
+            "args": {key: value for key, value in vars(args).items() if key not in ("json", "baseline", "log", "keep_db")},
+            "virtual_hours": round((corpus.end - corpus.start) / 3600, 1),
+            "real_s": round(real_s, 1),
+            "requests": _request_summary(origin.requests),
+            "capture_delay": _capture_delays(corpus.events, origin.requests),
+            "stored": _stored(corpus.events),
+            "cpu_s": {
+                "crawler": round(process_cpu - origin.cpu_s, 2),
+                "parse_pool": _parse_pool_cpu_s(),
+                "origin": round(origin.cpu_s, 2),
+            },
+        }
+    finally:
+        server.shutdown()
+        log.close()
+
+    print(json.dumps({key: report[key] for key in ("real_s", "requests", "capture_delay", "stored", "cpu_s")}, indent=2))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"Wrote {args.json}")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        rows = [("requests", report["requests"]["total"], baseline["requests"]["total"])]
+        for kind, row in report["capture_delay"].items():
+            old = baseline.get("capture_delay", {}).get(kind, {})
+            rows += [(f"{kind} p50 min", row["p50_min"], old.get("p50_min")), (f"{kind} p95 min", row["p95_min"], old.get("p95_min"))]
+        rows.append(("crawler cpu s", report["cpu_s"]["crawler"], baseline["cpu_s"]["crawler"]))
+        print(f"vs {args.baseline}: new / old")
+        for name, new, old in rows:
+            ratio = f"{new / old:.2f}x" if new is not None and old else "n/a"
+            print(f"{name:>18} {new!s:>9} {old!s:>9} {ratio:>8}")
+    if args.keep_db:
+        # Through SQLite's backup API: the crawl's last writes may still be in the WAL.
+        source = sqlite3.connect(os.path.join(_TMP_DIR, "dog.db"))
+        target = sqlite3.connect(args.keep_db)
+        with target:
+            source.backup(target)
+        source.close()
+        target.close()
+    shutil.rmtree(_TMP_DIR, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,11 @@ Existing judges are never overwritten. Idempotent; run once against the host
 
     SECRET_KEY=dev python3 scripts/dog_sweep_breed_judges.py --dry-run
     SECRET_KEY=dev python3 scripts/dog_sweep_breed_judges.py
+
+With --changed, only the shows the dog_change log records a show, result or
+cache write for since the previous --changed run are swept (the log position is
+kept in dog_meta as `breed_sweep_change_id`); the first run, or one whose
+position has been pruned out of the log, sweeps everything.
 """
 
 import argparse
@@ -37,22 +42,37 @@ from app.dog_show import db as dog_db, sqlstore  # noqa: E402
 
 logger = structlog.get_logger(__name__)
 
+CURSOR_KEY = "breed_sweep_change_id"
+# The writes whose rows the sweeps read; their own judge/flag entries are not.
+SWEEP_INPUT_KINDS = ("show", "result_doc", "results")
+
 
 def main():
     parser = argparse.ArgumentParser(description="Fold captured judges/result flags into the dog breed index")
     parser.add_argument("--dry-run", action="store_true", help="Count the updates without committing them")
+    parser.add_argument("--changed", action="store_true", help="Only sweep shows changed since the last --changed run")
     args = parser.parse_args()
 
     dog_db.init_db()
 
     def _sweep(session):
+        show_ids = None
+        if args.changed:
+            after_id = sqlstore.get_meta_number(session, CURSOR_KEY, default=None)
+            if after_id is not None:
+                show_ids, newest = sqlstore.read_changed_show_ids(session, after_id, kinds=SWEEP_INPUT_KINDS)
+            else:
+                newest = sqlstore.read_change_cursor(session)
         counts = {
-            "judges_from_results": sqlstore.sweep_breed_judges_from_results(session),
-            "judges_from_cache_meta": sqlstore.sweep_breed_judges_from_cache_meta(session),
-            "result_flags": sqlstore.sweep_breed_result_flags(session),
+            "judges_from_results": sqlstore.sweep_breed_judges_from_results(session, show_ids),
+            "judges_from_cache_meta": sqlstore.sweep_breed_judges_from_cache_meta(session, show_ids),
+            "result_flags": sqlstore.sweep_breed_result_flags(session, show_ids),
+            "shows": "all" if show_ids is None else len(show_ids),
         }
         if args.dry_run:
             session.rollback()
+        elif args.changed:
+            sqlstore.set_meta(session, CURSOR_KEY, newest)
         return counts
 
     counts = dog_db.run_write(_sweep, op="breed_judge_sweep")
@@ -60,7 +80,7 @@ def main():
     prefix = "Would update" if args.dry_run else "Updated"
     print(f"{prefix} {counts['judges_from_results']} breed judges from result rows,")
     print(f"{prefix.lower()} {counts['judges_from_cache_meta']} from zero-result cache meta,")
-    print(f"and {counts['result_flags']} has_results flags.")
+    print(f"and {counts['result_flags']} has_results flags ({counts['shows']} shows swept).")
     logger.info("dog_breed_sweep_done", dry_run=args.dry_run, **counts)
 
 
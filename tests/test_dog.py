@@ -1,4 +1,5 @@
 import datetime
+import gzip
 import json
 import time
 
@@ -7,14 +8,19 @@ from unittest.mock import patch, MagicMock
 import requests
 from app.api import dog as dog_module
 from app.dog_show.store import _show_list_cache
+from app.dog_show import conditional as dog_conditional
 from app.dog_show import crawler as dog_crawler
 from app.dog_show import finals as dog_finals
 from app.dog_show import indexing as dog_indexing
+from app.dog_show import models as dog_models
+from app.dog_show import parse_pool as dog_parse_pool
 from app.dog_show import result_cache as dog_result_cache
 from app.dog_show import showlink as dog_showlink
+from app.dog_show import shows as dog_shows
 from app.dog_show import sqlstore as dog_sqlstore
 from app.dog_show import store as dog_store
 from app.dog_show import db as dog_db
+from app.dog_show import writer as dog_writer
 from app.dog_show.utils import (
     _result_doc_last_result_at, _result_live_plan, _show_is_recent, _show_live_phase,
     _show_result_availability, _utc_iso,
@@ -172,9 +178,13 @@ def clear_caches(monkeypatch, tmp_path):
     dog_db.configure(dog_db_uri)
     dog_db.init_db(dog_db_uri)
 
-    _show_list_cache["data"] = None
-    _show_list_cache["ts"] = 0
+    _show_list_cache.update(data=None, ts=0, version=None)
+    # Fresh, unpaced Showlink budgets: the mocked fetches need no politeness.
+    monkeypatch.setattr(dog_showlink, "_host_budgets", {})
+    monkeypatch.setattr(dog_showlink, "SHOWLINK_REQUESTS_PER_SECOND", 0.0)
+    monkeypatch.setattr(dog_parse_pool, "RESULT_PARSE_PROCESSES", 0)
     dog_indexing._show_stats_cache.clear()
+    dog_store._clear_result_doc_cache()
     yield
     # Release the per-test database file so its WAL handles don't leak.
     dog_db.configure("sqlite://")
@@ -188,6 +198,12 @@ def _current_month_label():
     return f"{FINNISH_MONTHS[now.month - 1]} {now.year}"
 
 
+def store_show_list():
+    """Fetch and persist the Showlink list the way the crawler does (through the
+    test's mocked Showlink session); the web tier only reads the stored copy."""
+    return dog_shows._get_show_list()
+
+
 def seed_index_show(show_id, show):
     """Seed one show into the dog index the way the app's writers do — one
     wholesale row write through the store facade, read back per request."""
@@ -212,6 +228,7 @@ def test_get_shows(mock_get, client):
     mock_resp.status_code = 200
     mock_get.return_value = mock_resp
 
+    store_show_list()
     resp = client.get("/api/dog/shows")
     assert resp.status_code == 200
     data = resp.get_json()
@@ -226,6 +243,35 @@ def test_get_shows(mock_get, client):
     assert data["index"]["total_show_count"] == 2
 
 
+@patch("app.dog_show.showlink._SESSION.get")
+def test_show_list_is_read_from_the_stored_copy(mock_get, client):
+    mock_resp = MagicMock()
+    mock_resp.text = SAMPLE_SHOW_LIST_HTML
+    mock_resp.status_code = 200
+    mock_get.return_value = mock_resp
+
+    # Before the crawler's first list fetch there is nothing to serve, and the
+    # request does not go to Showlink itself.
+    assert client.get("/api/dog/shows").status_code == 503
+    assert mock_get.call_count == 0
+
+    store_show_list()
+    assert mock_get.call_count == 1
+    # Within SHOW_LIST_TTL the crawler reuses the stored list, across restarts too.
+    _show_list_cache.update(data=None, ts=0, version=None)
+    assert len(store_show_list()) == 2
+    assert mock_get.call_count == 1
+
+    # Another worker (empty in-process copy) serves the same stored list.
+    _show_list_cache.update(data=None, ts=0, version=None)
+    assert [s["id"] for s in client.get("/api/dog/shows").get_json()["shows"]] == [14042, 14043]
+    assert mock_get.call_count == 1
+
+    # A changed list from the crawler moves the stored version; readers reload.
+    dog_store._save_show_list([{"id": 14043, "name": "Villakoira", "date": "", "month": ""}], time.time())
+    assert [s["id"] for s in client.get("/api/dog/shows").get_json()["shows"]] == [14043]
+    assert mock_get.call_count == 1
+
 @patch("app.dog_show.showlink._SESSION.get")
 def test_get_shows_enriches_cached_index_stats(mock_get, client):
     seed_index_show("14042", {
@@ -242,6 +288,7 @@ def test_get_shows_enriches_cached_index_stats(mock_get, client):
     mock_resp.status_code = 200
     mock_get.return_value = mock_resp
 
+    store_show_list()
     resp = client.get("/api/dog/shows")
 
     assert resp.status_code == 200
@@ -494,7 +541,7 @@ def test_get_shows_queues_stale_live_result_refresh(monkeypatch, client):
         "failed_breeds": {},
         "results": [{"name": f"Dog {idx}", "breedName": "basenji"} for idx in range(106)],
     })
-    monkeypatch.setattr(dog_module, "_get_show_list", lambda: [show])
+    monkeypatch.setattr(dog_module, "_stored_show_list", lambda: [show])
     monkeypatch.setattr(dog_result_cache.time, "time", lambda: now)
     # The fixture's `now` is fixed but recency reads the real clock; pin it so the
     # test doesn't rot as the fixture date ages out of the recent window.
@@ -596,6 +643,7 @@ def test_get_shows_does_not_show_stats_for_empty_index_entries(mock_get, client)
     mock_resp.status_code = 200
     mock_get.return_value = mock_resp
 
+    store_show_list()
     resp = client.get("/api/dog/shows")
 
     assert resp.status_code == 200
@@ -664,6 +712,67 @@ def test_show_detail_uses_persisted_index_without_fetching(mock_get, client):
     mock_get.assert_not_called()
 
 
+def test_show_detail_revalidates_against_index_version(monkeypatch, client):
+    """A matching If-None-Match is a 304 before the detail is built; a re-index
+    moves the validator."""
+    seed_index_show("14042", {
+        "title": "14.06.2000 Basenji",
+        "month": "kesäkuu 2000",
+        "updated_at": 961000000,
+        "breeds": [{ "name": "basenji", "count": 78, "group": "5", "breed_id": "3" }],
+    })
+
+    first = client.get("/api/dog/shows/14042")
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == "no-cache"
+    assert first.headers["Last-Modified"]
+
+    def fail_build(show_id):
+        raise AssertionError("a 304 must not rebuild the show detail")
+
+    monkeypatch.setattr(dog_module, "_show_detail_from_index", fail_build)
+    revalidated = client.get("/api/dog/shows/14042", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == etag
+    assert revalidated.data == b""
+    monkeypatch.undo()
+
+    seed_index_show("14042", dict(dog_store._indexed_show("14042"), updated_at=961000100))
+    changed = client.get("/api/dog/shows/14042", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+    # A judge set on its own moves neither the show row nor a cache header.
+    etag = changed.headers["ETag"]
+    breed_etag = dog_conditional._breed_results_validator(14042, "5", "3")["etag"]
+    dog_db.run_write(lambda session: dog_sqlstore.set_breed_judge(session, 14042, "5", "3", "Uusi Tuomari"))
+    assert client.get("/api/dog/shows/14042", headers={"If-None-Match": etag}).status_code == 200
+    assert dog_conditional._breed_results_validator(14042, "5", "3")["etag"] != breed_etag
+
+
+@patch("app.dog_show.showlink._SESSION.get")
+def test_show_list_revalidates_until_data_or_clock_moves(mock_get, monkeypatch, client):
+    mock_resp = MagicMock()
+    mock_resp.text = SAMPLE_SHOW_LIST_HTML
+    mock_resp.status_code = 200
+    mock_get.return_value = mock_resp
+
+    store_show_list()
+    etag = client.get("/api/dog/shows").headers["ETag"]
+    assert client.get("/api/dog/shows", headers={"If-None-Match": etag}).status_code == 304
+
+    # A crawler job write is a data change every list poll must see.
+    dog_store._queue_result_cache_job(14043, reason="test")
+    resp = client.get("/api/dog/shows", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    etag = resp.headers["ETag"]
+
+    # Live phases and stats move with the clock alone; the bucket bounds that lag.
+    monkeypatch.setattr(dog_conditional, "API_VALIDATOR_CLOCK_SECONDS", 7)
+    assert client.get("/api/dog/shows", headers={"If-None-Match": etag}).status_code == 200
+
+
 @patch("app.dog_show.showlink._SESSION.get")
 def test_show_detail_includes_live_breed_result_progress_and_queues_refresh(mock_get, monkeypatch, client):
     now = datetime.datetime(2026, 6, 20, 12, 0).timestamp()
@@ -1227,6 +1336,377 @@ def test_result_crawl_reads_floatleft_breed_header_and_backfills_index(mock_get,
     assert dog_store._indexed_show("13771")["breeds"][0]["judge"] == "Pietro Marino"
 
 
+@patch("app.dog_show.showlink._SESSION.get")
+def test_result_crawl_pipeline_parses_in_process_pool(mock_get, monkeypatch):
+    """With parse processes configured, the fetch threads hand raw pages to the
+    process pool and the crawl records the parsed breeds, reporting per-stage
+    timings; the captured rows match an in-thread parse."""
+    monkeypatch.setattr(dog_parse_pool, "RESULT_PARSE_PROCESSES", 2)
+    monkeypatch.setattr(dog_parse_pool, "_parse_inline", lambda html, show_id: pytest.fail("parsed outside the pool"))
+    breeds = [
+        {"name": f"breed {n}", "count": 3, "group": "5", "breed_id": str(n), "has_results": True}
+        for n in range(1, 6)
+    ]
+    seed_index_show("14042", {
+        "title": "14.06.2026 Basenji", "name": "Basenji", "date": "14.06.", "month": "kesäkuu 2026",
+        "source_url": dog_showlink._source_url(14042), "breeds": breeds,
+    })
+    mock_resp = MagicMock()
+    mock_resp.text = SAMPLE_BREED_RESULTS_HTML
+    mock_resp.status_code = 200
+    mock_get.return_value = mock_resp
+
+    pool = dog_parse_pool._parse_pool()
+    try:
+        summary = dog_result_cache.crawl_result_cache_for_show(14042, delay=0, source="test", workers=3, force=True)
+        assert dog_parse_pool._pool is pool  # no worker died along the way
+        # The workers parse without the web app: no Flask, no site.db models.
+        loaded = pool.submit(eval, "[m for m in ('flask', 'app.models') if m in __import__('sys').modules]")
+        assert loaded.result(10) == []
+    finally:
+        dog_parse_pool._reset_parse_pool(pool)
+
+    assert summary["status"] == "complete"
+    stages = summary["stages"]
+    assert stages["pipelined"] is True
+    assert stages["fetch_s"] >= 0 and stages["parse_s"] > 0 and stages["write_s"] > 0
+    doc = dog_store._load_result_cache_doc(14042)
+    assert sorted(doc["completed_breeds"]) == [f"5:{n}" for n in range(1, 6)]
+    expected = dog_result_cache._fetch_breed_results_for_show_cache(14042, breeds[0])["breed_data"]
+    assert doc["completed_breeds"]["5:1"]["judge"] == expected["judge"] == "Paula Steele"
+    rows = [row for row in doc["results"] if row["breedId"] == "1"]
+    assert [row["name"] for row in rows] == [dog["name"] for dog in expected["results"]]
+
+
+def test_capture_writer_group_commits_breeds_that_arrive_together(monkeypatch):
+    """Breeds handed to the writer while a commit is in flight share the next
+    transaction: rows, awards, index flag and judge, with the header written
+    from the latest snapshot."""
+    import threading
+    seed_index_show("14042", {
+        "title": "14.06.2026 Basenji", "month": "kesäkuu 2026",
+        "source_url": dog_showlink._source_url(14042),
+        "breeds": [{"name": f"breed {n}", "count": 3, "group": "5", "breed_id": str(n)} for n in range(1, 5)],
+    })
+    doc = dog_result_cache._all_results_doc_base(14042, "test")
+    ops = []
+    real_run_write = dog_db.run_write
+    monkeypatch.setattr(dog_db, "run_write", lambda work, op="dog_db_write": (ops.append(op), real_run_write(work, op=op))[1])
+    first_commit = threading.Event()
+    release = threading.Event()
+    real_write = dog_writer._write_breed_captures
+
+    def write_breed_captures(*args, **kwargs):
+        first_commit.set()
+        release.wait(5)
+        return real_write(*args, **kwargs)
+
+    monkeypatch.setattr(dog_writer, "_write_breed_captures", write_breed_captures)
+    writer = dog_writer._CaptureWriter(14042, max_batch=8)
+    for n in range(1, 5):
+        breed = {"name": f"breed {n}", "group": "5", "breed_id": str(n)}
+        breed_data = {"judge": f"Judge {n}", "results": [], "awards": []}
+        rows = [_phase_c_result("5", str(n), 1)]
+        dog_result_cache._apply_breed_capture(doc, breed, breed_data, rows, time.time())
+        writer.put(doc, {"group": "5", "breed_id": str(n), "results": rows, "result_count": 1, "judge": f"Judge {n}"})
+        if n == 1:
+            assert first_commit.wait(5)
+    release.set()
+    writer.close()
+
+    assert (writer.commits, writer.breeds) == (2, 4)
+    assert ops == ["result_breed_batch", "show_stats"] * 2  # one transaction (and stats refresh) per batch
+    stored = dog_store._load_result_cache_doc(14042)
+    assert sorted(stored["completed_breeds"]) == [f"5:{n}" for n in range(1, 5)]
+    assert sorted(row["breedId"] for row in stored["results"]) == ["1", "2", "3", "4"]
+    indexed = {breed["breed_id"]: breed for breed in dog_store._indexed_show(14042)["breeds"]}
+    assert all(indexed[str(n)]["has_results"] and indexed[str(n)]["judge"] == f"Judge {n}" for n in range(1, 5))
+
+
+def test_capture_writer_refreshes_show_stats_at_a_bounded_interval(monkeypatch):
+    """A stats refresh rebuilds the whole show doc, so the writer refreshes
+    after its first commit, then at most every SHOW_STATS_REFRESH_SECONDS, and
+    once more on close — not once per commit."""
+    seed_index_show("14043", {
+        "title": "Stats Show", "name": "Stats Show", "date": "01.03.", "month": "maaliskuu 2026",
+        "breeds": [{"name": f"breed {n}", "count": 3, "group": "5", "breed_id": str(n)} for n in range(1, 7)],
+    })
+    doc = dog_result_cache._all_results_doc_base(14043, "test")
+    refreshes = []
+    monkeypatch.setattr(dog_writer, "_refresh_show_stats", lambda show_ids: refreshes.append(list(show_ids)) or 1)
+    monkeypatch.setattr(dog_writer, "SHOW_STATS_REFRESH_SECONDS", 3600)
+    writer = dog_writer._CaptureWriter(14043, max_batch=1)
+    for n in range(1, 7):
+        breed = {"name": f"breed {n}", "group": "5", "breed_id": str(n)}
+        rows = [_phase_c_result("5", str(n), 1)]
+        dog_result_cache._apply_breed_capture(doc, breed, {"judge": "", "results": [], "awards": []}, rows, time.time())
+        writer.put(doc, {"group": "5", "breed_id": str(n), "results": rows, "result_count": 1})
+    writer.close()
+
+    assert (writer.commits, writer.breeds) == (6, 6)
+    assert refreshes == [[14043], [14043]]  # the first commit, then close
+
+    # A writer that only sent heartbeats has nothing to refresh.
+    refreshes.clear()
+    writer = dog_writer._CaptureWriter(14043)
+    writer.put(fetch_states={})
+    writer.close()
+    assert refreshes == []
+
+
+def test_capture_writer_commits_heartbeats_of_unchanged_pages_once_per_interval(monkeypatch):
+    """A page that came back unchanged only heartbeats the job; a run of them
+    doesn't cost a write transaction each."""
+    seed_index_show("14044", {
+        "title": "Quiet Show", "name": "Quiet Show", "date": "01.03.", "month": "maaliskuu 2026",
+        "breeds": [{"name": "breed 1", "count": 3, "group": "5", "breed_id": "1"}],
+    })
+    doc = dog_result_cache._all_results_doc_base(14044, "test")
+    commits = []
+    monkeypatch.setattr(
+        dog_writer, "_write_breed_captures", lambda show_id, doc, captures, **kwargs: commits.append(len(captures)),
+    )
+    monkeypatch.setattr(dog_writer, "_refresh_show_stats", lambda show_ids: 1)
+    writer = dog_writer._CaptureWriter(14044, max_batch=1)
+    for _ in range(20):
+        writer.put()
+    rows = [_phase_c_result("5", "1", 1)]
+    breed = {"name": "breed 1", "group": "5", "breed_id": "1"}
+    dog_result_cache._apply_breed_capture(doc, breed, {"judge": "", "results": [], "awards": []}, rows, time.time())
+    writer.put(doc, {"group": "5", "breed_id": "1", "results": rows, "result_count": 1})
+    for _ in range(20):
+        writer.put()
+    writer.close()
+
+    assert commits == [0, 1]  # the first heartbeat, then the capture
+    assert (writer.commits, writer.breeds) == (2, 1)
+
+    # Once the interval has passed, a heartbeat commits on its own again.
+    commits.clear()
+    monkeypatch.setattr(dog_writer, "JOB_HEARTBEAT_SECONDS", 0)
+    writer = dog_writer._CaptureWriter(14044, max_batch=1)
+    writer.put()
+    writer.put()
+    writer.close()
+    assert commits == [0, 0]
+
+
+@patch("app.dog_show.showlink._SESSION.get")
+def test_archived_pages_replay_into_rows_without_network(mock_get, monkeypatch, tmp_path):
+    """With the page archive on, fetched pages are kept gzip-compressed by
+    content hash; a replay re-parses them offline and rewrites only the breeds
+    whose parse differs from the stored rows."""
+    from app.dog_show import archive as dog_archive
+    from app.dog_show import replay as dog_replay
+    monkeypatch.setattr(dog_archive, "PAGE_ARCHIVE_DIR", str(tmp_path / "pages"))
+    seed_index_show("13771", {
+        "title": "20.-21.06.2024 Jyväskylä KV", "name": "Jyväskylä KV",
+        "date": "20.-21.06.", "month": "kesäkuu 2024",
+        "source_url": dog_showlink._source_url(13771),
+        "breeds": [
+            {"name": "sileäkarvainen noutaja", "count": 26, "group": "8", "breed_id": "124", "has_results": True},
+        ],
+    })
+    mock_resp = MagicMock()
+    mock_resp.text = SAMPLE_BREED_RESULTS_FLOATLEFT_HTML
+    mock_resp.status_code = 200
+    mock_get.return_value = mock_resp
+    assert dog_result_cache.crawl_result_cache_for_show(13771, delay=0, source="test", workers=1)["status"] == "complete"
+
+    entry = dog_archive._archived_pages(13771)[dog_showlink._source_url(13771, "8", "124")]
+    assert entry["page"] == "breed"
+    blob = tmp_path / "pages" / "blobs" / entry["sha1"][:2] / f"{entry['sha1']}.html.gz"
+    assert gzip.decompress(blob.read_bytes()).decode("utf-8") == SAMPLE_BREED_RESULTS_FLOATLEFT_HTML
+    assert dog_archive._archived_show_ids() == [13771]
+
+    mock_get.side_effect = AssertionError("replay must not fetch")
+    assert dog_replay.replay_show_from_archive(13771, workers=1)["status"] == "unchanged"
+
+    # A capture stored before the parser read the competitive placement.
+    doc = dog_store._load_result_cache_doc(13771)
+    for row in doc["results"]:
+        row["competitive_placement"] = ""
+    dog_store._save_result_cache_doc(13771, doc)
+
+    assert dog_replay.replay_show_from_archive(13771, workers=1, dry_run=True)["changed_breeds"] == 1
+    assert dog_store._load_result_cache_doc(13771)["results"][0].get("competitive_placement", "") == ""
+    summary = dog_replay.replay_show_from_archive(13771, workers=1)
+    assert summary["status"] == "replayed" and summary["changed_breeds"] == 1
+    doc = dog_store._load_result_cache_doc(13771)
+    assert doc["status"] == "complete"
+    assert doc["results"][0]["competitive_placement"] == "PU3"
+    assert doc["completed_breeds"]["8:124"]["judge"] == "Pietro Marino"
+
+
+def test_showlink_stand_in_plays_back_a_show_day_on_the_virtual_clock():
+    """scripts/dog_showlink_sim.py serves what the crawler's own parsers read,
+    as it stood at the clock's time: breeds unjudged until published, finals
+    appended onto the winners' rows in the evening. Its clock drives the
+    crawler's show calendar and skips sleeps."""
+    import os
+    import sys
+    from urllib.parse import urlsplit
+    from app.dog_show import parsers as dog_parsers
+    from app.dog_show import utils as dog_utils
+    scripts_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts")
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+    import dog_showlink_sim as sim
+
+    day = datetime.date(2026, 6, 13)
+    corpus = sim._SyntheticCorpus(day, days=1, breeds=12, entries=120, rings=3, seed=3)
+    (show_id,) = corpus.shows
+
+    def soup_at(now, key, page):
+        return dog_showlink._page_soup(corpus.page(key, now), page)
+
+    def detail_at(now):
+        fetch = lambda url, page=None: soup_at(now, sim._page_key(urlsplit(url).query), page)  # noqa: E731
+        return dog_parsers._parse_show_detail(soup_at(now, (str(show_id), "", ""), "detail"), show_id, fetch_page=fetch)
+
+    morning, night = sim._local_ts(day, 8), sim._local_ts(day, 23, 59)
+    listed = dog_parsers._parse_show_list(soup_at(morning, ("", "", ""), "list"))
+    assert [(show["id"], show["date"], show["month"]) for show in listed] == [(show_id, "13.06.", "kesäkuu 2026")]
+    assert len(detail_at(morning)["breeds"]) == 12
+    assert not any(breed["has_results"] for breed in detail_at(morning)["breeds"])
+    assert all(breed["has_results"] for breed in detail_at(night)["breeds"])
+
+    bis = next(event for event in corpus.events if event.get("token") == "BIS-1")
+    key = (str(show_id), bis["group"], bis["breed_id"])
+    published = next(e["at"] for e in corpus.events if e["kind"] == "results" and (e["group"], e["breed_id"]) == key[1:])
+    assert dog_parsers._parse_breed_results(soup_at(published - 1, key, "breed"), show_id)["results"] == []
+    evening = dog_parsers._parse_breed_results(soup_at(bis["at"] - 1, key, "breed"), show_id)
+    final = dog_parsers._parse_breed_results(soup_at(bis["at"], key, "breed"), show_id)
+    assert len(final["results"]) == len(evening["results"]) > 0
+    rop = next(row["awards"] for row in final["results"] if "ROP" in dog_finals._tokens(row["awards"]))
+    assert "RYP-1" in dog_finals._tokens(rop) and "BIS-1" in dog_finals._tokens(rop)
+    assert not any("BIS-1" in dog_finals._tokens(row["awards"]) for row in evening["results"])
+
+    clock = sim._SimClock(sim._local_ts(day, 12), stop_at=sim._local_ts(day, 14))
+    started = time.perf_counter()
+    with clock.installed():
+        time.sleep(3600)
+        assert dog_utils._local_now().replace(minute=0, second=0, microsecond=0) == datetime.datetime(2026, 6, 13, 13)
+        assert dog_utils._show_date_state({"date": "13.06.", "month": "kesäkuu 2026"}) == "live"
+        with pytest.raises(sim._SimulationOver):
+            time.sleep(3600)
+    assert time.perf_counter() - started < 5
+
+    origin = sim._Origin(corpus, sim._SimClock(night), etags=True)
+    server = sim._serve(origin)
+    try:
+        url = sim._base_url(server) + f"?Id={show_id}&R={bis['group']}&RO={bis['breed_id']}"
+        first = requests.get(url, timeout=5)
+        again = requests.get(url, headers={"If-None-Match": first.headers["ETag"]}, timeout=5)
+    finally:
+        server.shutdown()
+    assert (first.status_code, again.status_code) == (200, 304)
+    assert [(kind, status) for _at, kind, _key, status in origin.requests] == [("breed", 200), ("breed", 304)]
+
+
+def _metric_samples(text):
+    """{sample with labels: value} from a Prometheus text exposition."""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+@patch("app.dog_show.showlink._SESSION.get")
+def test_crawler_metrics_are_exposed_in_prometheus_text_format(mock_get, tmp_path):
+    """Fetches, parses and dog.db writes land in app/dog_show/metrics.py; /metrics
+    and the node_exporter textfile expose them in the text format."""
+    from sqlalchemy.exc import OperationalError
+    from app.dog_show import metrics as dog_metrics
+    dog_metrics._reset_metrics()
+    mock_get.return_value = MagicMock(status_code=200, text=SAMPLE_SHOW_LIST_HTML)
+    dog_showlink._fetch_page(dog_showlink.BASE_URL, page="list")
+    mock_get.side_effect = requests.ConnectionError("reset")
+    with pytest.raises(requests.ConnectionError):
+        dog_showlink._fetch_page(dog_showlink._source_url(13786), page="detail")
+
+    attempts = []
+
+    def contended(session):
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise OperationalError("INSERT", {}, Exception("database is locked"))
+        dog_sqlstore.write_result_doc(session, 13786, {
+            "status": "complete", "completed_breeds": {"5:3": {"name": "basenji", "result_count": 2}},
+            "results": [
+                {"name": f"Dog {n}", "breedName": "basenji", "breedGroup": "5", "breedId": "3", "awards": ""}
+                for n in range(2)
+            ],
+        })
+
+    dog_db.run_write(contended, op="result_cache_doc")
+
+    text = dog_metrics._render_metrics()
+    samples = _metric_samples(text)
+    assert "# TYPE dog_showlink_fetch_seconds histogram" in text
+    assert samples['dog_showlink_fetch_seconds_count{page="list",status="200"}'] == 1
+    assert samples['dog_showlink_fetch_seconds_count{page="detail",status="error"}'] == 1
+    assert samples['dog_showlink_fetch_seconds_bucket{page="list",status="200",le="+Inf"}'] == 1
+    assert samples['dog_parse_seconds_count{page="list"}'] == 1
+    assert samples['dog_db_write_contention_total{op="result_cache_doc"}'] == 1
+    assert samples['dog_db_write_seconds_count{op="result_cache_doc"}'] == 1
+    # Each attempt's wait for the write lock, timed apart from the transaction.
+    assert samples['dog_db_write_lock_wait_seconds_count{op="result_cache_doc"}'] == 2
+    # Only the committed attempt's rows count.
+    assert samples['dog_db_rows_written_total{table="dog_result"}'] == 2
+    assert samples["dog_crawler_last_pass_timestamp_seconds"] == 0
+
+    server = dog_metrics._serve_metrics(0)
+    try:
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        resp = requests.get(base + "/metrics", timeout=5)
+        missing = requests.get(base + "/", timeout=5)
+    finally:
+        server.shutdown()
+    assert resp.headers["Content-Type"] == dog_metrics.CONTENT_TYPE
+    assert _metric_samples(resp.text)['dog_db_rows_written_total{table="dog_result"}'] == 2
+    assert missing.status_code == 404
+
+    path = tmp_path / "dog_crawler.prom"
+    dog_metrics._write_metrics_textfile(str(path))
+    assert _metric_samples(path.read_text())['dog_db_write_contention_total{op="result_cache_doc"}'] == 1
+    assert [p.name for p in tmp_path.iterdir() if p.name.startswith("dog_crawler")] == ["dog_crawler.prom"]
+
+
+def test_capture_lag_is_measured_from_the_previous_fetch_without_results():
+    """A breed's first results are timed from the last fetch that found its page
+    empty; breeds never fetched empty before are not observed."""
+    from app.dog_show import metrics as dog_metrics
+    dog_metrics._reset_metrics()
+    doc = {"results": [], "completed_breeds": {"5:3": {"name": "basenji", "result_count": 0}}}
+    writer = MagicMock(show_id=13786, write_rows=True)
+
+    def item(group, breed_id, previous_fetched_at):
+        breed = {"name": "basenji", "group": group, "breed_id": breed_id}
+        row = {"name": "Dog", "breedName": "basenji", "breedGroup": group, "breedId": breed_id, "awards": ""}
+        return {
+            "breed": breed, "breed_key": f"{group}:{breed_id}", "unchanged": False,
+            "source_url": dog_showlink._source_url(13786, group, breed_id), "fetch_state": None,
+            "breed_data": {"judge": "Judge", "results": [{}], "awards": []},
+            "mapped_results": [row], "fetched_at": 1000.0, "previous_fetched_at": previous_fetched_at,
+        }
+
+    memo = dog_result_cache._new_fetch_memo()
+    dog_result_cache._record_result_breed_success(doc, item("5", "3", 820.0), writer, memo)
+    dog_result_cache._record_result_breed_success(doc, item("5", "4", None), writer, memo)
+    # A re-fetch of a breed that already had results (a finals sweep) is no capture.
+    dog_result_cache._record_result_breed_success(doc, item("5", "3", 990.0), writer, memo)
+
+    samples = _metric_samples(dog_metrics._render_metrics())
+    assert samples["dog_result_capture_lag_seconds_count"] == 1
+    assert samples["dog_result_capture_lag_seconds_sum"] == 180
+    assert samples['dog_result_capture_lag_seconds_bucket{le="120"}'] == 0
+    assert samples['dog_result_capture_lag_seconds_bucket{le="300"}'] == 1
+    assert not any("13786" in sample for sample in samples)  # no per-show series
+
+
 @patch("app.dog_show.showlink._SESSION.get")
 def test_future_breed_results_return_not_ready_without_fetching(mock_get, client):
     seed_index_show("15001", {
@@ -1307,20 +1787,9 @@ def test_show_all_results_poll_does_not_refresh_running_job_clock(mock_get, monk
         ],
     })
     old_updated_at = 100
-    dog_store._save_result_jobs({
-        "jobs": {
-            "14042": {
-                "show_id": 14042,
-                "state": "running",
-                "created_at": old_updated_at,
-                "requested_at": old_updated_at,
-                "updated_at": old_updated_at,
-                "last_started_at": old_updated_at,
-                "attempts": 1,
-            },
-        },
-        "updated_at": old_updated_at,
-    })
+    monkeypatch.setattr(dog_store.time, "time", lambda: old_updated_at)
+    dog_store._queue_result_cache_job(14042)
+    assert dog_store._claim_result_cache_job(14042)["state"] == "running"
     monkeypatch.setattr(dog_store.time, "time", lambda: 1000)
 
     resp = client.get("/api/dog/shows/14042/all-results")
@@ -1336,6 +1805,55 @@ def test_show_all_results_poll_does_not_refresh_running_job_clock(mock_get, monk
     mock_get.assert_not_called()
 
 
+def test_result_job_operations_touch_only_their_own_row(monkeypatch):
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(dog_store.time, "time", lambda: clock["now"])
+    dog_store._queue_result_cache_job(1, reason="user")
+    dog_store._queue_result_cache_job(2, reason="user")
+    assert dog_store._claim_result_cache_job(2)["state"] == "running"
+
+    clock["now"] = 1010.0
+    # Re-queueing a running job keeps its state and heartbeat clock.
+    job = dog_store._queue_result_cache_job(2, reason="stale-refresh")
+    assert (job["state"], job["updated_at"], job["requested_at"]) == ("running", 1000.0, 1010.0)
+    assert dog_store._heartbeat_result_cache_job(2, min_interval=15) is False
+    clock["now"] = 1015.0
+    assert dog_store._heartbeat_result_cache_job(2, min_interval=15) is True
+    assert dog_store._heartbeat_result_cache_job(1, min_interval=15) is False  # not running
+
+    for attempt in (1, 2):
+        job = dog_store._defer_result_cache_job(2, "HTTP 503")
+        assert job["attempts"] == attempt
+        assert job["next_attempt_at"] == 1015.0 + attempt * dog_store.RESULT_JOB_BACKOFF_SECONDS
+    assert job["state"] == "queued"
+
+    jobs = dog_store._load_result_jobs()["jobs"]
+    assert jobs["1"]["state"] == "queued"
+    assert jobs["1"]["updated_at"] == 1000.0
+    assert dog_store._remove_result_cache_job(1) is True
+    assert dog_store._remove_result_cache_job(1) is False
+    assert set(dog_store._load_result_jobs()["jobs"]) == {"2"}
+
+
+def test_claim_result_job_takes_oldest_due_and_reclaims_stale_running(monkeypatch):
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(dog_store.time, "time", lambda: clock["now"])
+    for show_id in (3, 1, 2):
+        dog_store._queue_result_cache_job(show_id, reason="user")
+        clock["now"] += 1
+    dog_store._defer_result_cache_job(3, "timeout")  # oldest, but backing off
+
+    assert dog_store._claim_result_cache_job(now=1010.0, stale_seconds=60)["show_id"] == 1
+    assert dog_store._claim_result_cache_job(now=1010.0, stale_seconds=60)["show_id"] == 2
+    assert dog_store._claim_result_cache_job(now=1010.0, stale_seconds=60) is None
+    # A second crawler racing for a job that was just claimed gets nothing.
+    assert dog_store._claim_result_cache_job(1, now=1011.0, stale_seconds=60) is None
+
+    # Without heartbeats a running job becomes claimable again.
+    job = dog_store._claim_result_cache_job(1, now=1071.0, stale_seconds=60)
+    assert (job["state"], job["last_started_at"]) == ("running", 1071.0)
+
+
 @patch("app.dog_show.showlink._SESSION.get")
 def test_show_all_results_serves_persisted_cache_without_fetching(mock_get, client):
     seed_index_show("14042", {
@@ -1703,6 +2221,58 @@ def test_show_stats_cache_decouples_polling_from_result_doc_reads(monkeypatch, c
     assert calls["n"] == 2
 
 
+def test_show_stats_served_from_crawler_rows_until_stale(monkeypatch, client):
+    """The crawler stores each show's list stats; polls read those rows without
+    computing, and a row whose inputs moved (or whose phase boundary passed) is
+    computed per request until the crawler's due sweep rewrites it."""
+    from sqlalchemy import select
+    seed_index_show("13960", {
+        "title": "14.06.2020 Old Show", "date": "14.06.", "month": "kesäkuu 2020",
+        "breeds": [{"name": "basenji", "count": 4, "group": "5", "breed_id": "3", "has_results": True}],
+    })
+    seed_index_show("13961", {
+        "title": "Upcoming", "date": "01.01.", "month": "tammikuu 2999",
+        "breeds": [{"name": "basenji", "count": 2, "group": "5", "breed_id": "3"}],
+    })
+    assert dog_store._due_show_stats_ids() == [13960, 13961]
+    assert dog_crawler.refresh_show_stats_once() == {"due": 2, "written": 2}
+    assert dog_store._due_show_stats_ids() == []
+
+    now = time.time()
+    stored = dog_store._load_show_stats([13960, 13961, 424242])
+    assert stored[13960]["entry_count"] == 4
+    assert stored[13961]["show_state"] == "upcoming"
+    assert stored[424242] is None  # not indexed: no stats, nothing to compute
+    # A past show's stats only move with its data; an upcoming one's at the next
+    # phase hour at the latest.
+    with dog_db.session_scope() as session:
+        rows = {row.show_id: row for row in session.execute(select(dog_models.DogShowStats)).scalars()}
+    assert rows[13960].valid_until is None
+    assert now < rows[13961].valid_until <= now + 24 * 3600
+
+    computed = {"n": 0}
+    real_compute = dog_indexing._compute_show_stats
+    monkeypatch.setattr(dog_indexing, "_compute_show_stats",
+                        lambda *a, **k: (computed.__setitem__("n", computed["n"] + 1), real_compute(*a, **k))[1])
+    shows = [{"id": 13960, "date": "14.06.", "month": "kesäkuu 2020"}]
+    assert dog_indexing._shows_with_cached_stats(shows)[0]["stats"]["entry_count"] == 4
+    assert computed["n"] == 0
+
+    # A re-index moves the stamp: the stored row is ignored, not served stale.
+    seed_index_show("13960", {
+        "title": "14.06.2020 Old Show", "date": "14.06.", "month": "kesäkuu 2020", "updated_at": 5.0,
+        "breeds": [{"name": "basenji", "count": 7, "group": "5", "breed_id": "3", "has_results": True}],
+    })
+    assert 13960 not in dog_store._load_show_stats([13960])
+    assert dog_indexing._shows_with_cached_stats(shows)[0]["stats"]["entry_count"] == 7
+    assert computed["n"] == 1
+    assert dog_store._due_show_stats_ids() == [13960]
+
+    # So does the clock passing the row's phase boundary.
+    assert 13961 not in dog_store._load_show_stats([13961], now=rows[13961].valid_until)
+    assert dog_store._due_show_stats_ids(now=rows[13961].valid_until) == [13960, 13961]
+
+
 def test_finals_resweep_targets_missing_ryp_groups_then_bis_finalists():
     """The re-sweep is structural, not a blind rotation: while a group still
     lacks RYP-1 it re-checks that group's ROP winners; once every group has
@@ -1798,7 +2368,7 @@ def test_live_refresh_fetches_only_newly_judged_breeds(monkeypatch, client):
     )
     fetched = []
 
-    def fake_fetch(sid, breed):
+    def fake_fetch(sid, breed, previous=None):
         key = f'{breed["group"]}:{breed["breed_id"]}'
         fetched.append(key)
         return {
@@ -1869,7 +2439,7 @@ def test_finals_resweep_recaptures_ryp1_winners_until_main_bis(monkeypatch, clie
     )
     fetched = []
 
-    def fake_fetch(sid, breed):
+    def fake_fetch(sid, breed, previous=None):
         key = f'{breed["group"]}:{breed["breed_id"]}'
         fetched.append(key)
         awards = "SA, ROP, RYP-1, BIS-1" if key == "5:3" else "SA, ROP, RYP-1"
@@ -1919,7 +2489,7 @@ def test_finals_settles_only_after_terminal_confirmed_stable(monkeypatch, client
     # re-fetch of that breed (a late finals placement).
     fetch_counts = {}
 
-    def fake_fetch(sid, breed):
+    def fake_fetch(sid, breed, previous=None):
         key = f'{breed["group"]}:{breed["breed_id"]}'
         fetch_counts[key] = fetch_counts.get(key, 0) + 1
         awards = "SA, ROP, RYP-1"
@@ -2449,6 +3019,162 @@ def test_breed_results_surface_judge_from_result_rows(mock_get, client):
     mock_get.assert_not_called()
 
 
+@patch("app.dog_show.showlink._SESSION.get")
+def test_breed_results_read_only_the_breed_slice(mock_get, monkeypatch, client):
+    """/results serves one breed's rows and honor roll without rebuilding the
+    whole-show doc, and an uncaptured breed of a complete show is not served."""
+    seed_index_show("14043", {
+        "title": "15.06.2000 Kaikki rodut",
+        "month": "kesäkuu 2000",
+        "breeds": [
+            { "name": "basenji", "count": 2, "group": "5", "breed_id": "3", "has_results": True, "judge": "Paula Steele" },
+            { "name": "beagle", "count": 1, "group": "6", "breed_id": "8", "has_results": True },
+            { "name": "pointteri", "count": 1, "group": "7", "breed_id": "2" },
+        ],
+    })
+
+    def result(number, name, group, breed_id, breed_name, **extra):
+        return {
+            "number": number, "name": name, "grade": "ERI",
+            "breedName": breed_name, "breedGroup": group, "breedId": breed_id,
+            "breedObj": { "name": breed_name, "group": group, "breed_id": breed_id },
+            **extra,
+        }
+
+    dog_store._save_result_cache_doc(14043, {
+        "version": dog_result_cache.RESULT_CACHE_VERSION,
+        "show_id": 14043,
+        "status": "complete",
+        "title": "15.06.2000 Kaikki rodut",
+        "cached_at": 1001,
+        "completed_breeds": {
+            "5:3": {"name": "basenji", "result_count": 2, "awards": [
+                {"type": "ROP", "text": "ROP", "name": "Ajibu", "owner": "Omistaja A"},
+                {"type": "VSP", "text": "VSP", "name": "Bwana", "owner": "Omistaja B"},
+            ]},
+            "6:8": {"name": "beagle", "result_count": 1},
+        },
+        "results": [
+            result(1, "Ajibu", "5", "3", "basenji", competitive_placement="1"),
+            result(1, "Beagle One", "6", "8", "beagle"),
+            result(2, "Bwana", "5", "3", "basenji"),
+        ],
+    })
+
+    def fail_doc_read(*args, **kwargs):
+        raise AssertionError("the breed read must not rebuild the whole-show doc")
+
+    monkeypatch.setattr(dog_store.sqlstore, "read_result_doc", fail_doc_read)
+
+    data = client.get("/api/dog/shows/14043/results?group=5&breed=3").get_json()
+    assert [dog["name"] for dog in data["results"]] == ["Ajibu", "Bwana"]
+    assert data["results"][0]["competitive_placement"] == "1"
+    assert data["results"][1]["competitive_placement"] is None
+    assert data["judge"] == "Paula Steele"
+    assert [award["name"] for award in data["awards"]] == ["Ajibu", "Bwana"]
+    assert data["awards"][0] == {"type": "ROP", "text": "ROP", "name": "Ajibu", "owner": "Omistaja A"}
+
+    beagle = client.get("/api/dog/shows/14043/results?group=6&breed=8").get_json()
+    assert [dog["name"] for dog in beagle["results"]] == ["Beagle One"]
+    assert beagle["awards"] == []
+
+    assert dog_result_cache._breed_results_from_all_results_cache(14043, "7", "2") is None
+    mock_get.assert_not_called()
+
+
+def test_showlink_host_budget_spaces_requests_across_threads(monkeypatch):
+    """Concurrent fetches to one host share its token bucket and in-flight cap:
+    starts are spaced 1/rate apart whichever thread asks, other hosts are not."""
+    import threading
+
+    sleeps = []
+    monkeypatch.setattr(dog_showlink.time, "sleep", lambda seconds: sleeps.append(round(seconds, 2)))
+    monkeypatch.setattr(dog_showlink.time, "monotonic", lambda: 100.0)
+    budget = dog_showlink._host_budget(dog_showlink.BASE_URL)
+    budget.configure(rate=2.0, max_in_flight=2)
+    assert dog_showlink._host_budget(dog_showlink._source_url(1, "5", "3")) is budget
+    assert dog_showlink._host_budget("https://example.test/x") is not budget
+
+    open_now = []
+    peak = []
+    lock = threading.Lock()
+
+    def fetch():
+        with budget.slot():
+            with lock:
+                open_now.append(1)
+                peak.append(len(open_now))
+            with lock:
+                open_now.pop()
+
+    threads = [threading.Thread(target=fetch) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(s for s in sleeps if s) == [0.5, 1.0, 1.5]
+    assert max(peak) <= 2
+    assert budget.requests == 4 and budget.waited_s == 3.0
+
+
+def test_showlink_host_budget_grants_waiting_fetches_by_priority():
+    """With the host's in-flight cap reached, the next free slot goes to the
+    most urgent waiting fetch, not the earliest."""
+    import threading
+
+    budget = dog_showlink._host_budget(dog_showlink.BASE_URL)
+    budget.configure(max_in_flight=1)
+    order = []
+
+    def fetch(priority, name):
+        with dog_showlink._fetch_priority_scope(priority):
+            with budget.slot():
+                order.append(name)
+
+    with budget.slot():
+        threads = [threading.Thread(target=fetch, args=args) for args in ((3, "warming"), (1, "finals"))]
+        for thread in threads:
+            thread.start()
+        deadline = time.time() + 5
+        while len(budget._waiting) < 2 and time.time() < deadline:
+            time.sleep(0.005)
+    for thread in threads:
+        thread.join()
+    assert order == ["finals", "warming"]
+
+
+def test_crawl_result_cache_once_crawls_selected_shows_concurrently(monkeypatch):
+    """A pass crawls its selected shows side by side, each at its candidate's
+    priority class, and settles every job as before."""
+    import threading
+
+    monkeypatch.setattr(dog_result_cache, "_queued_result_cache_candidates", lambda now: [
+        {"show_id": 501, "source": "queued", "job": {}, "stale_seconds": 60, "priority": 0},
+    ])
+    monkeypatch.setattr(dog_result_cache, "_auto_result_cache_candidates", lambda now: [
+        {"show_id": 502, "source": "auto", "job": None, "priority": 2},
+    ])
+    monkeypatch.setattr(dog_result_cache, "_claim_result_cache_job", lambda show_id, **kwargs: {"show_id": show_id})
+    removed = []
+    monkeypatch.setattr(dog_result_cache, "_remove_result_cache_job", removed.append)
+    both_running = threading.Barrier(2, timeout=5)
+    seen = {}
+
+    def fake_crawl(show_id, delay, source, workers):
+        both_running.wait()  # raises BrokenBarrierError if the shows ran one after another
+        seen[show_id] = dog_showlink._fetch_priority.get()
+        return {"status": "complete", "show_id": show_id}
+
+    monkeypatch.setattr(dog_result_cache, "crawl_result_cache_for_show", fake_crawl)
+    summary = dog_result_cache.crawl_result_cache_once(limit=2, show_concurrency=2)
+
+    assert summary["completed"] == 2 and summary["failed"] == 0
+    assert [item["show_id"] for item in summary["items"]] == [501, 502]
+    assert seen == {501: 0, 502: 2}
+    assert sorted(removed) == [501, 502]
+
+
 @patch("app.dog_show.showlink._SESSION.get")
 def test_crawl_result_cache_for_show_persists_results_with_delay(mock_get, monkeypatch, client):
     seed_index_show("14042", {
@@ -2470,7 +3196,9 @@ def test_crawl_result_cache_for_show_persists_results_with_delay(mock_get, monke
     summary = dog_result_cache.crawl_result_cache_for_show(14042, delay=0.25, source="test")
 
     assert summary["status"] == "complete"
-    assert sleeps == [0.25]
+    # The delay paces the shared Showlink budget; a lone first fetch never waits.
+    assert dog_showlink._host_budget(dog_showlink.BASE_URL).rate == 4.0
+    assert sleeps == []
     mock_get.assert_called_once()
     doc = dog_store._load_result_cache_doc(14042)
     assert doc["status"] == "complete"
@@ -2487,6 +3215,163 @@ def test_crawl_result_cache_for_show_persists_results_with_delay(mock_get, monke
     mock_get.assert_not_called()
 
 
+@patch("app.dog_show.showlink._SESSION.get")
+def test_all_results_served_from_materialized_payload(mock_get, monkeypatch, client):
+    """A complete crawl stores the serialized, gzip-ready /all-results body; the
+    endpoint streams it (gzip or plain) with the same JSON the doc path builds,
+    and a later index write retires it until the next crawl."""
+    seed_index_show("14042", {
+        "title": "14.06.2000 Basenji",
+        "month": "tammikuu 2000",
+        "source_url": dog_showlink._source_url(14042),
+        "breeds": [
+            { "name": "basenji", "count": 78, "group": "5", "breed_id": "3", "has_results": True },
+        ],
+    })
+    monkeypatch.setattr(dog_result_cache.time, "sleep", lambda seconds: None)
+    mock_resp = MagicMock()
+    mock_resp.text = SAMPLE_BREED_RESULTS_HTML
+    mock_resp.status_code = 200
+    mock_get.return_value = mock_resp
+
+    assert dog_result_cache.crawl_result_cache_for_show(14042, source="test")["status"] == "complete"
+    assert dog_store._load_result_payload(14042)["result_count"] == 1
+
+    gz = client.get("/api/dog/shows/14042/all-results", headers={"Accept-Encoding": "gzip, br"})
+    assert gz.status_code == 200
+    assert gz.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in gz.headers["Vary"]
+    served = json.loads(gzip.decompress(gz.data))
+    assert served["results"][0]["name"] == "Ajibu You Are My Thrill"
+    assert served["cache"]["status"] == "complete"
+    assert "availability" in served
+
+    plain = client.get("/api/dog/shows/14042/all-results", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in plain.headers
+    assert plain.get_json() == served
+
+    monkeypatch.setattr(dog_result_cache, "_load_result_payload", lambda show_id: None)
+    from_doc = client.get("/api/dog/shows/14042/all-results")
+    assert from_doc.get_json() == served
+    monkeypatch.undo()
+
+    etag = plain.headers["ETag"]
+    assert gz.headers["ETag"] == etag[:-1] + '-gzip"'  # a different body, a different strong tag
+    assert from_doc.headers["ETag"] == etag[:-1] + '-doc"'  # jsonify's bytes, not the stored ones
+    monkeypatch.setattr(dog_module, "_all_results_payload", lambda show_id: pytest.fail("304 reads no payload"))
+    assert client.get(
+        "/api/dog/shows/14042/all-results", headers={"If-None-Match": etag},
+    ).status_code == 304
+    revalidated = client.get(
+        "/api/dog/shows/14042/all-results",
+        headers={"If-None-Match": gz.headers["ETag"], "Accept-Encoding": "gzip"},
+    )
+    assert (revalidated.status_code, revalidated.headers["ETag"]) == (304, gz.headers["ETag"])
+    revalidated = client.get(
+        "/api/dog/shows/14042/all-results", headers={"If-None-Match": from_doc.headers["ETag"]},
+    )
+    assert (revalidated.status_code, revalidated.headers["ETag"]) == (304, from_doc.headers["ETag"])
+    monkeypatch.undo()
+
+    seed_index_show("14042", dict(dog_store._indexed_show("14042"), updated_at=time.time()))
+    assert dog_store._load_result_payload(14042) is None
+    assert client.get(
+        "/api/dog/shows/14042/all-results", headers={"If-None-Match": etag},
+    ).status_code == 200
+    mock_get.assert_called_once()
+
+
+@patch("app.dog_show.showlink._SESSION.get")
+def test_refetch_of_captured_breed_is_conditional_and_skips_unchanged_pages(mock_get, monkeypatch):
+    """A captured breed's page is re-fetched with its stored validators; a 304
+    or an identical body is neither parsed nor rewritten, a changed one is."""
+    seed_index_show("14042", {
+        "title": "14.06.2000 Basenji",
+        "month": "tammikuu 2000",
+        "source_url": dog_showlink._source_url(14042),
+        "breeds": [
+            { "name": "basenji", "count": 78, "group": "5", "breed_id": "3", "has_results": True },
+        ],
+    })
+    monkeypatch.setattr(dog_result_cache.time, "sleep", lambda seconds: None)
+    mock_resp = MagicMock()
+    mock_resp.text = SAMPLE_BREED_RESULTS_HTML
+    mock_resp.status_code = 200
+    mock_resp.headers = {"ETag": '"v1"'}
+    mock_get.return_value = mock_resp
+    assert dog_result_cache.crawl_result_cache_for_show(14042, source="test")["status"] == "complete"
+
+    url = dog_showlink._source_url(14042, "5", "3")
+    assert dog_store._load_fetch_states([url])[url]["etag"] == '"v1"'
+    doc = dog_store._load_result_cache_doc(14042)
+    breed = {"name": "basenji", "group": "5", "breed_id": "3", "has_results": True}
+    appended = []
+    real_write = dog_writer._write_breed_captures
+
+    def write_breed_captures(show_id, doc, captures, **kwargs):
+        appended.extend((capture["group"], capture["breed_id"]) for capture in captures)
+        return real_write(show_id, doc, captures, **kwargs)
+
+    monkeypatch.setattr(dog_writer, "_write_breed_captures", write_breed_captures)
+    monkeypatch.setattr(dog_result_cache, "_parse_breed_results", MagicMock(wraps=dog_result_cache._parse_breed_results))
+
+    def refetch():
+        memo = dog_result_cache._new_fetch_memo()
+        assert dog_result_cache._crawl_missing_breed_results(
+            14042, [breed], doc, workers=1, preserve_existing_complete=False, fetch_memo=memo,
+        ) is None
+        return memo
+
+    mock_resp.status_code = 304
+    assert refetch()["unchanged"] == 1
+    assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+    mock_resp.status_code = 200
+    mock_resp.headers = {}
+    assert refetch()["unchanged"] == 1
+    assert appended == [] and dog_result_cache._parse_breed_results.call_count == 0
+
+    mock_resp.text = SAMPLE_BREED_RESULTS_HTML.replace("Ajibu You Are My Thrill", "Ajibu Changed")
+    assert refetch()["changed"] == 1
+    assert appended == [("5", "3")]
+    stored = dog_store._load_fetch_states([url])[url]
+    assert stored["etag"] is None and stored["changed_at"] >= stored["fetched_at"] - 1
+
+
+@patch("app.dog_show.showlink._SESSION.get")
+def test_all_results_since_cursor_serves_only_the_delta(mock_get, monkeypatch, client):
+    """?since=<cursor> answers with just what changed after a previous
+    response's cursor, and falls back to the full body for an unknown cursor."""
+    seed_index_show("14042", {
+        "title": "14.06.2000 Basenji",
+        "month": "tammikuu 2000",
+        "source_url": dog_showlink._source_url(14042),
+        "breeds": [
+            { "name": "basenji", "count": 78, "group": "5", "breed_id": "3", "has_results": True },
+        ],
+    })
+    monkeypatch.setattr(dog_result_cache.time, "sleep", lambda seconds: None)
+    mock_resp = MagicMock()
+    mock_resp.text = SAMPLE_BREED_RESULTS_HTML
+    mock_resp.status_code = 200
+    mock_get.return_value = mock_resp
+    assert dog_result_cache.crawl_result_cache_for_show(14042, source="test")["status"] == "complete"
+
+    full = client.get("/api/dog/shows/14042/all-results").get_json()
+    assert full["cursor"] == 0
+
+    resp = client.get(f"/api/dog/shows/14042/all-results?since={full['cursor']}")
+    assert resp.status_code == 200
+    delta = resp.get_json()
+    assert delta["since"] == delta["cursor"] == 0
+    assert delta["results"] == [] and delta["tombstones"] == [] and delta["breed_awards"] == {}
+    assert resp.headers["ETag"] != client.get("/api/dog/shows/14042/all-results").headers["ETag"]
+
+    everything = client.get("/api/dog/shows/14042/all-results?since=-1").get_json()
+    assert everything["results"] == full["results"]
+    assert client.get("/api/dog/shows/14042/all-results?since=7").get_json()["results"] == full["results"]
+
+
 @patch("app.dog_show.showlink._SESSION.get")
 def test_crawl_result_cache_refreshes_stale_recent_index_before_fetching_results(mock_get, monkeypatch):
     seed_index_show("14042", {
@@ -2825,6 +3710,7 @@ def test_search_shows(mock_get, client):
     mock_resp.status_code = 200
     mock_get.return_value = mock_resp
 
+    store_show_list()
     resp = client.get("/api/dog/search?q=villa")
     assert resp.status_code == 200
     data = resp.get_json()
@@ -2834,6 +3720,41 @@ def test_search_shows(mock_get, client):
     assert data["results"][0]["breed"] is None
     assert data["results"][0]["match"] == "show"
 
+@patch("app.dog_show.showlink._SESSION.get")
+def test_request_reads_share_one_session_and_snapshot(mock_get, client):
+    """A request's store reads check out one read connection and see one
+    snapshot; a write made by the request itself ends that snapshot."""
+    import threading
+    from sqlalchemy import event
+
+    mock_get.return_value = MagicMock(text=SAMPLE_SHOW_LIST_HTML, status_code=200)
+    store_show_list()
+    seed_index_show("14042", {"title": "14.06.2026 Basenji", "breeds": [
+        {"name": "basenji", "count": 78, "group": "5", "breed_id": "3", "has_results": True},
+    ]})
+    checkouts = []
+    event.listen(dog_db.get_read_engine(), "checkout", lambda *args: checkouts.append(1))
+    assert client.get("/api/dog/search?q=base").status_code == 200
+    assert client.get("/api/dog/shows").status_code == 200
+    assert len(checkouts) == 2
+
+    def retitle(title):
+        worker = threading.Thread(target=seed_index_show, args=("14042", {"title": title, "breeds": []}))
+        worker.start()
+        worker.join()
+
+    dog_db.begin_request_reads()
+    try:
+        assert dog_store._indexed_show(14042)["title"] == "14.06.2026 Basenji"
+        retitle("14.06.2026 Basenji KV")  # another connection commits mid-request
+        assert dog_store._indexed_show(14042)["title"] == "14.06.2026 Basenji"
+        dog_store._queue_result_cache_job(14042)
+        assert dog_store._indexed_show(14042)["title"] == "14.06.2026 Basenji KV"
+        assert dog_store._load_result_job(14042)["state"] == "queued"
+    finally:
+        dog_db.end_request_reads()
+
+
 @patch("app.dog_show.showlink._SESSION.get")
 def test_search_shows_by_breed(mock_get, client):
     mock_resp_list = MagicMock()
@@ -2849,6 +3770,7 @@ def test_search_shows_by_breed(mock_get, client):
 
     mock_get.return_value = mock_resp_list
 
+    store_show_list()
     resp = client.get("/api/dog/search?q=base")
     assert resp.status_code == 200
     data = resp.get_json()
@@ -2873,6 +3795,7 @@ def test_search_indexed_show_name_without_breed_match(mock_get, client):
     })
     mock_get.return_value = mock_resp_list
 
+    store_show_list()
     resp = client.get("/api/dog/search?q=base")
 
     assert resp.status_code == 200
@@ -2919,6 +3842,7 @@ def test_search_shows_by_judge(mock_get, client):
 
     mock_get.return_value = mock_resp_list
 
+    store_show_list()
     resp = client.get("/api/dog/search?q=steele")
     assert resp.status_code == 200
     data = resp.get_json()
@@ -3488,6 +4412,122 @@ def test_parse_breed_results_honor_roll_splits_owner():
     assert award["owner"] == "Kortelainen Sanna"
 
 
+def test_parser_backends_agree_on_synthetic_page_corpus(monkeypatch):
+    """The strained backend builds only the elements parsers.py reads; on every
+    page of the synthetic corpus it must give the parsers exactly what the full
+    tree gives them (group pages linked from detail pages come from the corpus).
+    The pages are hand-written to the shapes the parsers read, so this guards the
+    strainer against parser changes, not against real Showlink markup."""
+    import os
+    from app.dog_show import parsers as dog_parsers
+
+    corpus_dir = os.path.join(os.path.dirname(__file__), "fixtures", "showlink")
+    with open(os.path.join(corpus_dir, "corpus.json"), encoding="utf-8") as fh:
+        entries = json.load(fh)
+    pages = {}
+    for entry in entries:
+        with open(os.path.join(corpus_dir, entry["file"]), encoding="utf-8") as fh:
+            pages[entry["url"]] = fh.read()
+
+    def parse_corpus(backend):
+        monkeypatch.setattr(
+            dog_parsers, "_fetch_page",
+            lambda url, page=None: dog_showlink._page_soup(pages[url], page, backend),
+        )
+        outputs = []
+        for entry in entries:
+            soup = dog_showlink._page_soup(pages[entry["url"]], entry["page"], backend)
+            sid = entry["show_id"]
+            if entry["page"] == "list":
+                outputs.append(dog_parsers._parse_show_list(soup))
+            elif entry["page"] == "detail":
+                outputs.append((
+                    dog_parsers._parse_show_detail(soup, sid),
+                    dog_parsers._parse_breeds_from_soup(soup, sid),
+                    dog_parsers._breed_list_targets_from_soup(soup, sid),
+                ))
+            else:
+                outputs.append(dog_parsers._parse_breed_results(soup, sid))
+        return outputs
+
+    full = parse_corpus("full")
+    assert parse_corpus("strained") == full
+    by_file = dict(zip((entry["file"] for entry in entries), full))
+    assert len(by_file["list.html"]) == 54
+    assert by_file["detail-14100-general.html"][2] == ["1", "2", "3", "5", "9"]
+    assert len(by_file["detail-14100-general.html"][0]["breeds"]) == 22
+    assert by_file["detail-14130-nocontent.html"][2] == ["7"]
+    breed = by_file["breed-14100-8-103.html"]
+    assert breed["breed"] == "sileäkarvainen noutaja" and breed["judge"] == "Pietro Marino"
+    assert len(breed["awards"]) == 5 and len(breed["results"]) == 64
+
+
+def test_parser_bench_reads_real_captures_from_the_page_archive(monkeypatch, tmp_path):
+    """scripts/dog_bench_parsers.py --archive-dir checks the backends on the
+    latest archived capture of each URL, the pages Showlink actually served."""
+    import os
+    import sys
+    from app.dog_show import archive as dog_archive
+    scripts_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts")
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+    import dog_bench_parsers
+
+    monkeypatch.setattr(dog_archive, "PAGE_ARCHIVE_DIR", str(tmp_path / "pages"))
+    breed_url = dog_showlink._source_url(13786, "5", "3")
+    dog_archive._archive_page(dog_showlink.BASE_URL, SAMPLE_SHOW_LIST_HTML, "list", fetched_at=1.0)
+    dog_archive._archive_page(breed_url, "<html>before judging</html>", "breed", fetched_at=1.0)
+    dog_archive._archive_page(breed_url, SAMPLE_BREED_RESULTS_HTML, "breed", fetched_at=2.0)
+
+    entries = dog_bench_parsers._load_archive(str(tmp_path / "pages"))
+    assert [(entry["page"], entry["show_id"], entry["url"]) for entry in entries] == [
+        ("list", None, dog_showlink.BASE_URL), ("breed", 13786, breed_url),
+    ]
+    assert entries[1]["html"] == SAMPLE_BREED_RESULTS_HTML
+    assert [dog_bench_parsers._parse_entry(entry, "strained") for entry in entries] == [
+        dog_bench_parsers._parse_entry(entry, "full") for entry in entries
+    ]
+
+
+def test_generated_dog_db_smoke_and_api_bench_run(tmp_path):
+    """scripts/dog_generate_db.py at a tiny scale still writes every table the
+    app reads, and scripts/dog_bench_api.py runs against it, reporting peak RSS
+    once for the run."""
+    import os
+    import sqlite3
+    import subprocess
+    import sys
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    path = tmp_path / "dog.db"
+    subprocess.run(
+        [sys.executable, os.path.join(repo_root, "scripts", "dog_generate_db.py"),
+         "--out", str(path), "--seasons", "1", "--entries", "50"],
+        check=True, capture_output=True, timeout=300,
+    )
+
+    conn = sqlite3.connect(str(path))
+    try:
+        counts = {
+            table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]  # noqa: S608 - fixed names
+            for table in ("dog_show", "dog_breed", "dog_result", "dog_show_stats", "dog_result_payload", "dog_result_job")
+        }
+    finally:
+        conn.close()
+    assert counts["dog_show"] == 66 and counts["dog_result_job"] == 20
+    assert all(counts.values()), counts
+
+    report_path = tmp_path / "bench.json"
+    subprocess.run(
+        [sys.executable, os.path.join(repo_root, "scripts", "dog_bench_api.py"),
+         "--db", str(path), "--requests", "2", "--json", str(report_path)],
+        check=True, capture_output=True, timeout=300,
+    )
+    report = json.loads(report_path.read_text())
+    assert report["peak_rss_mb"] > 0
+    assert report["endpoints"]["shows"]["requests"] == 2
+    assert not any("peak_rss_mb" in row for row in report["endpoints"].values())
+
+
 def test_split_award_name_owner():
     from app.dog_show.parsers import _split_award_name_owner
     assert _split_award_name_owner("Heinäkengän, Om. Hytönen Leena") == ("Heinäkengän", "Hytönen Leena")
@@ -3637,6 +4677,402 @@ def test_append_result_breed_idempotent_on_resave():
     assert (_dog_row_count(DogResult, 9100), _dog_row_count(DogBreedAward, 9100)) == (2, 1)
 
 
+def test_read_scope_uses_tuned_read_only_connections(monkeypatch):
+    """Store reads run on the read engine: read-only, tuned by read_pragmas, and
+    seeing every run_write commit; with the engine off they share the writer's."""
+    from sqlalchemy import text
+    from sqlalchemy.exc import OperationalError
+
+    seed_index_show("14042", {"title": "14.06.2026 Basenji", "breeds": []})
+    assert dog_store._indexed_show(14042)["title"] == "14.06.2026 Basenji"
+    engine = dog_db.get_read_engine()
+    assert engine is not None and engine is not dog_db.get_engine()
+    with dog_db.read_scope() as session:
+        assert session.get_bind() is engine
+        pragmas = dog_db.read_pragmas()
+        for name in ("mmap_size", "cache_size", "query_only"):
+            assert session.execute(text(f"PRAGMA {name}")).scalar() == {"query_only": 1}.get(name, pragmas[name])
+        with pytest.raises(OperationalError):
+            session.execute(text("DELETE FROM dog_show"))
+
+    seed_index_show("14043", {"title": "15.06.2026 Villakoira", "breeds": []})
+    assert dog_store._indexed_show(14043)["title"] == "15.06.2026 Villakoira"
+
+    monkeypatch.setattr(dog_db, "READ_ENGINE", False)
+    dog_db._drop_read_engine()
+    assert dog_db.get_read_engine() is None
+    with dog_db.read_scope() as session:
+        assert session.get_bind() is dog_db.get_engine()
+    assert dog_store._indexed_show(14042)["title"] == "14.06.2026 Basenji"
+
+
+def test_result_delta_returns_rows_and_tombstones_after_cursor():
+    """Appends and breed replacements are readable after a seq cursor: a full
+    rewrite keeps unchanged breeds' rows in place, tombstones the replaced
+    breed, and applying the delta to the old rows yields the new doc."""
+    import copy
+    from sqlalchemy import select
+    from app.dog_show import sqlstore
+    from app.dog_show.models import DogResult
+
+    doc = {
+        "version": 1, "status": "complete", "source": "test", "title": "T",
+        "source_url": "u", "total_breeds": 2, "updated_at": 5.0, "cached_at": 5.0,
+        "completed_breeds": {
+            "5:3": {"name": "breed-3", "result_count": 2, "judge": "J",
+                    "awards": [{"type": "ROP", "name": "Dog 1", "owner": "O", "text": "Dog 1, Om. O"}]},
+            "8:124": {"name": "breed-124", "result_count": 1, "judge": "J", "awards": []},
+        },
+        "failed_breeds": {},
+        "results": [
+            _phase_c_result("5", "3", 1, comp="PU1"),
+            _phase_c_result("5", "3", 2),
+            _phase_c_result("8", "124", 1),
+        ],
+    }
+    with dog_db.session_scope() as session:
+        sqlstore.write_result_doc(session, 9003, doc)
+    with dog_db.session_scope() as session:
+        before = sqlstore.read_result_doc(session, 9003)
+        assert before["result_cursor"] == 2
+        assert sqlstore.read_result_delta(session, 9003, 2)["results"] == []
+
+    # A new breed appended by the live crawl.
+    doc["results"].append(_phase_c_result("2", "7", 1))
+    doc["completed_breeds"]["2:7"] = {"name": "breed-7", "result_count": 1, "judge": "J", "awards": []}
+    with dog_db.session_scope() as session:
+        sqlstore.append_result_breed(session, 9003, doc, "2", "7", doc["results"][-1:])
+    with dog_db.session_scope() as session:
+        delta = sqlstore.read_result_delta(session, 9003, 2)
+    assert delta["cursor"] == 3
+    assert [(r["breedId"], r["number"]) for r in delta["results"]] == [("7", 1)]
+    assert delta["tombstones"] == []
+    assert list(delta["completed_breeds"]) == ["2:7"]
+
+    # The finals re-sweep rewrites basenji's rows; the full save touches only it.
+    doc["results"][1] = dict(doc["results"][1], competitive_placement="PU2")
+    doc["updated_at"] = 6.0
+    with dog_db.session_scope() as session:
+        sqlstore.write_result_doc(session, 9003, copy.deepcopy(doc))
+    with dog_db.session_scope() as session:
+        after = sqlstore.read_result_doc(session, 9003)
+        delta = sqlstore.read_result_delta(session, 9003, before["result_cursor"])
+        assert sqlstore.read_result_delta(session, 9003, 99)["reset"] is True
+        unchanged = session.execute(
+            select(DogResult.seq).where(DogResult.show_id == 9003, DogResult.breed_id == "124")
+        ).scalars().all()
+    assert unchanged == [2]
+    assert delta["cursor"] == after["result_cursor"] == 5
+    assert delta["tombstones"] == [("5", "3")]
+    assert [(r["breedId"], r["number"]) for r in delta["results"]] == [("7", 1), ("3", 1), ("3", 2)]
+
+    dropped = set(delta["tombstones"])
+    applied = [r for r in before["results"] if (r["breedGroup"], r["breedId"]) not in dropped] + delta["results"]
+    assert applied == after["results"]
+
+
+def test_result_doc_cache_rebuilds_once_per_write(monkeypatch):
+    """Repeat loads of an unchanged doc are served from the process-wide cache;
+    a store write, or a header change made behind its back (another process),
+    forces exactly one rebuild."""
+    dog_store._save_result_cache_doc(9150, {
+        "status": "complete", "updated_at": 5.0, "cached_at": 5.0,
+        "completed_breeds": {"5:3": {"result_count": 1}},
+        "results": [_phase_c_result("5", "3", 1)],
+    })
+    calls = {"n": 0}
+    real_read = dog_sqlstore.read_result_doc
+    monkeypatch.setattr(dog_sqlstore, "read_result_doc",
+                        lambda session, sid: (calls.__setitem__("n", calls["n"] + 1), real_read(session, sid))[1])
+
+    first = dog_store._load_result_cache_doc(9150)
+    first["status"] = "mutated by caller"
+    second = dog_store._load_result_cache_doc(9150)
+    assert calls["n"] == 1
+    assert second["status"] == "complete"  # callers get a copy, not the cached dict
+
+    # Same header stamp, new rows: the store write itself invalidates.
+    dog_store._save_result_cache_doc(9150, {
+        "status": "complete", "updated_at": 5.0, "cached_at": 5.0,
+        "results": [_phase_c_result("5", "3", 1), _phase_c_result("5", "3", 2)],
+    })
+    assert len(dog_store._load_result_cache_doc(9150)["results"]) == 2
+    assert calls["n"] == 2
+
+    # A crawler-process write bypasses this process's store, but moves the stamp.
+    dog_db.run_write(lambda session: dog_sqlstore.write_result_doc(session, 9150, {
+        "status": "complete", "updated_at": 6.0, "cached_at": 6.0, "results": [],
+    }))
+    assert dog_store._load_result_cache_doc(9150)["results"] == []
+    assert calls["n"] == 3
+    assert dog_store._load_result_cache_doc(9151) is None
+
+
+def test_result_doc_cache_evicts_least_recently_used_by_size(monkeypatch):
+    for sid in (9160, 9161, 9162):
+        dog_store._save_result_cache_doc(sid, {
+            "status": "complete", "updated_at": 1.0,
+            "results": [_phase_c_result("5", "3", n) for n in range(3)],
+        })
+    one_doc = dog_store._result_doc_size_estimate(dog_store._load_result_cache_doc(9160))
+    dog_store._clear_result_doc_cache()
+    monkeypatch.setattr(dog_store, "RESULT_DOC_CACHE_BYTES", one_doc * 2)
+
+    dog_store._load_result_cache_doc(9160)
+    dog_store._load_result_cache_doc(9161)
+    dog_store._load_result_cache_doc(9160)  # 9160 is now most recently used
+    dog_store._load_result_cache_doc(9162)
+
+    cached = {key[1] for key in dog_store._result_doc_cache}
+    assert cached == {9160, 9162}
+    assert dog_store._result_doc_cache_state["bytes"] <= one_doc * 2
+
+
+def test_single_flight_shares_one_doc_rebuild_between_concurrent_threads(monkeypatch):
+    import threading
+    from app.dog_show import single_flight as dog_single_flight
+
+    dog_store._save_result_cache_doc(9170, {
+        "status": "complete", "updated_at": 1.0,
+        "results": [_phase_c_result("5", "3", 1)],
+    })
+    dog_store._clear_result_doc_cache()
+    started, release = threading.Event(), threading.Event()
+    calls = {"n": 0}
+    real_read = dog_sqlstore.read_result_doc
+
+    def slow_read(session, sid):
+        calls["n"] += 1
+        started.set()
+        release.wait(5)
+        return real_read(session, sid)
+
+    monkeypatch.setattr(dog_sqlstore, "read_result_doc", slow_read)
+    before = dog_single_flight._single_flight_stats().get("result_doc", {}).get("coalesced", 0)
+    docs = []
+    threads = [threading.Thread(target=lambda: docs.append(dog_store._load_result_cache_doc(9170))) for _ in range(4)]
+    threads[0].start()
+    assert started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    while dog_single_flight._flights and next(iter(dog_single_flight._flights.values())).waiters < 3:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls["n"] == 1
+    assert len(docs) == 4 and all(len(doc["results"]) == 1 for doc in docs)
+    assert dog_single_flight._single_flight_stats()["result_doc"]["coalesced"] == before + 3
+
+
+def test_single_flight_takes_value_published_by_another_process(monkeypatch):
+    import fcntl
+    import os
+    import threading
+    from app.dog_show import single_flight as dog_single_flight
+
+    directory, lock_path, wait_path, result_path, digest = dog_single_flight._flight_paths("search", "basenji")
+    os.makedirs(directory, exist_ok=True)
+    # Stand in for another worker's leader: hold the key's lock, then publish.
+    other_leader = os.open(lock_path, os.O_RDWR | os.O_CREAT)
+    fcntl.flock(other_leader, fcntl.LOCK_EX)
+    computed = []
+    result = {}
+    thread = threading.Thread(target=lambda: result.setdefault(
+        "value", dog_single_flight._single_flight("search", "basenji", lambda: computed.append(1) or ["local"]),
+    ))
+    thread.start()
+    time.sleep(0.1)
+    probe = os.open(wait_path, os.O_RDWR)
+    assert dog_single_flight._has_process_waiters(probe)  # the thread registered as a waiter
+    os.close(probe)
+    dog_single_flight._publish(result_path, digest, ["shared"])
+    os.close(other_leader)
+    thread.join(5)
+
+    assert result["value"] == ["shared"]
+    assert computed == []
+    # The last waiter out removed the published value.
+    assert not os.path.exists(result_path)
+
+
+def test_nested_single_flight_on_its_own_shard_computes_without_waiting(monkeypatch):
+    """A search computes show stats, which read the result doc; an inner key on
+    a shard the outer flight holds must not wait on that flock."""
+    from app.dog_show import single_flight as dog_single_flight
+
+    monkeypatch.setattr(dog_single_flight, "SINGLE_FLIGHT_WAIT_SECONDS", 2)
+    lock_path = dog_single_flight._flight_paths("search", "outer")[1]
+    inner = next(
+        n for n in range(10000)
+        if dog_single_flight._flight_paths("show_stats", n)[1] == lock_path
+    )
+    timeouts = []
+    monkeypatch.setattr(
+        dog_single_flight.logger, "warning", lambda event, **kw: timeouts.append(event),
+    )
+
+    started = time.monotonic()
+    value = dog_single_flight._single_flight(
+        "search", "outer",
+        lambda: ["outer", dog_single_flight._single_flight("show_stats", inner, lambda: "inner")],
+    )
+
+    assert value == ["outer", "inner"]
+    assert time.monotonic() - started < 1
+    assert timeouts == []
+    assert dog_single_flight._held_shards() == set()
+
+
+def test_single_flight_files_stay_bounded_and_shared_docs_fill_the_local_cache(monkeypatch):
+    import fcntl
+    import os
+    import threading
+    from app.dog_show import single_flight as dog_single_flight
+
+    for n in range(300):
+        assert dog_single_flight._single_flight("search", f"query-{n}", lambda n=n: [n]) == [n]
+    directory = dog_single_flight._flight_paths("search", "x")[0]
+    assert len(os.listdir(directory)) <= 2 * dog_single_flight.FLIGHT_SHARDS
+
+    # Another key on a busy shard waits, then computes its own value.
+    _, lock_path, _, result_path, digest = dog_single_flight._flight_paths("search", "query-1")
+    other = next(f"q{n}" for n in range(10000) if dog_single_flight._flight_paths("search", f"q{n}")[1] == lock_path)
+    dog_single_flight._publish(result_path, digest, ["query-1"])
+    assert dog_single_flight._single_flight("search", other, lambda: ["own"]) == ["own"]
+
+    dog_store._save_result_cache_doc(9171, {
+        "status": "complete", "updated_at": 1.0,
+        "results": [_phase_c_result("5", "3", 1)],
+    })
+    dog_store._clear_result_doc_cache()
+    with dog_db.read_scope() as session:
+        version = dog_sqlstore.read_result_doc_version(session, 9171)
+        shared = dog_sqlstore.read_result_doc(session, 9171)
+    _, lock_path, wait_path, result_path, digest = dog_single_flight._flight_paths("result_doc", (9171, version))
+    other_leader = os.open(lock_path, os.O_RDWR | os.O_CREAT)
+    fcntl.flock(other_leader, fcntl.LOCK_EX)
+    docs = []
+    thread = threading.Thread(target=lambda: docs.append(dog_store._load_result_cache_doc(9171)))
+    thread.start()
+    time.sleep(0.1)
+    dog_single_flight._publish(result_path, digest, shared)
+    os.close(other_leader)
+    thread.join(5)
+    assert len(docs[0]["results"]) == 1
+
+    reads = []
+    monkeypatch.setattr(dog_sqlstore, "read_result_doc", lambda session, sid: reads.append(sid))
+    assert len(dog_store._load_result_cache_doc(9171)["results"]) == 1
+    assert reads == []
+
+
+def test_result_doc_version_moves_with_breed_judge_and_result_flag():
+    """A breed's judge or result flag written by another process moves neither
+    the cache header nor the show row; the doc version still changes, so cached
+    docs and materialized payloads built before it are not served."""
+    seed_index_show("9172", {
+        "title": "Flag Show", "name": "Flag Show", "date": "01.03.", "month": "maaliskuu 2026",
+        "breeds": [{"name": "basenji", "count": 3, "group": "5", "breed_id": "3"}],
+    })
+    dog_store._save_result_cache_doc(9172, {
+        "status": "partial", "updated_at": 1.0, "results": [_phase_c_result("5", "3", 1)],
+    })
+
+    def version():
+        with dog_db.read_scope() as session:
+            return dog_sqlstore.read_result_doc_version(session, 9172)
+
+    seen = [version()]
+    dog_db.run_write(lambda session: dog_sqlstore.set_breed_judge(session, 9172, "5", "3", "Uusi Tuomari"))
+    seen.append(version())
+    dog_db.run_write(lambda session: dog_sqlstore.set_breed_has_results(session, 9172, "5", "3"))
+    seen.append(version())
+
+    assert len(set(seen)) == 3
+    assert seen[0][:4] == seen[2][:4]  # header and show row untouched
+
+
+
+
+def _fresh_event_hub(monkeypatch):
+    from app.dog_show import events as dog_events
+
+    hub = dog_events._EventHub()
+    monkeypatch.setattr(dog_events._EventHub, "_run", lambda self: None)  # tests drive poll_once
+    monkeypatch.setattr(dog_events, "_hub", hub)
+    return dog_events, hub
+
+
+def _drain(subscriber):
+    events = []
+    while not subscriber.queue.empty():
+        events.append(subscriber.queue.get_nowait())
+    return events
+
+
+def test_show_events_push_only_the_appended_breed_and_finals(monkeypatch):
+    dog_events, hub = _fresh_event_hub(monkeypatch)
+    seed_index_show("9180", {"title": "Live KV", "breeds": [
+        {"name": "breed-1", "group": "5", "breed_id": "1", "count": 2},
+        {"name": "breed-2", "group": "5", "breed_id": "2", "count": 1},
+    ]})
+    doc = {
+        "status": "partial", "updated_at": 1.0,
+        "completed_breeds": {"5:1": {"result_count": 2, "updated_at": 1.0}},
+        "results": [_phase_c_result("5", "1", 1), _phase_c_result("5", "1", 2)],
+    }
+    dog_store._save_result_cache_doc(9180, doc)
+    subscriber = hub.subscribe(9180)
+    assert subscriber.ready == {"show_id": 9180, "status": "partial", "terminal_confirmed": False, "completed_breeds": 1}
+    hub.poll_once()
+    assert _drain(subscriber) == []
+
+    doc["completed_breeds"]["5:2"] = {"result_count": 1, "updated_at": 2.0}
+    doc["updated_at"] = 2.0
+    dog_store._append_result_breed(9180, doc, "5", "2", [_phase_c_result("5", "2", 7)])
+    hub.poll_once()
+    (event, data), = _drain(subscriber)
+    assert event == "breed"
+    assert (data["group"], data["breed_id"]) == ("5", "2")
+    assert [row["number"] for row in data["results"]] == [7]
+
+    doc.update(status="complete", updated_at=3.0, terminal_confirmed=True)
+    dog_store._save_result_cache_header(9180, doc)
+    hub.poll_once()
+    assert [event for event, _ in _drain(subscriber)] == ["status", "finals"]
+
+    hub.unsubscribe(subscriber)
+    assert hub.stream_count() == 0
+
+
+def test_show_events_endpoint_streams_ready_and_caps_streams(monkeypatch, client):
+    dog_events, hub = _fresh_event_hub(monkeypatch)
+    seed_index_show("9181", {"title": "Live KV", "breeds": []})
+
+    resp = client.get("/api/dog/shows/9181/events", buffered=False)
+    assert resp.status_code == 200
+    assert resp.mimetype == "text/event-stream"
+    chunks = (chunk.decode() if isinstance(chunk, bytes) else chunk for chunk in resp.response)
+    assert next(chunks).startswith("retry:")
+    ready = next(chunks)
+    assert ready.startswith("event: ready\n")
+    assert json.loads(ready.split("data: ", 1)[1])["show_id"] == 9181
+    assert hub.stream_count() == 1
+
+    monkeypatch.setattr(dog_events, "SSE_MAX_STREAMS", 1)
+    assert client.get("/api/dog/shows/events").status_code == 503
+    resp.close()
+    assert hub.stream_count() == 0
+
+    # A response closed without ever being iterated still frees its slot.
+    monkeypatch.setattr(dog_events, "SSE_MAX_STREAMS", 2)
+    with client.application.test_request_context("/api/dog/shows/9181/events"):
+        unread = dog_module._event_stream_response(9181)
+    assert hub.stream_count() == 1
+    unread.close()
+    assert hub.stream_count() == 0
 
 
 # ---------------------------------------------------------------------------
@@ -3743,6 +5179,50 @@ def test_sqlstore_search_precedence_and_unicode_case():
         assert dog_sqlstore.indexed_show_ids(session, [9300, 424242, "junk"]) == {9300}
 
 
+def test_search_index_folds_diacritics_and_follows_writes():
+    """The FTS5 index matches infix and diacritic-insensitively, and the writers
+    keep it in step: a rewrite drops old names, an append adds the breed's dogs,
+    and a judge update is searchable immediately."""
+    assert dog_db.search_index_ready()
+    _seed_search_doc(16071, [_search_result_row(1, "Iltatähti")])
+    with dog_db.session_scope() as session:
+        assert [d["show_id"] for d in dog_sqlstore.search_dog_results_by_name(session, "TAHTI")] == [16071]
+
+    doc = {
+        "version": 1, "status": "complete", "source": "t", "title": "14.06.2026 Show 16071",
+        "source_url": "u", "total_breeds": 2, "started_at": 1.0, "updated_at": 10.0,
+        "cached_at": 10.0, "last_error": None, "completed_breeds": {}, "failed_breeds": {},
+        "results": [_search_result_row(1, "Aamurusko")],
+    }
+    with dog_db.session_scope() as session:
+        dog_sqlstore.write_result_doc(session, 16071, doc)
+        dog_sqlstore.append_result_breed(
+            session, 16071, doc, "5", "4", [_search_result_row(1, "Päivänsäde", breed="4")],
+        )
+        dog_sqlstore.set_breed_judge(session, 16071, "5", "3", "Örjan Ärräpää")
+    with dog_db.session_scope() as session:
+        assert dog_sqlstore.search_dog_results_by_name(session, "tähti") == []
+        assert len(dog_sqlstore.search_dog_results_by_name(session, "aamurusko")) == 1
+        assert len(dog_sqlstore.search_dog_results_by_name(session, "paivansade")) == 1
+        judges = dog_sqlstore.search_breeds_by_judge(session, ["orjan arrapaa"])
+        assert [(sid, b["breed_id"]) for sid, b in judges] == [(16071, "3")]
+
+
+def test_search_index_rebuild_backfills_existing_rows():
+    from sqlalchemy import text
+    seed_index_show("9301", {
+        "title": "14.06.2026 Kesänäyttely", "breeds": [
+            {"name": "lapinkoira", "count": 3, "group": "5", "breed_id": "189", "judge": "Päivi Eerola"},
+        ],
+    })
+    with dog_db.session_scope() as session:
+        session.execute(text("DELETE FROM dog_search"))
+        assert dog_sqlstore.search_breeds_by_name(session, ["lapinkoira"]) == []
+        assert dog_sqlstore.rebuild_search_index(session) == 3  # breed, judge, show text
+        assert [sid for sid, _ in dog_sqlstore.search_breeds_by_name(session, ["LAPIN"])] == [9301]
+        assert dog_sqlstore.search_show_ids(session, ["kesanayttely"]) == [9301]
+
+
 def test_sweep_folds_result_rows_into_index_flags_and_judges():
     seed_index_show("9400", {
         "title": "14.06.2024 Sweep Show", "name": "Sweep", "date": "14.06.",
@@ -3774,6 +5254,53 @@ def test_sweep_folds_result_rows_into_index_flags_and_judges():
     assert breed["has_results"] is True
 
 
+def test_change_log_records_writes_in_their_transaction():
+    """Each writer appends its dog_change entries with the write itself; a
+    rolled-back write leaves none, and sweeps can be scoped to changed shows."""
+    def kinds(after=0, show_id=None):
+        with dog_db.session_scope() as session:
+            return [(c["show_id"], c["group"], c["breed_id"], c["kind"])
+                    for c in dog_sqlstore.read_changes(session, after, show_id=show_id)]
+
+    seed_index_show("9401", {
+        "title": "T", "source_url": "u", "updated_at": 1.0,
+        "breeds": [{"name": "basenji", "count": 2, "group": "5", "breed_id": "3"}],
+    })
+    seed_index_show("9402", {"title": "U", "source_url": "u", "updated_at": 1.0, "breeds": []})
+    doc = {
+        "version": 1, "status": "running", "source": "t", "title": "T", "source_url": "u",
+        "total_breeds": 1, "results": [_phase_c_result("5", "3", 1, judge="Paula Steele")],
+        "completed_breeds": {"5:3": {"name": "basenji", "result_count": 1, "judge": "Paula Steele"}},
+    }
+    with dog_db.session_scope() as session:
+        dog_sqlstore.append_result_breed(session, 9401, doc, "5", "3", doc["results"])
+    with dog_db.session_scope() as session:
+        cursor = dog_sqlstore.read_change_cursor(session)
+        dog_sqlstore.write_result_doc(session, 9401, dict(doc, status="complete"))  # rows unchanged
+    with pytest.raises(RuntimeError):
+        with dog_db.session_scope() as session:
+            dog_sqlstore.set_breed_has_results(session, 9401, "5", "3")
+            raise RuntimeError("rolled back")
+
+    assert kinds() == [
+        (9401, None, None, "show"), (9402, None, None, "show"),
+        (9401, "5", "3", "results"), (9401, None, None, "result_doc"),
+    ]
+    with dog_db.session_scope() as session:
+        assert dog_sqlstore.read_changed_show_ids(session, cursor) == ([9401], cursor + 1)
+        assert dog_sqlstore.sweep_breed_result_flags(session, [9402]) == 0
+        assert dog_sqlstore.sweep_breed_result_flags(session, [9401]) == 1
+        assert dog_sqlstore.set_breed_judge(session, 9401, "5", "3", "Paula Steele") == 1
+    assert kinds(after=cursor + 1) == [(9401, "5", "3", "has_results"), (9401, "5", "3", "judge")]
+
+    with dog_db.session_scope() as session:
+        newest = dog_sqlstore.read_change_cursor(session)
+        assert dog_sqlstore.prune_changes(session, time.time() + 1) == newest - 1
+    with dog_db.session_scope() as session:
+        assert dog_sqlstore.read_changed_show_ids(session, 0) == (None, newest)
+        assert dog_sqlstore.read_changed_show_ids(session, newest) == ([], newest)
+
+
 def test_show_is_recent_date_window():
     today = datetime.date(2026, 7, 6)
     def recent(show):